@@ -83,6 +83,7 @@ def _read_into_tree_array(
         taxon_namespace,
         rooting,
         tree_offset,
+        tree_stride,
         use_tree_weights,
         preserve_underscores,
         info_message_func,
@@ -90,14 +91,20 @@ def _read_into_tree_array(
         log_frequency,
         debug_mode,
         ):
+    # when node ages are not needed, the splits can be calculated directly
+    # from the structures of the trees
+    structure_only = bool(tree_array.ignore_node_ages
+            and schema in ("newick", "nexus", "nexus/newick"))
     if not log_frequency:
         tree_array.read_from_files(
             files=tree_sources,
             schema=schema,
             rooting=rooting,
             tree_offset=tree_offset,
+            tree_stride=tree_stride,
             store_tree_weights=use_tree_weights,
             preserve_underscores=preserve_underscores,
+            structure_only=structure_only,
             ignore_unrecognized_keyword_arguments=True,
             )
     else:
@@ -106,14 +113,11 @@ def _read_into_tree_array(
                     info_message_func is not None
                     and (
                         (log_frequency == 1)
-                        or (tree_offset > 0 and current_tree_offset == tree_offset)
-                        or (current_tree_offset >= 0 and log_frequency > 0 and (current_tree_offset % log_frequency) == 0)
+                        or (current_tree_offset == tree_offset)
+                        or (current_tree_offset >= 0 and log_frequency > 0 and (current_tree_offset % log_frequency) < tree_stride)
                         )
                     ):
-                if current_tree_offset >= tree_offset:
-                    coda = " (analyzing)"
-                else:
-                    coda = " (burning-in)"
+                coda = " (analyzing)"
                 info_message_func("'{source_name}': tree at offset {current_tree_offset}{coda}".format(
                     source_name=source_name,
                     current_tree_offset=current_tree_offset,
@@ -126,16 +130,19 @@ def _read_into_tree_array(
                 store_tree_weights=use_tree_weights,
                 preserve_underscores=preserve_underscores,
                 rooting=rooting,
+                tree_offset=tree_offset,
+                tree_stride=tree_stride,
+                structure_only=structure_only,
                 ignore_unrecognized_keyword_arguments=True,
                 )
         current_source_index = None
         current_tree_offset = None
         try:
             for aggregate_tree_idx, tree in enumerate(tree_yielder):
+                current_tree_offset = tree_yielder.current_tree_offset
                 current_yielder_index = tree_yielder.current_file_index
                 if current_yielder_index != current_source_index:
                     current_source_index = current_yielder_index
-                    current_tree_offset = 0
                     source_name = tree_yielder.current_file_name
                     if source_name is None:
                         source_name = "<stdin>"
@@ -143,12 +150,10 @@ def _read_into_tree_array(
                         info_message_func("Analyzing {} of {}: '{}'".format(current_source_index+1, len(tree_sources), source_name), wrap=False)
                     else:
                         info_message_func("Analyzing: '{}'".format(source_name), wrap=False)
-                if current_tree_offset >= tree_offset:
-                    tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
-                    _log_progress(source_name, current_tree_offset)
-                else:
-                    _log_progress(source_name, current_tree_offset)
-                current_tree_offset += 1
+                    if tree_offset > 0:
+                        info_message_func("'{}': skipped {} trees (burning-in)".format(source_name, tree_offset), wrap=False)
+                tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
+                _log_progress(source_name, current_tree_offset)
         except (Exception, KeyboardInterrupt) as e:
             if debug_mode and not isinstance(e, KeyboardInterrupt):
                 raise
@@ -165,6 +170,7 @@ class TreeAnalysisWorker(multiprocessing.Process):
             source_schema,
             taxon_labels,
             tree_offset,
+            tree_stride,
             is_source_trees_rooted,
             preserve_underscores,
             ignore_edge_lengths,
@@ -185,6 +191,7 @@ class TreeAnalysisWorker(multiprocessing.Process):
         self.taxon_namespace = dendropy.TaxonNamespace(self.taxon_labels)
         self.taxon_namespace.is_mutable = False
         self.tree_offset = tree_offset
+        self.tree_stride = tree_stride
         self.is_source_trees_rooted = is_source_trees_rooted
         self.rooting_interpretation = dendropy.get_rooting_argument(is_rooted=self.is_source_trees_rooted)
         self.preserve_underscores = preserve_underscores
@@ -260,6 +267,7 @@ class TreeAnalysisWorker(multiprocessing.Process):
                         taxon_namespace=self.taxon_namespace,
                         rooting=self.rooting_interpretation,
                         tree_offset=self.tree_offset,
+                        tree_stride=self.tree_stride,
                         use_tree_weights=self.use_tree_weights,
                         preserve_underscores=self.preserve_underscores,
                         info_message_func=self.send_info,
@@ -326,6 +334,7 @@ class TreeProcessor(object):
             schema,
             taxon_namespace=None,
             tree_offset=0,
+            tree_stride=1,
             preserve_underscores=False,
             ):
         if self.num_processes is None or self.num_processes <= 1:
@@ -334,6 +343,7 @@ class TreeProcessor(object):
                     schema=schema,
                     taxon_namespace=taxon_namespace,
                     tree_offset=tree_offset,
+                    tree_stride=tree_stride,
                     preserve_underscores=preserve_underscores,
                     )
         else:
@@ -342,6 +352,7 @@ class TreeProcessor(object):
                     schema=schema,
                     taxon_namespace=taxon_namespace,
                     tree_offset=tree_offset,
+                    tree_stride=tree_stride,
                     preserve_underscores=preserve_underscores,
                     )
         return tree_array
@@ -351,6 +362,7 @@ class TreeProcessor(object):
             schema,
             taxon_namespace=None,
             tree_offset=0,
+            tree_stride=1,
             preserve_underscores=False,
             ):
         if taxon_namespace is None:
@@ -372,6 +384,7 @@ class TreeProcessor(object):
                 taxon_namespace=taxon_namespace,
                 rooting=self.rooting_interpretation,
                 tree_offset=tree_offset,
+                tree_stride=tree_stride,
                 use_tree_weights=self.use_tree_weights,
                 preserve_underscores=preserve_underscores,
                 info_message_func=self.info_message,
@@ -385,6 +398,7 @@ class TreeProcessor(object):
             tree_sources,
             schema,
             tree_offset=0,
+            tree_stride=1,
             preserve_underscores=False,
             taxon_namespace=None,
             ):
@@ -429,6 +443,7 @@ class TreeProcessor(object):
                     source_schema=schema,
                     taxon_labels=taxon_labels,
                     tree_offset=tree_offset,
+                    tree_stride=tree_stride,
                     is_source_trees_rooted=self.is_source_trees_rooted,
                     preserve_underscores=preserve_underscores,
                     ignore_edge_lengths=self.ignore_edge_lengths,
@@ -503,6 +518,7 @@ def _write_trees(trees,
                 store_tree_weights=True,
                 suppress_annotations=args.suppress_annotations,
                 suppress_item_comments=args.clear_item_comments,
+                writer_engine="streaming",
                 )
     elif args.output_tree_format == "nexus":
         trees.write_to_stream(
@@ -515,6 +531,7 @@ def _write_trees(trees,
                 store_tree_weights=True,
                 suppress_annotations=args.suppress_annotations,
                 suppress_item_comments=args.clear_item_comments,
+                writer_engine="streaming",
                 simple=args.no_taxa_block,
                 file_comments=file_comments,
                 )
@@ -651,6 +668,15 @@ def main():
                  "Number of trees to skip from the beginning of *each* tree "
                  "file when counting support (default: %(default)s)."
                  ))
+    source_options.add_argument("--sample-interval",
+            type=int,
+            default=1,
+            metavar="N",
+            help=(
+                 "Only use every N-th tree following the burn-in of *each* "
+                 "tree file when counting support, skipping the trees in "
+                 "between without parsing them (default: %(default)s)."
+                 ))
     source_options.add_argument("--force-rooted", "--rooted",
             dest="is_source_trees_rooted",
             action="store_true",
@@ -1283,6 +1309,12 @@ def main():
     if args.burnin:
         messenger.info("{} initial trees to be discarded/ignored as burn-in from *each* source".format(args.burnin))
         processing_report_lines.append("{} initial trees discarded/ignored as burn-in from *each* source".format(args.burnin))
+    if args.sample_interval < 1:
+        messenger.error("Sample interval must be a positive integer: {}".format(args.sample_interval))
+        sys.exit(1)
+    elif args.sample_interval > 1:
+        messenger.info("Every {} trees following burn-in to be sampled from *each* source".format(args.sample_interval))
+        processing_report_lines.append("Every {} trees following burn-in sampled from *each* source".format(args.sample_interval))
 
     ######################################################################
     ## Target Validation
@@ -1524,6 +1556,7 @@ def main():
                 schema=args.input_format,
                 taxon_namespace=taxon_namespace,
                 tree_offset=args.burnin,
+                tree_stride=args.sample_interval,
                 preserve_underscores=args.preserve_underscores,
                 )
         if tree_array.split_distribution.is_mixed_rootings_counted():
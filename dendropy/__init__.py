@@ -31,9 +31,11 @@ from dendropy.datamodel.treemodel import Bipartition
 from dendropy.datamodel.treemodel import Edge
 from dendropy.datamodel.treemodel import Node
 from dendropy.datamodel.treemodel import Tree
+from dendropy.datamodel.compacttreemodel import CompactTree
 from dendropy.datamodel.treecollectionmodel import TreeList
 from dendropy.datamodel.treecollectionmodel import SplitDistribution
 from dendropy.datamodel.treecollectionmodel import TreeArray
+from dendropy.datamodel.lazytreecollectionmodel import LazyTreeList
 from dendropy.datamodel.charstatemodel import StateAlphabet
 from dendropy.datamodel.charstatemodel import DNA_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import RNA_STATE_ALPHABET
@@ -61,6 +63,7 @@ from dendropy.datamodel.charmatrixmodel import StandardCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import StandardCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import ContinuousCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import ContinuousCharacterMatrix
+from dendropy.datamodel.packedcharmatrixmodel import PackedCharacterMatrix
 from dendropy.calculate.phylogeneticdistance import PhylogeneticDistanceMatrix
 from dendropy.datamodel.datasetmodel import DataSet
 from dendropy.utility.error import ImmutableTaxonNamespaceError
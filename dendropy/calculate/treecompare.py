@@ -23,6 +23,7 @@ Statistics, metrics, measurements, and values calculated *between* *two* trees.
 import math
 import collections
 from dendropy.utility import error
+from dendropy.datamodel import compacttreemodel
 
 ###############################################################################
 ## Public Functions
@@ -220,6 +221,13 @@ def false_positives_and_negatives(
     """
     if reference_tree.taxon_namespace is not comparison_tree.taxon_namespace:
         raise error.TaxonNamespaceIdentityError(reference_tree, comparison_tree)
+    if (isinstance(reference_tree, compacttreemodel.CompactTree)
+            or isinstance(comparison_tree, compacttreemodel.CompactTree)):
+        ref_bipartitions = set(_get_split_bitmask_length_map(reference_tree, "length", is_bipartitions_updated))
+        comparison_bipartitions = set(_get_split_bitmask_length_map(comparison_tree, "length", is_bipartitions_updated))
+        false_positives = ref_bipartitions.difference(comparison_bipartitions)
+        false_negatives = comparison_bipartitions.difference(ref_bipartitions)
+        return len(false_positives), len(false_negatives)
     if not is_bipartitions_updated:
         reference_tree.encode_bipartitions()
         comparison_tree.encode_bipartitions()
@@ -688,6 +696,24 @@ def _get_length_diffs(
     bipartition_length_diffs = {}
     if tree1.taxon_namespace is not tree2.taxon_namespace:
         raise error.TaxonNamespaceIdentityError(tree1, tree2)
+    if (isinstance(tree1, compacttreemodel.CompactTree)
+            or isinstance(tree2, compacttreemodel.CompactTree)):
+        # bipartitions are given by their split bitmasks, and missing
+        # lengths are taken to be 0
+        tree1_lengths = _get_split_bitmask_length_map(tree1, edge_weight_attr, is_bipartitions_updated)
+        tree2_lengths = _get_split_bitmask_length_map(tree2, edge_weight_attr, is_bipartitions_updated)
+        for split_bitmask in tree1_lengths:
+            length_diffs.append((value_type(tree1_lengths[split_bitmask] or 0.0),
+                    value_type(tree2_lengths.get(split_bitmask) or 0.0)))
+            bipartition_length_diffs[split_bitmask] = length_diffs[-1]
+        for split_bitmask in tree2_lengths:
+            if split_bitmask not in tree1_lengths:
+                length_diffs.append((value_type(0.0), value_type(tree2_lengths[split_bitmask] or 0.0)))
+                bipartition_length_diffs[split_bitmask] = length_diffs[-1]
+        if bipartition_length_diff_map:
+            return length_diffs, bipartition_length_diffs
+        else:
+            return length_diffs
     if not is_bipartitions_updated:
         tree1.encode_bipartitions()
         tree2.encode_bipartitions()
@@ -764,6 +790,23 @@ def _get_length_diffs(
     else:
         return length_diffs
 
+def _get_split_bitmask_length_map(tree, edge_weight_attr, is_bipartitions_updated):
+    """
+    Returns a dictionary mapping the split bitmasks of the bipartitions of
+    ``tree`` (a |Tree| or a |CompactTree|) to the weights of their edges. The
+    bipartitions of a |CompactTree| are calculated directly from its arrays,
+    and its edges are only weighted by their lengths.
+    """
+    if isinstance(tree, compacttreemodel.CompactTree):
+        if edge_weight_attr != "length":
+            raise ValueError("Edges of CompactTree objects are only weighted by length: '{}'".format(edge_weight_attr))
+        split_bitmasks, edge_lengths, tree_leafset_bitmask = tree.encode_split_bitmasks()
+        return dict(zip(split_bitmasks, edge_lengths))
+    if not is_bipartitions_updated or tree.bipartition_encoding is None:
+        tree.encode_bipartitions()
+    return dict((bipartition.split_bitmask, getattr(edge, edge_weight_attr))
+            for bipartition, edge in tree.bipartition_edge_map.items())
+
 def _bipartition_difference(
         tree1,
         tree2,
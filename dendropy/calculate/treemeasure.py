@@ -22,6 +22,7 @@ Statistics, metrics, measurements, and values calculated on (single) trees.
 
 import math
 from dendropy.calculate import phylogeneticdistance
+from dendropy.datamodel import compacttreemodel
 
 EULERS_CONSTANT = 0.5772156649015328606065120900824024310421
 
@@ -61,6 +62,8 @@ def B1(tree):
     number of nodes between each interior node and tip over all internal
     nodes excluding root.
     """
+    if isinstance(tree, compacttreemodel.CompactTree):
+        return _compact_tree_B1(tree)
     b1 = 0.0
     nd_mi = {}
     for nd in tree.postorder_node_iter():
@@ -94,21 +97,24 @@ def colless_tree_imbalance(tree, normalize="max"):
             no normalization
 
     """
-    colless = 0.0
-    num_leaves = 0
-    subtree_leaves = {}
-    for nd in tree.postorder_node_iter():
-        if nd.is_leaf():
-            subtree_leaves[nd] = 1
-            num_leaves += 1
-        else:
-            total_leaves = 0
-            if len(nd._child_nodes) > 2:
-                raise TypeError("Colless' tree imbalance statistic requires strictly bifurcating trees")
-            left = subtree_leaves[nd._child_nodes[0]]
-            right = subtree_leaves[nd._child_nodes[1]]
-            colless += abs(right-left)
-            subtree_leaves[nd] = right + left
+    if isinstance(tree, compacttreemodel.CompactTree):
+        colless, num_leaves = _compact_tree_colless(tree)
+    else:
+        colless = 0.0
+        num_leaves = 0
+        subtree_leaves = {}
+        for nd in tree.postorder_node_iter():
+            if nd.is_leaf():
+                subtree_leaves[nd] = 1
+                num_leaves += 1
+            else:
+                total_leaves = 0
+                if len(nd._child_nodes) > 2:
+                    raise TypeError("Colless' tree imbalance statistic requires strictly bifurcating trees")
+                left = subtree_leaves[nd._child_nodes[0]]
+                right = subtree_leaves[nd._child_nodes[1]]
+                colless += abs(right-left)
+                subtree_leaves[nd] = right + left
     if normalize == "yule":
         colless = float(colless - (num_leaves * math.log(num_leaves)) - (num_leaves * (EULERS_CONSTANT - 1.0 - math.log(2))))/num_leaves
     elif normalize == "pda":
@@ -186,12 +192,15 @@ def N_bar(tree):
     Returns the $\bar{N}$ statistic: the average number of nodes above a
     terminal node.
     """
-    leaf_count = 0
-    nbar = 0
-    for leaf_node in tree.leaf_node_iter():
-        leaf_count += 1
-        for parent in leaf_node.ancestor_iter(inclusive=False):
-            nbar += 1
+    if isinstance(tree, compacttreemodel.CompactTree):
+        nbar, leaf_count = _compact_tree_leaf_depths(tree)
+    else:
+        leaf_count = 0
+        nbar = 0
+        for leaf_node in tree.leaf_node_iter():
+            leaf_count += 1
+            for parent in leaf_node.ancestor_iter(inclusive=False):
+                nbar += 1
     return float(nbar) / leaf_count
 
 def sackin_index(tree, normalize=True):
@@ -212,12 +221,15 @@ def sackin_index(tree, normalize=True):
             no normalization
 
     """
-    leaf_count = 0
-    num_anc = 0
-    for leaf_node in tree.leaf_node_iter():
-        leaf_count += 1
-        for parent in leaf_node.ancestor_iter(inclusive=False):
-            num_anc += 1
+    if isinstance(tree, compacttreemodel.CompactTree):
+        num_anc, leaf_count = _compact_tree_leaf_depths(tree)
+    else:
+        leaf_count = 0
+        num_anc = 0
+        for leaf_node in tree.leaf_node_iter():
+            leaf_count += 1
+            for parent in leaf_node.ancestor_iter(inclusive=False):
+                num_anc += 1
     if normalize == "yule":
         x = sum(1.0/j for j in range(2, leaf_count+1))
         s = float(num_anc - (2 * leaf_count * x))/leaf_count
@@ -238,6 +250,16 @@ def treeness(tree):
     """
     internal = 0.0
     external = 0.0
+    if isinstance(tree, compacttreemodel.CompactTree):
+        parent_indexes = tree.parent_indexes
+        edge_lengths = tree.edge_lengths
+        num_children = _compact_tree_num_children(tree)
+        for idx in range(1, len(parent_indexes)):
+            if num_children[idx]:
+                internal += edge_lengths[idx]
+            else:
+                external += edge_lengths[idx]
+        return internal/(external + internal)
     for nd in tree.postorder_node_iter():
         if not nd._parent_node:
             continue
@@ -247,3 +269,77 @@ def treeness(tree):
             internal += nd.edge.length
     return internal/(external + internal)
 
+###############################################################################
+## Calculations on CompactTree arrays
+
+def _compact_tree_num_children(tree):
+    # the number of children of each node
+    num_children = [0] * len(tree.parent_indexes)
+    for parent_idx in tree.parent_indexes:
+        if parent_idx >= 0:
+            num_children[parent_idx] += 1
+    return num_children
+
+def _compact_tree_B1(tree):
+    # the maximum number of nodes between each node and its leaves is
+    # accumulated over a reverse (postorder) pass over the node indexes
+    parent_indexes = tree.parent_indexes
+    num_nodes = len(parent_indexes)
+    num_children = _compact_tree_num_children(tree)
+    mi = [0.0] * num_nodes
+    b1 = 0.0
+    for idx in range(num_nodes - 1, 0, -1):
+        if num_children[idx]:
+            mi[idx] += 1
+            b1 += 1.0/mi[idx]
+        parent_idx = parent_indexes[idx]
+        if mi[idx] > mi[parent_idx]:
+            mi[parent_idx] = mi[idx]
+    return b1
+
+def _compact_tree_colless(tree):
+    # returns the unnormalized statistic and the number of leaves
+    parent_indexes = tree.parent_indexes
+    num_nodes = len(parent_indexes)
+    num_children = _compact_tree_num_children(tree)
+    subtree_leaves = [0] * num_nodes
+    # the children of a node come after it, with its first child first, so
+    # that the last value recorded for each node is that of its first child
+    first_child_leaves = [0] * num_nodes
+    colless = 0.0
+    num_leaves = 0
+    for idx in range(num_nodes - 1, -1, -1):
+        if num_children[idx] == 0:
+            subtree_leaves[idx] = 1
+            num_leaves += 1
+        else:
+            if num_children[idx] != 2:
+                raise TypeError("Colless' tree imbalance statistic requires strictly bifurcating trees")
+            left = first_child_leaves[idx]
+            right = subtree_leaves[idx] - left
+            colless += abs(right-left)
+        parent_idx = parent_indexes[idx]
+        if parent_idx >= 0:
+            subtree_leaves[parent_idx] += subtree_leaves[idx]
+            first_child_leaves[parent_idx] = subtree_leaves[idx]
+    return colless, num_leaves
+
+def _compact_tree_leaf_depths(tree):
+    # returns the sum of the numbers of ancestors of the leaves, and the
+    # number of leaves
+    parent_indexes = tree.parent_indexes
+    num_nodes = len(parent_indexes)
+    depths = [0] * num_nodes
+    is_internal = [False] * num_nodes
+    for idx in range(1, num_nodes):
+        parent_idx = parent_indexes[idx]
+        depths[idx] = depths[parent_idx] + 1
+        is_internal[parent_idx] = True
+    num_anc = 0
+    leaf_count = 0
+    for idx in range(num_nodes):
+        if not is_internal[idx]:
+            num_anc += depths[idx]
+            leaf_count += 1
+    return num_anc, leaf_count
+
@@ -17,6 +17,10 @@
 ##############################################################################
 
 import collections
+from dendropy.dataio import asyncyielder
+from dendropy.dataio import binarytreereader
+from dendropy.dataio import binarytreewriter
+from dendropy.dataio import binarytreeyielder
 from dendropy.dataio import d3writer
 from dendropy.dataio import newickreader
 from dendropy.dataio import newickwriter
@@ -31,6 +35,9 @@ from dendropy.dataio import nexmlwriter
 from dendropy.dataio import nexmlyielder
 from dendropy.dataio import phylipreader
 from dendropy.dataio import phylipwriter
+from dendropy.dataio import parallelyielder
+from dendropy.dataio import parsecache
+from dendropy.dataio import treeindex
 from dendropy.utility import container
 
 _IOServices = collections.namedtuple(
@@ -39,6 +46,7 @@ _IOServices = collections.namedtuple(
         )
 
 _IO_SERVICE_REGISTRY = container.CaseInsensitiveDict()
+_IO_SERVICE_REGISTRY["binary-trees"] = _IOServices(binarytreereader.BinaryTreeReader, binarytreewriter.BinaryTreeWriter, binarytreeyielder.BinaryTreeDataYielder)
 _IO_SERVICE_REGISTRY["d3"] = _IOServices(None, d3writer.D3Writer, None)
 _IO_SERVICE_REGISTRY["newick"] = _IOServices(newickreader.NewickReader, newickwriter.NewickWriter, newickyielder.NewickTreeDataYielder)
 _IO_SERVICE_REGISTRY["nexus"] = _IOServices(nexusreader.NexusReader, nexuswriter.NexusWriter, nexusyielder.NexusTreeDataYielder)
@@ -82,14 +90,44 @@ def get_tree_yielder(
         yielder_type =_IO_SERVICE_REGISTRY[schema].tree_yielder
         if yielder_type is None:
             raise KeyError
+    except KeyError:
+        raise NotImplementedError("'{}' is not a supported data yielding schema".format(schema))
+    num_processes = kwargs.pop("num_processes", None)
+    use_mmap = kwargs.pop("use_mmap", False)
+    # binary data is decoded faster than the trees could be transferred
+    # from worker processes, so is always read sequentially
+    if num_processes is not None and num_processes > 1 and not yielder_type.is_binary:
+        # worker processes read byte ranges of sources given as paths
+        # directly
+        yielder = parallelyielder.ParallelTreeDataYielder(
+                files=files,
+                schema=schema,
+                taxon_namespace=taxon_namespace,
+                tree_type=tree_type,
+                num_processes=num_processes,
+                **kwargs)
+    else:
         yielder = yielder_type(
                 files=files,
                 taxon_namespace=taxon_namespace,
                 tree_type=tree_type,
                 **kwargs)
-        return yielder
+        yielder.use_mmap = use_mmap
+    return yielder
+
+def is_binary_schema(schema):
+    """
+    Returns |True| if data in ``schema`` is binary rather than text, and
+    must thus be read from or written to streams opened in binary mode.
+    """
+    try:
+        services = _IO_SERVICE_REGISTRY[schema]
     except KeyError:
-        raise NotImplementedError("'{}' is not a supported data yielding schema".format(schema))
+        return False
+    for service in services:
+        if service is not None:
+            return service.is_binary
+    return False
 
 def register_service(schema, reader=None, writer=None, tree_yielder=None):
     global _IO_SERVICE_REGISTRY
@@ -0,0 +1,336 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Asynchronous iteration over the trees of a collection of sources, for use
+with ``asyncio`` (Python 3.5 or later).
+"""
+
+import codecs
+import threading
+from dendropy.utility import textprocessing
+
+class _AsyncStreamSource(object):
+    """
+    File-like wrapper around an asynchronous stream (e.g., an
+    ``asyncio.StreamReader`` connected to a pipe or socket), read from a
+    thread other than that running the event loop of the stream: each read
+    is scheduled as a coroutine on the event loop, and the calling thread
+    waits for its result.
+    """
+
+    # number of bytes requested from the stream at a time
+    read_size = 65536
+
+    # seconds between checks for the source being closed while waiting for data
+    poll_interval = 0.1
+
+    def __init__(self, stream, loop, encoding=None, name=None):
+        """
+        Parameters
+        ----------
+        stream : object
+            Stream with a coroutine method ``read(n)`` returning up to ``n``
+            bytes, or no bytes at the end of the stream.
+        loop : event loop
+            The event loop that the stream belongs to.
+        encoding : string
+            The encoding of the data, which is decoded incrementally (so that
+            multi-byte characters can be split across reads). If |None|, then
+            the data is binary, and reads return the number of bytes
+            requested unless the end of the stream is reached.
+        name : string
+            Name of the source (e.g., for error messages).
+        """
+        self.stream = stream
+        self.loop = loop
+        self.name = name
+        if encoding is None:
+            self._decoder = None
+            self._buffer = b""
+        else:
+            self._decoder = codecs.getincrementaldecoder(encoding)()
+            self._buffer = u""
+        self._pos = 0
+        self._is_eof = False
+        self._is_closed = False
+
+    def close(self):
+        """
+        Closes the source: a read that is waiting for data is abandoned, and
+        this and further reads raise ``IOError``.
+        """
+        self._is_closed = True
+
+    def _fill(self):
+        """
+        Extends the buffer with the data next received from the stream.
+        Returns |False| if the end of the stream has been reached.
+        """
+        import asyncio
+        import concurrent.futures
+        while True:
+            if self._is_closed:
+                raise IOError("Source has been closed: '{}'".format(self.name))
+            if self.loop.is_closed():
+                raise IOError("Event loop of source has been closed: '{}'".format(self.name))
+            future = asyncio.run_coroutine_threadsafe(self.stream.read(self.read_size), self.loop)
+            while True:
+                try:
+                    data = future.result(timeout=self.poll_interval)
+                    break
+                except concurrent.futures.TimeoutError:
+                    # stop waiting if the event loop is gone (e.g., if an
+                    # ``async for`` loop was left without closing the
+                    # yielder), so that the worker thread does not keep the
+                    # interpreter from exiting
+                    if self._is_closed or self.loop.is_closed() or not self.loop.is_running():
+                        future.cancel()
+                        raise IOError("Source has been closed: '{}'".format(self.name))
+                except concurrent.futures.CancelledError:
+                    raise IOError("Read from source has been cancelled: '{}'".format(self.name))
+            if not data:
+                self._is_eof = True
+            if self._decoder is not None:
+                data = self._decoder.decode(data, final=self._is_eof)
+            if self._pos:
+                self._buffer = self._buffer[self._pos:]
+                self._pos = 0
+            self._buffer += data
+            if self._is_eof:
+                return False
+            if data:
+                return True
+            # only part of a multi-byte character has been received
+
+    def read(self, size=-1):
+        """
+        Returns up to ``size`` characters (or bytes, if the data is binary),
+        or all the remaining data if ``size`` is negative or |None|. With
+        text, fewer characters than requested are returned if the stream has
+        no more data available yet, so that the data can be parsed as it
+        arrives; an empty string is returned only at the end of the stream.
+        """
+        if size is None or size < 0:
+            while not self._is_eof:
+                self._fill()
+            size = len(self._buffer) - self._pos
+        elif self._decoder is None:
+            while len(self._buffer) - self._pos < size and not self._is_eof:
+                self._fill()
+        elif self._pos >= len(self._buffer) and not self._is_eof:
+            self._fill()
+        s = self._buffer[self._pos:self._pos+size]
+        self._pos += len(s)
+        return s
+
+class AsyncTreeDataYielder(object):
+    """
+    An asynchronous iterator over the trees of a collection of sources, for
+    use in ``async for`` statements. The trees are parsed by a
+    :class:`~dendropy.dataio.ioservice.TreeDataYielder` of the schema (e.g.,
+    :class:`~dendropy.dataio.newickyielder.NewickTreeDataYielder` or
+    :class:`~dendropy.dataio.nexusyielder.NexusTreeDataYielder`) in a worker
+    thread, so that the event loop is not blocked while large tree
+    statements are parsed, or while waiting for data to arrive.
+
+    Sources may be file paths, file-like objects open for reading, or
+    asynchronous streams, i.e., objects with a coroutine method ``read(n)``,
+    such as the ``asyncio.StreamReader`` objects of pipes (e.g., of
+    subprocesses) or sockets. The data of asynchronous streams is parsed
+    incrementally as it arrives, with each tree being yielded as soon as its
+    statement has been received.
+
+    The yielder is an asynchronous context manager, which closes it (see
+    :meth:`close()`) on exit, also when the trees are not iterated over to
+    the end.
+
+    Usage::
+
+        reader, writer = await asyncio.open_connection(host, port)
+        async with dendropy.Tree.async_yield_from_files(
+                files=[reader],
+                schema="newick") as tree_yielder:
+            async for tree in tree_yielder:
+                print(tree.length())
+
+    """
+
+    def __init__(self,
+            files=None,
+            schema=None,
+            taxon_namespace=None,
+            tree_type=None,
+            **kwargs):
+        """
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths, file-like objects open for reading, or asynchronous
+            streams.
+        schema : string
+            The name of the data format (e.g., "newick" or "nexus").
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        tree_type : type
+            The type of the trees yielded.
+        encoding : string
+            The encoding of the data of asynchronous streams (except with
+            binary schemas). Defaults to "utf-8".
+        executor : ``concurrent.futures.Executor``
+            The executor in which the trees are parsed. This must run tasks
+            one at a time and in order (e.g., a ``ThreadPoolExecutor`` with a
+            single worker). If not given, a new single-thread executor is
+            created (and shut down by :meth:`close()`).
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the tree yielder of the schema
+            (see :meth:`Tree.yield_from_files()`).
+        """
+        from dendropy import dataio
+        self.encoding = kwargs.pop("encoding", "utf-8")
+        self._executor = kwargs.pop("executor", None)
+        self._is_executor_owned = self._executor is None
+        self.files = files
+        self._loop = None
+        self._sources = []
+        self._sources_lock = threading.Lock()
+        self._tree_iter = None
+        self._is_exhausted = False
+        self.tree_yielder = dataio.get_tree_yielder(
+                self._iter_sources(),
+                schema,
+                taxon_namespace=taxon_namespace,
+                tree_type=tree_type,
+                **kwargs)
+
+    def _get_taxon_namespace(self):
+        return self.tree_yielder.taxon_namespace
+    taxon_namespace = property(_get_taxon_namespace)
+
+    def _get_current_tree_offset(self):
+        return self.tree_yielder.current_tree_offset
+    current_tree_offset = property(_get_current_tree_offset)
+
+    def _iter_sources(self):
+        # asynchronous streams are wrapped when they are reached, in the
+        # worker thread
+        import asyncio
+        is_binary = getattr(self.tree_yielder, "is_binary", False)
+        for src in self.files:
+            if (not textprocessing.is_str_type(src)
+                    and asyncio.iscoroutinefunction(getattr(src, "read", None))):
+                src = _AsyncStreamSource(
+                        stream=src,
+                        loop=self._loop,
+                        encoding=None if is_binary else self.encoding,
+                        name=getattr(src, "name", None))
+                with self._sources_lock:
+                    self._sources.append(src)
+            yield src
+
+    def _next_tree(self):
+        # called in the worker thread; |None| signals the end of the trees
+        if self._tree_iter is None:
+            self._tree_iter = iter(self.tree_yielder)
+        try:
+            return next(self._tree_iter)
+        except StopIteration:
+            return None
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        """
+        Returns an awaitable for the next tree, which raises
+        ``StopAsyncIteration`` when there are no more trees.
+        """
+        import asyncio
+        loop = asyncio.get_event_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("Trees must be yielded in the same event loop")
+        future = loop.create_future()
+        if self._is_exhausted:
+            future.set_exception(StopAsyncIteration())
+            return future
+        if self._executor is None:
+            import concurrent.futures
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        def _set_result(f):
+            if future.cancelled():
+                return
+            if f.cancelled():
+                future.cancel()
+                return
+            exc = f.exception()
+            if exc is not None:
+                future.set_exception(exc)
+                return
+            tree = f.result()
+            if tree is None:
+                self._is_exhausted = True
+                future.set_exception(StopAsyncIteration())
+            else:
+                future.set_result(tree)
+        def _on_done(f):
+            # called in the worker thread, after which the event loop may
+            # have been closed
+            try:
+                loop.call_soon_threadsafe(_set_result, f)
+            except RuntimeError:
+                pass
+        self._executor.submit(self._next_tree).add_done_callback(_on_done)
+        return future
+
+    def _completed_future(self, result=None):
+        import asyncio
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(result)
+        return future
+
+    def __aenter__(self):
+        return self._completed_future(self)
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return self._completed_future(False)
+
+    def aclose(self):
+        """
+        Returns an awaitable that closes this yielder (see :meth:`close()`).
+        """
+        self.close()
+        return self._completed_future()
+
+    def close(self):
+        """
+        Stops reading the sources: asynchronous streams are no longer read
+        (with any tree being parsed failing with ``IOError``), and the
+        executor is shut down if it was created by this object.
+        """
+        self._is_exhausted = True
+        with self._sources_lock:
+            for src in self._sources:
+                src.close()
+        if self._is_executor_owned and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
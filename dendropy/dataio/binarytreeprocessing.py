@@ -0,0 +1,158 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Definition of, and support for encoding and decoding, the "binary-trees"
+schema: a compact binary serialization of trees.
+
+A file consists of a header (the 8 bytes "DPYTREES" followed by the format
+version as a 32-bit integer) and a series of records, each consisting of a
+type code (8-bit integer), the size of the record body in bytes (32-bit
+integer) and the body. All integers and floats are little-endian, and strings
+are given by their size in bytes (32-bit integer, with 0xFFFFFFFF for |None|)
+followed by their UTF-8 encoding. The record types are:
+
+    ``TREE_LIST_RECORD``
+        Starts a new collection of trees, with an empty taxon table. The body
+        is the label of the collection.
+    ``TAXA_RECORD``
+        Appends taxa to the taxon table of the current collection. The body
+        is the number of taxa (32-bit integer) followed by their labels.
+    ``TREE_RECORD``
+        A tree of the current collection. The body is the label of the tree,
+        the rooting state (8-bit integer: 0 for unspecified, 1 for unrooted,
+        2 for rooted), the weight (64-bit float, NaN for |None|), the number
+        of nodes, *n* (32-bit integer), followed by three arrays of *n*
+        elements, giving, for each node in preorder, the index of its parent
+        (32-bit integers, -1 for the seed node), the length of its edge (64-bit
+        floats, NaN for |None|), and the index of its taxon in the taxon table
+        (32-bit integers, -1 for none), and finally the number of node labels
+        (32-bit integer) followed by the index of the node (32-bit integer)
+        and the label of each labeled node.
+
+Records of unknown types are skipped by readers, so that later versions of the
+format can add types of records that can be ignored by earlier readers.
+"""
+
+import sys
+import array
+import struct
+
+FORMAT_MAGIC = b"DPYTREES"
+FORMAT_VERSION = 1
+FILE_HEADER = struct.Struct("<8sI")
+RECORD_HEADER = struct.Struct("<BI")
+
+TREE_LIST_RECORD = 1
+TAXA_RECORD = 2
+TREE_RECORD = 3
+
+TREE_HEADER = struct.Struct("<BdI")
+ROOTING_UNSPECIFIED = 0
+ROOTING_UNROOTED = 1
+ROOTING_ROOTED = 2
+
+_UINT32 = struct.Struct("<I")
+_NONE_STRING_SIZE = 0xffffffff
+_IS_BIG_ENDIAN = sys.byteorder == "big"
+_NAN = float("nan")
+
+if sys.hexversion < 0x03000000:
+    def _array_to_bytes(a):
+        return a.tostring()
+    def _array_from_bytes(a, b):
+        a.fromstring(b)
+    def _decode_string_bytes(b):
+        return b
+else:
+    def _array_to_bytes(a):
+        return a.tobytes()
+    def _array_from_bytes(a, b):
+        a.frombytes(b)
+    def _decode_string_bytes(b):
+        return b.decode("utf-8")
+
+def new_int_array(values=()):
+    """
+    Returns a new ``array.array`` of 32-bit integers.
+    """
+    a = array.array("i", values)
+    assert a.itemsize == 4
+    return a
+
+def encode_array(a):
+    """
+    Returns the little-endian bytes of the elements of the ``array.array``
+    ``a``.
+    """
+    if _IS_BIG_ENDIAN:
+        a = array.array(a.typecode, a)
+        a.byteswap()
+    return _array_to_bytes(a)
+
+def decode_array(typecode, buf, offset, count):
+    """
+    Returns a tuple of an ``array.array`` of ``count`` elements of type
+    ``typecode`` decoded from ``buf`` starting at ``offset``, and the offset
+    following them.
+    """
+    a = array.array(typecode)
+    end = offset + count * a.itemsize
+    if end > len(buf):
+        raise ValueError("Truncated array")
+    _array_from_bytes(a, buf[offset:end])
+    if _IS_BIG_ENDIAN:
+        a.byteswap()
+    return a, end
+
+def encode_string(s):
+    """
+    Returns the encoding of the string ``s`` (which may be |None|).
+    """
+    if s is None:
+        return _UINT32.pack(_NONE_STRING_SIZE)
+    if not isinstance(s, bytes):
+        s = s.encode("utf-8")
+    return _UINT32.pack(len(s)) + s
+
+def decode_string(buf, offset):
+    """
+    Returns a tuple of the string (or |None|) decoded from ``buf`` starting at
+    ``offset``, and the offset following it.
+    """
+    size = _UINT32.unpack_from(buf, offset)[0]
+    offset += 4
+    if size == _NONE_STRING_SIZE:
+        return None, offset
+    end = offset + size
+    if end > len(buf):
+        raise ValueError("Truncated string")
+    return _decode_string_bytes(buf[offset:end]), end
+
+def encode_uint32(value):
+    return _UINT32.pack(value)
+
+def decode_uint32(buf, offset):
+    return _UINT32.unpack_from(buf, offset)[0], offset + 4
+
+def encode_record(record_type, body):
+    """
+    Returns the bytes of the record of type ``record_type`` with body
+    ``body``.
+    """
+    return RECORD_HEADER.pack(record_type, len(body)) + body
@@ -0,0 +1,248 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of "binary-trees"-schema data reader.
+"""
+
+import array
+import struct
+from dendropy.dataio import ioservice
+from dendropy.dataio import binarytreeprocessing
+from dendropy.utility import error
+from dendropy.datamodel.compacttreemodel import CompactTree
+
+_ROOTING_STATES = {
+    binarytreeprocessing.ROOTING_UNSPECIFIED: None,
+    binarytreeprocessing.ROOTING_UNROOTED: False,
+    binarytreeprocessing.ROOTING_ROOTED: True,
+}
+
+class BinaryTreeReader(ioservice.DataReader):
+    """
+    Reader for trees serialized in the "binary-trees" schema (see
+    :mod:`~dendropy.dataio.binarytreeprocessing`). The arrays of the trees
+    are decoded in bulk rather than parsed: if the trees are read into
+    |CompactTree| objects (e.g., with "``structure_only=True``"), the arrays
+    are used directly, while full |Tree| objects are built from them without
+    any parsing. Streams must be opened in binary mode.
+    """
+
+    is_binary = True
+
+    class BinaryTreeReaderError(error.DataParseError):
+
+        def __init__(self, message, stream=None):
+            error.DataParseError.__init__(self, message=message, stream=stream)
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        case_sensitive_taxon_labels: boolean, default: |False|
+            If |True|, then taxon labels are case sensitive (e.g., "P.regius"
+            and "P.REGIUS" wil be treated as different operation taxonomic
+            unit concepts). Otherwise, taxon label intepretation will be made
+            without regard for case.
+        structure_only : boolean, default: |False|
+            Accepted for compatibility with the "newick" and "nexus" readers:
+            whether |CompactTree| or full |Tree| objects are created depends
+            on the type of the trees of the collection being populated, which
+            is |CompactTree| when reading with "``structure_only=True``".
+        ignore_unrecognized_keyword_arguments : boolean, default: |False|
+            If |True|, then unsupported or unrecognized keyword arguments will
+            not result in an error. Default is |False|: unsupported keyword
+            arguments will result in an error.
+        """
+        ioservice.DataReader.__init__(self)
+        self.case_sensitive_taxon_labels = kwargs.pop("case_sensitive_taxon_labels", False)
+        kwargs.pop("structure_only", None)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    ###########################################################################
+    ## Implementation of DataReader interface
+
+    def _read(self,
+            stream,
+            taxon_namespace_factory=None,
+            tree_list_factory=None,
+            char_matrix_factory=None,
+            state_alphabet_factory=None,
+            global_annotations_target=None):
+        tree_lists = []
+        if taxon_namespace_factory is None or tree_list_factory is None:
+            # still validate the source
+            for record_type, size in self.iter_records(stream):
+                self.skip_record_body(stream, size)
+            return self.Product(taxon_namespaces=None, tree_lists=tree_lists, char_matrices=None)
+        tree_list = None
+        taxa = None
+        for record_type, size in self.iter_records(stream):
+            if record_type == binarytreeprocessing.TREE_LIST_RECORD:
+                label, offset = self._decode(stream, binarytreeprocessing.decode_string, self.read_record_body(stream, size), 0)
+                taxon_namespace = taxon_namespace_factory(label=None)
+                tree_list = tree_list_factory(label=label, taxon_namespace=taxon_namespace)
+                tree_lists.append(tree_list)
+                taxa = [None]
+            elif record_type == binarytreeprocessing.TAXA_RECORD:
+                self._require_tree_list(tree_list, stream)
+                self.decode_taxa(stream, self.read_record_body(stream, size), tree_list.taxon_namespace, taxa)
+            elif record_type == binarytreeprocessing.TREE_RECORD:
+                self._require_tree_list(tree_list, stream)
+                self.decode_tree(stream, self.read_record_body(stream, size), tree_list.new_tree, taxa)
+            else:
+                self.skip_record_body(stream, size)
+        return self.Product(taxon_namespaces=None, tree_lists=tree_lists, char_matrices=None)
+
+    ###########################################################################
+    ## Records
+
+    def iter_records(self, stream):
+        """
+        Checks the file header and then iterates over the records in
+        ``stream``, as tuples of the type of the record and the size of its
+        body. The body of each record must be read (using
+        :meth:`read_record_body()`) or skipped (using
+        :meth:`skip_record_body()`) before iterating to the next record.
+        """
+        header = stream.read(binarytreeprocessing.FILE_HEADER.size)
+        if len(header) < binarytreeprocessing.FILE_HEADER.size:
+            raise BinaryTreeReader.BinaryTreeReaderError("Not a 'binary-trees' data source: missing header", stream=stream)
+        magic, version = binarytreeprocessing.FILE_HEADER.unpack(header)
+        if magic != binarytreeprocessing.FORMAT_MAGIC:
+            raise BinaryTreeReader.BinaryTreeReaderError("Not a 'binary-trees' data source: invalid header", stream=stream)
+        if version > binarytreeprocessing.FORMAT_VERSION:
+            raise BinaryTreeReader.BinaryTreeReaderError("Unsupported 'binary-trees' format version: {} (maximum supported version = {})".format(version, binarytreeprocessing.FORMAT_VERSION), stream=stream)
+        record_header_size = binarytreeprocessing.RECORD_HEADER.size
+        while True:
+            record_header = stream.read(record_header_size)
+            if not record_header:
+                return
+            if len(record_header) < record_header_size:
+                raise BinaryTreeReader.BinaryTreeReaderError("Truncated record header", stream=stream)
+            yield binarytreeprocessing.RECORD_HEADER.unpack(record_header)
+
+    def read_record_body(self, stream, size):
+        body = stream.read(size)
+        if len(body) < size:
+            raise BinaryTreeReader.BinaryTreeReaderError("Truncated record", stream=stream)
+        return body
+
+    def skip_record_body(self, stream, size):
+        try:
+            is_seekable = stream.seekable()
+        except AttributeError:
+            is_seekable = False
+        if is_seekable:
+            stream.seek(size, 1)
+        else:
+            self.read_record_body(stream, size)
+
+    def decode_taxa(self, stream, body, taxon_namespace, taxa):
+        """
+        Decodes the taxa of a taxa record, with body ``body``, into |Taxon|
+        objects of ``taxon_namespace``, which are inserted before the last
+        element of ``taxa`` (which is kept as |None|, so that the index -1
+        maps to |None|). Taxa are matched to existing |Taxon| objects by
+        label.
+        """
+        label_taxon_map = {}
+        for taxon in taxon_namespace:
+            label = taxon.label
+            if label is not None and not self.case_sensitive_taxon_labels:
+                label = label.lower()
+            label_taxon_map.setdefault(label, taxon)
+        count, offset = self._decode(stream, binarytreeprocessing.decode_uint32, body, 0)
+        new_taxa = []
+        for idx in range(count):
+            label, offset = self._decode(stream, binarytreeprocessing.decode_string, body, offset)
+            if label is None:
+                new_taxa.append(taxon_namespace.new_taxon(label=None))
+                continue
+            key = label if self.case_sensitive_taxon_labels else label.lower()
+            taxon = label_taxon_map.get(key, None)
+            if taxon is None:
+                taxon = taxon_namespace.new_taxon(label=label)
+                label_taxon_map[key] = taxon
+            new_taxa.append(taxon)
+        taxa[-1:-1] = new_taxa
+
+    def decode_tree(self, stream, body, tree_factory, taxa):
+        """
+        Decodes a tree record, with body ``body``, into a new tree created
+        by calling ``tree_factory()``, with taxon indexes referencing
+        elements of ``taxa``.
+        """
+        try:
+            label, offset = binarytreeprocessing.decode_string(body, 0)
+            rooting, weight, num_nodes = binarytreeprocessing.TREE_HEADER.unpack_from(body, offset)
+            offset += binarytreeprocessing.TREE_HEADER.size
+            parent_indexes, offset = binarytreeprocessing.decode_array("i", body, offset, num_nodes)
+            edge_lengths, offset = binarytreeprocessing.decode_array("d", body, offset, num_nodes)
+            taxon_indexes, offset = binarytreeprocessing.decode_array("i", body, offset, num_nodes)
+            num_node_labels, offset = binarytreeprocessing.decode_uint32(body, offset)
+            node_labels = []
+            for idx in range(num_node_labels):
+                node_idx, offset = binarytreeprocessing.decode_uint32(body, offset)
+                node_label, offset = binarytreeprocessing.decode_string(body, offset)
+                node_labels.append( (node_idx, node_label) )
+            is_rooted = _ROOTING_STATES[rooting]
+            if num_nodes == 0 or parent_indexes[0] != -1:
+                raise ValueError("Invalid seed node")
+            node_taxa = [taxa[idx] for idx in taxon_indexes]
+        except (ValueError, KeyError, IndexError, struct.error) as e:
+            raise BinaryTreeReader.BinaryTreeReaderError("Invalid tree record: {}".format(e), stream=stream)
+        tree = tree_factory()
+        tree.label = label
+        tree.is_rooted = is_rooted
+        if weight == weight:
+            tree.weight = weight
+        if isinstance(tree, CompactTree):
+            tree.parent_indexes = array.array(tree.parent_indexes.typecode, parent_indexes)
+            tree.edge_lengths = edge_lengths
+            tree.node_taxa = node_taxa
+            return tree
+        node_factory = tree.node_factory
+        nodes = [tree.seed_node]
+        for idx in range(1, num_nodes):
+            parent_idx = parent_indexes[idx]
+            if parent_idx < 0 or parent_idx >= idx:
+                raise BinaryTreeReader.BinaryTreeReaderError("Invalid tree record: nodes not in preorder", stream=stream)
+            node = node_factory()
+            nodes[parent_idx].add_child(node)
+            nodes.append(node)
+        for node, length, taxon in zip(nodes, edge_lengths, node_taxa):
+            if length == length:
+                node.edge.length = length
+            if taxon is not None:
+                node.taxon = taxon
+        for node_idx, node_label in node_labels:
+            if node_idx >= num_nodes:
+                raise BinaryTreeReader.BinaryTreeReaderError("Invalid tree record: node label index out of range", stream=stream)
+            nodes[node_idx].label = node_label
+        return tree
+
+    def _decode(self, stream, decode_fn, body, offset):
+        try:
+            return decode_fn(body, offset)
+        except (ValueError, struct.error) as e:
+            raise BinaryTreeReader.BinaryTreeReaderError("Invalid record: {}".format(e), stream=stream)
+
+    def _require_tree_list(self, tree_list, stream):
+        if tree_list is None:
+            raise BinaryTreeReader.BinaryTreeReaderError("Record found before the start of a tree collection", stream=stream)
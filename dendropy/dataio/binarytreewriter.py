@@ -0,0 +1,217 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of "binary-trees"-schema data writer.
+"""
+
+import array
+from dendropy.dataio import ioservice
+from dendropy.dataio import binarytreeprocessing
+from dendropy.datamodel.compacttreemodel import CompactTree
+
+_NAN = float("nan")
+
+class BinaryTreeWriter(ioservice.DataWriter):
+    """
+    Writer for trees in the "binary-trees" schema (see
+    :mod:`~dendropy.dataio.binarytreeprocessing`), which stores the
+    structure of each tree as an array of the indexes of the parents of the
+    nodes, the edge lengths as an array of floats, and the taxa as indexes
+    into a table of taxon labels. Tree and node labels, rooting states and
+    tree weights are also stored; annotations and comments are not. Both
+    |Tree| and |CompactTree| objects can be written. Streams must be opened
+    in binary mode.
+    """
+
+    is_binary = True
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        suppress_node_labels : boolean, default: |False|
+            If |True|, then node labels will not be written.
+        ignore_unrecognized_keyword_arguments : boolean, default: |False|
+            If |True|, then unsupported or unrecognized keyword arguments will
+            not result in an error. Default is |False|: unsupported keyword
+            arguments will result in an error.
+        """
+        ioservice.DataWriter.__init__(self)
+        self.suppress_node_labels = kwargs.pop("suppress_node_labels", False)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    ###########################################################################
+    ## Implementation of DataWriter interface
+
+    def _write(self,
+            stream,
+            taxon_namespaces=None,
+            tree_lists=None,
+            char_matrices=None,
+            global_annotations_target=None):
+        self._write_file_header(stream)
+        for tree_list in tree_lists:
+            if (self.attached_taxon_namespace is not None
+                    and tree_list.taxon_namespace is not self.attached_taxon_namespace):
+                continue
+            self._write_trees(stream,
+                    trees=tree_list,
+                    label=tree_list.label,
+                    taxa=tree_list.taxon_namespace)
+
+    def write_trees(self, trees, stream, label=None):
+        """
+        Writes the trees given by ``trees``, which can be any iterable of
+        |Tree| or |CompactTree| objects (e.g., a generator or the tree
+        yielder returned by :meth:`Tree.yield_from_files()`), to ``stream``
+        as a single collection of trees labeled ``label``. The trees do not
+        need to be collected into a |TreeList| first, and each tree is
+        finished with as soon as it has been written.
+
+        Parameters
+        ----------
+        trees : iterable of |Tree| or |CompactTree| objects
+            The trees to be written.
+        stream : file or file-like object
+            Destination for data, opened in binary mode.
+        label : string
+            The label of the collection of trees.
+        """
+        self._write_file_header(stream)
+        self._write_trees(stream, trees=trees, label=label, taxa=())
+
+    def _write_file_header(self, stream):
+        stream.write(binarytreeprocessing.FILE_HEADER.pack(
+            binarytreeprocessing.FORMAT_MAGIC,
+            binarytreeprocessing.FORMAT_VERSION))
+
+    def _write_trees(self, stream, trees, label, taxa):
+        """
+        Writes a tree collection record, followed by a taxa record for
+        ``taxa`` and the records of ``trees``. Taxa of the trees that are not
+        in ``taxa`` are written in additional taxa records as they are
+        found.
+        """
+        stream.write(binarytreeprocessing.encode_record(
+            binarytreeprocessing.TREE_LIST_RECORD,
+            binarytreeprocessing.encode_string(label)))
+        taxon_index_map = {}
+        new_taxa = []
+        for taxon in taxa:
+            self._index_taxon(taxon, taxon_index_map, new_taxa)
+        for tree in trees:
+            if isinstance(tree, CompactTree):
+                body_parts = self._compose_compact_tree_body(tree, taxon_index_map, new_taxa)
+            else:
+                body_parts = self._compose_tree_body(tree, taxon_index_map, new_taxa)
+            if new_taxa:
+                self._write_taxa(stream, new_taxa)
+                new_taxa = []
+            body_size = sum(len(part) for part in body_parts)
+            stream.write(binarytreeprocessing.RECORD_HEADER.pack(
+                binarytreeprocessing.TREE_RECORD,
+                body_size))
+            stream.write(b"".join(body_parts))
+        if new_taxa:
+            self._write_taxa(stream, new_taxa)
+
+    def _write_taxa(self, stream, new_taxa):
+        parts = [binarytreeprocessing.encode_uint32(len(new_taxa))]
+        for taxon in new_taxa:
+            parts.append(binarytreeprocessing.encode_string(taxon.label))
+        stream.write(binarytreeprocessing.encode_record(
+            binarytreeprocessing.TAXA_RECORD,
+            b"".join(parts)))
+
+    def _index_taxon(self, taxon, taxon_index_map, new_taxa):
+        """
+        Returns the index of ``taxon`` in the taxon table, adding it to the
+        table (and to the list of taxa to be written, ``new_taxa``) if it is
+        not yet in the table.
+        """
+        try:
+            return taxon_index_map[taxon]
+        except KeyError:
+            idx = len(taxon_index_map)
+            taxon_index_map[taxon] = idx
+            new_taxa.append(taxon)
+            return idx
+
+    def _compose_tree_header(self, tree, num_nodes):
+        if tree.is_rooted is None:
+            rooting = binarytreeprocessing.ROOTING_UNSPECIFIED
+        elif tree.is_rooted:
+            rooting = binarytreeprocessing.ROOTING_ROOTED
+        else:
+            rooting = binarytreeprocessing.ROOTING_UNROOTED
+        weight = tree.weight
+        if weight is None:
+            weight = _NAN
+        return (binarytreeprocessing.encode_string(tree.label)
+                + binarytreeprocessing.TREE_HEADER.pack(rooting, float(weight), num_nodes))
+
+    def _compose_tree_body(self, tree, taxon_index_map, new_taxa):
+        """
+        Returns the list of the parts of the body of the record of the
+        |Tree| ``tree``, with its nodes visited iteratively in preorder.
+        """
+        parent_indexes = binarytreeprocessing.new_int_array()
+        edge_lengths = array.array("d")
+        taxon_indexes = binarytreeprocessing.new_int_array()
+        node_label_parts = []
+        suppress_node_labels = self.suppress_node_labels
+        nan = _NAN
+        stack = [(tree.seed_node, -1)]
+        while stack:
+            node, parent_idx = stack.pop()
+            idx = len(parent_indexes)
+            parent_indexes.append(parent_idx)
+            length = node.edge.length
+            edge_lengths.append(nan if length is None else float(length))
+            taxon = node.taxon
+            if taxon is None:
+                taxon_indexes.append(-1)
+            else:
+                taxon_indexes.append(self._index_taxon(taxon, taxon_index_map, new_taxa))
+            if node.label is not None and not suppress_node_labels:
+                node_label_parts.append(binarytreeprocessing.encode_uint32(idx))
+                node_label_parts.append(binarytreeprocessing.encode_string(node.label))
+            child_nodes = node._child_nodes
+            for child_node in child_nodes[::-1]:
+                stack.append((child_node, idx))
+        return [self._compose_tree_header(tree, len(parent_indexes)),
+                binarytreeprocessing.encode_array(parent_indexes),
+                binarytreeprocessing.encode_array(edge_lengths),
+                binarytreeprocessing.encode_array(taxon_indexes),
+                binarytreeprocessing.encode_uint32(len(node_label_parts) // 2)] + node_label_parts
+
+    def _compose_compact_tree_body(self, tree, taxon_index_map, new_taxa):
+        """
+        Returns the list of the parts of the body of the record of the
+        |CompactTree| ``tree``, whose arrays are already in the required
+        form.
+        """
+        taxon_indexes = binarytreeprocessing.new_int_array(
+                -1 if taxon is None else self._index_taxon(taxon, taxon_index_map, new_taxa)
+                for taxon in tree.node_taxa)
+        return [self._compose_tree_header(tree, len(tree.parent_indexes)),
+                binarytreeprocessing.encode_array(binarytreeprocessing.new_int_array(tree.parent_indexes)),
+                binarytreeprocessing.encode_array(tree.edge_lengths),
+                binarytreeprocessing.encode_array(taxon_indexes),
+                binarytreeprocessing.encode_uint32(0)]
@@ -0,0 +1,98 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of "binary-trees"-schema tree iterator.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.dataio import binarytreereader
+from dendropy.dataio import binarytreeprocessing
+
+class BinaryTreeDataYielder(ioservice.TreeDataYielder):
+
+    is_binary = True
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            tree_type=None,
+            **kwargs):
+        """
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading in binary mode. If a
+            source element is a string, then it is assumed to be a path to a
+            file. Otherwise, the source is assumed to be a file-like object.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        tree_offset : integer
+            Number of trees at the beginning of each source to skip. These
+            trees are not decoded: their records are skipped over.
+        tree_stride : integer
+            Only every ``tree_stride``-th tree of each source following the
+            first ``tree_offset`` trees will be yielded, with the trees in
+            between skipped without being decoded.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the base
+            `binarytreereader.BinaryTreeReader` class. See
+            `binarytreereader.BinaryTreeReader` for details.
+        """
+        ioservice.TreeDataYielder.__init__(self,
+                files=files,
+                taxon_namespace=taxon_namespace,
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", None),
+                tree_stride=kwargs.pop("tree_stride", None))
+        self.binary_tree_reader = binarytreereader.BinaryTreeReader(**kwargs)
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        reader = self.binary_tree_reader
+        taxa = None
+        tree_offset = 0
+        for record_type, size in reader.iter_records(stream):
+            if record_type == binarytreeprocessing.TREE_LIST_RECORD:
+                reader.skip_record_body(stream, size)
+                taxa = [None]
+            elif record_type == binarytreeprocessing.TAXA_RECORD:
+                reader._require_tree_list(taxa, stream)
+                reader.decode_taxa(stream,
+                        reader.read_record_body(stream, size),
+                        self.attached_taxon_namespace,
+                        taxa)
+            elif record_type == binarytreeprocessing.TREE_RECORD:
+                reader._require_tree_list(taxa, stream)
+                if self._is_tree_selected(tree_offset):
+                    tree = reader.decode_tree(stream,
+                            reader.read_record_body(stream, size),
+                            self.tree_factory,
+                            taxa)
+                    self._current_tree_offset = tree_offset
+                    yield tree
+                else:
+                    reader.skip_record_body(stream, size)
+                tree_offset += 1
+            else:
+                reader.skip_record_body(stream, size)
@@ -21,17 +21,73 @@ Writing of D3-format tree to a stream.
 """
 
 import re
+import json
 import warnings
 from dendropy.utility import error
 from dendropy.utility import textprocessing
 from dendropy.dataio import ioservice
 
+# values that JSON has no numbers for, and that are written as ``null``
+_NON_FINITE_VALUES = (float("inf"), float("-inf"))
+
+def _is_non_finite(value):
+    # NaN is the only value that is not equal to itself
+    return value != value or value in _NON_FINITE_VALUES
+
+def _replace_non_finite(value):
+    """
+    Returns ``value`` with non-finite numbers, including those in lists,
+    tuples and dictionaries, replaced by |None|.
+    """
+    if isinstance(value, float):
+        if _is_non_finite(value):
+            return None
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(v) for v in value]
+    if isinstance(value, dict):
+        return dict((k, _replace_non_finite(v)) for k, v in value.items())
+    return value
+
+def _dumps_value(value):
+    """
+    Returns the JSON text of an annotation value, with non-finite numbers
+    written as ``null`` and values of other types than those of JSON
+    written as strings.
+    """
+    try:
+        return json.dumps(value, default=str, allow_nan=False)
+    except ValueError:
+        return json.dumps(_replace_non_finite(value), default=str, allow_nan=False)
+
+# formatted real values that can be written as JSON numbers
+_JSON_NUMBER_PATTERN = re.compile(r"\s*-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?\s*$")
+
 ##############################################################################
 ## D3Writer
 
 class D3Writer(ioservice.DataWriter):
     """
     Formatter for D3 data.
+
+    Each tree is written as a JSON object on a line of its own, with the
+    nodes of the tree given by the nested "``root``" object, in the
+    hierarchical form expected by ``d3.hierarchy()``::
+
+        {"label": "tree 1", "rooted": true, "root": {"children": [
+            {"name": "A", "length": 0.25}, {"name": "B", "length": 0.5}]}}
+
+    The "``label``" and "``rooted``" members of a tree are only written if it
+    has a label or a defined rooting state, and the "``name``" and
+    "``length``" members of a node only if it has a label (see notes below)
+    or an edge length. Tree weights, annotations (as a "``annotations``"
+    object of names and values) and comments (as a "``comments``" array of
+    strings) are written if requested.
+
+    The JSON text of each tree is composed by visiting its nodes
+    iteratively, and collected into a buffer that is written to the
+    destination in large chunks, so that even very large trees are written
+    without building an intermediate structure of the whole document.
     """
 
     def __init__(self, **kwargs):
@@ -86,15 +142,33 @@ class D3Writer(ioservice.DataWriter):
             an argument, and returns the string to be used to represent the
             edge length in the tree statement.
         real_value_format_specifier : string, default: ''
-            Format specification for real/float values. Will be applied to edge
-            lengths (if ``edge_label_compose_fn`` is not given) as well as
-            annotations. The format specifier should be given in Python's
-            string format specification mini-language. E.g. ".8f", ".4E",
-            "8.4f".
+            Format specification for edge lengths (if
+            ``edge_label_compose_fn`` is not given). The format specifier
+            should be given in Python's string format specification
+            mini-language, and should give JSON numbers. E.g. ".8f", ".4E",
+            "8.4f"; specifiers that do not, such as ".3%" or ",.2f", result
+            in a ``ValueError``.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
             arguments will result in an error.
+
+        Notes
+        -----
+
+        The "``name``" of a node is composed from its taxon label and its
+        node label, as with the NEWICK writer: leaves are named by their taxon
+        labels and internal nodes by their node labels, unless this is
+        changed using ``suppress_leaf_taxon_labels``,
+        ``suppress_leaf_node_labels``, ``suppress_internal_taxon_labels`` and
+        ``suppress_internal_node_labels``, or by ``node_label_compose_fn``.
+
+        Edge lengths are written as JSON numbers, formatted according to
+        ``real_value_format_specifier``, unless ``edge_label_compose_fn`` is
+        given, in which case the strings it returns are written as JSON
+        strings. As JSON has no numbers for infinite or undefined (NaN)
+        values, such edge lengths, tree weights and annotation values are
+        written as ``null``.
         """
         ioservice.DataWriter.__init__(self)
         ioservice.DataWriter.__init__(self, **kwargs)
@@ -113,6 +187,7 @@ class D3Writer(ioservice.DataWriter):
         self._real_value_format_specifier = ""
         self._real_value_formatter = None
         self.real_value_format_specifier = kwargs.pop("real_value_format_specifier", self._real_value_format_specifier)
+        self._edge_lengths_as_numbers = self.edge_label_compose_fn is None
         if self.edge_label_compose_fn is None:
             self.edge_label_compose_fn = self._format_edge_length
         self.check_for_unused_keyword_arguments(kwargs)
@@ -122,8 +197,15 @@ class D3Writer(ioservice.DataWriter):
     def _set_real_value_format_specifier(self, f):
         if f is None:
             f = ""
+        s = "{:" + f + "}"
+        for value in (0.25, -1234567.75, 1e-7, 1e21):
+            try:
+                is_number = _JSON_NUMBER_PATTERN.match(s.format(value)) is not None
+            except ValueError:
+                is_number = False
+            if not is_number:
+                raise ValueError("Real value format specifier does not give JSON numbers: '{}'".format(f))
         self._real_value_format_specifier = f
-        s = "{:" + self._real_value_format_specifier + "}"
         self._real_value_formatter = s.format
     real_value_format_specifier = property(_get_real_value_format_specifier, _set_real_value_format_specifier)
 
@@ -149,13 +231,180 @@ class D3Writer(ioservice.DataWriter):
         """
         Writes a |TreeList| in D3 schema to ``stream``.
         """
-        for tree in tree_list:
-            self._write_tree(stream, tree)
-            stream.write("\n")
+        self._write_trees(stream, tree_list)
+
+    def write_trees(self, trees, stream):
+        """
+        Writes the trees given by ``trees``, which can be any iterable of
+        |Tree| objects (e.g., a generator or the tree yielder returned by
+        :meth:`Tree.yield_from_files()`), to ``stream``, one tree per line.
+
+        Parameters
+        ----------
+        trees : iterable of |Tree| objects
+            The trees to be written.
+        stream : file or file-like object
+            Destination for data.
+        """
+        self._write_trees(stream, trees)
+
+    def _write_trees(self, stream, trees):
+        """
+        Writes each tree in ``trees`` to ``stream``, followed by a line break.
+        """
+        buffered_parts = []
+        for tree in trees:
+            self._compose_tree(tree, buffered_parts, stream)
+            buffered_parts.append("\n")
+            if len(buffered_parts) >= 65536:
+                stream.write("".join(buffered_parts))
+                del buffered_parts[:]
+        if buffered_parts:
+            stream.write("".join(buffered_parts))
 
     def _write_tree(self, stream, tree):
         """
         Composes and writes ``tree`` to ``stream``.
         """
-        pass
+        parts = []
+        self._compose_tree(tree, parts, stream)
+        stream.write("".join(parts))
+
+    def _compose_tree(self, tree, parts, stream):
+        """
+        Composes the JSON object of ``tree``, visiting the nodes iteratively,
+        and appends its elements to the list ``parts``, which is written to
+        ``stream`` (and emptied) whenever it grows large.
+        """
+        parts_append = parts.append
+        members = []
+        if tree.label:
+            members.append('"label":' + json.dumps(tree.label))
+        if not tree.rooting_state_is_undefined:
+            members.append('"rooted":' + ("true" if tree.is_rooted else "false"))
+        if self.store_tree_weights and tree.weight is not None:
+            if _is_non_finite(tree.weight):
+                members.append('"weight":null')
+            else:
+                members.append('"weight":' + json.dumps(tree.weight))
+        members.extend(self._compose_metadata_members(tree))
+        members.append('"root":')
+        parts_append("{" + ",".join(members))
+        # rendering decisions that are fixed for the whole tree
+        node_label_compose_fn = self.node_label_compose_fn
+        if node_label_compose_fn is None:
+            compose_node_name = self._compose_node_name_renderer()
+        write_edge_lengths = not self.suppress_edge_lengths
+        edge_label_compose_fn = self.edge_label_compose_fn
+        edge_lengths_as_numbers = self._edge_lengths_as_numbers
+        write_metadata = not (self.suppress_annotations and self.suppress_item_comments)
+        compose_metadata_members = self._compose_metadata_members
+        # Stack entries are nodes paired with a flag, which is |None| for a
+        # node whose children have been written and is waiting to be closed,
+        # and otherwise indicates whether the node is the first child of its
+        # parent.
+        stack = [(tree.seed_node, True)]
+        while stack:
+            node, is_first_child = stack.pop()
+            if is_first_child is None:
+                parts_append("]}")
+                continue
+            if not is_first_child:
+                parts_append(",")
+            child_nodes = node._child_nodes
+            members = []
+            if node_label_compose_fn is None:
+                name = compose_node_name(node, not child_nodes)
+            else:
+                name = node_label_compose_fn(node)
+                if name:
+                    name = json.dumps(name)
+            if name:
+                members.append('"name":' + name)
+            edge = node.edge
+            if write_edge_lengths and edge.length is not None:
+                if edge_lengths_as_numbers:
+                    if _is_non_finite(edge.length):
+                        members.append('"length":null')
+                    else:
+                        members.append('"length":' + edge_label_compose_fn(edge))
+                else:
+                    members.append('"length":' + json.dumps(edge_label_compose_fn(edge)))
+            if write_metadata:
+                members.extend(compose_metadata_members(node, edge))
+            if child_nodes:
+                members.append('"children":[')
+                parts_append("{" + ",".join(members))
+                stack.append((node, None))
+                for child_node in child_nodes[:0:-1]:
+                    stack.append((child_node, False))
+                stack.append((child_nodes[0], True))
+            else:
+                parts_append("{" + ",".join(members) + "}")
+            if len(parts) >= 65536:
+                stream.write("".join(parts))
+                del parts[:]
+        parts_append("}")
+
+    def _compose_node_name_renderer(self):
+        """
+        Returns a function that takes a node and a flag indicating whether or
+        not it is a leaf, and returns the JSON string of its name (or an
+        empty string if it has none). The JSON strings of the labels of taxa
+        are composed once per tree.
+        """
+        taxon_names = {}
+        node_label_element_separator = self.node_label_element_separator
+        leaf_taxa = not self.suppress_leaf_taxon_labels
+        leaf_labels = not self.suppress_leaf_node_labels
+        internal_taxa = not self.suppress_internal_taxon_labels
+        internal_labels = not self.suppress_internal_node_labels
+        def compose_node_name(node, is_leaf):
+            if is_leaf:
+                taxon = node.taxon if leaf_taxa else None
+                label = node.label if leaf_labels else None
+            else:
+                taxon = node.taxon if internal_taxa else None
+                label = node.label if internal_labels else None
+            if taxon and taxon.label is not None:
+                if not label:
+                    try:
+                        return taxon_names[taxon]
+                    except KeyError:
+                        name = json.dumps(taxon.label) if taxon.label else ""
+                        taxon_names[taxon] = name
+                        return name
+                return json.dumps(node_label_element_separator.join([taxon.label, str(label)]))
+            elif label:
+                return json.dumps(str(label))
+            return ""
+        return compose_node_name
 
+    def _compose_metadata_members(self, *items):
+        """
+        Returns a list of the "annotations" and "comments" members of the
+        JSON object of the given items (e.g., a node and its edge), if they
+        are not suppressed and the items have any.
+        """
+        members = []
+        if not self.suppress_annotations:
+            annotations = []
+            for item in items:
+                if item.has_annotations:
+                    for annote in item.annotations:
+                        if annote.is_hidden:
+                            continue
+                        annotations.append(json.dumps(annote.name) + ":" + _dumps_value(annote.value))
+            if annotations:
+                members.append('"annotations":{' + ",".join(annotations) + "}")
+        if not self.suppress_item_comments:
+            comments = []
+            for item in items:
+                if item.comments:
+                    if textprocessing.is_str_type(item.comments):
+                        comments.append(item.comments)
+                    else:
+                        comments.extend(item.comments)
+            if comments:
+                members.append('"comments":' + json.dumps(comments))
+        return members
@@ -20,13 +20,21 @@
 Implementation of FASTA-format data reader.
 """
 
+import re
 from dendropy.dataio import ioservice
 from dendropy.utility.error import DataParseError
 from dendropy.utility import deprecate
+from dendropy.utility import filesys
 
 class FastaReader(ioservice.DataReader):
     "Encapsulates loading and parsing of a FASTA format file."
 
+    _whitespace_pattern = re.compile(r"\s+")
+    _whitespace_chars = " \t\n\r\f\v"
+    _line_break_pattern = re.compile(r"\r\n|\n|\r")
+    _mapped_line_end_pattern = re.compile(b"\r\n?|\n")
+    _mapped_line_start_pattern = re.compile(b"(?:^|[\r\n])[ \t\f\v]*$")
+
     def __init__(self, **kwargs):
         """
         Keyword Arguments
@@ -38,9 +46,17 @@ class FastaReader(ioservice.DataReader):
         default_state_alphabet: |StateAlphabet| instance
             A |StateAlphabet| object to be used to manage the alphabet of the
             characters (|StandardCharacterMatrix| **only**).
+        packed: bool
+            If |True|, then the symbols of each sequence are translated in
+            bulk into the state indexes of a
+            :class:`~dendropy.datamodel.packedcharmatrixmodel.PackedCharacterMatrix`
+            (the character matrix factory is expected to create objects of
+            this type) instead of into |StateIdentity| objects. Default is
+            |False|.
         """
         ioservice.DataReader.__init__(self)
         self.data_type = kwargs.pop("data_type", None)
+        self.packed = kwargs.pop("packed", False)
         self.default_state_alphabet = kwargs.pop("default_state_alphabet", None)
         if self.default_state_alphabet is not None:
             if self.data_type is None:
@@ -72,40 +88,137 @@ class FastaReader(ioservice.DataReader):
                     label=None,
                     taxon_namespace=taxon_namespace)
         symbol_state_map = char_matrix.default_state_alphabet.full_symbol_state_map
+        if isinstance(stream, filesys.MappedTextFile):
+            records = self._iter_mapped_records(stream)
+            get_line_num = stream.line_num_at
+        else:
+            records = self._iter_stream_records(stream)
+            get_line_num = lambda line_num: line_num
         curr_vec = None
-        curr_taxon = None
-        for line_index, line in enumerate(stream):
-            s = line.strip()
-            if not s:
+        for name, name_loc, seq_str, seq_loc in records:
+            if name is None:
+                # data preceding the first sequence name
+                lines = self._line_break_pattern.split(seq_str)
+                for line_offset, line in enumerate(lines):
+                    if line.strip():
+                        raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=get_line_num(seq_loc) + line_offset, stream=stream)
                 continue
-            if s.startswith('>'):
-                name = s[1:].strip()
-                curr_taxon = taxon_namespace.require_taxon(label=name)
-                if curr_taxon in char_matrix:
-                    raise DataParseError(message="FASTA error: Repeated sequence name ('{}') found".format(name), line_num=line_index + 1, stream=stream)
-                if curr_vec is not None and len(curr_vec) == 0:
-                    raise DataParseError(message="FASTA error: Expected sequence, but found another sequence name ('{}')".format(name), line_num=line_index + 1, stream=stream)
-                curr_vec = char_matrix[curr_taxon]
-            elif curr_vec is None:
-                raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=line_index + 1, stream=stream)
-            else:
-                states = []
-                for col_ind, c in enumerate(s):
-                    c = c.strip()
-                    if not c:
-                        continue
-                    try:
-                        state = symbol_state_map[c]
-                    except KeyError:
-                        raise DataParseError(message="Unrecognized sequence symbol '{}'".format(c), line_num=line_index + 1, col_num=col_ind + 1, stream=stream)
-                    states.append(state)
-                curr_vec.extend(states)
+            curr_taxon = taxon_namespace.require_taxon(label=name)
+            if curr_taxon in char_matrix:
+                raise DataParseError(message="FASTA error: Repeated sequence name ('{}') found".format(name), line_num=get_line_num(name_loc), stream=stream)
+            if curr_vec is not None and len(curr_vec) == 0:
+                raise DataParseError(message="FASTA error: Expected sequence, but found another sequence name ('{}')".format(name), line_num=get_line_num(name_loc), stream=stream)
+            curr_vec = char_matrix[curr_taxon]
+            if self.packed:
+                curr_vec.extend(self._parse_packed_sequence(
+                        char_matrix,
+                        seq_str,
+                        get_line_num(seq_loc),
+                        symbol_state_map,
+                        stream))
+                continue
+            symbols = self._whitespace_pattern.sub("", seq_str)
+            try:
+                states = [symbol_state_map[c] for c in symbols]
+            except KeyError:
+                self._raise_unrecognized_symbol_error(
+                        seq_str,
+                        get_line_num(seq_loc),
+                        symbol_state_map,
+                        stream)
+            curr_vec.extend(states)
         product = self.Product(
                 taxon_namespaces=None,
                 tree_lists=None,
                 char_matrices=[char_matrix])
         return product
 
+    def _iter_stream_records(self, stream):
+        """
+        Iterates over the sequences in ``stream``, line by line, yielding
+        tuples of the sequence name (|None| for any data before the first
+        name), the line number of the name, the sequence data, and the line
+        number of the first line of the sequence data.
+        """
+        name = None
+        name_line_num = None
+        seq_lines = []
+        seq_line_num = 1
+        for line_index, line in enumerate(stream):
+            s = line.strip()
+            if s.startswith('>'):
+                yield name, name_line_num, "".join(seq_lines), seq_line_num
+                name = s[1:].strip()
+                name_line_num = line_index + 1
+                seq_lines = []
+                seq_line_num = line_index + 2
+            else:
+                seq_lines.append(line)
+        yield name, name_line_num, "".join(seq_lines), seq_line_num
+
+    def _iter_mapped_records(self, stream):
+        """
+        As :meth:`FastaReader._iter_stream_records()`, but for a
+        memory-mapped source, which is scanned directly for the sequence
+        names, with the data of each sequence being decoded in a single
+        slice instead of line by line. Byte offsets are yielded instead of
+        line numbers.
+        """
+        buf = stream.buffer
+        name = None
+        name_offset = None
+        seq_offset = 0
+        pos = 0
+        while True:
+            pos = buf.find(b">", pos)
+            if pos < 0:
+                break
+            # only a '>' at the start of a line (ignoring leading whitespace)
+            # begins a sequence name
+            line_start = max(pos - 64, 0)
+            if not self._mapped_line_start_pattern.search(buf, line_start, pos):
+                pos += 1
+                continue
+            m = self._mapped_line_end_pattern.search(buf, pos)
+            if m is None:
+                name_end = next_seq_offset = stream.size
+            else:
+                name_end = m.start()
+                next_seq_offset = m.end()
+            yield name, name_offset, stream.decode(seq_offset, pos), seq_offset
+            name = stream.decode(pos + 1, name_end).strip()
+            name_offset = pos
+            seq_offset = pos = next_seq_offset
+        yield name, name_offset, stream.decode(seq_offset, stream.size), seq_offset
+
+    def _parse_packed_sequence(self, char_matrix, seq_str, line_num, symbol_state_map, stream):
+        """
+        Returns the state indexes of the sequence data ``seq_str``, translated
+        in bulk by a |PackedCharacterMatrix| ``char_matrix``.
+        """
+        try:
+            return char_matrix.state_indexes_for_symbols(seq_str,
+                    ignore_chars=self._whitespace_chars)
+        except ValueError:
+            pass
+        # only whitespace characters that are not in the fast path's set
+        # (e.g., non-ASCII ones) can get us here with valid data
+        try:
+            return char_matrix.state_indexes_for_symbols(
+                    self._whitespace_pattern.sub("", seq_str))
+        except ValueError:
+            self._raise_unrecognized_symbol_error(
+                    seq_str,
+                    line_num,
+                    symbol_state_map,
+                    stream)
+
+    def _raise_unrecognized_symbol_error(self, seq_str, line_num, symbol_state_map, stream):
+        for line_offset, line in enumerate(self._line_break_pattern.split(seq_str)):
+            for col_ind, c in enumerate(line.strip()):
+                c = c.strip()
+                if c and c not in symbol_state_map:
+                    raise DataParseError(message="Unrecognized sequence symbol '{}'".format(c), line_num=line_num + line_offset, col_num=col_ind + 1, stream=stream)
 
 class DnaFastaReader(FastaReader):
 
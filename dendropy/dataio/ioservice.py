@@ -22,6 +22,7 @@ import warnings
 from dendropy.datamodel import taxonmodel
 from dendropy.utility import deprecate
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 
@@ -33,6 +34,10 @@ class IOService(object):
     Base class for all readers/writers.
     """
 
+    # |True| for services that read or write binary data, which must be given
+    # streams opened in binary mode
+    is_binary = False
+
     @staticmethod
     def attached_taxon_set_deprecation_warning():
         deprecate.dendropy_deprecation_warning(
@@ -502,6 +507,8 @@ class DataYielder(IOService):
     def __init__(self, files=None):
         IOService.__init__(self)
         self.files = files
+        # if |True|, sources given as paths are read through memory maps
+        self.use_mmap = False
         self._current_file_index = None
         self._current_file = None
         self._current_file_name = None
@@ -531,7 +538,10 @@ class DataYielder(IOService):
 
     def iterate_over_file(self, current_file):
         if textprocessing.is_str_type(current_file):
-            self._current_file = open(current_file, "r")
+            if self.is_binary:
+                self._current_file = filesys.open_binary_file(current_file, "r")
+            else:
+                self._current_file = filesys.open_text_file(current_file, "r", use_mmap=self.use_mmap)
             self._current_file_name = current_file
         else:
             self._current_file = current_file
@@ -557,12 +567,51 @@ class TreeDataYielder(DataYielder):
     def __init__(self,
             files=None,
             taxon_namespace=None,
-            tree_type=None):
+            tree_type=None,
+            tree_offset=None,
+            tree_stride=None):
         DataYielder.__init__(self, files=files)
         self.taxon_namespace = taxon_namespace
         assert self.taxon_namespace is not None
         self.attached_taxon_namespace = self.taxon_namespace
         self.tree_type = tree_type
+        self.tree_offset = tree_offset
+        self.tree_stride = tree_stride
+        self._current_tree_offset = None
+
+    def _get_tree_offset(self):
+        return self._tree_offset
+    def _set_tree_offset(self, value):
+        if value is None:
+            value = 0
+        if value < 0:
+            raise ValueError("'tree_offset' must be a non-negative integer: {}".format(value))
+        self._tree_offset = value
+    tree_offset = property(_get_tree_offset, _set_tree_offset)
+
+    def _get_tree_stride(self):
+        return self._tree_stride
+    def _set_tree_stride(self, value):
+        if value is None:
+            value = 1
+        if value < 1:
+            raise ValueError("'tree_stride' must be a positive integer: {}".format(value))
+        self._tree_stride = value
+    tree_stride = property(_get_tree_stride, _set_tree_stride)
+
+    def _get_current_tree_offset(self):
+        return self._current_tree_offset
+    current_tree_offset = property(_get_current_tree_offset)
+
+    def _is_tree_selected(self, tree_offset):
+        """
+        Returns |True| if the tree at (0-based) position ``tree_offset`` in
+        the current source is to be yielded given the values of
+        ``tree_offset`` and ``tree_stride``, or |False| if it is to be
+        skipped.
+        """
+        return (tree_offset >= self._tree_offset
+                and (tree_offset - self._tree_offset) % self._tree_stride == 0)
 
     def tree_factory(self):
         return self.tree_type(taxon_namespace=self.taxon_namespace)
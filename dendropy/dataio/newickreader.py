@@ -21,6 +21,9 @@ Parsing of NEWICK-format tree from a stream.
 """
 
 import re
+import array
+import hashlib
+import functools
 import warnings
 from dendropy.utility import error
 from dendropy.utility import deprecate
@@ -149,7 +152,9 @@ class NewickReader(ioservice.DataReader):
             corresponding object (accessible through the ``annotations``
             attribute of the object). This requires that the comment
             contents conform to a particular format (NHX or BEAST: 'field =
-            value'). If |False|, then the comments will not be parsed,
+            value'). The fields are only parsed into |Annotation| objects
+            when the ``annotations`` attribute of the object is first
+            accessed. If |False|, then the comments will not be parsed,
             but will be instead stored directly as elements of the ``comments``
             list attribute of the associated object.
         store_tree_weights : boolean, default: |False|
@@ -181,6 +186,39 @@ class NewickReader(ioservice.DataReader):
         terminating_semicolon_required : boolean, default: |True|
             If |True| [default], then a tree statement that does not end in a
             semi-colon is an error. If |False|, then no error will be raised.
+        tokenizer_engine : string, {['standard'], 'buffered'}
+            The tokenization engine used to process the data source. The
+            'standard' engine reads the source one character at a time. The
+            'buffered' engine reads the source in large blocks and extracts
+            tokens using regular expressions, which is much faster on large
+            files.
+        parser_engine : string, {['standard'], 'statement'}
+            The tree parsing engine. The 'standard' engine builds each tree
+            by recursively descending through the tokens delivered by the
+            tokenizer (see ``tokenizer_engine``). The 'statement' engine reads
+            each complete tree statement into a string, splits it into tokens
+            in a single pass, and then builds the tree using an iterative
+            (stack-based) parser, which is considerably faster and is not
+            subject to the Python recursion limit on very large or deeply
+            nested trees. The 'statement' engine is only used for NEWICK
+            sources (the ``tokenizer_engine`` setting is ignored when it is
+            selected).
+        structure_only : boolean, default: |False|
+            If |True|, then only the structure of each tree (its topology,
+            edge lengths, leaf taxa and rooting state) is read, and the trees
+            are built as |CompactTree| objects instead of |Tree| objects,
+            which is much faster. Comments, metadata annotations and the
+            labels of internal nodes are not processed, and edge lengths are
+            stored as floating-point values. Cannot be combined with
+            ``suppress_leaf_node_taxa=True``.
+        parse_cache : :class:`~dendropy.dataio.parsecache.TreeParseCache`, default: |None|
+            If given, then the trees built from tree statements are recorded
+            in this cache, keyed by a digest of the statement text, and trees
+            for statements that are found in the cache are built from their
+            records instead of being parsed. This selects the 'statement'
+            parser engine if ``parser_engine`` is not given, and is only
+            used with it (so not with NEXUS sources). Cannot be combined with
+            ``finish_node_fn``.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
@@ -254,6 +292,17 @@ class NewickReader(ioservice.DataReader):
         self.suppress_leaf_node_taxa = kwargs.pop("suppress_external_node_taxa", False) # legacy (will be deprecated)
         self.suppress_leaf_node_taxa = kwargs.pop("suppress_leaf_node_taxa", self.suppress_leaf_node_taxa)
         self.terminating_semicolon_required = kwargs.pop("terminating_semicolon_required", True)
+        self.tokenizer_engine = kwargs.pop("tokenizer_engine", None)
+        self.parse_cache = kwargs.pop("parse_cache", None)
+        parser_engine = kwargs.pop("parser_engine", None)
+        if parser_engine is None and self.parse_cache is not None:
+            parser_engine = "statement"
+        self.parser_engine = parser_engine
+        self.structure_only = kwargs.pop("structure_only", False)
+        if self.structure_only and self.suppress_leaf_node_taxa:
+            raise ValueError("'structure_only' cannot be combined with 'suppress_leaf_node_taxa': leaf node labels can only be read as taxa")
+        if self.parse_cache is not None and self.finish_node_fn is not None:
+            raise ValueError("'parse_cache' cannot be combined with 'finish_node_fn': trees built from the cache are not parsed node by node")
         self.check_for_unused_keyword_arguments(kwargs)
 
         # per-tree book-keeping
@@ -264,7 +313,9 @@ class NewickReader(ioservice.DataReader):
     def tree_iter(self,
             stream,
             taxon_symbol_mapper,
-            tree_factory):
+            tree_factory,
+            tree_offset=0,
+            tree_stride=1):
         """
         Iterator that yields trees in NEWICK-formatted source.
 
@@ -277,6 +328,13 @@ class NewickReader(ioservice.DataReader):
         tree_factory : function object
             A function that returns a new |Tree| object when called
             without arguments.
+        tree_offset : integer
+            Number of trees at the beginning of the source to skip.
+        tree_stride : integer
+            Only every ``tree_stride``-th tree following the first
+            ``tree_offset`` trees will be returned. Skipped trees are not
+            parsed: the source is only scanned for the end of their tree
+            statements.
 
         Returns
         -------
@@ -284,16 +342,47 @@ class NewickReader(ioservice.DataReader):
             An iterator yielding |Tree| objects constructed based on
             data in ``stream``.
         """
-        nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
-                preserve_unquoted_underscores=self.preserve_unquoted_underscores)
+        if self._parser_engine == "statement":
+            for tree in self._statement_parser_tree_iter(
+                    stream=stream,
+                    tree_factory=tree_factory,
+                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol,
+                    tree_offset=tree_offset,
+                    tree_stride=tree_stride):
+                yield tree
+            yield None
+            return
+        nexus_tokenizer = self.create_tokenizer(stream)
+        tree_idx = 0
         while True:
+            if tree_idx < tree_offset or (tree_idx - tree_offset) % tree_stride:
+                if not self._skip_tree_statement(nexus_tokenizer):
+                    yield None
+                    return
+                tree_idx += 1
+                continue
+            # the source is read past the end of the statement only once the
+            # next tree is requested, so that a tree is yielded as soon as
+            # its statement has been read (e.g., from a pipe)
             tree = self._parse_tree_statement(
                     nexus_tokenizer=nexus_tokenizer,
                     tree_factory=tree_factory,
-                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol,
+                    is_lookahead_deferred=True)
             yield tree
             if tree is None:
-                raise StopIteration
+                return
+            self._consume_tree_statement_end(nexus_tokenizer)
+            tree_idx += 1
+
+    def create_tokenizer(self, stream):
+        """
+        Returns a tokenizer for ``stream``, configured according to this
+        reader's ``tokenizer_engine`` and ``preserve_underscores`` settings.
+        """
+        return nexusprocessing.create_nexus_tokenizer(stream,
+                preserve_unquoted_underscores=self.preserve_unquoted_underscores,
+                tokenizer_engine=self.tokenizer_engine)
 
     def _read(self,
             stream,
@@ -333,18 +422,45 @@ class NewickReader(ioservice.DataReader):
         self._rooting = val
     rooting = property(_get_rooting, _set_rooting)
 
+    def _get_parser_engine(self):
+        """
+        Get tree parsing engine.
+        """
+        return self._parser_engine
+    def _set_parser_engine(self, val):
+        """
+        Set tree parsing engine.
+        """
+        if val is None:
+            val = "standard"
+        if val not in ("standard", "statement"):
+            raise ValueError("Unrecognized parser engine: '{}'".format(val))
+        self._parser_engine = val
+    parser_engine = property(_get_parser_engine, _set_parser_engine)
+
     def _parse_tree_statement(self,
             nexus_tokenizer,
             tree_factory,
-            taxon_symbol_map_fn):
+            taxon_symbol_map_fn,
+            is_lookahead_deferred=False):
         """
         Parses a single tree statement from a token stream and constructs a
         corresponding Tree object. Expects that the first non-comment and
         non-semi-colon token to be found, including the current token, to be
         the parenthesis that opens the tree statement. When complete, the
         current token will be the token immediately following the semi-colon,
-        if any.
+        if any. If ``is_lookahead_deferred`` is |True|, then the current token
+        will instead be the semi-colon itself, and nothing beyond it will have
+        been read: the caller then calls
+        :meth:`NewickReader._consume_tree_statement_end()` before reading
+        on.
         """
+        if self.structure_only:
+            return self._parse_compact_tree_statement(
+                    nexus_tokenizer=nexus_tokenizer,
+                    tree_factory=tree_factory,
+                    taxon_symbol_map_fn=taxon_symbol_map_fn,
+                    is_lookahead_deferred=is_lookahead_deferred)
         current_token = nexus_tokenizer.current_token
         tree_comments = nexus_tokenizer.pull_captured_comments()
         while (current_token == ";" or current_token is None) and not nexus_tokenizer.is_eof():
@@ -382,10 +498,43 @@ class NewickReader(ioservice.DataReader):
         self._seen_taxa = None
         self._parenthesis_nesting_level = None
         self._tree_statement_complete = None
+        if not is_lookahead_deferred:
+            self._consume_tree_statement_end(nexus_tokenizer)
+        return tree
+
+    def _consume_tree_statement_end(self, nexus_tokenizer):
+        """
+        Advances the token stream from the semi-colon that terminates a tree
+        statement to the token immediately following it (and any further
+        semi-colons), if any.
+        """
+        current_token = nexus_tokenizer.current_token
         while current_token == ";" and not nexus_tokenizer.is_eof():
             nexus_tokenizer.clear_captured_comments()
             current_token = nexus_tokenizer.next_token()
-        return tree
+
+    def _skip_tree_statement(self, nexus_tokenizer):
+        """
+        Skips over a single tree statement in a token stream without parsing
+        it, by scanning for the terminating semi-colon. Follows the same
+        conventions as :meth:`NewickReader._parse_tree_statement()` with
+        respect to the current token on entry and exit. Returns |False| if
+        there are no more tree statements in the stream.
+        """
+        current_token = nexus_tokenizer.current_token
+        while (current_token == ";" or current_token is None) and not nexus_tokenizer.is_eof():
+            current_token = nexus_tokenizer.require_next_token()
+        nexus_tokenizer.clear_captured_comments()
+        if nexus_tokenizer.is_eof():
+            return False
+        if not nexus_tokenizer.skip_past_char(";"):
+            # unterminated final tree statement
+            return True
+        current_token = ";"
+        while current_token == ";" and not nexus_tokenizer.is_eof():
+            nexus_tokenizer.clear_captured_comments()
+            current_token = nexus_tokenizer.next_token()
+        return True
 
     def _process_tree_comments(self, tree, tree_comments, nexus_tokenizer):
         # NOTE: this also unconditionally sets the tree rootedness and
@@ -407,41 +556,11 @@ class NewickReader(ioservice.DataReader):
             elif (self.store_tree_weights
                     and (stripped_comment.startswith("&W ") or stripped_comment.startswith("&w "))
                     ):
-                try:
-                    weight_expression = stripped_comment[2:]
-                    if not weight_expression:
-                        raise ValueError
-                    we_parts = weight_expression.split("/")
-                    if len(we_parts) > 2:
-                        raise ValueError
-                        # raise NewickReader.NewickReaderInvalidValueError(
-                        #         message="Invalid tree weight expression: '{}'".format(weight_expression),
-                        #         line_num=nexus_tokenizer.token_line_num,
-                        #         col_num=nexus_tokenizer.token_column_num,
-                        #         stream=nexus_tokenizer.src)
-                    elif len(we_parts) == 2:
-                        x = float(we_parts[0])
-                        y = float(we_parts[1])
-                        tree.weight = x/y
-                    else:
-                        tree.weight = float(we_parts[0])
-                    weighting_token_found = True
-                except ValueError:
-                    exc = NewickReader.NewickReaderInvalidValueError(
-                            message="Invalid tree weight expression: '{}'".format(stripped_comment),
-                            line_num=nexus_tokenizer.token_line_num,
-                            col_num=nexus_tokenizer.token_column_num,
-                            stream=nexus_tokenizer.src)
-                    exc.__context__ = None # Python 3.0, 3.1, 3.2
-                    exc.__cause__ = None # Python 3.3, 3.4
-                    raise exc
-            elif self.extract_comment_metadata and comment.startswith("&"):
-                annotations = nexusprocessing.parse_comment_metadata_to_annotations(
-                    comment=comment)
-                if annotations:
-                    tree.annotations.update(annotations)
-                else:
-                    tree.comments.append(comment)
+                tree.weight = self._parse_tree_weight(stripped_comment, nexus_tokenizer)
+                weighting_token_found = True
+            elif self.extract_comment_metadata and nexusprocessing.has_comment_metadata(comment):
+                tree.add_deferred_annotations(comment,
+                        nexusprocessing.parse_comment_metadata_to_annotations)
             else:
                 tree.comments.append(comment)
         if not rooting_token_found:
@@ -449,6 +568,42 @@ class NewickReader(ioservice.DataReader):
         if self.store_tree_weights and not weighting_token_found:
             tree.weight = self.default_tree_weight
 
+    def _parse_tree_weight(self, stripped_comment, nexus_tokenizer):
+        """
+        Returns the tree weight given by a "[&W ...]" comment.
+        """
+        try:
+            weight_expression = stripped_comment[2:]
+            if not weight_expression:
+                raise ValueError
+            we_parts = weight_expression.split("/")
+            if len(we_parts) > 2:
+                raise ValueError
+                # raise NewickReader.NewickReaderInvalidValueError(
+                #         message="Invalid tree weight expression: '{}'".format(weight_expression),
+                #         line_num=nexus_tokenizer.token_line_num,
+                #         col_num=nexus_tokenizer.token_column_num,
+                #         stream=nexus_tokenizer.src)
+            elif len(we_parts) == 2:
+                x = float(we_parts[0])
+                y = float(we_parts[1])
+                return x/y
+            else:
+                return float(we_parts[0])
+        except ValueError:
+            if nexus_tokenizer is not None:
+                exc = NewickReader.NewickReaderInvalidValueError(
+                        message="Invalid tree weight expression: '{}'".format(stripped_comment),
+                        line_num=nexus_tokenizer.token_line_num,
+                        col_num=nexus_tokenizer.token_column_num,
+                        stream=nexus_tokenizer.src)
+            else:
+                exc = NewickReader.NewickReaderInvalidValueError(
+                        message="Invalid tree weight expression: '{}'".format(stripped_comment))
+            exc.__context__ = None # Python 3.0, 3.1, 3.2
+            exc.__cause__ = None # Python 3.3, 3.4
+            raise exc
+
     def _parse_tree_rooting_state(self, rooting_comment=None):
         """
         Returns rooting state for tree with given rooting comment token, taking
@@ -602,9 +757,9 @@ class NewickReader(ioservice.DataReader):
                 self._finish_node(current_node)
                 return current_node
             elif nexus_tokenizer.current_token == ";": #256
-                # end of tree statement
+                # end of tree statement: the token stream is advanced past it
+                # by the calling code
                 self._tree_statement_complete = True
-                nexus_tokenizer.next_token()
                 break
             elif nexus_tokenizer.current_token == ",": #260
                 # end of this node
@@ -671,3 +826,932 @@ class NewickReader(ioservice.DataReader):
     def _finish_node(self, node):
         if self.finish_node_fn is not None:
             self.finish_node_fn(node)
+
+    ###########################################################################
+    ## Statement Parser Engine
+
+    # number of characters to read from the source stream at a time
+    statement_block_size = 65536
+
+    # whitespace, then: a captured delimiter (group 1), an opening quote (group
+    # 2), or an unquoted token (group 3) or comment (group 4)
+    _statement_token_pattern = re.compile(
+            "[ \\t\\n\\r]*(?:"
+            "([(),;:{}=\\\\\"])"
+            "|(')"
+            "|([^ \\t\\n\\r(),;:{}=\\\\\"'\\[][^ \\t\\n\\r(),;:{}=\\\\\"\\[]*)?(\\[)?"
+            ")")
+    # continuation of an unquoted token following a comment
+    _statement_unquoted_pattern = re.compile("[^ \\t\\n\\r(),;:{}=\\\\\"\\[]*")
+    _statement_comment_delimiter_pattern = re.compile("[\\[\\]]")
+    # characters that may end a statement, begin a quoted token or begin a
+    # comment, and the delimiters after which a quote begins a quoted token
+    _statement_skip_pattern = re.compile("[;'\\[]")
+    _statement_delimiters = " \t\n\r(),;:{}=\\\""
+
+    def _statement_parser_tree_iter(self,
+            stream,
+            tree_factory,
+            taxon_symbol_map_fn,
+            tree_offset=0,
+            tree_stride=1):
+        """
+        Iterator that yields trees in NEWICK-formatted source, using the
+        'statement' parser engine.
+        """
+        buf = ""
+        pos = 0
+        line_num = 1
+        col_offset = 0
+        is_src_exhausted = False
+        tree_idx = 0
+        parse_cache = self.parse_cache
+        if parse_cache is not None:
+            parse_cache_hasher = self._create_parse_cache_hasher()
+        while True:
+            is_skipped = tree_idx < tree_offset or (tree_idx - tree_offset) % tree_stride != 0
+            if is_skipped or parse_cache is not None:
+                # with the parse cache, only the end of the statement is
+                # needed to look it up: it is split into tokens only if it is
+                # not found
+                scanned = self._skip_tree_statement_str(
+                        statement_str=buf,
+                        pos=pos,
+                        is_final=is_src_exhausted,
+                        stream=stream,
+                        line_num=line_num,
+                        col_offset=col_offset)
+            else:
+                scanned = self._scan_tree_statement(
+                        statement_str=buf,
+                        pos=pos,
+                        is_final=is_src_exhausted,
+                        stream=stream,
+                        line_num=line_num,
+                        col_offset=col_offset)
+            if scanned is None:
+                # statement not terminated within the buffer: extend it; the
+                # amount read grows with the size of the (incomplete)
+                # statement so that very large trees do not get rescanned too
+                # many times
+                block = stream.read(max(self.statement_block_size, len(buf) - pos))
+                if not block:
+                    is_src_exhausted = True
+                else:
+                    last_newline = buf.rfind("\n", 0, pos)
+                    if last_newline < 0:
+                        col_offset += pos
+                    else:
+                        col_offset = pos - last_newline
+                    line_num += buf.count("\n", 0, pos)
+                    buf = buf[pos:] + block
+                    pos = 0
+                continue
+            if is_skipped or parse_cache is not None:
+                end, is_tree = scanned
+                if not is_tree:
+                    if end >= len(buf) and is_src_exhausted:
+                        break
+                    pos = end
+                    continue
+                tree_idx += 1
+                if is_skipped:
+                    pos = end
+                    continue
+                hasher = parse_cache_hasher.copy()
+                statement = buf[pos:end].strip()
+                if not isinstance(statement, bytes):
+                    statement = statement.encode("utf-8")
+                hasher.update(statement)
+                key = hasher.digest()
+                tree = tree_factory()
+                record = parse_cache.get(key, tree.taxon_namespace)
+                if record is not None:
+                    self._build_tree_from_parse_cache_record(tree, record)
+                else:
+                    tokens, token_comments, token_offsets, end = self._scan_tree_statement(
+                            statement_str=buf,
+                            pos=pos,
+                            is_final=is_src_exhausted,
+                            stream=stream,
+                            line_num=line_num,
+                            col_offset=col_offset)
+                    self._build_tree_from_statement_tokens_fn()(
+                            tokens=tokens,
+                            token_comments=token_comments,
+                            token_offsets=token_offsets,
+                            statement_str=buf,
+                            line_num=line_num,
+                            col_offset=col_offset,
+                            stream=stream,
+                            tree_factory=lambda: tree,
+                            taxon_symbol_map_fn=taxon_symbol_map_fn)
+                    record, num_nodes = self._compose_parse_cache_record(tree)
+                    if record is not None:
+                        parse_cache.add(key, tree.taxon_namespace, record, num_nodes)
+                yield tree
+                pos = end
+                continue
+            tokens, token_comments, token_offsets, end = scanned
+            if not tokens:
+                break
+            if tokens[0] != ";":
+                tree_idx += 1
+                tree = self._build_tree_from_statement_tokens_fn()(
+                        tokens=tokens,
+                        token_comments=token_comments,
+                        token_offsets=token_offsets,
+                        statement_str=buf,
+                        line_num=line_num,
+                        col_offset=col_offset,
+                        stream=stream,
+                        tree_factory=tree_factory,
+                        taxon_symbol_map_fn=taxon_symbol_map_fn)
+                yield tree
+            pos = end
+
+    def _build_tree_from_statement_tokens_fn(self):
+        """
+        Returns the method that builds trees from the tokens of tree
+        statements: :meth:`NewickReader._build_tree_from_statement_tokens()`
+        or, with ``structure_only``,
+        :meth:`NewickReader._build_compact_tree_from_statement_tokens()`.
+        """
+        if self.structure_only:
+            return self._build_compact_tree_from_statement_tokens
+        return self._build_tree_from_statement_tokens
+
+    def _create_parse_cache_hasher(self):
+        """
+        Returns a hash object that has been fed the settings that affect the
+        trees built from tree statements, to be copied and fed each
+        statement to obtain its key in the parse cache.
+        """
+        settings = (
+                self.structure_only,
+                self.rooting,
+                self.edge_length_type,
+                self.suppress_edge_lengths,
+                self.extract_comment_metadata,
+                self.store_tree_weights,
+                self.default_tree_weight,
+                self.case_sensitive_taxon_labels,
+                self.preserve_unquoted_underscores,
+                self.suppress_internal_node_taxa,
+                self.suppress_leaf_node_taxa,
+                self.terminating_semicolon_required,
+                )
+        return hashlib.sha1(repr(settings).encode("utf-8"))
+
+    def _compose_parse_cache_record(self, tree):
+        """
+        Returns a tuple consisting of a record of the tree ``tree``, just
+        built from a tree statement, from which
+        :meth:`NewickReader._build_tree_from_parse_cache_record()` builds
+        copies of it, and the number of nodes of the tree. The record is
+        |None| if the tree cannot be recorded.
+        """
+        if self.structure_only:
+            # copies, as the arrays of the tree may be modified
+            record = (tree.is_rooted,
+                    tree.weight,
+                    tree.parent_indexes[:],
+                    tree.edge_lengths[:],
+                    tuple(tree.node_taxa))
+            return record, len(tree.parent_indexes)
+        deferred_annotations = self._get_deferred_annotations(tree)
+        if deferred_annotations is False:
+            return None, 0
+        rows = []
+        stack = [(tree.seed_node, -1)]
+        while stack:
+            node, parent_idx = stack.pop()
+            node_deferred_annotations = self._get_deferred_annotations(node)
+            if node_deferred_annotations is False:
+                return None, 0
+            idx = len(rows)
+            rows.append((parent_idx,
+                    node.label,
+                    node.taxon,
+                    node.edge.length,
+                    tuple(node.comments) if node.comments else None,
+                    node_deferred_annotations))
+            for child in reversed(node._child_nodes):
+                stack.append((child, idx))
+        record = (tree.is_rooted,
+                tree.weight,
+                tuple(tree.comments) if tree.comments else None,
+                deferred_annotations,
+                rows)
+        return record, len(rows)
+
+    def _get_deferred_annotations(self, item):
+        """
+        Returns a tuple of the (unparsed) metadata comments added to ``item``
+        (see :meth:`Annotable.add_deferred_annotations()`), |None| if there
+        are none, or |False| if its annotations have already been parsed.
+        """
+        annotations = getattr(item, "_annotations", None)
+        if annotations is None:
+            return None
+        if isinstance(annotations, list):
+            return tuple(annotations)
+        if len(annotations) == 0:
+            return None
+        return False
+
+    def _build_tree_from_parse_cache_record(self, tree, record):
+        """
+        Populates the newly-created tree ``tree`` from a record composed by
+        :meth:`NewickReader._compose_parse_cache_record()`.
+        """
+        if self.structure_only:
+            tree.is_rooted, tree.weight, parent_indexes, edge_lengths, node_taxa = record
+            tree.parent_indexes = parent_indexes[:]
+            tree.edge_lengths = edge_lengths[:]
+            tree.node_taxa = list(node_taxa)
+            return tree
+        tree.is_rooted, tree.weight, comments, deferred_annotations, rows = record
+        if comments:
+            tree.comments.extend(comments)
+        if deferred_annotations:
+            for source, parse_fn in deferred_annotations:
+                tree.add_deferred_annotations(source, parse_fn)
+        node_factory = tree.node_factory
+        nodes = []
+        for parent_idx, label, taxon, edge_length, comments, deferred_annotations in rows:
+            if parent_idx < 0:
+                node = tree.seed_node
+            else:
+                node = node_factory()
+                nodes[parent_idx].add_child(node)
+            nodes.append(node)
+            if label is not None:
+                node.label = label
+            if taxon is not None:
+                node.taxon = taxon
+            if edge_length is not None:
+                node.edge.length = edge_length
+            if comments:
+                node.comments.extend(comments)
+            if deferred_annotations:
+                for source, parse_fn in deferred_annotations:
+                    node.add_deferred_annotations(source, parse_fn)
+        return tree
+
+    def _statement_line_col(self, statement_str, line_num, col_offset, offset):
+        """
+        Returns the line and column number of the character at position
+        ``offset`` of ``statement_str``, which begins on line ``line_num``
+        of the source, following ``col_offset`` columns of that line. These
+        follow the conventions of |Tokenizer|: a newline character is counted
+        as the first column of the line that it begins, and a position at the
+        end of ``statement_str`` is reported as that of its last character.
+        """
+        if offset >= len(statement_str):
+            offset = len(statement_str) - 1
+        if offset < 0:
+            return line_num, col_offset
+        line_num = line_num + statement_str.count("\n", 0, offset + 1)
+        last_newline = statement_str.rfind("\n", 0, offset + 1)
+        if last_newline < 0:
+            return line_num, col_offset + offset + 1
+        return line_num, offset - last_newline + 1
+
+    def _unterminated_comment_error(self, statement_str, line_num, col_offset, stream):
+        """
+        Returns the error raised when the source ends within a comment of
+        ``statement_str``.
+        """
+        err_line_num, err_col_num = self._statement_line_col(statement_str, line_num, col_offset, len(statement_str))
+        return tokenizer.Tokenizer.UnexpectedEndOfStreamError(
+                message="Unexpected end of stream in comment",
+                line_num=err_line_num,
+                col_num=err_col_num,
+                stream=stream)
+
+    def _skip_tree_statement_str(self, statement_str, pos, is_final, stream, line_num, col_offset):
+        """
+        Finds the end of the tree statement beginning at position ``pos`` of
+        ``statement_str`` without splitting it into tokens, but respecting
+        quoted tokens and comments as :meth:`NewickReader._scan_tree_statement()`
+        does. Returns a tuple consisting of the position following the
+        terminating semi-colon (or the end of ``statement_str``, if there is
+        none) and whether or not the statement has any content other than
+        comments. If ``is_final`` is |False|, then |None| is returned if the
+        statement is not terminated within ``statement_str``.
+        """
+        s = statement_str
+        slen = len(s)
+        skip_pattern_search = self._statement_skip_pattern.search
+        comment_delimiter_search = self._statement_comment_delimiter_pattern.search
+        delimiters = self._statement_delimiters
+        has_content = False
+        is_token_start = True
+        while True:
+            m = skip_pattern_search(s, pos)
+            if m is None:
+                if not is_final:
+                    return None
+                if not has_content and s[pos:].strip():
+                    has_content = True
+                return slen, has_content
+            idx = m.start()
+            if idx > pos:
+                if not has_content and s[pos:idx].strip():
+                    has_content = True
+                is_token_start = s[idx-1] in delimiters
+            c = s[idx]
+            pos = idx + 1
+            if c == ";":
+                return pos, has_content
+            elif c == "[":
+                nesting = 1
+                while nesting:
+                    cm = comment_delimiter_search(s, pos)
+                    if cm is None:
+                        if not is_final:
+                            return None
+                        raise self._unterminated_comment_error(s, line_num, col_offset, stream)
+                    pos = cm.end()
+                    if cm.group() == "[":
+                        nesting += 1
+                    else:
+                        nesting -= 1
+                is_token_start = False
+            elif is_token_start:
+                has_content = True
+                while True:
+                    end = s.find("'", pos)
+                    if end < 0 or (end + 1 >= slen and not is_final):
+                        if not is_final:
+                            return None
+                        err_line_num, err_col_num = self._statement_line_col(s, line_num, col_offset, slen)
+                        raise tokenizer.Tokenizer.UnterminatedQuoteError(
+                                quote_char="'",
+                                line_num=err_line_num,
+                                col_num=err_col_num,
+                                stream=stream)
+                    pos = end + 1
+                    if s.startswith("'", pos):
+                        pos += 1
+                    else:
+                        break
+            else:
+                has_content = True
+                is_token_start = False
+
+    def _scan_tree_statement(self, statement_str, pos, is_final, stream, line_num, col_offset):
+        """
+        Splits the tree statement beginning at position ``pos`` of
+        ``statement_str`` into tokens, following the same tokenization rules
+        as |NexusTokenizer|. Returns a tuple consisting of a list of tokens, a
+        list of the comments preceding each token (or |None| if there are
+        none), a list of the positions of each token, and the position
+        following the terminating semi-colon. If ``is_final`` is |False|,
+        then |None| is returned if the statement (or a token, comment or
+        quoted string within it) is not terminated within ``statement_str``.
+        """
+        tokens = []
+        token_comments = []
+        token_offsets = []
+        comments = None
+        s = statement_str
+        slen = len(s)
+        token_pattern_match = self._statement_token_pattern.match
+        unquoted_pattern_match = self._statement_unquoted_pattern.match
+        preserve_unquoted_underscores = self.preserve_unquoted_underscores
+        while True:
+            m = token_pattern_match(s, pos)
+            delimiter, quote, token, comment_begin = m.groups()
+            if delimiter is not None:
+                tokens.append(delimiter)
+                token_comments.append(comments)
+                token_offsets.append(m.start(1))
+                comments = None
+                pos = m.end()
+                if delimiter == ";":
+                    break
+            elif quote is not None:
+                offset = m.start(2)
+                pos = m.end()
+                parts = []
+                while True:
+                    end = s.find("'", pos)
+                    if end < 0 or (end + 1 >= slen and not is_final):
+                        # an unterminated quote, or one that may be escaped
+                        # by a character not yet read
+                        if not is_final:
+                            return None
+                        err_line_num, err_col_num = self._statement_line_col(s, line_num, col_offset, slen)
+                        raise tokenizer.Tokenizer.UnterminatedQuoteError(
+                                quote_char="'",
+                                line_num=err_line_num,
+                                col_num=err_col_num,
+                                stream=stream)
+                    parts.append(s[pos:end])
+                    pos = end + 1
+                    if s.startswith("'", pos):
+                        parts.append("'")
+                        pos += 1
+                    else:
+                        break
+                tokens.append("".join(parts))
+                token_comments.append(comments)
+                token_offsets.append(offset)
+                comments = None
+            elif token is not None or comment_begin is not None:
+                offset = m.start(3) if token is not None else m.start(4)
+                pos = m.end()
+                if comment_begin is not None:
+                    parts = [token] if token is not None else []
+                    while True:
+                        # comment within or before an unquoted token
+                        nesting = 1
+                        comment_parts = []
+                        while True:
+                            cm = self._statement_comment_delimiter_pattern.search(s, pos)
+                            if cm is None:
+                                if not is_final:
+                                    return None
+                                raise self._unterminated_comment_error(s, line_num, col_offset, stream)
+                            end = cm.start()
+                            comment_parts.append(s[pos:end])
+                            pos = end + 1
+                            if s[end] == "]":
+                                nesting -= 1
+                                if nesting <= 0:
+                                    break
+                            else:
+                                nesting += 1
+                        if comments is None:
+                            comments = []
+                        comments.append("".join(comment_parts))
+                        end = unquoted_pattern_match(s, pos).end()
+                        if end > pos:
+                            parts.append(s[pos:end])
+                            pos = end
+                        if not s.startswith("[", pos):
+                            break
+                        pos += 1
+                    token = "".join(parts)
+                if pos >= slen and not is_final:
+                    # token may continue into characters not yet read
+                    return None
+                if not token:
+                    # only comments
+                    continue
+                if not preserve_unquoted_underscores and "_" in token:
+                    token = token.replace("_", " ")
+                tokens.append(token)
+                token_comments.append(comments)
+                token_offsets.append(offset)
+                comments = None
+            else:
+                # only whitespace remains
+                if not is_final:
+                    return None
+                pos = slen
+                break
+        return tokens, token_comments, token_offsets, pos
+
+    def _build_tree_from_statement_tokens(self,
+            tokens,
+            token_comments,
+            token_offsets,
+            statement_str,
+            line_num,
+            col_offset,
+            stream,
+            tree_factory,
+            taxon_symbol_map_fn):
+        """
+        Constructs a Tree object from the tokens of a single tree statement.
+        This follows exactly the same logic as the 'standard' parser engine
+        (see :meth:`NewickReader._parse_tree_statement()` and
+        :meth:`NewickReader._parse_tree_node_description()`), but maintains an
+        explicit stack of partially-constructed ancestor nodes instead of
+        recursing.
+        """
+        ntokens = len(tokens)
+        extract_comment_metadata = self.extract_comment_metadata
+        process_comments_for_item = nexusprocessing.process_comments_for_item
+        finish_node_fn = self.finish_node_fn
+
+        def _error(error_type, message, idx):
+            if idx < ntokens:
+                offset = token_offsets[idx]
+            else:
+                offset = len(statement_str)
+            err_line_num, err_col_num = self._statement_line_col(statement_str, line_num, col_offset, offset)
+            return error_type(
+                    message=message,
+                    line_num=err_line_num,
+                    col_num=err_col_num,
+                    stream=stream)
+
+        def _unexpected_end_of_stream_error():
+            exc = _error(tokenizer.Tokenizer.UnexpectedEndOfStreamError,
+                    "Unexpected end of stream",
+                    ntokens)
+            exc.__context__ = None # Python 3.0, 3.1, 3.2
+            exc.__cause__ = None # Python 3.3, 3.4
+            return exc
+
+        idx = 0
+        token = tokens[0]
+        tree_comments = token_comments[0]
+        captured = []
+        if token != "(":
+            # allow for possibility of single node tree, e.g.: T0:10;
+            parenthesis_nesting_level = 0
+        else:
+            parenthesis_nesting_level = 1
+        tree = tree_factory()
+        self._process_tree_comments(tree, tree_comments, None)
+        node_factory = tree.node_factory
+        seen_taxa = set()
+        tree_statement_complete = False
+
+        # stack of (node, is_internal_node, node_created) of ancestors of the
+        # node currently being parsed
+        stack = []
+        current_node = tree.seed_node
+        is_internal_node = None
+        node_created = False
+        in_child_nodes = token == "("
+        if in_child_nodes:
+            idx += 1
+            if idx >= ntokens:
+                raise _unexpected_end_of_stream_error()
+            token = tokens[idx]
+            if token_comments[idx]:
+                captured.extend(token_comments[idx])
+        while True:
+            if in_child_nodes:
+                if token == ",":
+                    if not node_created: #184
+                        # no node has been created yet: ',' designates a
+                        # preceding blank node
+                        new_node = node_factory()
+                        process_comments_for_item(new_node, captured, extract_comment_metadata)
+                        captured = []
+                        if finish_node_fn is not None:
+                            finish_node_fn(new_node)
+                        current_node.add_child(new_node)
+                    while True:
+                        idx += 1
+                        if idx >= ntokens:
+                            raise _unexpected_end_of_stream_error()
+                        token = tokens[idx]
+                        if token_comments[idx]:
+                            captured.extend(token_comments[idx])
+                        if token != ",":
+                            break
+                        # another blank node
+                        new_node = node_factory()
+                        process_comments_for_item(new_node, captured, extract_comment_metadata)
+                        captured = []
+                        if finish_node_fn is not None:
+                            finish_node_fn(new_node)
+                        current_node.add_child(new_node)
+                    if not node_created and token == ")": #200
+                        # end of node
+                        new_node = node_factory()
+                        process_comments_for_item(new_node, captured, extract_comment_metadata)
+                        captured = []
+                        if finish_node_fn is not None:
+                            finish_node_fn(new_node)
+                        current_node.add_child(new_node)
+                        node_created = True
+                    continue
+                elif token == ")": #206
+                    # end of child nodes
+                    parenthesis_nesting_level -= 1
+                    idx += 1
+                    if idx >= ntokens:
+                        raise _unexpected_end_of_stream_error()
+                    token = tokens[idx]
+                    if token_comments[idx]:
+                        captured.extend(token_comments[idx])
+                    in_child_nodes = False
+                else: #210
+                    # assume child nodes: a leaf node (if a label) or
+                    # internal (if a parenthesis)
+                    new_node = node_factory()
+                    process_comments_for_item(new_node, captured, extract_comment_metadata)
+                    captured = []
+                    stack.append((current_node, is_internal_node, node_created))
+                    current_node = new_node
+                    node_created = False
+                    if token == "(":
+                        parenthesis_nesting_level += 1
+                        is_internal_node = True
+                        idx += 1
+                        if idx >= ntokens:
+                            raise _unexpected_end_of_stream_error()
+                        token = tokens[idx]
+                        if token_comments[idx]:
+                            captured.extend(token_comments[idx])
+                        continue
+                    is_internal_node = False
+
+            # label, edge length and comments of the current node
+            label_parsed = False
+            tree_statement_complete = False
+            if is_internal_node is None:
+                # the root node: internal if there are children; this
+                # allows for a single-tip tree
+                if current_node._child_nodes:
+                    is_internal_node = True
+            current_node_comments = []
+            is_node_closed = False
+            while True:
+                if captured:
+                    current_node_comments.extend(captured)
+                    captured = []
+                if token == ":": #246
+                    idx += 1
+                    if idx >= ntokens:
+                        raise _unexpected_end_of_stream_error()
+                    token = tokens[idx]
+                    if token_comments[idx]:
+                        captured.extend(token_comments[idx])
+                    if not self.suppress_edge_lengths:
+                        try:
+                            edge_length = self.edge_length_type(token)
+                        except ValueError:
+                            raise _error(NewickReader.NewickReaderMalformedStatementError,
+                                    "Invalid edge length: '{}'".format(token),
+                                    idx)
+                        current_node.edge.length = edge_length
+                    idx += 1
+                    if idx >= ntokens:
+                        if self.terminating_semicolon_required:
+                            exc = _unexpected_end_of_stream_error()
+                            exc.message = exc.message + ". (Perhaps the terminating semicolon for the tree statement is missing? If so, add a semicolon to the tree statement or specify 'terminating_semicolon_required=False' to allow for missing semicolons)"
+                            raise exc
+                        else:
+                            tree_statement_complete = True
+                            break
+                    token = tokens[idx]
+                    if token_comments[idx]:
+                        captured.extend(token_comments[idx])
+                elif token == ")" or token == ",": #253, #260
+                    # closing of parent token or end of this node
+                    is_node_closed = True
+                    break
+                elif token == ";": #256
+                    # end of tree statement
+                    tree_statement_complete = True
+                    break
+                elif token == "(": #263
+                    # start of another node or tree without finishing this
+                    # node
+                    parenthesis_nesting_level += 1
+                    raise _error(NewickReader.NewickReaderMalformedStatementError,
+                            "Malformed tree statement",
+                            idx)
+                else: #267
+                    # label
+                    if label_parsed: #269
+                        raise _error(NewickReader.NewickReaderMalformedStatementError,
+                                "Expecting ':', ')', ',' or ';' after reading label but found '{}'".format(token),
+                                idx)
+                    if ( (is_internal_node and self.suppress_internal_node_taxa)
+                            or ((not is_internal_node) and self.suppress_leaf_node_taxa) ):
+                        current_node.label = token
+                    else:
+                        node_taxon = taxon_symbol_map_fn(token)
+                        if node_taxon in seen_taxa:
+                            raise _error(NewickReader.NewickReaderDuplicateTaxonError,
+                                    node_taxon.label,
+                                    idx)
+                        seen_taxa.add(node_taxon)
+                        current_node.taxon = node_taxon
+                    label_parsed = True
+                    idx += 1
+                    if idx >= ntokens:
+                        if self.terminating_semicolon_required:
+                            raise _unexpected_end_of_stream_error()
+                        else:
+                            break
+                    token = tokens[idx]
+                    if token_comments[idx]:
+                        captured.extend(token_comments[idx])
+            if not is_node_closed and parenthesis_nesting_level != 0:
+                ## if we are here, we have reached the end of the tree
+                raise _error(NewickReader.NewickReaderMalformedStatementError,
+                        "Unbalanced parentheses at tree statement termination: balance index = {}".format(parenthesis_nesting_level),
+                        idx)
+            process_comments_for_item(current_node, current_node_comments, extract_comment_metadata)
+            if finish_node_fn is not None:
+                finish_node_fn(current_node)
+            if not stack:
+                break
+            new_node = current_node
+            current_node, is_internal_node, node_created = stack.pop()
+            current_node.add_child(new_node)
+            node_created = True
+            in_child_nodes = True
+        if not tree_statement_complete:
+            raise _error(NewickReader.NewickReaderIncompleteTreeStatementError,
+                    "Incomplete or improperly-terminated tree statement (last character read was '{}' instead of a semi-colon ';')".format(token),
+                    idx)
+        return tree
+
+    ###########################################################################
+    ## Structure-Only Parsing
+
+    def _process_compact_tree_comments(self, tree, tree_comments, nexus_tokenizer=None):
+        rooting_comment = ""
+        if self.store_tree_weights:
+            tree.weight = self.default_tree_weight
+        if tree_comments:
+            for comment in tree_comments:
+                stripped_comment = comment.strip()
+                if stripped_comment in ["&u", "&U", "&r", "&R"]:
+                    rooting_comment = stripped_comment
+                elif (self.store_tree_weights
+                        and (stripped_comment.startswith("&W ") or stripped_comment.startswith("&w "))
+                        ):
+                    tree.weight = self._parse_tree_weight(stripped_comment, nexus_tokenizer)
+        tree.is_rooted = self._parse_tree_rooting_state(rooting_comment)
+
+    def _parse_compact_tree_statement(self,
+            nexus_tokenizer,
+            tree_factory,
+            taxon_symbol_map_fn,
+            is_lookahead_deferred=False):
+        """
+        Parses a single tree statement from a token stream into a
+        |CompactTree| object returned by ``tree_factory``. The tokenizer is
+        expected to be positioned as for
+        :meth:`NewickReader._parse_tree_statement()`, and is left positioned
+        in the same way.
+        """
+        current_token = nexus_tokenizer.current_token
+        tree_comments = nexus_tokenizer.pull_captured_comments()
+        while (current_token == ";" or current_token is None) and not nexus_tokenizer.is_eof():
+            current_token = nexus_tokenizer.require_next_token()
+            tree_comments = nexus_tokenizer.pull_captured_comments()
+        if nexus_tokenizer.is_eof():
+            return None
+        tree = tree_factory()
+        self._process_compact_tree_comments(tree, tree_comments, nexus_tokenizer)
+        def _error(error_type, message):
+            return error_type(
+                    message=message,
+                    line_num=nexus_tokenizer.token_line_num,
+                    col_num=nexus_tokenizer.token_column_num,
+                    stream=nexus_tokenizer.src)
+        capture_comments = nexus_tokenizer.capture_comments
+        nexus_tokenizer.capture_comments = False
+        try:
+            self._build_compact_tree(
+                    tree=tree,
+                    token=current_token,
+                    next_token_fn=nexus_tokenizer.next_token,
+                    taxon_symbol_map_fn=taxon_symbol_map_fn,
+                    error_fn=_error)
+        finally:
+            nexus_tokenizer.capture_comments = capture_comments
+        if not is_lookahead_deferred:
+            self._consume_tree_statement_end(nexus_tokenizer)
+        return tree
+
+    def _build_compact_tree_from_statement_tokens(self,
+            tokens,
+            token_comments,
+            token_offsets,
+            statement_str,
+            line_num,
+            col_offset,
+            stream,
+            tree_factory,
+            taxon_symbol_map_fn):
+        """
+        Constructs a |CompactTree| object from the tokens of a single tree
+        statement (see :meth:`NewickReader._scan_tree_statement()`).
+        """
+        ntokens = len(tokens)
+        # |None| marks the end of the statement
+        token_iter = iter(tokens + [None])
+        def _error(error_type, message):
+            # index of the last token delivered
+            idx = ntokens - token_iter.__length_hint__()
+            if idx < ntokens:
+                offset = token_offsets[idx]
+            else:
+                offset = len(statement_str)
+            err_line_num, err_col_num = self._statement_line_col(statement_str, line_num, col_offset, offset)
+            return error_type(
+                    message=message,
+                    line_num=err_line_num,
+                    col_num=err_col_num,
+                    stream=stream)
+        tree = tree_factory()
+        self._process_compact_tree_comments(tree, token_comments[0])
+        self._build_compact_tree(
+                tree=tree,
+                token=next(token_iter),
+                next_token_fn=functools.partial(next, token_iter, None),
+                taxon_symbol_map_fn=taxon_symbol_map_fn,
+                error_fn=_error)
+        return tree
+
+    def _build_compact_tree(self,
+            tree,
+            token,
+            next_token_fn,
+            taxon_symbol_map_fn,
+            error_fn):
+        """
+        Populates the |CompactTree| object ``tree`` from the tokens of a tree
+        statement, given the first token, ``token``, and a function,
+        ``next_token_fn``, that returns each of the following tokens in turn
+        (or |None| once there are no more). The labels of internal nodes are
+        ignored. Parsing stops after the terminating semi-colon.
+        ``error_fn`` is called with an exception type and a message to create
+        exceptions, and is expected to supply the location of the most
+        recently read token.
+        """
+        nan = float("nan")
+        parent_indexes = [-1]
+        edge_lengths = [nan]
+        node_taxa = [None]
+        seen_taxa = set()
+        if self.suppress_edge_lengths:
+            edge_length_type = None
+        else:
+            edge_length_type = self.edge_length_type
+        current_idx = 0
+        parenthesis_nesting_level = 0
+        is_node_start = True
+        label_parsed = False
+        while True:
+            if token == "(":
+                if not is_node_start:
+                    raise error_fn(NewickReader.NewickReaderMalformedStatementError,
+                            "Malformed tree statement")
+                parenthesis_nesting_level += 1
+                parent_indexes.append(current_idx)
+                edge_lengths.append(nan)
+                node_taxa.append(None)
+                current_idx = len(parent_indexes) - 1
+            elif token == "," or token == ")":
+                if parenthesis_nesting_level == 0:
+                    raise error_fn(NewickReader.NewickReaderIncompleteTreeStatementError,
+                            "Incomplete or improperly-terminated tree statement (last character read was '{}' instead of a semi-colon ';')".format(token))
+                current_idx = parent_indexes[current_idx]
+                if token == ",":
+                    parent_indexes.append(current_idx)
+                    edge_lengths.append(nan)
+                    node_taxa.append(None)
+                    current_idx = len(parent_indexes) - 1
+                    is_node_start = True
+                else:
+                    parenthesis_nesting_level -= 1
+                    is_node_start = False
+                label_parsed = False
+            elif token == ":":
+                token = next_token_fn()
+                if token is None:
+                    raise error_fn(tokenizer.Tokenizer.UnexpectedEndOfStreamError,
+                            "Unexpected end of stream")
+                if edge_length_type is not None:
+                    try:
+                        edge_lengths[current_idx] = edge_length_type(token)
+                    except ValueError:
+                        raise error_fn(NewickReader.NewickReaderMalformedStatementError,
+                                "Invalid edge length: '{}'".format(token))
+                is_node_start = False
+            elif token == ";":
+                if parenthesis_nesting_level != 0:
+                    raise error_fn(NewickReader.NewickReaderMalformedStatementError,
+                            "Unbalanced parentheses at tree statement termination: balance index = {}".format(parenthesis_nesting_level))
+                break
+            elif token is None:
+                if self.terminating_semicolon_required or parenthesis_nesting_level != 0:
+                    raise error_fn(tokenizer.Tokenizer.UnexpectedEndOfStreamError,
+                            "Unexpected end of stream")
+                break
+            else:
+                if label_parsed:
+                    raise error_fn(NewickReader.NewickReaderMalformedStatementError,
+                            "Expecting ':', ')', ',' or ';' after reading label but found '{}'".format(token))
+                if current_idx == len(parent_indexes) - 1:
+                    # no nodes have been added since this one: a leaf
+                    node_taxon = taxon_symbol_map_fn(token)
+                    if node_taxon in seen_taxa:
+                        raise error_fn(NewickReader.NewickReaderDuplicateTaxonError,
+                                node_taxon.label)
+                    seen_taxa.add(node_taxon)
+                    node_taxa[current_idx] = node_taxon
+                label_parsed = True
+                is_node_start = False
+            token = next_token_fn()
+        tree.parent_indexes = array.array("l", parent_indexes)
+        tree.edge_lengths = array.array("d", edge_lengths)
+        tree.node_taxa = node_taxa
+        return tree
@@ -44,6 +44,14 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer
+            Number of trees at the beginning of each source to skip. These
+            trees are not parsed: the source is only scanned for the ends of
+            their tree statements.
+        tree_stride : integer
+            Only every ``tree_stride``-th tree of each source following the
+            first ``tree_offset`` trees will be yielded, with the trees in
+            between skipped without being parsed.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `newickreader.NexusReader`
             class. See `newickreader.NexusReader` for details.
@@ -51,24 +59,28 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", None),
+                tree_stride=kwargs.pop("tree_stride", None))
         self.newick_reader = newickreader.NewickReader(**kwargs)
 
     ###########################################################################
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
-        nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
-                preserve_unquoted_underscores=self.newick_reader.preserve_unquoted_underscores)
         taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(
                 taxon_namespace=self.attached_taxon_namespace,
                 enable_lookup_by_taxon_number=False,
                 case_sensitive=self.newick_reader.case_sensitive_taxon_labels)
-        while True:
-            tree = self.newick_reader._parse_tree_statement(
-                    nexus_tokenizer=nexus_tokenizer,
-                    tree_factory=self.tree_factory,
-                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+        current_tree_offset = self.tree_offset
+        for tree in self.newick_reader.tree_iter(
+                stream=stream,
+                taxon_symbol_mapper=taxon_symbol_mapper,
+                tree_factory=self.tree_factory,
+                tree_offset=self.tree_offset,
+                tree_stride=self.tree_stride):
             if tree is None:
                 break
+            self._current_tree_offset = current_tree_offset
+            current_tree_offset += self.tree_stride
             yield tree
@@ -279,15 +279,12 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
             char_matrix_factory=None,
             state_alphabet_factory=None,
             global_annotations_target=None):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
         self._taxon_namespace_factory = taxon_namespace_factory
         self._tree_list_factory = tree_list_factory
         self._char_matrix_factory = char_matrix_factory
         self._state_alphabet_factory = state_alphabet_factory
         self._global_annotations_target = global_annotations_target
-        self._parse_document(xml_doc)
+        self._parse_document(stream)
         self._product = self.Product(
                 taxon_namespaces=self._taxon_namespaces,
                 tree_lists=self._tree_lists,
@@ -334,88 +331,176 @@ class NexmlReader(ioservice.DataReader, _AnnotationParser):
 
     ## Following methods are class-specific ###
 
-    def _parse_document(self, xml_doc):
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
+    def _parse_document(self, stream):
+        tree_parser = _NexmlTreeParser(
+                id_taxon_map=self._id_taxon_map,
+                annotations_processor_fn=self._parse_annotations,
+                )
+        tree_list = None
+        for trees_idx, nxtrees, nxtree in self._iter_tree_elements(stream):
+            if self._tree_list_factory is None:
+                continue
+            if nxtree is None:
+                tree_list = self._parse_tree_list(nxtrees, trees_idx)
+            else:
+                tree_obj = tree_list.new_tree()
+                tree_parser.build_tree(tree_obj, nxtree, nxtrees.get('otus', None))
+
+    def _iter_tree_elements(self, stream):
+        """
+        Incrementally parses the NEXML document in ``stream``.
+
+        Taxon namespaces, character matrices (if ``self._char_matrix_factory``
+        is set) and global annotations (if ``self._global_annotations_target``
+        is set) are built as their elements are completed. Tree elements are
+        not built here, but yielded as tuples ``(trees_idx, nxtrees,
+        nxtree)`` as they are completed, where ``nxtrees`` is the enclosing
+        trees block element and ``trees_idx`` its index. At the beginning of
+        each trees block (i.e., just before its first tree, when its own
+        annotations are complete, or at its end if it has no trees), a tuple
+        with ``nxtree`` being |None| is yielded.
+
+        Elements are removed from the document as soon as they have been
+        processed (for tree elements, when the iteration is resumed), so that
+        the memory used is bounded by the size of the largest tree or row of
+        a character matrix rather than by that of the whole document.
+        """
+        if self.default_namespace:
+            namespace = "{%s}" % self.default_namespace
+        else:
+            namespace = ""
+        otus_tag = namespace + "otus"
+        characters_tag = namespace + "characters"
+        format_tag = namespace + "format"
+        matrix_tag = namespace + "matrix"
+        row_tag = namespace + "row"
+        trees_tag = namespace + "trees"
+        tree_tag = namespace + "tree"
+        meta_tag = namespace + "meta"
+        wrap = self._subelement_factory
+        self._namespace_registry = xmlprocessing.XmlNamespaces()
         if self._char_matrix_factory is not None:
-            self._parse_char_matrices(xml_root)
-        if self._tree_list_factory is not None:
-            self._parse_tree_lists(xml_root)
-        if self._global_annotations_target is not None:
-            top_annotations = [i for i in xml_root.findall_annotations()]
-            for annotation in top_annotations:
-                self._parse_annotations(self._global_annotations_target, annotation)
-
-    def _parse_taxon_namespaces(self, xml_root):
-        for nxtaxa in xml_root.iter_otus():
-            taxon_namespace_label = nxtaxa.get('label', None)
-            taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
-            taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
-            self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
-            annotations = [i for i in nxtaxa.findall_annotations()]
-            for annotation in annotations:
-                self._parse_annotations(taxon_namespace, annotation)
-            if self.case_sensitive_taxon_labels:
-                label_taxon_map = {}
+            char_block_parser = _NexmlCharBlockParser(self._namespace_registry,
+                    self._id_taxon_namespace_map,
+                    self._id_taxon_map,
+                    self._new_char_matrix,
+                    self._state_alphabet_factory)
+        else:
+            char_block_parser = None
+        root_element = None
+        chars_element = None
+        matrix_element = None
+        trees_element = None
+        trees_idx = -1
+        for event, element, parent in xmlprocessing.iterparse_elements(stream, self._namespace_registry):
+            tag = element.tag
+            if event == "start":
+                if root_element is None:
+                    root_element = element
+                elif tag == characters_tag:
+                    chars_element = element
+                    if char_block_parser is not None:
+                        char_block_parser.begin_char_matrix(wrap(element))
+                elif tag == matrix_tag and parent is chars_element:
+                    matrix_element = element
+                    if char_block_parser is not None:
+                        char_block_parser.begin_char_matrix_rows()
+                continue
+            if tag == tree_tag and parent is not None and parent.tag == trees_tag:
+                if parent is not trees_element:
+                    trees_element = parent
+                    trees_idx += 1
+                    yield trees_idx, wrap(parent), None
+                yield trees_idx, wrap(parent), wrap(element)
+            elif tag == row_tag and parent is matrix_element:
+                if char_block_parser is not None:
+                    char_block_parser.parse_char_row(wrap(element))
+            elif tag == meta_tag:
+                if parent is root_element:
+                    if self._global_annotations_target is not None:
+                        self._parse_annotations(self._global_annotations_target, wrap(element))
+                elif parent is chars_element:
+                    if char_block_parser is not None:
+                        char_block_parser.parse_char_matrix_annotation(wrap(element))
+                elif parent is matrix_element:
+                    if char_block_parser is not None:
+                        char_block_parser.parse_char_matrix_rows_annotation(wrap(element))
+                else:
+                    # processed (and freed) with the element it annotates
+                    continue
+            elif tag == format_tag and parent is chars_element:
+                if char_block_parser is not None:
+                    char_block_parser.parse_char_matrix_format(wrap(element))
+            elif tag == matrix_tag and element is matrix_element:
+                matrix_element = None
+            elif tag == characters_tag:
+                chars_element = None
+            elif tag == trees_tag:
+                if element is not trees_element:
+                    trees_idx += 1
+                    yield trees_idx, wrap(element), None
+                trees_element = None
+            elif tag == otus_tag:
+                self._parse_taxon_namespace(wrap(element))
             else:
-                label_taxon_map = container.OrderedCaselessDict()
-            if self.attached_taxon_namespace is not None:
-                for t in taxon_namespace:
-                    label_taxon_map[t.label] = t
-            for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
-                taxon = None
-                taxon_label = nxtaxon.get('label', None)
-                taxon_oid = nxtaxon.get('id', id(nxtaxon))
-                if taxon_label is not None and self.attached_taxon_namespace is not None:
-                    # taxon = label_taxon_map.get_taxon(
-                    #         label=taxon_label,
-                    #         case_sensitive=self.case_sensitive_taxon_labels)
-                    try:
-                        taxon = label_taxon_map[taxon_label]
-                    except KeyError:
-                        taxon = None
-                if taxon is None:
-                    taxon = taxon_namespace.new_taxon(label=taxon_label)
-                annotations = [i for i in nxtaxon.findall_annotations()]
-                for annotation in annotations:
-                    self._parse_annotations(taxon, annotation)
-                self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
-
-    def _parse_char_matrices(self, xml_root):
-        nxc = _NexmlCharBlockParser(self._namespace_registry,
-                self._id_taxon_namespace_map,
-                self._id_taxon_map,
-                self._new_char_matrix,
-                self._state_alphabet_factory)
-        for char_matrix_element in xml_root.iter_characters():
-            nxc.parse_char_matrix(char_matrix_element)
-
-    def _parse_tree_lists(self, xml_root):
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            self._parse_tree_list(trees_element, trees_idx, True)
-
-    def _parse_tree_list(self, nxtrees, trees_idx=None, add_to_tree_list=True):
+                continue
+            if parent is not None:
+                parent.remove(element)
+
+    def _parse_taxon_namespace(self, nxtaxa):
+        taxon_namespace_label = nxtaxa.get('label', None)
+        taxon_namespace = self._new_taxon_namespace(label=taxon_namespace_label)
+        taxon_namespace_id = nxtaxa.get('id', id(taxon_namespace))
+        self._id_taxon_namespace_map[taxon_namespace_id] = taxon_namespace
+        annotations = [i for i in nxtaxa.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(taxon_namespace, annotation)
+        if self.case_sensitive_taxon_labels:
+            label_taxon_map = {}
+        else:
+            label_taxon_map = container.OrderedCaselessDict()
+        if self.attached_taxon_namespace is not None:
+            for t in taxon_namespace:
+                label_taxon_map[t.label] = t
+        for idx, nxtaxon in enumerate(nxtaxa.findall_otu()):
+            taxon = None
+            taxon_label = nxtaxon.get('label', None)
+            taxon_oid = nxtaxon.get('id', id(nxtaxon))
+            if taxon_label is not None and self.attached_taxon_namespace is not None:
+                # taxon = label_taxon_map.get_taxon(
+                #         label=taxon_label,
+                #         case_sensitive=self.case_sensitive_taxon_labels)
+                try:
+                    taxon = label_taxon_map[taxon_label]
+                except KeyError:
+                    taxon = None
+            if taxon is None:
+                taxon = taxon_namespace.new_taxon(label=taxon_label)
+            annotations = [i for i in nxtaxon.findall_annotations()]
+            for annotation in annotations:
+                self._parse_annotations(taxon, annotation)
+            self._id_taxon_map[(taxon_namespace_id, taxon_oid)] = taxon
+
+    def _get_tree_list_taxon_namespace(self, nxtrees, trees_idx=None):
         trees_id = nxtrees.get('id', "Trees" + str(trees_idx))
-        trees_label = nxtrees.get('label', None)
         otus_id = nxtrees.get('otus', None)
         if otus_id is None:
             raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
         taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
         if not taxon_namespace:
             raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
+        return taxon_namespace
+
+    def _parse_tree_list(self, nxtrees, trees_idx=None):
+        taxon_namespace = self._get_tree_list_taxon_namespace(nxtrees, trees_idx)
+        trees_label = nxtrees.get('label', None)
         tree_list = self._new_tree_list(
                 label=trees_label,
                 taxon_namespace=taxon_namespace)
         annotations = [i for i in nxtrees.findall_annotations()]
         for annotation in annotations:
             self._parse_annotations(tree_list, annotation)
-        tree_parser = _NexmlTreeParser(
-                id_taxon_map=self._id_taxon_map,
-                annotations_processor_fn=self._parse_annotations,
-                )
-        for tree_element in nxtrees.findall_tree():
-            tree_obj = tree_list.new_tree()
-            tree_parser.build_tree(tree_obj, tree_element, otus_id)
+        return tree_list
 
 class _NexmlTreeParser(object):
 
@@ -593,11 +678,47 @@ class _NexmlCharBlockParser(_AnnotationParser):
         self._char_types = []
         self._chartype_id_to_pos_map = {}
 
+        self._char_matrix = None
+        self._char_matrix_oid = None
+        self._char_matrix_otus_id = None
+        self._char_matrix_data_type = None
+        self._char_matrix_nxchartype = None
+        self._is_char_format_parsed = False
+
     def parse_char_matrix(self, nxchars):
         """
         Given an XmlElement representing a nexml characters block, this
         instantiates and returns a corresponding DendroPy CharacterMatrix object.
         """
+        char_matrix = self.begin_char_matrix(nxchars)
+        annotations = [i for i in nxchars.findall_annotations()]
+        for annotation in annotations:
+            self.parse_char_matrix_annotation(annotation)
+        nxformat = nxchars.find_char_format()
+        if nxformat is not None:
+            self.parse_char_matrix_format(nxformat)
+        self.begin_char_matrix_rows()
+        nxmatrix = nxchars.find_char_matrix()
+        annotations = [i for i in nxmatrix.findall_annotations()]
+        for annotation in annotations:
+            self.parse_char_matrix_rows_annotation(annotation)
+        for nxrow in nxmatrix.findall_char_row():
+            self.parse_char_row(nxrow)
+        # if fixed_state_alphabet:
+        #     char_matrix.remap_to_default_state_alphabet_by_symbol(purge_other_state_alphabets=True)
+        return char_matrix
+
+    ## The following methods parse a characters block piece by piece (in
+    ## document order), so that its elements can be parsed (and freed) as
+    ## they are completed when reading incrementally.
+
+    def begin_char_matrix(self, nxchars):
+        """
+        Given an XmlElement representing a nexml characters block (of which
+        only the attributes are needed), this instantiates and returns a
+        corresponding (empty) DendroPy CharacterMatrix object, to which
+        subsequently parsed annotations, format and rows will be added.
+        """
 
         # clear
         self._id_state_alphabet_map = {}
@@ -642,112 +763,127 @@ class _NexmlCharBlockParser(_AnnotationParser):
                 label=label,
                 **extra_kwargs)
 
-        # annotation processing
-        annotations = [i for i in nxchars.findall_annotations()]
-        for annotation in annotations:
-            self._parse_annotations(char_matrix, annotation)
+        self._char_matrix = char_matrix
+        self._char_matrix_oid = char_matrix_oid
+        self._char_matrix_otus_id = otus_id
+        self._char_matrix_data_type = data_type
+        self._char_matrix_nxchartype = nxchartype
+        self._is_char_format_parsed = False
+        return char_matrix
 
-        # get state mappings
-        nxformat = nxchars.find_char_format()
-        if nxformat is not None:
-            self.parse_characters_format(nxformat, data_type, char_matrix)
-        elif data_type == "standard":
-            self.create_standard_character_alphabet(char_matrix)
+    def parse_char_matrix_annotation(self, nxannotation):
+        self._parse_annotations(self._char_matrix, nxannotation)
 
-        nxmatrix = nxchars.find_char_matrix()
-        annotations = [i for i in nxmatrix.findall_annotations()]
-        for annotation in annotations:
-            self._parse_annotations(char_matrix.taxon_seq_map, annotation)
-        for nxrow in nxmatrix.findall_char_row():
-            row_id = nxrow.get('id', None)
-            label = nxrow.get('label', None)
-            taxon_id = nxrow.get('otu', None)
-            try:
-                taxon = self._id_taxon_map[(otus_id, taxon_id)]
-            except KeyError:
-                raise error.DataParseError(message='Character Block %s (\"%s\"): Taxon with id "%s" not defined in taxa block "%s"' % (char_matrix.oid, char_matrix.label, taxon_id, otus_id))
+    def parse_char_matrix_format(self, nxformat):
+        self.parse_characters_format(nxformat,
+                self._char_matrix_data_type,
+                self._char_matrix)
+        self._is_char_format_parsed = True
 
-            character_vector = char_matrix.new_sequence(taxon=taxon)
-            annotations = [i for i in nxrow.findall_annotations()]
-            for annotation in annotations:
-                self._parse_annotations(character_vector, annotation)
-
-            if data_type == "continuous":
-                if nxchartype.endswith('Seqs'):
-                    seq = nxrow.find_char_seq()
-                    if seq is not None:
-                        seq = seq.replace('\n\r', ' ').replace('\r\n', ' ').replace('\n', ' ').replace('\r',' ')
-                        col_idx = -1
-                        for char in seq.split(' '):
-                            char = char.strip()
-                            if char:
-                                col_idx += 1
-                                if len(self._char_types) <= col_idx:
-                                    raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
-                                        + " %d (matrix = '%s' row='%s', taxon='%s')" % (col_idx+1, char_matrix.oid, row_id, taxon.label))
-                                character_vector.append(character_value=float(char), character_type=self._char_types[col_idx])
-                else:
-                    for nxcell in nxrow.findall_char_cell():
-                        chartype_id = nxcell.get('char', None)
-                        if chartype_id is None:
-                            raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
-                        if chartype_id not in self._id_chartype_map:
-                            raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
-                        chartype = self._id_chartype_map[chartype_id]
-                        pos_idx = self._char_types.index(chartype)
-#                         column = id_chartype_map[chartype_id]
-#                         state = column.state_id_map[cell.get('state', None)]
-                        # annotations = [i for i in nxcell.findall_annotations]
-                        # for annotation in annotations:
-                        #     self._parse_annotations(cell, annotation)
-                        character_vector.append(character_value=float(nxcell.get('state')),
-                                character_type=chartype)
-            else:
-                if nxchartype.endswith('Seqs'):
-                    seq = nxrow.find_char_seq()
-                    if seq is not None:
-                        seq = seq.replace(' ', '').replace('\n', '').replace('\r', '')
-                        col_idx = -1
-                        for char in seq:
+    def begin_char_matrix_rows(self):
+        if not self._is_char_format_parsed and self._char_matrix_data_type == "standard":
+            self.create_standard_character_alphabet(self._char_matrix)
+
+    def parse_char_matrix_rows_annotation(self, nxannotation):
+        self._parse_annotations(self._char_matrix.taxon_seq_map, nxannotation)
+
+    def parse_char_row(self, nxrow):
+        """
+        Given an XmlElement representing a row of the matrix of the current
+        characters block, this adds the corresponding sequence to the
+        current CharacterMatrix object.
+        """
+        char_matrix = self._char_matrix
+        char_matrix_oid = self._char_matrix_oid
+        otus_id = self._char_matrix_otus_id
+        data_type = self._char_matrix_data_type
+        nxchartype = self._char_matrix_nxchartype
+        row_id = nxrow.get('id', None)
+        label = nxrow.get('label', None)
+        taxon_id = nxrow.get('otu', None)
+        try:
+            taxon = self._id_taxon_map[(otus_id, taxon_id)]
+        except KeyError:
+            raise error.DataParseError(message='Character Block %s (\"%s\"): Taxon with id "%s" not defined in taxa block "%s"' % (char_matrix.oid, char_matrix.label, taxon_id, otus_id))
+
+        character_vector = char_matrix.new_sequence(taxon=taxon)
+        annotations = [i for i in nxrow.findall_annotations()]
+        for annotation in annotations:
+            self._parse_annotations(character_vector, annotation)
+
+        if data_type == "continuous":
+            if nxchartype.endswith('Seqs'):
+                seq = nxrow.find_char_seq()
+                if seq is not None:
+                    seq = seq.replace('\n\r', ' ').replace('\r\n', ' ').replace('\n', ' ').replace('\r',' ')
+                    col_idx = -1
+                    for char in seq.split(' '):
+                        char = char.strip()
+                        if char:
                             col_idx += 1
-                            state_alphabet = char_matrix.character_types[col_idx].state_alphabet
-                            try:
-                                state = state_alphabet[char]
-                            except KeyError:
-                                raise error.DataParseError(message="Character Block row '%s', character position %s: State with symbol '%s' in sequence '%s' not defined" \
-                                        % (row_id, col_idx, char, seq))
                             if len(self._char_types) <= col_idx:
                                 raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
-                                    + " %d (row='%s', taxon='%s')" % (col_idx+1, row_id, taxon.label))
-                            character_type = self._char_types[col_idx]
-                            character_vector.append(character_value=state,
-                                    character_type=character_type)
-                else:
-                    for nxcell in nxrow.findall_char_cell():
-                        chartype_id = nxcell.get('char', None)
-                        if chartype_id is None:
-                            raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
-                        if chartype_id not in self._id_chartype_map:
-                            raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
-                                        + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
-                        chartype = self._id_chartype_map[chartype_id]
-                        state_alphabet = self._id_chartype_map[chartype_id].state_alphabet
-                        pos_idx = self._chartype_id_to_pos_map[chartype_id]
-                        state = self._id_state_map[ (state_alphabet, nxcell.get('state', None)) ]
-                        character_vector.set_at(pos_idx,
-                                character_value=state,
-                                character_type=chartype)
-                        # self._id_state_alphabet_map = {}
-                        # self._id_state_map = {}
-                        # self._id_chartype_map = {}
-
-            char_matrix[taxon] = character_vector
-
-        # if fixed_state_alphabet:
-        #     char_matrix.remap_to_default_state_alphabet_by_symbol(purge_other_state_alphabets=True)
+                                    + " %d (matrix = '%s' row='%s', taxon='%s')" % (col_idx+1, char_matrix.oid, row_id, taxon.label))
+                            character_vector.append(character_value=float(char), character_type=self._char_types[col_idx])
+            else:
+                for nxcell in nxrow.findall_char_cell():
+                    chartype_id = nxcell.get('char', None)
+                    if chartype_id is None:
+                        raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
+                    if chartype_id not in self._id_chartype_map:
+                        raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix.oid, row_id, taxon.label))
+                    chartype = self._id_chartype_map[chartype_id]
+                    pos_idx = self._char_types.index(chartype)
+#                         column = id_chartype_map[chartype_id]
+#                         state = column.state_id_map[cell.get('state', None)]
+                    # annotations = [i for i in nxcell.findall_annotations]
+                    # for annotation in annotations:
+                    #     self._parse_annotations(cell, annotation)
+                    character_vector.append(character_value=float(nxcell.get('state')),
+                            character_type=chartype)
+        else:
+            if nxchartype.endswith('Seqs'):
+                seq = nxrow.find_char_seq()
+                if seq is not None:
+                    seq = seq.replace(' ', '').replace('\n', '').replace('\r', '')
+                    col_idx = -1
+                    for char in seq:
+                        col_idx += 1
+                        state_alphabet = char_matrix.character_types[col_idx].state_alphabet
+                        try:
+                            state = state_alphabet[char]
+                        except KeyError:
+                            raise error.DataParseError(message="Character Block row '%s', character position %s: State with symbol '%s' in sequence '%s' not defined" \
+                                    % (row_id, col_idx, char, seq))
+                        if len(self._char_types) <= col_idx:
+                            raise error.DataParseError(message="Character column/type ('<char>') not defined for character in position"\
+                                + " %d (row='%s', taxon='%s')" % (col_idx+1, row_id, taxon.label))
+                        character_type = self._char_types[col_idx]
+                        character_vector.append(character_value=state,
+                                character_type=character_type)
+            else:
+                for nxcell in nxrow.findall_char_cell():
+                    chartype_id = nxcell.get('char', None)
+                    if chartype_id is None:
+                        raise error.DataParseError(message="'char' attribute missing for cell: cell markup must indicate character column type for character"\
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
+                    if chartype_id not in self._id_chartype_map:
+                        raise error.DataParseError(message="Character type ('<char>') with id '%s' referenced but not found for character" % chartype_id \
+                                    + " (matrix = '%s' row='%s', taxon='%s')" % (char_matrix_oid, row_id, taxon.label))
+                    chartype = self._id_chartype_map[chartype_id]
+                    state_alphabet = self._id_chartype_map[chartype_id].state_alphabet
+                    pos_idx = self._chartype_id_to_pos_map[chartype_id]
+                    state = self._id_state_map[ (state_alphabet, nxcell.get('state', None)) ]
+                    character_vector.set_at(pos_idx,
+                            character_value=state,
+                            character_type=chartype)
+                    # self._id_state_alphabet_map = {}
+                    # self._id_state_map = {}
+                    # self._id_chartype_map = {}
+
+        char_matrix[taxon] = character_vector
 
     def parse_ambiguous_state(self, nxstate, state_alphabet):
         """
@@ -24,7 +24,6 @@ import json
 import textwrap
 import collections
 from dendropy.dataio import ioservice
-from dendropy.utility.textprocessing import StringIO
 
 ############################################################################
 ## Local Module Methods
@@ -123,8 +122,8 @@ class NexmlWriter(ioservice.DataWriter):
         self._taxon_namespaces_to_write = []
         self._taxon_namespace_id_map = {}
         self._object_xml_id = {}
+        self._num_xml_ids = 0
         self._taxon_id_map = {}
-        self._node_id_map = {}
         self._state_alphabet_id_map = {}
         self._state_id_map = {}
 
@@ -139,19 +138,9 @@ class NexmlWriter(ioservice.DataWriter):
         self._taxon_namespaces_to_write = []
         self._taxon_namespace_id_map = {}
         self._taxon_id_map = {}
-        self._node_id_map = {}
         self._state_alphabet_id_map = {}
         self._state_id_map = {}
 
-        # Destination:
-        # Writing to buffer instead of directly to output
-        # stream so that all namespaces referenced in metadata
-        # can be written
-        body = StringIO()
-
-        # comments and metadata
-        self._write_annotations_and_comments(global_annotations_target, body, 1)
-
         # Taxon namespace discovery
         candidate_taxon_namespaces = collections.OrderedDict()
         if self.attached_taxon_namespace is not None:
@@ -171,21 +160,68 @@ class NexmlWriter(ioservice.DataWriter):
                         candidate_taxon_namespaces[i.taxon_namespace] = True
         self._taxon_namespaces_to_write = [tns for tns in candidate_taxon_namespaces if candidate_taxon_namespaces[tns]]
 
+        # The namespaces referenced in metadata are collected before anything
+        # is written, so that they can be declared in the opening tag and the
+        # rest of the document can be written directly to the stream
+        # instead of being held in a buffer.
+        self._register_annotation_namespaces(global_annotations_target)
         for tns in self._taxon_namespaces_to_write:
-            self._write_taxon_namespace(tns, body)
+            self._register_annotation_namespaces(tns)
+            for taxon in tns:
+                self._register_annotation_namespaces(taxon)
+        if char_matrices:
+            for char_matrix in char_matrices:
+                self._register_annotation_namespaces(char_matrix)
+                for taxon in char_matrix:
+                    char_vector = char_matrix[taxon]
+                    self._register_annotation_namespaces(char_vector)
+                    for char_value, cell_char_type, cell_annotations in char_vector.cell_iter():
+                        if cell_annotations is not None:
+                            self._register_annotation_set_namespaces(cell_annotations)
+        if tree_lists:
+            for tree_list in tree_lists:
+                self._register_annotation_namespaces(tree_list)
+                for tree in tree_list:
+                    self._register_annotation_namespaces(tree)
+                    for node in tree.preorder_node_iter():
+                        self._register_annotation_namespaces(node)
+                        self._register_annotation_namespaces(node.edge)
+
+        self._write_to_nexml_open(stream, indent_level=0)
+
+        # comments and metadata
+        self._write_annotations_and_comments(global_annotations_target, stream, 1)
+
+        for tns in self._taxon_namespaces_to_write:
+            self._write_taxon_namespace(tns, stream)
 
         if char_matrices:
             for char_matrix in char_matrices:
-                self._write_char_matrix(char_matrix=char_matrix, dest=body)
+                self._write_char_matrix(char_matrix=char_matrix, dest=stream)
 
         if tree_lists:
             for tree_list in tree_lists:
-                self._write_tree_list(tree_list=tree_list, dest=body)
+                self._write_tree_list(tree_list=tree_list, dest=stream)
 
-        self._write_to_nexml_open(stream, indent_level=0)
-        stream.write(body.getvalue())
         self._write_to_nexml_close(stream, indent_level=0)
 
+    def _register_annotation_namespaces(self, item):
+        """
+        Adds the prefixes and namespaces of the annotations of ``item`` that
+        will be written to the set of those declared in the opening tag.
+        """
+        if item is not None and item.has_annotations:
+            self._register_annotation_set_namespaces(item.annotations)
+
+    def _register_annotation_set_namespaces(self, annotation_set, include_hidden=False):
+        for annote in annotation_set:
+            if annote.is_hidden and not include_hidden:
+                continue
+            self._prefix_uri_tuples.add((annote.name_prefix, annote.namespace))
+            if annote.has_annotations:
+                # nested annotations are written even if hidden
+                self._register_annotation_set_namespaces(annote.annotations, include_hidden=True)
+
     def _write_taxon_namespace(self, taxon_namespace, dest, indent_level=1):
         self._taxon_namespace_id_map[taxon_namespace] = self._get_nexml_id(taxon_namespace)
         dest.write(self.indent * indent_level)
@@ -358,7 +394,10 @@ class NexmlWriter(ioservice.DataWriter):
     def _write_tree(self, tree, dest, indent_level=0):
         """
         Writes a single DendroPy Tree object as a NEXML nex:tree
-        element.
+        element. The node and edge elements are composed by iterating over
+        the nodes, and collected into a buffer that is written to ``dest`` in
+        chunks (and before the metadata of each annotated element). Only the
+        ids of the nodes of the tree are kept while it is being written.
         """
         parts = []
         parts.append('tree')
@@ -375,19 +414,66 @@ class NexmlWriter(ioservice.DataWriter):
         if tree.has_annotations or (hasattr(tree, "comments") and tree.comments):
             self._write_annotations_and_comments(tree, dest,
                     indent_level=indent_level+1)
+        element_indent = self.indent * (indent_level+1)
+        taxon_id_map = self._taxon_id_map
+        node_id_map = {}
+        root_node = tree.seed_node if tree.is_rooted else None
+        buffered_parts = []
+        parts_append = buffered_parts.append
         for node in tree.preorder_node_iter():
-            self._write_node(
-                    node=node,
-                    dest=dest,
-                    is_root=tree.is_rooted and node is tree.seed_node,
-                    indent_level=indent_level+1)
-        for edge in tree.preorder_edge_iter():
-            self._write_edge(
-                    edge=edge,
-                    dest=dest,
-                    is_root=tree.is_rooted and node is tree.seed_node,
-                    indent_level=indent_level+1)
-        dest.write('%s</tree>\n' % (self.indent * indent_level))
+            node_id = self._new_nexml_id()
+            node_id_map[node] = node_id
+            parts_append('%s<node id="%s"' % (element_indent, node_id))
+            if node.label:
+                parts_append(' label=%s' % _protect_attr(node.label))
+            if node.taxon:
+                parts_append(' otu="%s"' % taxon_id_map[node.taxon])
+            if node is root_node:
+                parts_append(' root="true"')
+            if node.has_annotations or node.comments:
+                parts_append('>\n')
+                dest.write("".join(buffered_parts))
+                del buffered_parts[:]
+                self._write_annotations_and_comments(node, dest, indent_level=indent_level+2)
+                parts_append('%s</node>\n' % element_indent)
+            else:
+                parts_append(' />\n')
+                if len(buffered_parts) >= 65536:
+                    dest.write("".join(buffered_parts))
+                    del buffered_parts[:]
+        for node in tree.preorder_node_iter():
+            edge = node.edge
+            if edge.tail_node is not None:
+                tag = "edge"
+                parts_append('%s<edge id="%s" source="%s" target="%s"' % (
+                    element_indent,
+                    self._new_nexml_id(),
+                    node_id_map[edge.tail_node],
+                    node_id_map[node]))
+            else:
+                # EDGE-ON-ROOT:
+                tag = "rootedge"
+                parts_append('%s<rootedge id="%s" target="%s"' % (
+                    element_indent,
+                    self._new_nexml_id(),
+                    node_id_map[node]))
+            if edge.length is not None:
+                parts_append(' length="%s"' % edge.length)
+            if edge.label:
+                parts_append(' label=%s' % _protect_attr(edge.label))
+            if edge.has_annotations or edge.comments:
+                parts_append('>\n')
+                dest.write("".join(buffered_parts))
+                del buffered_parts[:]
+                self._write_annotations_and_comments(edge, dest, indent_level=indent_level+2)
+                parts_append('%s</%s>\n' % (element_indent, tag))
+            else:
+                parts_append(' />\n')
+                if len(buffered_parts) >= 65536:
+                    dest.write("".join(buffered_parts))
+                    del buffered_parts[:]
+        parts_append('%s</tree>\n' % (self.indent * indent_level))
+        dest.write("".join(buffered_parts))
 
     def _write_to_nexml_open(self, dest, indent_level=0):
         "Writes the opening tag for a nexml element."
@@ -440,61 +526,6 @@ class NexmlWriter(ioservice.DataWriter):
         "Closing tag for a nexml element."
         dest.write('%s</nex:nexml>\n' % (self.indent*indent_level))
 
-    def _write_node(self, node, dest, is_root, indent_level=0):
-        "Writes out a NEXML node element."
-        parts = []
-        parts.append('<node')
-        self._node_id_map[node] = self._get_nexml_id(node)
-        parts.append('id="%s"' % self._node_id_map[node])
-        if hasattr(node, 'label') and node.label:
-            parts.append('label=%s' % _protect_attr(node.label))
-        if hasattr(node, 'taxon') and node.taxon:
-            parts.append('otu="%s"' % self._taxon_id_map[node.taxon])
-        if is_root:
-            parts.append('root="true"')
-        parts = ' '.join(parts)
-        dest.write('%s%s' % ((self.indent * indent_level), parts))
-        if node.has_annotations or (hasattr(node, "comments") and node.comments):
-            dest.write('>\n')
-            self._write_annotations_and_comments(node, dest, indent_level=indent_level+1)
-            dest.write('%s</node>\n' % (self.indent * indent_level))
-        else:
-            dest.write(' />\n')
-
-    def _write_edge(self, edge, dest, is_root, indent_level=0):
-        "Writes out a NEXML edge element."
-        if edge and edge.head_node:
-            parts = []
-            if edge.tail_node is not None:
-                tag = "edge"
-                parts.append('<%s' % tag)
-            else:
-                # EDGE-ON-ROOT:
-                tag = "rootedge"
-                parts.append('<%s' % tag)
-            parts.append('id="%s"' % self._get_nexml_id(edge))
-            # programmatically more efficent to do this in above
-            # block, but want to maintain this tag order ...
-            if edge.tail_node is not None:
-                parts.append('source="%s"' % self._node_id_map[edge.tail_node])
-            if edge.head_node is not None:
-                parts.append('target="%s"' % self._node_id_map[edge.head_node])
-            if hasattr(edge, 'length') and edge.length is not None:
-                parts.append('length="%s"' % edge.length)
-            if hasattr(edge, 'label') and edge.label:
-                parts.append('label=%s' % _protect_attr(edge.label))
-
-            # only write if we have more than just the 'edge' and '/' bit
-            if len(parts) > 2:
-                parts = ' '.join(parts)
-                dest.write('%s%s' % ((self.indent * indent_level), parts))
-                if edge.has_annotations or (hasattr(edge, "comments") and edge.comments):
-                    dest.write('>\n')
-                    self._write_annotations_and_comments(edge, dest, indent_level=indent_level+1)
-                    dest.write('%s</%s>\n' % ((self.indent * indent_level), tag))
-                else:
-                    dest.write(' />\n')
-
     def _write_annotations_and_comments(self, item, dest, indent_level=0):
         if item is not None:
             self._write_annotations(item, dest, indent_level=indent_level)
@@ -612,10 +643,20 @@ class NexmlWriter(ioservice.DataWriter):
         try:
             return self._object_xml_id[o]
         except KeyError:
-            oid = "d{}".format(len(self._object_xml_id))
+            oid = self._new_nexml_id()
             self._object_xml_id[o] = oid
             return oid
 
+    def _new_nexml_id(self):
+        """
+        Returns a new id for an element that is not referenced elsewhere in
+        the document (other than within the same tree), without keeping a
+        reference to the object it represents.
+        """
+        oid = "d{}".format(self._num_xml_ids)
+        self._num_xml_ids += 1
+        return oid
+
     def _compose_annotation_xml(self,
             annote,
             indent="",
@@ -647,7 +688,7 @@ class NexmlWriter(ioservice.DataWriter):
                 parts.append('content=""')
         if annote.datatype_hint:
             parts.append('datatype="%s"'% annote.datatype_hint)
-        parts.append('id="%s"' % self._get_nexml_id(annote))
+        parts.append('id="%s"' % self._new_nexml_id())
         if prefix_uri_tuples is not None:
             prefix_uri_tuples.add((annote.name_prefix, annote.namespace))
         if len(annote.annotations) > 0:
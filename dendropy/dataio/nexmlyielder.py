@@ -25,7 +25,6 @@ if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 from dendropy.dataio import ioservice
 from dendropy.dataio import nexmlreader
-from dendropy.dataio import xmlprocessing
 
 class NexmlTreeDataYielder(
         ioservice.TreeDataYielder,
@@ -48,6 +47,12 @@ class NexmlTreeDataYielder(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer
+            Number of trees at the beginning of each source to skip. These
+            trees are not built.
+        tree_stride : integer
+            Only every ``tree_stride``-th tree of each source following the
+            first ``tree_offset`` trees will be yielded.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `nexmlreader.NexusReader`
             class. See `nexmlreader.NexusReader` for details.
@@ -55,7 +60,9 @@ class NexmlTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", None),
+                tree_stride=kwargs.pop("tree_stride", None))
         nexmlreader.NexmlReader.__init__(self,
                 **kwargs)
         self.attached_taxon_namespace = self.taxon_namespace
@@ -64,25 +71,20 @@ class NexmlTreeDataYielder(
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
         tree_parser = nexmlreader._NexmlTreeParser(
                 id_taxon_map=self._id_taxon_map,
                 annotations_processor_fn=self._parse_annotations,
                 )
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            trees_id = trees_element.get('id', "Trees" + str(trees_idx))
-            trees_label = trees_element.get('label', None)
-            otus_id = trees_element.get('otus', None)
-            if otus_id is None:
-                raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
-            taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
-            if not taxon_namespace:
-                raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
-            for tree_element in trees_element.findall_tree():
-                tree_obj = self.tree_factory()
-                tree_parser.build_tree(tree_obj, tree_element, otus_id)
-                yield tree_obj
+        current_tree_offset = 0
+        for trees_idx, trees_element, tree_element in self._iter_tree_elements(stream):
+            if tree_element is None:
+                self._get_tree_list_taxon_namespace(trees_element, trees_idx)
+                continue
+            if not self._is_tree_selected(current_tree_offset):
+                current_tree_offset += 1
+                continue
+            tree_obj = self.tree_factory()
+            tree_parser.build_tree(tree_obj, tree_element, trees_element.get('otus', None))
+            self._current_tree_offset = current_tree_offset
+            current_tree_offset += 1
+            yield tree_obj
@@ -26,7 +26,9 @@ import itertools
 import numbers
 import decimal
 from dendropy.dataio.tokenizer import Tokenizer
+from dendropy.dataio.tokenizer import BufferedTokenizer
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 from dendropy.utility import container
 from dendropy.datamodel import basemodel
 
@@ -84,6 +86,7 @@ class NexusTokenizer(Tokenizer):
                 self.uncaptured_delimiters.append("\n")
             if "\r" not in self.uncaptured_delimiters:
                 self.uncaptured_delimiters.append("\r")
+        self._delimiters_changed()
 
     def set_hyphens_as_captured_delimiters(self, hyphens_as_captured_delimiters):
         if hyphens_as_captured_delimiters:
@@ -94,6 +97,7 @@ class NexusTokenizer(Tokenizer):
                 self.captured_delimiters.remove("-")
             except ValueError:
                 pass
+        self._delimiters_changed()
 
     def require_next_token_ucase(self):
         t = self.require_next_token()
@@ -126,12 +130,282 @@ class NexusTokenizer(Tokenizer):
 
     def skip_to_semicolon(self):
         token = self.next_token()
-        while token != ';' and not self._cur_char == "" and token != None:
+        while token != ';' and not self.is_eof() and token != None:
             token = self.next_token()
 
+##############################################################################
+## BufferedNexusTokenizer
+
+class BufferedNexusTokenizer(NexusTokenizer, BufferedTokenizer):
+    """
+    A |NexusTokenizer| that uses the block-buffered, pattern-matching
+    tokenization engine of |BufferedTokenizer|.
+    """
+
+    def __init__(self, src,
+            preserve_unquoted_underscores=False):
+        NexusTokenizer.__init__(self,
+                src=src,
+                preserve_unquoted_underscores=preserve_unquoted_underscores)
+
+_NEXUS_TOKENIZER_ENGINES = {
+    "standard": NexusTokenizer,
+    "buffered": BufferedNexusTokenizer,
+}
+
+def create_nexus_tokenizer(src,
+        preserve_unquoted_underscores=False,
+        tokenizer_engine=None):
+    """
+    Returns a NEXUS/NEWICK tokenizer for ``src``.
+
+    Parameters
+    ----------
+    src : file or file-like object
+        Source of data.
+    preserve_unquoted_underscores : boolean, default: |False|
+        If |True|, unquoted underscores will *not* be converted to spaces.
+    tokenizer_engine : string, {['standard'], 'buffered'}
+        The tokenization engine: 'standard' reads the source one character
+        at a time (|NexusTokenizer|), while 'buffered' reads the source in
+        large blocks and extracts tokens by pattern matching
+        (|BufferedNexusTokenizer|). If not specified, then 'buffered' is
+        used for memory-mapped sources
+        (:class:`~dendropy.utility.filesys.MappedTextFile`), and 'standard'
+        otherwise.
+
+    Returns
+    -------
+    t : |NexusTokenizer|
+        A new tokenizer.
+    """
+    if tokenizer_engine is None:
+        if isinstance(src, filesys.MappedTextFile):
+            tokenizer_engine = "buffered"
+        else:
+            tokenizer_engine = "standard"
+    try:
+        tokenizer_type = _NEXUS_TOKENIZER_ENGINES[tokenizer_engine]
+    except KeyError:
+        raise ValueError("Unrecognized tokenizer engine: '{}'".format(tokenizer_engine))
+    return tokenizer_type(src,
+            preserve_unquoted_underscores=preserve_unquoted_underscores)
+
+###############################################################################
+## Character Matrix Row Parsing
+
+# State indexes used in the results of :func:`parse_matrix_rows()` in place
+# of multistate (ambiguous or polymorphic) groups and MATCHCHAR symbols, which
+# have to be resolved by the reader, and of unrecognized symbols.
+MATRIX_MULTISTATE_INDEX = 253
+MATRIX_MATCH_CHAR_INDEX = 254
+MATRIX_INVALID_INDEX = 255
+
+_MATRIX_INVALID_INDEX_BYTE = bytes(bytearray([MATRIX_INVALID_INDEX]))
+_MATRIX_WHITESPACE = b" \t\r"
+_MATRIX_ROW_LABEL_PATTERN = re.compile(r"""[ \t\r]*(?:'((?:[^']|'')*)'|([^ \t\r{}(),;:=\\"]+))""")
+_MATRIX_MULTISTATE_PATTERN = re.compile(r"\(([^(){}]*)\)|\{([^(){}]*)\}")
+_MATRIX_COMMENT_OR_QUOTE_PATTERN = re.compile(r"[\[\]']")
+_MATRIX_QUOTED_TOKEN_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_MATRIX_TOKEN_DELIMITERS = " \t\r\n{}(),;:=\\\""
+
+def compile_matrix_symbol_index_table(state_alphabet, match_chars=None):
+    """
+    Returns a 256-byte translation table mapping single-character ASCII state
+    symbols of ``state_alphabet`` to the indexes of their states, the
+    characters in ``match_chars`` to ``MATRIX_MATCH_CHAR_INDEX``, and all
+    other characters to ``MATRIX_INVALID_INDEX``, for use with
+    :func:`parse_matrix_rows()`.
+    """
+    table = bytearray([MATRIX_INVALID_INDEX] * 256)
+    for symbol, state in state_alphabet.full_symbol_state_map.items():
+        if symbol is not None and len(symbol) == 1 and ord(symbol) < 128:
+            table[ord(symbol)] = state.index
+    if match_chars:
+        for symbol in match_chars:
+            if len(symbol) == 1 and ord(symbol) < 128:
+                table[ord(symbol)] = MATRIX_MATCH_CHAR_INDEX
+    return bytes(table)
+
+def _translate_matrix_symbols(symbols, symbol_index_table):
+    """
+    Translates the state symbols in ``symbols`` (ignoring whitespace) using
+    ``symbol_index_table``. Returns a tuple consisting of a ``bytearray`` of
+    state indexes, a list of the multistate groups (given as tuples of the
+    position of the group, its opening character and the symbols within it)
+    and the first unrecognized symbol (or |None| if all were recognized),
+    which is the opening character of a multistate group that is not
+    terminated.
+    """
+    multistates = []
+    if "(" in symbols or "{" in symbols:
+        indexes = bytearray()
+        pos = 0
+        for m in _MATRIX_MULTISTATE_PATTERN.finditer(symbols):
+            part, _, invalid_symbol = _translate_matrix_symbols(symbols[pos:m.start()], symbol_index_table)
+            if invalid_symbol is not None:
+                return indexes, multistates, invalid_symbol
+            indexes.extend(part)
+            group = m.group(1)
+            if group is None:
+                group = m.group(2)
+            multistates.append((len(indexes), symbols[m.start()], "".join(group.split())))
+            indexes.append(MATRIX_MULTISTATE_INDEX)
+            pos = m.end()
+        rest = symbols[pos:]
+        unterminated_pos = min(idx for idx in (rest.find("("), rest.find("{"), len(rest)) if idx >= 0)
+        part, _, invalid_symbol = _translate_matrix_symbols(rest[:unterminated_pos], symbol_index_table)
+        indexes.extend(part)
+        if invalid_symbol is None and unterminated_pos < len(rest):
+            invalid_symbol = rest[unterminated_pos]
+        return indexes, multistates, invalid_symbol
+    try:
+        indexes = symbols.encode("ascii").translate(symbol_index_table, _MATRIX_WHITESPACE)
+    except UnicodeError:
+        pass
+    else:
+        if indexes.find(_MATRIX_INVALID_INDEX_BYTE) < 0:
+            return bytearray(indexes), multistates, None
+    for symbol in symbols:
+        if symbol in " \t\r":
+            continue
+        if ord(symbol) >= 128 or symbol_index_table[ord(symbol):ord(symbol)+1] == _MATRIX_INVALID_INDEX_BYTE:
+            return bytearray(), multistates, symbol
+    return bytearray(), multistates, None
+
+def parse_matrix_rows(text, first_line_num, symbol_index_table, preserve_underscores=False):
+    """
+    Parses the lines of ``text``, which is (part of) the contents of a NEXUS
+    MATRIX statement of discrete characters with comments removed, into
+    state indexes, without reference to any |StateAlphabet|, |Taxon| or
+    |CharacterMatrix| objects, so that the lines of a large matrix can be
+    parsed in parallel by worker processes.
+
+    Parameters
+    ----------
+    text : string
+        The lines to parse.
+    first_line_num : integer
+        The line number of the first line of ``text`` in the source.
+    symbol_index_table : bytes
+        The table returned by :func:`compile_matrix_symbol_index_table()`.
+    preserve_underscores : boolean
+        If |False|, unquoted underscores in labels are converted to spaces.
+
+    Returns
+    -------
+    rows : list of tuples
+        A tuple for each line that is not blank, consisting of its line
+        number, its first token (a taxon label, or |None| if the line does
+        not begin with a label), whether the first token is quoted, the
+        results of translating the first token (|None| if quoted) and of
+        translating the rest of the line as state symbols, each as returned
+        by :func:`_translate_matrix_symbols()`.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    rows = []
+    for line_idx, line in enumerate(text.split("\n")):
+        if not line.strip(" \t"):
+            continue
+        m = _MATRIX_ROW_LABEL_PATTERN.match(line)
+        if m is None:
+            label = None
+            is_quoted = False
+            label_symbols = _translate_matrix_symbols("", symbol_index_table)
+            rest = line
+        elif m.group(1) is not None:
+            label = m.group(1).replace("''", "'")
+            is_quoted = True
+            label_symbols = None
+            rest = line[m.end():]
+        else:
+            token = m.group(2)
+            if preserve_underscores:
+                label = token
+            else:
+                label = token.replace("_", " ")
+            is_quoted = False
+            label_symbols = _translate_matrix_symbols(token, symbol_index_table)
+            rest = line[m.end():]
+        rows.append((first_line_num + line_idx,
+            label,
+            is_quoted,
+            label_symbols,
+            _translate_matrix_symbols(rest, symbol_index_table)))
+    return rows
+
+def _parse_matrix_rows_job(args):
+    # entry point for worker processes
+    return parse_matrix_rows(*args)
+
+def strip_matrix_comments(text):
+    """
+    Returns ``text`` with all (possibly nested) comments removed, except
+    from within quoted tokens.
+    """
+    parts = []
+    keep_start = 0
+    nesting = 0
+    quote_end = -1
+    for m in _MATRIX_COMMENT_OR_QUOTE_PATTERN.finditer(text):
+        idx = m.start()
+        if idx < quote_end:
+            continue
+        c = text[idx]
+        if nesting:
+            if c == "[":
+                nesting += 1
+            elif c == "]":
+                nesting -= 1
+                if nesting == 0:
+                    keep_start = idx + 1
+        elif c == "[":
+            parts.append(text[keep_start:idx])
+            nesting = 1
+        elif c == "'" and (idx == 0 or text[idx-1] in _MATRIX_TOKEN_DELIMITERS):
+            # as with the tokenizer, a quote character only begins a quoted
+            # token if it is found at the start of a token
+            quoted_token_match = _MATRIX_QUOTED_TOKEN_PATTERN.match(text, idx)
+            if quoted_token_match is None:
+                quote_end = len(text)
+            else:
+                quote_end = quoted_token_match.end()
+    if nesting == 0:
+        parts.append(text[keep_start:])
+    return "".join(parts)
+
 ###############################################################################
 ## Taxon Handling
 
+def taxon_label_key(taxon_namespace, label):
+    """
+    Returns the key of ``label`` in the dictionaries returned by
+    :func:`build_label_taxon_map()` for ``taxon_namespace``.
+    """
+    if taxon_namespace.is_case_sensitive:
+        return label
+    return str(label).lower()
+
+def build_label_taxon_map(taxon_namespace):
+    """
+    Returns a dictionary mapping the labels of the |Taxon| objects in
+    ``taxon_namespace`` (as keyed by :func:`taxon_label_key()`) to the first
+    |Taxon| object with each label, so that a series of labels can be
+    resolved in the same way as by :meth:`TaxonNamespace.get_taxon()`, but
+    without a scan of the namespace for each label.
+    """
+    label_taxon_map = {}
+    is_case_sensitive = taxon_namespace.is_case_sensitive
+    for taxon in taxon_namespace:
+        if taxon.label is None:
+            continue
+        if is_case_sensitive:
+            label_taxon_map.setdefault(taxon.label, taxon)
+        else:
+            label_taxon_map.setdefault(taxon.lower_cased_label, taxon)
+    return label_taxon_map
+
 class NexusTaxonSymbolMapper(object):
     """
     Manages |TaxonNamespace| and |Taxon| object look-ups when
@@ -160,6 +434,20 @@ class NexusTaxonSymbolMapper(object):
     create a new |Taxon| object with that symbol for its label, and
     register it in all the other supplemental mappings appropriately.
 
+    All three types of symbols are also compiled into a single plain
+    dictionary, ``symbol_taxon_map``, mapping each symbol (lower-cased, unless
+    look-up is case-sensitive) to the |Taxon| object that it resolves to
+    according to the resolution order, and which is kept up to date as
+    translate tokens and |Taxon| objects are added. Looking up a symbol that
+    is already known thus takes a single dictionary access, rather than
+    successive look-ups in each of the mapping containers.
+
+    With case-sensitive look-up, labels are still matched case-insensitively
+    if the |TaxonNamespace| is not case-sensitive. Translate tokens, which
+    are then matched with a different case rule than labels, are not
+    compiled into ``symbol_taxon_map`` but looked up in ``token_taxon_map``
+    first.
+
     Note that the |TaxonNamespace| object passed to this class and the
     member |Taxon| objects should not be modified during the lifespan of
     this class or, at least, the tenure of the management of
@@ -186,6 +474,7 @@ class NexusTaxonSymbolMapper(object):
             self.label_taxon_map = {}
         self.number_taxon_map = {}
         self.number_taxon_label_map = {}
+        self.symbol_taxon_map = {}
         self.enable_lookup_by_taxon_number = enable_lookup_by_taxon_number
         self._set_taxon_namespace(taxon_namespace)
 
@@ -215,62 +504,98 @@ class NexusTaxonSymbolMapper(object):
             self.label_taxon_map = container.CaseInsensitiveDict(self._taxon_namespace.label_taxon_map())
         else:
             self.label_taxon_map = self._taxon_namespace.label_taxon_map()
+        self._is_label_lookup_case_sensitive = self.case_sensitive and self._taxon_namespace.is_case_sensitive
+        self._is_token_lookup_compiled = self.case_sensitive == self._is_label_lookup_case_sensitive
         self.number_taxon_map.clear()
+        self.number_taxon_label_map.clear()
         for idx, taxon in enumerate(self._taxon_namespace):
             s = str(idx+1)
             self.number_taxon_map[s] = taxon
             self.number_taxon_label_map[s] = taxon.label
+        self.compile_symbol_taxon_map()
+
+    def compile_symbol_taxon_map(self):
+        """
+        (Re)builds ``symbol_taxon_map`` from the translate token (unless
+        these are matched with a different case rule than labels), label and
+        taxon number mappings. Lower-precedence mappings are entered first,
+        so that they are overwritten by higher-precedence ones.
+        """
+        symbol_taxon_map = {}
+        if self.enable_lookup_by_taxon_number:
+            symbol_taxon_map.update(self.number_taxon_map)
+        for label, taxon in self.label_taxon_map.items():
+            if label is not None:
+                symbol_taxon_map[self._symbol_key(label)] = taxon
+        if self._is_token_lookup_compiled:
+            for token, taxon in self.token_taxon_map.items():
+                symbol_taxon_map[self._symbol_key(token)] = taxon
+        self.symbol_taxon_map = symbol_taxon_map
+
+    def _symbol_key(self, symbol):
+        if self._is_label_lookup_case_sensitive:
+            return symbol
+        return symbol.lower()
+
+    def _register_taxon(self, taxon):
+        # keeps the compiled map in step with the label and number mappings
+        # without recompiling it: a label (or number) only becomes the
+        # resolution of a symbol if no higher-precedence mapping exists
+        label = taxon.label
+        self.label_taxon_map[label] = taxon
+        taxon_number = str(len(self._taxon_namespace))
+        self.number_taxon_map[taxon_number] = taxon
+        if label is not None and (not self._is_token_lookup_compiled
+                or label not in self.token_taxon_map):
+            self.symbol_taxon_map[self._symbol_key(label)] = taxon
+        if (self.enable_lookup_by_taxon_number
+                and taxon_number not in self.token_taxon_map
+                and taxon_number not in self.label_taxon_map):
+            self.symbol_taxon_map[taxon_number] = taxon
 
     def add_translate_token(self, token, taxon):
         if not textprocessing.is_str_type(token):
             token = str(token)
         self.token_taxon_map[token] = taxon
+        if self._is_token_lookup_compiled:
+            self.symbol_taxon_map[self._symbol_key(token)] = taxon
 
     def lookup_taxon_symbol(self, symbol, create_taxon_if_not_found=True):
-        # if symbol in self.token_taxon_map:
-        #     return self.token_taxon_map[symbol]
-        # if symbol in self.label_taxon_map:
-        #     return self.label_taxon_map[symbol]
-        # if symbol in self.number_taxon_map:
-        #     return self.number_taxon_map[symbol]
         if not textprocessing.is_str_type(symbol):
             symbol = str(symbol)
-        try:
-            return self.token_taxon_map[symbol]
-        except KeyError:
-            pass
-        try:
-            return self.label_taxon_map[symbol]
-        except KeyError:
-            pass
-        if self.enable_lookup_by_taxon_number:
-            try:
-                return self.number_taxon_map[symbol]
-            except KeyError:
-                pass
-        if create_taxon_if_not_found:
+        taxon = None
+        if not self._is_token_lookup_compiled:
+            taxon = self.token_taxon_map.get(symbol, None)
+        if taxon is None:
+            taxon = self.symbol_taxon_map.get(self._symbol_key(symbol), None)
+        if taxon is None and create_taxon_if_not_found:
             return self.new_taxon(symbol)
-        return None
+        return taxon
 
     def require_taxon_for_symbol(self, symbol):
+        # called for every leaf of every tree, so symbols that are already
+        # known are looked up directly
+        if self._is_token_lookup_compiled:
+            try:
+                if self._is_label_lookup_case_sensitive:
+                    return self.symbol_taxon_map[symbol]
+                return self.symbol_taxon_map[symbol.lower()]
+            except (KeyError, AttributeError):
+                pass
         return self.lookup_taxon_symbol(symbol=symbol, create_taxon_if_not_found=True)
 
     def new_taxon(self, label):
         self._taxon_namespace.is_mutable = self.taxon_namespace_original_mutability_state
         t = self._taxon_namespace.new_taxon(label)
         self._taxon_namespace.is_mutable = False
-        self.label_taxon_map[label] = t
-        taxon_number = str(len(self._taxon_namespace))
-        self.number_taxon_map[taxon_number] = t
+        self._register_taxon(t)
         return t
 
     def add_taxon(self, taxon):
         self._taxon_namespace.is_mutable = self.taxon_namespace_original_mutability_state
         self._taxon_namespace.add_taxon(taxon)
         self._taxon_namespace.is_mutable = False
-        self.label_taxon_map[taxon.label] = taxon
-        taxon_number = str(len(self._taxon_namespace))
-        self.number_taxon_map[taxon_number] = taxon
+        self._register_taxon(taxon)
         return taxon
 
 ###############################################################################
@@ -279,6 +604,29 @@ class NexusTaxonSymbolMapper(object):
 FIGTREE_COMMENT_FIELD_PATTERN = re.compile(r'(.+?)=({.+?,.+?}|.+?)(,|$)')
 NHX_COMMENT_FIELD_PATTERN = re.compile(r'(.+?)=({.+?,.+?}|.+?)(:|$)')
 
+def _split_comment_metadata(comment):
+    """
+    Returns the pattern of the metadata fields of a comment token and the
+    part of the comment following the metadata prefix, or ``(None, None)``
+    if the comment does not have a recognized metadata prefix.
+    """
+    if comment.startswith("&&NHX:"):
+        return NHX_COMMENT_FIELD_PATTERN, comment[6:]
+    elif comment.startswith("&&"):
+        return NHX_COMMENT_FIELD_PATTERN, comment[2:]
+    elif comment.startswith("&"):
+        return FIGTREE_COMMENT_FIELD_PATTERN, comment[1:]
+    return None, None
+
+def has_comment_metadata(comment):
+    """
+    Returns |True| if at least one |Annotation| object would be parsed from
+    the comment token ``comment`` by
+    :func:`parse_comment_metadata_to_annotations()`, without creating them.
+    """
+    pattern, comment = _split_comment_metadata(comment)
+    return pattern is not None and pattern.search(comment) is not None
+
 def parse_comment_metadata_to_annotations(
         comment,
         annotations=None,
@@ -318,16 +666,8 @@ def parse_comment_metadata_to_annotations(
         field_name_map = {}
     if field_value_types is None:
         field_value_types = {}
-    if comment.startswith("&&NHX:"):
-        pattern = NHX_COMMENT_FIELD_PATTERN
-        comment = comment[6:]
-    elif comment.startswith("&&"):
-        pattern = NHX_COMMENT_FIELD_PATTERN
-        comment = comment[2:]
-    elif comment.startswith("&"):
-        pattern = FIGTREE_COMMENT_FIELD_PATTERN
-        comment = comment[1:]
-    else:
+    pattern, comment = _split_comment_metadata(comment)
+    if pattern is None:
         # unrecognized metadata pattern
         return annotations
     for match_group in pattern.findall(comment):
@@ -375,12 +715,9 @@ def process_comments_for_item(item,
     if not item_comments or item is None:
         return
     for comment in item_comments:
-        if extract_comment_metadata and comment.startswith("&"):
-            annotations = parse_comment_metadata_to_annotations(comment)
-            if annotations:
-                item.annotations.update(annotations)
-            else:
-                item.comments.append(comment)
+        if extract_comment_metadata and has_comment_metadata(comment):
+            # parsed when the annotations of the item are first accessed
+            item.add_deferred_annotations(comment, parse_comment_metadata_to_annotations)
         else:
             item.comments.append(comment)
 
@@ -25,6 +25,7 @@ import collections
 from dendropy.utility import error
 from dendropy.utility import textprocessing
 from dendropy.dataio import ioservice
+from dendropy.dataio import tokenizer
 from dendropy.dataio import nexusprocessing
 from dendropy.dataio import newickreader
 
@@ -188,6 +189,11 @@ class NexusReader(ioservice.DataReader):
                     col_num=col_num,
                     stream=stream)
 
+    # approximate size (in characters) of the chunks of rows into which the
+    # MATRIX statements of discrete characters are split when parsed in
+    # worker processes
+    matrix_chunk_size = 4194304
+
     ###########################################################################
     ## Life-cycle and Setup
 
@@ -224,7 +230,9 @@ class NexusReader(ioservice.DataReader):
             corresponding object (accessible through the ``annotations``
             attribute of the object). This requires that the comment
             contents conform to a particular format (NHX or BEAST: 'field =
-            value'). If |False|, then the comments will not be parsed,
+            value'). The fields are only parsed into |Annotation| objects
+            when the ``annotations`` attribute of the object is first
+            accessed. If |False|, then the comments will not be parsed,
             but will be instead stored directly as elements of the ``comments``
             list attribute of the associated object.
         store_tree_weights : boolean, default: |False|
@@ -282,6 +290,37 @@ class NexusReader(ioservice.DataReader):
             |True|: tree data will be read.
         attached_taxon_namespace : |TaxonNamespace|
             Unify all operational taxonomic unit definitions in this namespace.
+        tokenizer_engine : string, {['standard'], 'buffered'}
+            The tokenization engine used to process the data source. The
+            'standard' engine reads the source one character at a time. The
+            'buffered' engine reads the source in large blocks and extracts
+            tokens using regular expressions, which is much faster on large
+            files.
+        packed : boolean, default: |False|
+            If |True|, then the rows of discrete character matrices are
+            translated in bulk into the state indexes of a
+            :class:`~dendropy.datamodel.packedcharmatrixmodel.PackedCharacterMatrix`
+            (the character matrix factory is expected to create objects of
+            this type) instead of into |StateIdentity| objects.
+        num_processes : integer, default: |None|
+            If greater than 1, then the MATRIX statements of discrete
+            character matrices are split into chunks of rows that are parsed
+            by this number of worker processes, and the resulting rows of
+            state indexes are merged into the matrix in the main process.
+            With this option or with ``packed``, the MATRIX statement is read
+            in its entirety before being parsed, each row of a
+            non-interleaved matrix (or each line of an interleaved one) must
+            begin on a new line, and multistate groups must not span lines.
+            Errors in the MATRIX statement are then reported with the line
+            number of the row, but without a column number, and a row of a
+            non-interleaved matrix with too few characters results in a
+            ``NexusReader.NexusReaderError`` reporting the number of
+            characters found.
+        structure_only : boolean, default: |False|
+            If |True|, then only the structure of each tree (its topology,
+            edge lengths, leaf taxa and rooting state) is read, and the trees
+            are built as |CompactTree| objects instead of |Tree| objects.
+            See |NewickReader|.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
@@ -298,6 +337,8 @@ class NexusReader(ioservice.DataReader):
         self.exclude_trees = kwargs.pop("exclude_trees", False)
         self._data_type = kwargs.pop("data_type", "standard")
         self.attached_taxon_namespace = kwargs.pop("attached_taxon_namespace", None)
+        self.packed = kwargs.pop("packed", False)
+        self.num_processes = kwargs.pop("num_processes", None)
 
         # Following are undocumented for a GOOD reason! They are experimental and subject to change!
         self.unconstrained_taxa_accumulation_mode = kwargs.pop("unconstrained_taxa_accumulation_mode", False)
@@ -309,6 +350,8 @@ class NexusReader(ioservice.DataReader):
         self.preserve_underscores = kwargs.get('preserve_underscores', False)
         self.case_sensitive_taxon_labels = kwargs.get('case_sensitive_taxon_labels', False)
         self.extract_comment_metadata = kwargs.get('extract_comment_metadata', True)
+        self.tokenizer_engine = kwargs.get('tokenizer_engine', None)
+        self.structure_only = kwargs.get('structure_only', False)
 
         # As above, but the NEXUS format default is different from the NEWICK
         # default, so this rather convoluted approach
@@ -370,7 +413,8 @@ class NexusReader(ioservice.DataReader):
     ## Tokenizer Control
 
     def create_tokenizer(self, stream, **kwargs):
-        self._nexus_tokenizer = nexusprocessing.NexusTokenizer(
+        kwargs["tokenizer_engine"] = kwargs.get("tokenizer_engine", self.tokenizer_engine)
+        self._nexus_tokenizer = nexusprocessing.create_nexus_tokenizer(
                 stream, **kwargs)
         return self._nexus_tokenizer
 
@@ -638,6 +682,7 @@ class NexusReader(ioservice.DataReader):
         """
         if taxon_namespace is None:
             taxon_namespace = self._get_taxon_namespace()
+        label_taxon_map = nexusprocessing.build_label_taxon_map(taxon_namespace)
         token = self._nexus_tokenizer.next_token()
         while token != ';':
             label = token
@@ -647,11 +692,13 @@ class NexusReader(ioservice.DataReader):
             #     raise self._too_many_taxa_error(taxon_namespace=taxon_namespace, label=label)
             # else:
             #     taxon_namespace.require_taxon(label=label)
-            taxon = taxon_namespace.get_taxon(label=label)
+            label_key = nexusprocessing.taxon_label_key(taxon_namespace, label)
+            taxon = label_taxon_map.get(label_key, None)
             if taxon is None:
                 if len(taxon_namespace) >= self._file_specified_ntax and not self.attached_taxon_namespace and not self.unconstrained_taxa_accumulation_mode:
                     raise self._too_many_taxa_error(taxon_namespace=taxon_namespace, label=label)
                 taxon = taxon_namespace.new_taxon(label=label)
+                label_taxon_map[label_key] = taxon
             token = self._nexus_tokenizer.next_token()
             self._nexus_tokenizer.process_and_clear_comments_for_item(taxon,
                     self.extract_comment_metadata)
@@ -742,6 +789,9 @@ class NexusReader(ioservice.DataReader):
                 no_data_symbol=self._missing_char,
                 gap_symbol=self._gap_char,
                 case_sensitive=False)
+        if self.packed:
+            char_block.default_state_alphabet = sa
+            return
         char_block.state_alphabets = [sa]
         char_block.default_state_alphabet = char_block.state_alphabets[0]
 
@@ -923,6 +973,9 @@ class NexusReader(ioservice.DataReader):
     def _process_discrete_matrix_data(self, char_block):
         if self._data_type == "standard":
             self._build_state_alphabet(char_block, self._symbols)
+        if self.packed or (self.num_processes is not None and self.num_processes > 1):
+            self._process_discrete_matrix_rows(char_block)
+            return
         taxon_namespace = char_block.taxon_namespace
         token = self._nexus_tokenizer.next_token()
         state_alphabet = char_block.default_state_alphabet
@@ -948,6 +1001,188 @@ class NexusReader(ioservice.DataReader):
                         % (taxon.label, self._file_specified_nchar, len(char_block[taxon]), char_block[taxon].symbols_as_string()))
                 token = self._nexus_tokenizer.next_token()
 
+    def _process_discrete_matrix_rows(self, char_block):
+        """
+        Reads the MATRIX statement in its entirety and parses it line by line
+        into rows of state indexes (see
+        :func:`~dendropy.dataio.nexusprocessing.parse_matrix_rows()`), in
+        chunks of rows that are parsed in worker processes if
+        ``self.num_processes`` is greater than 1. The rows are then merged
+        into the sequences of the taxa, with multistate groups and MATCHCHAR
+        symbols being resolved, and the sequences are added to ``char_block``.
+        """
+        state_alphabet = char_block.default_state_alphabet
+        original_states = state_alphabet.states
+        if len(original_states) >= nexusprocessing.MATRIX_MULTISTATE_INDEX:
+            raise self._nexus_error("State alphabet has too many states ({}) to be parsed as state indexes".format(len(original_states)))
+        symbol_index_table = nexusprocessing.compile_matrix_symbol_index_table(state_alphabet, self._match_char)
+        first_line_num = self._nexus_tokenizer.current_line_num
+        text = self._nexus_tokenizer.read_past_char(";")
+        if "[" in text:
+            text = nexusprocessing.strip_matrix_comments(text)
+        jobs = []
+        start = 0
+        line_num = first_line_num
+        while start < len(text):
+            end = text.find("\n", start + self.matrix_chunk_size)
+            if end < 0:
+                end = len(text)
+            jobs.append((text[start:end], line_num, symbol_index_table, self.preserve_underscores))
+            line_num += text.count("\n", start, end)
+            start = end
+        del text
+        if self.num_processes is not None and self.num_processes > 1 and len(jobs) > 1:
+            import multiprocessing
+            pool = multiprocessing.Pool(processes=min(self.num_processes, len(jobs)))
+            try:
+                chunk_rows = pool.imap(nexusprocessing._parse_matrix_rows_job, jobs)
+                self._merge_matrix_rows(char_block, chunk_rows)
+                pool.close()
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            chunk_rows = (nexusprocessing.parse_matrix_rows(*job) for job in jobs)
+            self._merge_matrix_rows(char_block, chunk_rows)
+
+    def _merge_matrix_rows(self, char_block, chunk_rows):
+        taxon_namespace = char_block.taxon_namespace
+        state_alphabet = char_block.default_state_alphabet
+        original_states = state_alphabet.states
+        nchar = self._file_specified_nchar
+        # sequences of state indexes, and of multistates (by position), of
+        # the taxa in order of their first row
+        sequences = collections.OrderedDict()
+        sequence_multistates = {}
+        label_taxon_map = {}
+        current_taxon = None
+        line_num = None
+        for rows in chunk_rows:
+            for line_num, label, is_quoted, label_symbols, symbols in rows:
+                try:
+                    if current_taxon is not None:
+                        # continuation of the row of a non-interleaved matrix
+                        if label is not None:
+                            if is_quoted:
+                                raise self._invalid_character_state_symbol_error(state_alphabet, "'")
+                            self._extend_matrix_row(current_taxon, label_symbols, sequences, sequence_multistates, state_alphabet)
+                        self._extend_matrix_row(current_taxon, symbols, sequences, sequence_multistates, state_alphabet)
+                    else:
+                        if label is None:
+                            raise self._nexus_error("Expecting taxon label at start of matrix row")
+                        if self.case_sensitive_taxon_labels:
+                            label_key = label
+                        else:
+                            label_key = label.lower()
+                        taxon = label_taxon_map.get(label_key, None)
+                        if taxon is None:
+                            taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=label)
+                            label_taxon_map[label_key] = taxon
+                        if taxon not in sequences:
+                            sequences[taxon] = bytearray()
+                            sequence_multistates[taxon] = {}
+                        self._extend_matrix_row(taxon, symbols, sequences, sequence_multistates, state_alphabet)
+                        if not self._interleave:
+                            current_taxon = taxon
+                    if current_taxon is not None and len(sequences[current_taxon]) >= nchar:
+                        current_taxon = None
+                except error.DataParseError as e:
+                    e.line_num = line_num
+                    e.col_num = None
+                    raise
+        if current_taxon is not None:
+            exc = self._nexus_error("Insufficient characters given for taxon '{}': expecting {} but only found {}".format(
+                current_taxon.label, nchar, len(sequences[current_taxon])))
+            exc.line_num = line_num
+            exc.col_num = None
+            raise exc
+        if self.packed:
+            if any(sequence_multistates.values()):
+                # new multistates without symbols are not indexed when they are
+                # created
+                state_alphabet.compile_symbol_lookup_mappings()
+            final_states = state_alphabet.states
+            if len(final_states) >= nexusprocessing.MATRIX_MULTISTATE_INDEX:
+                raise self._nexus_error("State alphabet has too many states ({}) to be stored as bytes".format(len(final_states)))
+            if final_states != original_states:
+                # indexes of existing states are changed by adding multistates
+                index_map = bytes(bytearray([state.index for state in original_states]
+                    + list(range(len(original_states), 256))))
+            else:
+                index_map = None
+            for taxon, seq in sequences.items():
+                if index_map is not None:
+                    seq = seq.translate(index_map)
+                for pos, state in sequence_multistates[taxon].items():
+                    seq[pos] = state.index
+                char_block[taxon] = seq
+        else:
+            index_state_list = list(original_states) + [None] * (256 - len(original_states))
+            for taxon, seq in sequences.items():
+                states = [index_state_list[idx] for idx in seq]
+                for pos, state in sequence_multistates[taxon].items():
+                    states[pos] = state
+                char_block[taxon].extend(states)
+
+    def _extend_matrix_row(self, taxon, symbols, sequences, sequence_multistates, state_alphabet):
+        indexes, multistates, invalid_symbol = symbols
+        if invalid_symbol is not None:
+            if invalid_symbol in "({":
+                # as when reading tokens until the closing character
+                raise self._nexus_error("Unexpected end of row in multistate group beginning with '{}'".format(invalid_symbol),
+                        tokenizer.Tokenizer.UnexpectedEndOfStreamError)
+            raise self._invalid_character_state_symbol_error(state_alphabet, invalid_symbol)
+        seq = sequences[taxon]
+        offset = len(seq)
+        if offset + len(indexes) > self._file_specified_nchar:
+            excess_pos = self._file_specified_nchar - offset
+            excess_index = indexes[excess_pos]
+            if excess_index == nexusprocessing.MATRIX_MULTISTATE_INDEX:
+                character = [ms[2] for ms in multistates if ms[0] == excess_pos][0]
+            elif excess_index == nexusprocessing.MATRIX_MATCH_CHAR_INDEX:
+                character = sorted(self._match_char)[0]
+            else:
+                character = state_alphabet.states[excess_index]
+            raise self._too_many_characters_error(character)
+        seq.extend(indexes)
+        if multistates:
+            multistate_map = sequence_multistates[taxon]
+            for pos, opening_char, multistate_symbols in multistates:
+                if opening_char == "{":
+                    multistate_type = state_alphabet.AMBIGUOUS_STATE
+                else:
+                    multistate_type = state_alphabet.POLYMORPHIC_STATE
+                multistate_map[offset + pos] = self._get_state_for_multistate_tokens(
+                        multistate_symbols,
+                        multistate_type,
+                        state_alphabet)
+        match_char_index = bytes(bytearray([nexusprocessing.MATRIX_MATCH_CHAR_INDEX]))
+        pos = seq.find(match_char_index, offset)
+        if pos < 0:
+            return
+        first_taxon = next(iter(sequences))
+        if first_taxon is taxon:
+            raise self._nexus_error("Cannot dereference MATCHCHAR '{}' on first sequence".format(sorted(self._match_char)[0]))
+        first_seq = sequences[first_taxon]
+        first_multistate_map = sequence_multistates[first_taxon]
+        while pos >= 0:
+            if pos >= len(first_seq):
+                raise self._nexus_error("Cannot dereference MATCHCHAR '{}': current position ({}) exceeds length of first sequence ({})".format(
+                        sorted(self._match_char)[0],
+                        pos + 1,
+                        len(first_seq)))
+            seq[pos] = first_seq[pos]
+            if pos in first_multistate_map:
+                sequence_multistates[taxon][pos] = first_multistate_map[pos]
+            pos = seq.find(match_char_index, pos + 1)
+
+    def _invalid_character_state_symbol_error(self, state_alphabet, symbol):
+        return self._nexus_error("Unrecognized character state symbol for state alphabet '{}' ({}) : '{}'".format(
+                    state_alphabet.label,
+                    state_alphabet.__class__.__name__,
+                    symbol),
+                    NexusReader.InvalidCharacterStateSymbolError)
+
     def _get_state_for_multistate_tokens(self,
             state_char_seq,
             multistate_type,
@@ -975,11 +1210,14 @@ class NexusReader(ioservice.DataReader):
     ###########################################################################
     ## TREE / TREE BLOCK PARSERS
 
-    def _parse_tree_statement(self, tree_factory, taxon_symbol_mapper):
+    def _parse_tree_statement(self, tree_factory, taxon_symbol_mapper, is_lookahead_deferred=False):
         """
         Processes a TREE command. Assumes that the file reader is
         positioned right after the "TREE" token in a TREE command.
-        Calls on the NewickStatementParser of the trees module.
+        Calls on the NewickStatementParser of the trees module. If
+        ``is_lookahead_deferred`` is |True|, then the current token on return
+        is the terminating semi-colon (see
+        :meth:`NewickReader._parse_tree_statement()`).
         """
         token = self._nexus_tokenizer.next_token()
         if token == '*':
@@ -992,10 +1230,12 @@ class NexusReader(ioservice.DataReader):
         tree_comments = self._nexus_tokenizer.pull_captured_comments()
         # advance to '('; comments will be processed by newick reader
         self._nexus_tokenizer.next_token()
-        tree = self._build_tree_from_newick_tree_string(tree_factory, taxon_symbol_mapper)
+        tree = self._build_tree_from_newick_tree_string(tree_factory, taxon_symbol_mapper,
+                is_lookahead_deferred=is_lookahead_deferred)
         tree.label = tree_name
-        nexusprocessing.process_comments_for_item(tree, pre_tree_comments, self.extract_comment_metadata)
-        nexusprocessing.process_comments_for_item(tree, tree_comments, self.extract_comment_metadata)
+        if not self.structure_only:
+            nexusprocessing.process_comments_for_item(tree, pre_tree_comments, self.extract_comment_metadata)
+            nexusprocessing.process_comments_for_item(tree, tree_comments, self.extract_comment_metadata)
         # if self.extract_comment_metadata:
         #     annotations = nexustokenizer.parse_comment_metadata(tree_comments)
         #     for annote in annotations:
@@ -1010,11 +1250,28 @@ class NexusReader(ioservice.DataReader):
         #     self._nexus_tokenizer.skip_to_semicolon()
         return tree
 
-    def _build_tree_from_newick_tree_string(self, tree_factory, taxon_symbol_mapper):
+    def _skip_tree_statement(self):
+        """
+        Skips over a TREE command without parsing it, by scanning for the
+        terminating semi-colon. Assumes that the file reader is positioned
+        right after the "TREE" token in a TREE command. As with
+        :meth:`NexusReader._parse_tree_statement()`, the current token on
+        return will be the token immediately following the terminating
+        semi-colon.
+        """
+        self._nexus_tokenizer.skip_past_char(";")
+        self._nexus_tokenizer.clear_captured_comments()
+        token = self._nexus_tokenizer.next_token()
+        while token == ";" and not self._nexus_tokenizer.is_eof():
+            self._nexus_tokenizer.clear_captured_comments()
+            token = self._nexus_tokenizer.next_token()
+
+    def _build_tree_from_newick_tree_string(self, tree_factory, taxon_symbol_mapper, is_lookahead_deferred=False):
         tree = self.newick_reader._parse_tree_statement(
                 nexus_tokenizer=self._nexus_tokenizer,
                 tree_factory=tree_factory,
-                taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+                taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol,
+                is_lookahead_deferred=is_lookahead_deferred)
         return tree
 
     def _parse_translate_statement(self, taxon_namespace, taxon_symbol_mapper=None):
@@ -1032,18 +1289,25 @@ class NexusReader(ioservice.DataReader):
             # Badly-formed NEXUS file, yet widely-found in the wild
             # Override namespace modification lock
             taxon_namespace.is_mutable = True
+        label_taxon_map = nexusprocessing.build_label_taxon_map(taxon_namespace)
         while True:
             translation_token = self._nexus_tokenizer.next_token()
             if translation_token == ";" and not self._nexus_tokenizer.is_token_quoted:
                 raise self._nexus_error("Expecting translation token but found ';' instead")
             translation_label = self._nexus_tokenizer.next_token()
-            try:
-                taxon = taxon_namespace.require_taxon(label=translation_label)
-            except error.ImmutableTaxonNamespaceError:
-                exc = self._undefined_taxon_error(taxon_namespace=taxon_namespace, label=translation_label)
-                exc.__context__ = None # Python 3.0, 3.1, 3.2
-                exc.__cause__ = None # Python 3.3, 3.4
-                raise exc
+            label_key = nexusprocessing.taxon_label_key(taxon_namespace, translation_label)
+            taxon = label_taxon_map.get(label_key, None)
+            if taxon is None:
+                # as 'taxon_namespace.require_taxon()' would, given that the
+                # label is not in the namespace
+                try:
+                    taxon = taxon_namespace.new_taxon(label=translation_label)
+                except error.ImmutableTaxonNamespaceError:
+                    exc = self._undefined_taxon_error(taxon_namespace=taxon_namespace, label=translation_label)
+                    exc.__context__ = None # Python 3.0, 3.1, 3.2
+                    exc.__cause__ = None # Python 3.3, 3.4
+                    raise exc
+                label_taxon_map[label_key] = taxon
             taxon_symbol_mapper.add_translate_token(translation_token, taxon)
             token = self._nexus_tokenizer.next_token() # ","
             if (not token) or (token == ';'):
@@ -1144,7 +1408,9 @@ class NexusReader(ioservice.DataReader):
                     raise self._nexus_error('Expecting "=" after character set name "%s", but instead found "%s"' % (charset_name, token))
                 else:
                     positions = self._parse_positions(adjust_to_zero_based=True)
-                char_matrix.new_character_subset(charset_name, positions)
+                # character subsets are not represented in packed matrices
+                if not self.packed:
+                    char_matrix.new_character_subset(charset_name, positions)
 
     def _parse_positions(self, adjust_to_zero_based=True, verify=True):
         """
@@ -162,6 +162,9 @@ class NexusWriter(ioservice.DataWriter):
             annotations. The format specifier should be given in Python's
             string format specification mini-language. E.g. ".8f", ".4E",
             "8.4f".
+        writer_engine : string, {['standard'], 'streaming'}
+            The engine used to write tree statements; see
+            :class:`~dendropy.dataio.newickwriter.NewickWriter`.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
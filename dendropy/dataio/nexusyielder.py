@@ -50,6 +50,14 @@ class NexusTreeDataYielder(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer
+            Number of trees at the beginning of each source to skip. These
+            trees are not parsed: the source is only scanned for the ends of
+            their tree statements.
+        tree_stride : integer
+            Only every ``tree_stride``-th tree of each source following the
+            first ``tree_offset`` trees will be yielded, with the trees in
+            between skipped without being parsed.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `nexusreader.NexusReader`
             class. See `nexusreader.NexusReader` for details.
@@ -57,7 +65,9 @@ class NexusTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", None),
+                tree_stride=kwargs.pop("tree_stride", None))
         self.assume_newick_if_not_nexus = kwargs.pop("assume_newick_if_not_nexus", False)
         kwargs["attached_taxon_namespace"] = self.attached_taxon_namespace
         nexusreader.NexusReader.__init__(self, **kwargs)
@@ -73,6 +83,7 @@ class NexusTreeDataYielder(
                 preserve_unquoted_underscores=self.preserve_underscores)
         else:
             self._nexus_tokenizer.set_stream(stream)
+        self._stream_tree_offset = 0
         token = self._nexus_tokenizer.next_token()
         if token.upper() != "#NEXUS":
             if self.assume_newick_if_not_nexus:
@@ -81,12 +92,21 @@ class NexusTreeDataYielder(
                         enable_lookup_by_taxon_number=False,
                         )
                 while True:
+                    if not self._is_tree_selected(self._stream_tree_offset):
+                        if not self.newick_reader._skip_tree_statement(self._nexus_tokenizer):
+                            break
+                        self._stream_tree_offset += 1
+                        continue
                     tree = self._build_tree_from_newick_tree_string(
                             tree_factory=self.tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
+                            taxon_symbol_mapper=taxon_symbol_mapper,
+                            is_lookahead_deferred=True)
                     if tree is None:
                         break
+                    self._current_tree_offset = self._stream_tree_offset
+                    self._stream_tree_offset += 1
                     yield tree
+                    self.newick_reader._consume_tree_statement_end(self._nexus_tokenizer)
             else:
                 raise self._nexus_error("Expecting '#NEXUS', but found '{}'".format(token),
                         nexusreader.NexusReader.NotNexusFileError)
@@ -158,11 +178,21 @@ class NexusTreeDataYielder(
                     ## the terminating semi-colon of a tree
                     ## statement. Typically, this will be
                     ## 'TREE' if there is another tree, or
-                    ## 'END'/'ENDBLOCK'.
-                    tree = self._parse_tree_statement(
-                            tree_factory=tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
-                    yield tree
+                    ## 'END'/'ENDBLOCK'. The source is only read
+                    ## past the semi-colon once the next tree is
+                    ## requested.
+                    if self._is_tree_selected(self._stream_tree_offset):
+                        tree = self._parse_tree_statement(
+                                tree_factory=tree_factory,
+                                taxon_symbol_mapper=taxon_symbol_mapper,
+                                is_lookahead_deferred=True)
+                        self._current_tree_offset = self._stream_tree_offset
+                        self._stream_tree_offset += 1
+                        yield tree
+                        self.newick_reader._consume_tree_statement_end(self._nexus_tokenizer)
+                    else:
+                        self._skip_tree_statement()
+                        self._stream_tree_offset += 1
                     if self._nexus_tokenizer.is_eof() or not self._nexus_tokenizer.current_token:
                         break
                     if self._nexus_tokenizer.cast_current_token_to_ucase() != "TREE":
@@ -172,7 +202,7 @@ class NexusTreeDataYielder(
                 raise self._nexus_error("'BEGIN' found without completion of previous block",
                         nexusreader.NexusReader.IncompleteBlockError)
         self._nexus_tokenizer.skip_to_semicolon() # move past END command
-        raise StopIteration
+        return
 
 class NexusNewickTreeDataYielder(NexusTreeDataYielder):
 
@@ -0,0 +1,357 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Parallel (multi-process) tree iterator.
+"""
+
+import os
+import re
+import locale
+import collections
+import multiprocessing
+from dendropy.utility import error
+from dendropy.utility import textprocessing
+from dendropy.utility import filesys
+from dendropy.utility.textprocessing import StringIO
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import compacttreemodel
+from dendropy.dataio import ioservice
+
+##############################################################################
+## Worker Support
+
+def _read_trees_from_source(schema, tree_type, source, kwargs):
+    """
+    Parses all the trees in ``source``, returning a tuple consisting of the
+    |TaxonNamespace| and the list of |Tree| objects created. ``source`` is a
+    tuple consisting of a path, start and end byte offsets, data string and
+    the line number of the first line of the data, where either the path or
+    the data string is |None|.
+    """
+    from dendropy import dataio
+    path, start, end, data, first_line_num = source
+    if data is None:
+        with open(path, "rb") as src:
+            src.seek(start)
+            data = src.read(end - start)
+        data = data.decode(locale.getpreferredencoding(False))
+    taxon_namespace = taxonmodel.TaxonNamespace()
+    if not data.strip():
+        return taxon_namespace, []
+    tree_yielder = dataio.get_tree_yielder(
+            files=[StringIO(data)],
+            schema=schema,
+            taxon_namespace=taxon_namespace,
+            tree_type=tree_type,
+            **kwargs)
+    try:
+        trees = list(tree_yielder)
+    except error.DataParseError as e:
+        # the original exception cannot be sent back to the main process as
+        # it references the (closed) stream, and its location is relative to
+        # the start of the chunk
+        line_num = e.line_num
+        if line_num is not None:
+            if first_line_num is None:
+                with open(path, "rb") as src:
+                    first_line_num = src.read(start).count(b"\n") + 1
+            line_num += first_line_num - 1
+        raise error.DataParseError(
+                message=e.message,
+                line_num=line_num,
+                col_num=e.col_num,
+                filename=path)
+    return taxon_namespace, trees
+
+##############################################################################
+## ParallelTreeDataYielder
+
+class ParallelTreeDataYielder(ioservice.TreeDataYielder):
+    """
+    Iterates over trees from multiple sources, parsing the sources in a pool of
+    worker processes.
+
+    Each file is parsed in its entirety by a single worker process, except for
+    NEWICK files, which are split into chunks of approximately
+    ``chunk_size`` bytes that are parsed independently. Chunk boundaries are
+    placed at the ends of lines that end with a semi-colon, and thus this
+    assumes that tree statements are not broken across lines at semi-colons
+    that are found in comments or quoted labels. Trees are yielded in the
+    same order as they are found in the sources, and bound to the shared
+    |TaxonNamespace|, in which taxa are accessioned in the same order as
+    they would be if the sources were read sequentially. File-like objects
+    and compressed files are read (and decompressed) in the main process,
+    with the chunks of NEWICK data being passed to the worker processes as
+    they are read, and other data being read into memory in its entirety
+    before being parsed. Trees excluded by ``tree_offset`` and
+    ``tree_stride`` are skipped without being parsed by the worker
+    processes, except in chunked NEWICK files, where they are parsed and then
+    discarded by the main process (as the position of a chunk's trees in the
+    file is not known until all previous chunks have been parsed).
+
+    The trees are transferred from the worker processes to the main process
+    by pickling, so very deeply-nested trees may exceed the recursion limit.
+    """
+
+    # approximate size (in bytes) of the chunks into which NEWICK files are
+    # split
+    chunk_size = 4194304
+
+    # number of bytes to read at a time when searching for chunk boundaries
+    _boundary_search_block_size = 65536
+
+    _newick_statement_boundary_pattern = re.compile(b";[ \t\r]*\n")
+    _newick_statement_boundary_str_pattern = re.compile(";[ \t\r]*\n")
+
+    def __init__(self,
+            files=None,
+            schema=None,
+            taxon_namespace=None,
+            tree_type=None,
+            num_processes=None,
+            **kwargs):
+        """
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string, then it is assumed to be a path to a file. Otherwise, the
+            source is assumed to be a file-like object.
+        schema : string
+            The name of the data format (e.g., "newick" or "nexus").
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        tree_type : type
+            The class of the trees to be created.
+        num_processes : integer
+            Number of worker processes. If |None|, then one process per CPU
+            will be used.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the schema-specific tree yielder
+            used in the worker processes.
+        """
+        ioservice.TreeDataYielder.__init__(self,
+                files=files,
+                taxon_namespace=taxon_namespace,
+                tree_type=tree_type,
+                tree_offset=kwargs.pop("tree_offset", None),
+                tree_stride=kwargs.pop("tree_stride", None))
+        self.schema = schema
+        if num_processes is None:
+            num_processes = multiprocessing.cpu_count()
+        self.num_processes = num_processes
+        self.case_sensitive_taxon_labels = kwargs.get("case_sensitive_taxon_labels", False)
+        self.yielder_kwargs = kwargs
+
+    ###########################################################################
+    ## Source Partitioning
+
+    def _iter_sources(self):
+        """
+        Iterates over the units of work as tuples of the index of the file
+        that they come from and the source specification passed to the worker
+        processes.
+        """
+        is_chunked = self.schema.lower() == "newick"
+        for file_index, current_file in enumerate(self.files):
+            if (textprocessing.is_str_type(current_file)
+                    and filesys.detect_compression(current_file) is not None):
+                with filesys.open_text_file(current_file, "r") as src:
+                    for source in self._iter_stream_sources(src, current_file, is_chunked):
+                        yield file_index, source
+            elif textprocessing.is_str_type(current_file):
+                if is_chunked:
+                    boundaries = self._find_chunk_boundaries(current_file)
+                else:
+                    boundaries = [0, os.path.getsize(current_file)]
+                for start, end in zip(boundaries[:-1], boundaries[1:]):
+                    yield file_index, (current_file, start, end, None, None if start else 1)
+            else:
+                try:
+                    name = current_file.name
+                except AttributeError:
+                    name = None
+                for source in self._iter_stream_sources(current_file, name, is_chunked):
+                    yield file_index, source
+
+    def _iter_stream_sources(self, stream, name, is_chunked):
+        """
+        Iterates over the source specifications of the data read from
+        ``stream``.
+        """
+        if is_chunked:
+            chunks = self._iter_stream_chunks(stream)
+        else:
+            chunks = [stream.read()]
+        line_num = 1
+        for chunk in chunks:
+            yield (name, None, None, chunk, line_num)
+            line_num += chunk.count("\n")
+
+    def _iter_stream_chunks(self, stream):
+        """
+        Reads ``stream`` incrementally, iterating over chunks of complete tree
+        statements, so that only about one chunk of the data is held in memory
+        at a time (e.g., when reading from a compressed file).
+        """
+        data = ""
+        while True:
+            block = stream.read(self.chunk_size)
+            if block:
+                data += block
+            while len(data) > self.chunk_size:
+                m = self._newick_statement_boundary_str_pattern.search(data, self.chunk_size)
+                if m is None:
+                    break
+                yield data[:m.end()]
+                data = data[m.end():]
+            if not block:
+                break
+        yield data
+
+    def _find_chunk_boundaries(self, path):
+        """
+        Returns a list of byte offsets splitting the file at ``path`` into
+        chunks of complete tree statements.
+        """
+        file_size = os.path.getsize(path)
+        boundaries = [0]
+        with open(path, "rb") as src:
+            target = self.chunk_size
+            while target < file_size:
+                src.seek(target)
+                offset = target
+                tail = b""
+                boundary = None
+                while boundary is None:
+                    block = src.read(self._boundary_search_block_size)
+                    if not block:
+                        break
+                    buf = tail + block
+                    m = self._newick_statement_boundary_pattern.search(buf)
+                    if m is not None:
+                        boundary = offset - len(tail) + m.end()
+                    else:
+                        # keep the end of the block in case the boundary
+                        # spans blocks
+                        tail = buf[-64:]
+                        offset += len(block)
+                if boundary is None or boundary >= file_size:
+                    break
+                boundaries.append(boundary)
+                target = max(boundary, target) + self.chunk_size
+        boundaries.append(file_size)
+        return boundaries
+
+    ###########################################################################
+    ## Taxon Binding
+
+    def _bind_trees(self, worker_taxon_namespace, trees):
+        """
+        Binds trees constructed in a worker process to the shared
+        |TaxonNamespace|.
+        """
+        label_taxon_map = {}
+        for taxon in self.taxon_namespace:
+            if taxon.label is None:
+                continue
+            if self.case_sensitive_taxon_labels:
+                label_taxon_map.setdefault(taxon.label, taxon)
+            else:
+                label_taxon_map.setdefault(taxon.lower_cased_label, taxon)
+        taxon_map = {}
+        for taxon in worker_taxon_namespace:
+            if taxon.label is None:
+                shared_taxon = None
+            elif self.case_sensitive_taxon_labels:
+                shared_taxon = label_taxon_map.get(taxon.label, None)
+            else:
+                shared_taxon = label_taxon_map.get(taxon.lower_cased_label, None)
+            if shared_taxon is None:
+                self.taxon_namespace.add_taxon(taxon)
+                shared_taxon = taxon
+            taxon_map[taxon] = shared_taxon
+        for tree in trees:
+            tree.taxon_namespace = self.taxon_namespace
+            if isinstance(tree, compacttreemodel.CompactTree):
+                tree.node_taxa = [taxon_map[t] if t is not None else None for t in tree.node_taxa]
+                continue
+            for nd in tree:
+                if nd.taxon is not None:
+                    nd.taxon = taxon_map[nd.taxon]
+        return trees
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def __iter__(self):
+        is_chunked = self.schema.lower() == "newick"
+        yielder_kwargs = dict(self.yielder_kwargs)
+        if not is_chunked:
+            yielder_kwargs["tree_offset"] = self.tree_offset
+            yielder_kwargs["tree_stride"] = self.tree_stride
+        pool = multiprocessing.Pool(processes=self.num_processes)
+        try:
+            pending = collections.deque()
+            sources = self._iter_sources()
+            current_file_index = None
+            file_tree_idx = 0
+            # keep a limited number of units of work in flight, so that parsed
+            # trees do not accumulate faster than they are consumed
+            max_pending = 2 * self.num_processes
+            while True:
+                while len(pending) < max_pending:
+                    try:
+                        file_index, source = next(sources)
+                    except StopIteration:
+                        break
+                    result = pool.apply_async(_read_trees_from_source,
+                            (self.schema, self.tree_type, source, yielder_kwargs))
+                    pending.append( (file_index, source, result) )
+                if not pending:
+                    break
+                file_index, source, result = pending.popleft()
+                worker_taxon_namespace, trees = result.get()
+                self._current_file_index = file_index
+                self._current_file_name = source[0]
+                if file_index != current_file_index:
+                    current_file_index = file_index
+                    file_tree_idx = 0
+                if is_chunked:
+                    selected_trees = []
+                    for tree in trees:
+                        if self._is_tree_selected(file_tree_idx):
+                            selected_trees.append( (file_tree_idx, tree) )
+                        file_tree_idx += 1
+                else:
+                    selected_trees = []
+                    for tree in trees:
+                        selected_trees.append( (self.tree_offset + file_tree_idx * self.tree_stride, tree) )
+                        file_tree_idx += 1
+                self._bind_trees(worker_taxon_namespace, [tree for idx, tree in selected_trees])
+                for idx, tree in selected_trees:
+                    self._current_tree_offset = idx
+                    yield tree
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
@@ -0,0 +1,156 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Cache of the trees built from tree statements, keyed by a hash of the
+statement text, so that repeated statements are not parsed again.
+"""
+
+import collections
+
+class TreeParseCache(object):
+    """
+    A least-recently-used cache of the structures of trees parsed from NEWICK
+    tree statements, for use by |NewickReader| (see the "``parse_cache``"
+    keyword argument of :meth:`Tree.get()`, :meth:`TreeList.get()` and
+    :meth:`Tree.yield_from_files()`).
+
+    Each entry is keyed by a digest of the text of a tree statement (and of
+    the settings of the reader that parsed it), and holds a record of the
+    structure, labels, taxa, edge lengths, comments and (unparsed) metadata
+    of the tree built from the statement. When the same statement is read
+    again, a new tree is built directly from the record instead of by parsing
+    the statement, which is much faster for highly redundant collections of
+    trees, such as posterior samples of MCMC analyses of few taxa. The trees
+    yielded are always new objects: records are never shared with trees.
+
+    The number of entries and the total number of nodes of the cached trees
+    are bounded by ``max_size`` and ``max_nodes``, with the least recently
+    used entries being evicted first. The counts of look-ups that succeeded
+    (``hits``) and failed (``misses``), and of evicted entries
+    (``evictions``), are kept for tuning these limits.
+
+    A cache can be shared by several readers (e.g., over successive calls to
+    :meth:`Tree.get()`), but records are only reused for trees that reference
+    the same |TaxonNamespace| as the tree they were made from.
+
+    Usage::
+
+        parse_cache = dendropy.dataio.parsecache.TreeParseCache(max_size=10000)
+        for tree in dendropy.Tree.yield_from_files(
+                files=["run1.trees", "run2.trees"],
+                schema="newick",
+                parse_cache=parse_cache):
+            ...
+        print(parse_cache.hit_rate())
+
+    """
+
+    def __init__(self, max_size=1024, max_nodes=None):
+        """
+        Parameters
+        ----------
+        max_size : integer
+            Maximum number of entries. Defaults to 1024.
+        max_nodes : integer
+            Maximum total number of nodes of the trees of all entries. If
+            |None| (default), then the number of nodes is not limited.
+        """
+        if max_size < 1:
+            raise ValueError("'max_size' must be at least 1: {}".format(max_size))
+        if max_nodes is not None and max_nodes < 1:
+            raise ValueError("'max_nodes' must be at least 1: {}".format(max_nodes))
+        self.max_size = max_size
+        self.max_nodes = max_nodes
+        self._entries = collections.OrderedDict()
+        self._num_nodes = 0
+        self.reset_counters()
+
+    def __len__(self):
+        """
+        Number of entries in the cache.
+        """
+        return len(self._entries)
+
+    def _get_num_nodes(self):
+        return self._num_nodes
+    num_nodes = property(_get_num_nodes)
+
+    def reset_counters(self):
+        """
+        Resets the counts of hits, misses and evictions to 0.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def hit_rate(self):
+        """
+        Returns the proportion of look-ups that found an entry, or |None| if
+        there have been no look-ups.
+        """
+        num_lookups = self.hits + self.misses
+        if not num_lookups:
+            return None
+        return float(self.hits) / num_lookups
+
+    def clear(self):
+        """
+        Discards all entries (but not the counters).
+        """
+        self._entries.clear()
+        self._num_nodes = 0
+
+    def get(self, key, taxon_namespace):
+        """
+        Returns the record stored under ``key`` for trees referencing
+        ``taxon_namespace``, or |None| if there is none, counting the look-up
+        as a hit or a miss.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] is not taxon_namespace:
+            self.misses += 1
+            if entry is not None:
+                self._num_nodes -= entry[2]
+            return None
+        # re-inserted as most recently used
+        self._entries[key] = entry
+        self.hits += 1
+        return entry[1]
+
+    def add(self, key, taxon_namespace, record, num_nodes):
+        """
+        Stores ``record``, the record of a tree of ``num_nodes`` nodes
+        referencing ``taxon_namespace``, under ``key``, evicting the least
+        recently used entries as needed to keep within the limits of the
+        cache. Records of trees with more than ``max_nodes`` nodes are not
+        stored.
+        """
+        if self.max_nodes is not None and num_nodes > self.max_nodes:
+            return
+        entries = self._entries
+        entry = entries.pop(key, None)
+        if entry is not None:
+            self._num_nodes -= entry[2]
+        entries[key] = (taxon_namespace, record, num_nodes)
+        self._num_nodes += num_nodes
+        while (len(entries) > self.max_size
+                or (self.max_nodes is not None and self._num_nodes > self.max_nodes)):
+            evicted_key, evicted_entry = entries.popitem(last=False)
+            self._num_nodes -= evicted_entry[2]
+            self.evictions += 1
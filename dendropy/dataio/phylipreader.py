@@ -22,6 +22,7 @@ Implementation of PHYLIP-format data reader.
 
 
 import re
+import itertools
 from dendropy.dataio import ioservice
 from dendropy.utility import filesys
 from dendropy.utility import error
@@ -85,6 +86,13 @@ class PhylipReader(ioservice.DataReader):
         ignore_invalid_chars : bool
             If |True| then any invalid characters in sequences will be ignored.
             Default is |False|: invalid characters result in errors.
+        packed: bool
+            If |True|, then the symbols of each sequence are translated in
+            bulk into the state indexes of a
+            :class:`~dendropy.datamodel.packedcharmatrixmodel.PackedCharacterMatrix`
+            (the character matrix factory is expected to create objects of
+            this type) instead of into |StateIdentity| objects. Default is
+            |False|.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
@@ -112,6 +120,7 @@ class PhylipReader(ioservice.DataReader):
         self.multispace_delimiter = kwargs.pop("multispace_delimiter", False)
         self.underscores_to_spaces = kwargs.pop("underscores_to_spaces", False)
         self.ignore_invalid_chars = kwargs.pop("ignore_invalid_chars", False)
+        self.packed = kwargs.pop("packed", False)
         self.default_state_alphabet = kwargs.pop("default_state_alphabet", None)
         if self.default_state_alphabet is not None:
             if self.data_type is None:
@@ -167,20 +176,26 @@ class PhylipReader(ioservice.DataReader):
                     self.data_type,
                     label=None,
                     taxon_namespace=self.taxon_namespace)
-            if self.data_type == "standard":
+            if self.data_type == "standard" and not self.packed:
                 state_alphabet = state_alphabet_factory(
                     fundamental_states="0123456789",
                     no_data_symbol="?",
                     gap_symbol="-",
                     case_sensitive=False)
                 self.char_matrix.state_alphabets.append(state_alphabet)
-        lines = filesys.get_lines(stream)
-        if len(lines) == 0:
+        if isinstance(stream, filesys.MappedTextFile):
+            # lines are decoded from the memory map one at a time instead of
+            # the entire source being read into memory
+            lines = stream.iter_lines()
+        else:
+            lines = iter(filesys.get_lines(stream))
+        leading_lines = list(itertools.islice(lines, 3))
+        if len(leading_lines) == 0:
             raise error.DataSourceError("No data in source", stream=self.stream)
-        elif len(lines) <= 2:
+        elif len(leading_lines) <= 2:
             raise error.DataParseError("Expecting at least 2 lines in PHYLIP format data source", stream=self.stream)
-        desc_line = lines[0]
-        lines = lines[1:]
+        desc_line = leading_lines[0]
+        lines = itertools.chain(leading_lines[1:], lines)
         m = re.match('\s*(\d+)\s+(\d+)\s*$', desc_line)
         if m is None:
             raise self._data_parse_error("Invalid data description line: '%s'" % desc_line)
@@ -240,17 +255,32 @@ class PhylipReader(ioservice.DataReader):
                 else:
                     self.char_matrix[current_taxon].append(state)
         else:
-            for c in line:
-                if c in [' ', '\t']:
-                    continue
+            if self.packed:
                 try:
-                    state = self.char_matrix.default_state_alphabet[c]
-                except KeyError:
-                    if not self.ignore_invalid_chars:
-                        raise self._data_parse_error("Invalid state symbol for taxon '%s': '%s'" % (current_taxon.label, c),
-                                line_index=line_index)
-                else:
-                    self.char_matrix[current_taxon].append(state)
+                    self.char_matrix[current_taxon].extend(
+                            self.char_matrix.state_indexes_for_symbols(line, ignore_chars=" \t"))
+                    return
+                except ValueError:
+                    # invalid symbols are skipped or reported as below
+                    pass
+            symbol_state_map = self.char_matrix.default_state_alphabet.full_symbol_state_map
+            symbols = line.replace(' ', '').replace('\t', '')
+            try:
+                states = [symbol_state_map[c] for c in symbols]
+            except KeyError:
+                states = []
+                for c in symbols:
+                    try:
+                        state = symbol_state_map[c]
+                    except KeyError:
+                        if not self.ignore_invalid_chars:
+                            raise self._data_parse_error("Invalid state symbol for taxon '%s': '%s'" % (current_taxon.label, c),
+                                    line_index=line_index)
+                    else:
+                        states.append(state)
+            if self.packed:
+                states = [state.index for state in states]
+            self.char_matrix[current_taxon].extend(states)
 
     def _parse_sequential(self, lines, line_num_start=1):
         seq_labels = []
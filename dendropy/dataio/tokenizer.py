@@ -17,8 +17,36 @@
 ##############################################################################
 
 import sys
+import re
 from dendropy.utility import error
 
+##############################################################################
+## Support
+
+class _StreamRecorder(object):
+    """
+    Wraps a source stream, keeping a copy of all the text read from it.
+    """
+
+    # number of reads after which the text read is joined into a single part
+    _parts_per_block = 4096
+
+    def __init__(self, src):
+        self.src = src
+        self._blocks = []
+        self._parts = []
+
+    def read(self, size=-1):
+        s = self.src.read(size)
+        self._parts.append(s)
+        if len(self._parts) >= self._parts_per_block:
+            self._blocks.append("".join(self._parts))
+            self._parts = []
+        return s
+
+    def getvalue(self):
+        return "".join(self._blocks) + "".join(self._parts)
+
 ##############################################################################
 ## Tokenizer
 
@@ -89,18 +117,8 @@ class Tokenizer(object):
         self.capture_comments = capture_comments
         self.preserve_unquoted_underscores = preserve_unquoted_underscores
 
-        # State (internals)
-        self.src = src
-        self._cur_char = None
-        self.current_token = None
-        self.is_token_quoted = False
-
-        # Meta-information
-        self.captured_comments = []
-        self.current_line_num = 1
-        self.current_column_num = 0
-        self.token_line_num = 0
-        self.token_column_num = 0
+        # State (internals) and meta-information
+        self.set_stream(src)
 
     def reset(self):
         self.set_stream(src=None)
@@ -119,6 +137,13 @@ class Tokenizer(object):
     def is_eof(self):
         return self._cur_char == ""
 
+    def _delimiters_changed(self):
+        """
+        Called by derived classes when ``uncaptured_delimiters`` or
+        ``captured_delimiters`` have been modified in-place.
+        """
+        pass
+
     def has_captured_comments(self):
         return len(self.captured_comments) > 0
 
@@ -168,6 +193,113 @@ class Tokenizer(object):
         del self.captured_comments[:]
         return c
 
+    def skip_past_char(self, target):
+        """
+        Consumes the stream up to and including the next occurrence of the
+        character ``target`` that is not within a quoted token or a comment,
+        without assembling tokens or capturing comments. Returns |False| if
+        the end of the stream was reached before ``target`` was found.
+        """
+        if self._cur_char is None:
+            self._get_next_char()
+        # as with tokenization, a quote character only begins a quoted token
+        # if it is found at the start of a token
+        is_token_start = True
+        while self._cur_char != "":
+            if self._cur_char == target:
+                self.current_token = target
+                self.token_line_num = self.current_line_num
+                self.token_column_num = self.current_column_num
+                self._get_next_char()
+                return True
+            elif self._cur_char in self.comment_begin:
+                capture_comments = self.capture_comments
+                self.capture_comments = False
+                try:
+                    self._handle_comment()
+                finally:
+                    self.capture_comments = capture_comments
+                is_token_start = False
+            elif self._cur_char in self.quote_chars and is_token_start:
+                cur_quote_char = self._cur_char
+                self._get_next_char()
+                while True:
+                    if self._cur_char == "":
+                        raise Tokenizer.UnterminatedQuoteError(
+                                quote_char=cur_quote_char,
+                                line_num=self.current_line_num,
+                                col_num=self.current_column_num,
+                                stream=self.src)
+                    if self._cur_char == cur_quote_char:
+                        self._get_next_char()
+                        if self.escape_quote_by_doubling:
+                            if self._cur_char == cur_quote_char:
+                                self._get_next_char()
+                            else:
+                                break
+                        else:
+                            self._get_next_char()
+                            break
+                    else:
+                        self._get_next_char()
+            else:
+                # fast path: consume a run of insignificant characters without
+                # going through ``_get_next_char()`` for each of them
+                src_read = self.src.read
+                significant_chars = self.comment_begin + self.quote_chars + target
+                line_num = self.current_line_num
+                column_num = self.current_column_num
+                c = self._cur_char
+                while True:
+                    prev_c = c
+                    c = src_read(1)
+                    if c == "\n":
+                        line_num += 1
+                        column_num = 1
+                    elif c == "":
+                        break
+                    else:
+                        column_num += 1
+                    if c in significant_chars:
+                        break
+                self._cur_char = c
+                self.current_line_num = line_num
+                self.current_column_num = column_num
+                is_token_start = (prev_c in self.uncaptured_delimiters
+                        or prev_c in self.captured_delimiters)
+        return False
+
+    def read_past_char(self, target):
+        """
+        Consumes the stream up to and including the next occurrence of the
+        character ``target`` as :meth:`skip_past_char()` does, and returns
+        the text consumed before ``target`` (or before the end of the stream,
+        if ``target`` is not found) verbatim, i.e., with any quotes and
+        comments it contains.
+        """
+        pending = self._get_unconsumed_text()
+        src = self.src
+        recorder = _StreamRecorder(src)
+        self.src = recorder
+        try:
+            is_found = self.skip_past_char(target)
+        finally:
+            self.src = src
+        text = pending + recorder.getvalue()
+        num_unconsumed = len(self._get_unconsumed_text())
+        if num_unconsumed:
+            text = text[:-num_unconsumed]
+        if is_found:
+            text = text[:-1]
+        return text
+
+    def _get_unconsumed_text(self):
+        """
+        Returns the text that has been read from the source stream but not
+        yet consumed.
+        """
+        return self._cur_char or ""
+
     def __iter__(self):
         return self
 
@@ -197,7 +329,7 @@ class Tokenizer(object):
                             quote_char=cur_quote_char,
                             line_num=self.current_line_num,
                             col_num=self.current_column_num,
-                            stream=src)
+                            stream=self.src)
                 if self._cur_char == cur_quote_char:
                     self._get_next_char()
                     if self.escape_quote_by_doubling:
@@ -291,3 +423,395 @@ class Tokenizer(object):
             # self.captured_comments.append(dest.getvalue())
             self.captured_comments.append("".join(dest))
 
+
+##############################################################################
+## BufferedTokenizer
+
+class BufferedTokenizer(Tokenizer):
+    """
+    Stream tokenizer that reads the source in large blocks and extracts tokens
+    using precompiled regular expressions, instead of reading and examining the
+    source one character at a time.
+
+    Tokens, quoting, comment capture and end-of-stream behavior are identical
+    to that of |Tokenizer|. Line and column numbers are not tracked as the
+    stream is consumed, but are calculated from the buffer only when requested
+    (e.g., when reporting an error).
+    """
+
+    # number of characters to read from the source stream at a time
+    block_size = 65536
+
+    # cache of compiled patterns, keyed by the delimiter sets they are built from
+    _pattern_cache = {}
+
+    def set_stream(self, src=None):
+        self.src = src
+        self.current_token = None
+        self.is_token_quoted = False
+        self.captured_comments = []
+        self._buffer = ""
+        self._pos = 0
+        self._is_started = False
+        self._is_src_exhausted = src is None
+        # absolute offset of the first character of the buffer in the stream
+        self._buffer_offset = 0
+        # number of newlines and absolute offset of the last newline in the
+        # part of the stream that has been discarded from the buffer
+        self._discarded_newlines = 0
+        self._discarded_last_newline = -1
+        # absolute offset of the first character of the current token
+        self._token_offset = None
+        self._token_line_col = None
+        self._delimiters_changed()
+
+    def _delimiters_changed(self):
+        uncaptured = "".join(self.uncaptured_delimiters)
+        captured = "".join(self.captured_delimiters)
+        self._skip_pattern = self._get_pattern(uncaptured, True)
+        self._unquoted_pattern = self._get_pattern(
+                uncaptured + captured + self.comment_begin, False)
+        self._comment_delimiter_pattern = re.compile(
+                "[{}]".format(re.escape(self.comment_begin + self.comment_end)))
+        self._token_pattern = self._get_token_pattern(
+                uncaptured,
+                captured,
+                self.quote_chars,
+                self.comment_begin)
+
+    @classmethod
+    def _get_pattern(cls, chars, is_included):
+        """
+        Returns a pattern matching a (possibly empty) run of characters that
+        are (if ``is_included`` is |True|) or are not (otherwise) in ``chars``.
+        """
+        key = (chars, is_included)
+        try:
+            return cls._pattern_cache[key]
+        except KeyError:
+            pass
+        if not chars:
+            pattern = re.compile("" if is_included else ".*", re.DOTALL)
+        elif is_included:
+            pattern = re.compile("[{}]*".format(re.escape(chars)))
+        else:
+            pattern = re.compile("[^{}]*".format(re.escape(chars)))
+        cls._pattern_cache[key] = pattern
+        return pattern
+
+    @classmethod
+    def _get_token_pattern(cls, uncaptured, captured, quote_chars, comment_begin):
+        """
+        Returns a pattern that skips leading uncaptured delimiters and then
+        matches either a captured delimiter (group 1) or an unquoted token
+        without comments (group 2), followed by an optional uncaptured
+        delimiter (group 3).
+        """
+        key = (uncaptured, captured, quote_chars, comment_begin)
+        try:
+            return cls._pattern_cache[key]
+        except KeyError:
+            pass
+        u = re.escape(uncaptured)
+        c = re.escape(captured)
+        b = re.escape(comment_begin)
+        q = re.escape(quote_chars)
+        pattern = "{skip}(?:{captured}|([^{u}{c}{b}{q}][^{u}{c}{b}]*){terminal})".format(
+                skip="[{}]*".format(u) if u else "",
+                captured="([{}])".format(c) if c else "((?!))",
+                terminal="([{}])?".format(u) if u else "((?!))?",
+                u=u,
+                c=c,
+                b=b,
+                q=q)
+        pattern = re.compile(pattern, re.DOTALL)
+        cls._pattern_cache[key] = pattern
+        return pattern
+
+    def is_eof(self):
+        if self._pos < len(self._buffer):
+            return False
+        if not self._is_started:
+            return False
+        return not self._fill()
+
+    def _fill(self):
+        """
+        Discards consumed characters (i.e., those before ``self._pos``) from
+        the buffer and extends it with the next block from the source stream.
+        Returns |False| if the source stream is exhausted.
+        """
+        if self._is_src_exhausted:
+            return False
+        block = self.src.read(self.block_size)
+        if not block:
+            self._is_src_exhausted = True
+            return False
+        buf = self._buffer
+        cut = self._pos
+        if cut:
+            if (self._token_offset is not None
+                    and self._token_offset < self._buffer_offset + cut
+                    and self._token_line_col is None):
+                self._token_line_col = self._line_col(self._token_offset)
+            nl_count = buf.count("\n", 0, cut)
+            if nl_count:
+                self._discarded_newlines += nl_count
+                self._discarded_last_newline = self._buffer_offset + buf.rfind("\n", 0, cut)
+            self._buffer_offset += cut
+            self._buffer = buf[cut:] + block
+            self._pos = 0
+        else:
+            self._buffer = buf + block
+        return True
+
+    def _line_col(self, offset):
+        """
+        Returns the line and column number of the character at absolute
+        position ``offset`` in the stream, following the conventions of
+        |Tokenizer| (a newline character is counted as the first column of the
+        line that it begins).
+        """
+        if offset < 0:
+            return 1, 0
+        idx = offset - self._buffer_offset
+        if idx < 0:
+            # no longer in buffer
+            return 0, 0
+        line_num = 1 + self._discarded_newlines + self._buffer.count("\n", 0, idx+1)
+        last_newline = self._buffer.rfind("\n", 0, idx+1)
+        if last_newline >= 0:
+            return line_num, idx - last_newline + 1
+        elif self._discarded_last_newline >= 0:
+            return line_num, offset - self._discarded_last_newline + 1
+        else:
+            return line_num, offset + 1
+
+    def _get_current_line_col(self):
+        if self._pos >= len(self._buffer) and self._is_started:
+            # the current character is the one following the last one consumed
+            self._fill()
+        pos = self._pos
+        if pos >= len(self._buffer):
+            pos = len(self._buffer) - 1
+        return self._line_col(self._buffer_offset + pos)
+
+    def _get_current_line_num(self):
+        return self._get_current_line_col()[0]
+    current_line_num = property(_get_current_line_num)
+
+    def _get_current_column_num(self):
+        return self._get_current_line_col()[1]
+    current_column_num = property(_get_current_column_num)
+
+    def _get_token_line_col(self):
+        if self._token_offset is None:
+            return 0, 0
+        if self._token_line_col is not None:
+            return self._token_line_col
+        return self._line_col(self._token_offset)
+
+    def _get_token_line_num(self):
+        return self._get_token_line_col()[0]
+    token_line_num = property(_get_token_line_num)
+
+    def _get_token_column_num(self):
+        return self._get_token_line_col()[1]
+    token_column_num = property(_get_token_column_num)
+
+    def _start_token(self):
+        self._token_offset = self._buffer_offset + self._pos
+        self._token_line_col = None
+
+    def __next__(self):
+        self.is_token_quoted = False
+        self._is_started = True
+        # Fast path: a captured delimiter or a simple unquoted token that is
+        # entirely within the buffer.
+        buf = self._buffer
+        m = self._token_pattern.match(buf, self._pos)
+        if m is not None:
+            end = m.end()
+            token = m.group(1)
+            if token is not None:
+                self._token_offset = self._buffer_offset + end - 1
+                self._token_line_col = None
+                self._pos = end
+                self.current_token = token
+                return token
+            token = m.group(2)
+            if token is not None and (m.group(3) is not None
+                    or (end < len(buf) and buf[end] not in self.comment_begin)):
+                self._token_offset = self._buffer_offset + m.start(2)
+                self._token_line_col = None
+                self._pos = end
+                if not self.preserve_unquoted_underscores and "_" in token:
+                    token = token.replace("_", " ")
+                self.current_token = token
+                return token
+        while True:
+            # skip to significant character
+            while True:
+                self._pos = self._skip_pattern.match(self._buffer, self._pos).end()
+                if self._pos < len(self._buffer) or not self._fill():
+                    break
+            if self._pos >= len(self._buffer):
+                raise StopIteration
+            cur_char = self._buffer[self._pos]
+            if cur_char in self.captured_delimiters:
+                self._start_token()
+                self._pos += 1
+                self.current_token = cur_char
+                return cur_char
+            elif cur_char in self.quote_chars:
+                self._start_token()
+                self.is_token_quoted = True
+                self.current_token = self._read_quoted(cur_char)
+                return self.current_token
+            else:
+                self._start_token()
+                token = self._read_unquoted()
+                if token:
+                    self.current_token = token
+                    return token
+                # empty token (e.g., comments only): continue on to the next
+                # significant character, if any
+                if self._pos >= len(self._buffer) and not self._fill():
+                    self.current_token = ""
+                    raise StopIteration
+    next = __next__ # Python 2 legacy support
+
+    def _get_unconsumed_text(self):
+        return self._buffer[self._pos:]
+
+    def skip_past_char(self, target):
+        self._is_started = True
+        key = ("skip", target, self.quote_chars, self.comment_begin)
+        try:
+            pattern = self._pattern_cache[key]
+        except KeyError:
+            pattern = re.compile("[{}]".format(re.escape(target + self.quote_chars + self.comment_begin)))
+            self._pattern_cache[key] = pattern
+        is_token_start = True
+        while True:
+            buf = self._buffer
+            m = pattern.search(buf, self._pos)
+            if m is None:
+                if len(buf) > self._pos:
+                    is_token_start = (buf[-1] in self.uncaptured_delimiters
+                            or buf[-1] in self.captured_delimiters)
+                self._pos = len(buf)
+                if not self._fill():
+                    return False
+                continue
+            idx = m.start()
+            if idx > self._pos:
+                is_token_start = (buf[idx-1] in self.uncaptured_delimiters
+                        or buf[idx-1] in self.captured_delimiters)
+            cur_char = buf[idx]
+            self._pos = idx
+            if cur_char == target:
+                self._start_token()
+                self._pos += 1
+                self.current_token = target
+                return True
+            elif cur_char in self.comment_begin:
+                capture_comments = self.capture_comments
+                self.capture_comments = False
+                try:
+                    self._read_comment()
+                finally:
+                    self.capture_comments = capture_comments
+                is_token_start = False
+            elif is_token_start:
+                self._start_token()
+                self._read_quoted(cur_char)
+            else:
+                self._pos += 1
+
+    def _read_quoted(self, quote_char):
+        self._pos += 1
+        parts = []
+        while True:
+            end = self._buffer.find(quote_char, self._pos)
+            if end < 0:
+                parts.append(self._buffer[self._pos:])
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise Tokenizer.UnterminatedQuoteError(
+                            quote_char=quote_char,
+                            line_num=self.current_line_num,
+                            col_num=self.current_column_num,
+                            stream=self.src)
+                continue
+            parts.append(self._buffer[self._pos:end])
+            self._pos = end + 1
+            if self._pos >= len(self._buffer):
+                self._fill()
+            if self.escape_quote_by_doubling:
+                if self._buffer.startswith(quote_char, self._pos):
+                    parts.append(quote_char)
+                    self._pos += 1
+                    continue
+            else:
+                # as with |Tokenizer|, skip the character following the
+                # closing quote
+                self._pos = min(self._pos + 1, len(self._buffer))
+            break
+        return "".join(parts)
+
+    def _read_unquoted(self):
+        parts = []
+        unquoted_pattern = self._unquoted_pattern
+        while True:
+            buf = self._buffer
+            pos = self._pos
+            end = unquoted_pattern.match(buf, pos).end()
+            if end > pos:
+                parts.append(buf[pos:end])
+            self._pos = end
+            if end >= len(buf):
+                if self._fill():
+                    continue
+                break
+            cur_char = buf[end]
+            if cur_char in self.uncaptured_delimiters:
+                self._pos += 1
+                break
+            elif cur_char in self.captured_delimiters:
+                break
+            else:
+                self._read_comment()
+                if self._pos >= len(self._buffer) and not self._fill():
+                    break
+        if len(parts) == 1:
+            token = parts[0]
+        else:
+            token = "".join(parts)
+        if not self.preserve_unquoted_underscores and "_" in token:
+            token = token.replace("_", " ")
+        return token
+
+    def _read_comment(self):
+        self._pos += 1
+        nesting = 1
+        parts = []
+        while True:
+            m = self._comment_delimiter_pattern.search(self._buffer, self._pos)
+            if m is None:
+                parts.append(self._buffer[self._pos:])
+                self._pos = len(self._buffer)
+                if self._fill():
+                    continue
+                break
+            end = m.start()
+            parts.append(self._buffer[self._pos:end])
+            self._pos = end + 1
+            if self._buffer[end] in self.comment_end:
+                nesting -= 1
+                if nesting <= 0:
+                    break
+            else:
+                nesting += 1
+        if self.capture_comments:
+            self.captured_comments.append("".join(parts))
@@ -0,0 +1,425 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Byte-offset index of the tree statements in NEWICK and NEXUS files, allowing
+for particular trees or ranges of trees to be retrieved from a file without
+parsing the trees that precede them.
+"""
+
+import os
+import re
+import json
+import locale
+from dendropy.utility import textprocessing
+from dendropy.utility import filesys
+
+##############################################################################
+## TreeSourceIndex
+
+class TreeSourceIndex(object):
+    """
+    Records the byte offsets of the tree statements in a NEWICK or NEXUS file.
+
+    The index is built by a single streaming scan of the file that only looks
+    for statement-terminating semi-colons (skipping over comments and quoted
+    labels), and is usually stored in a "sidecar" file next to the source
+    (named by appending ``index_suffix`` to the path of the source), so that
+    subsequent accesses do not need to scan the file again. An index stored
+    on disk is considered stale, and is rebuilt, if the size or modification
+    time of the source file has changed.
+
+    Trees are extracted by composing a (much smaller) data source in the same
+    schema consisting of just the selected tree statements. For NEXUS
+    sources, these are preceded by all the content of the file outside of
+    "TREES" blocks that comes before the selected block (e.g., the "TAXA"
+    block), as well as the header of the selected "TREES" block up to its
+    first tree statement (e.g., the "TRANSLATE" statement).
+
+    Usage::
+
+        tree_index = TreeSourceIndex.get_for_path("posterior.nex", "nexus")
+        print(tree_index.num_trees())
+        trees = dendropy.TreeList.get(
+                data=tree_index.extract(start=80000, stop=80100),
+                schema="nexus")
+
+    """
+
+    # suffix appended to the source path to give the path of the index file
+    index_suffix = ".dpidx"
+
+    # number of bytes to read at a time when scanning the source
+    scan_block_size = 65536
+
+    _format_name = "dendropy-tree-index"
+    _format_version = 1
+
+    _scan_pattern = re.compile(br"[;\[']")
+    _comment_pattern = re.compile(br"[\[\]]")
+    _whitespace_pattern = re.compile(br"\s*")
+    _word_pattern = re.compile(br"[^\s()\[\],;:=']+")
+    _delimiter_pattern = re.compile(br"[\s(),:;=\[\]]")
+    _comment_str_pattern = re.compile(r"\[[^\]]*\]")
+    _block_name_pattern = re.compile(r"\bBEGIN\s+([^\s;]+)", re.IGNORECASE)
+
+    def get_index_path(cls, path):
+        """
+        Returns the path of the index file for the source file at ``path``.
+        """
+        return path + cls.index_suffix
+    get_index_path = classmethod(get_index_path)
+
+    def get_for_path(cls, path, schema, save=True):
+        """
+        Returns the index for the source file at ``path``, loading it from the
+        index file if this exists and is up to date, or building it (and, if
+        ``save`` is |True|, storing it in the index file) otherwise.
+        """
+        index_path = cls.get_index_path(path)
+        if os.path.exists(index_path):
+            try:
+                tree_index = cls.load(index_path)
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                tree_index = None
+            if (tree_index is not None
+                    and tree_index.path == os.path.abspath(path)
+                    and tree_index.schema == schema.lower()
+                    and tree_index.is_current()):
+                return tree_index
+        tree_index = cls.build(path, schema)
+        if save:
+            try:
+                tree_index.save(index_path)
+            except (IOError, OSError):
+                # e.g., source is in a read-only directory: the index is still
+                # usable, just not reused
+                pass
+        return tree_index
+    get_for_path = classmethod(get_for_path)
+
+    def get_for_stream(cls, stream, schema, save=True):
+        """
+        Returns the index for the file underlying ``stream``, which must have
+        been opened from a path.
+        """
+        path = getattr(stream, "name", None)
+        if not textprocessing.is_str_type(path) or not os.path.isfile(path):
+            raise TypeError("Tree source index can only be used when reading from a file path")
+        return cls.get_for_path(path, schema, save=save)
+    get_for_stream = classmethod(get_for_stream)
+
+    def build(cls, path, schema):
+        """
+        Scans the source file at ``path`` and returns its index.
+        """
+        schema = schema.lower()
+        if schema not in ("newick", "nexus"):
+            raise NotImplementedError("Tree source index is not supported for '{}' data".format(schema))
+        if filesys.detect_compression(path) is not None:
+            # byte offsets into the decompressed data cannot be seeked to
+            raise TypeError("Tree source index cannot be used with compressed files")
+        tree_index = cls(path=path, schema=schema)
+        with open(path, "rb") as src:
+            spans = tree_index._scan_statements(src)
+            if schema == "newick":
+                tree_index._index_newick_statements(spans)
+            else:
+                tree_index._index_nexus_statements(src, spans)
+        return tree_index
+    build = classmethod(build)
+
+    def load(cls, index_path):
+        """
+        Reads and returns an index stored in ``index_path``.
+        """
+        with open(index_path, "r") as src:
+            d = json.load(src)
+        if d["format"] != cls._format_name or d["version"] != cls._format_version:
+            raise ValueError("Unsupported tree source index format")
+        tree_index = cls(path=d["path"], schema=d["schema"])
+        tree_index.source_size = d["source_size"]
+        tree_index.source_mtime = d["source_mtime"]
+        tree_index.collections = d["collections"]
+        return tree_index
+    load = classmethod(load)
+
+    def __init__(self, path, schema):
+        self.path = os.path.abspath(path)
+        self.schema = schema.lower()
+        st = os.stat(self.path)
+        self.source_size = st.st_size
+        self.source_mtime = st.st_mtime
+        # each collection is a dictionary giving the byte offsets of the start
+        # of the block ("begin"), the start of the first tree statement
+        # ("header_end"), the end of the block ("end"), and the start and end
+        # of each tree statement ("trees")
+        self.collections = []
+
+    def save(self, index_path=None):
+        """
+        Writes the index to ``index_path`` (by default, the sidecar index file
+        of the source).
+        """
+        if index_path is None:
+            index_path = self.get_index_path(self.path)
+        d = {
+            "format": self._format_name,
+            "version": self._format_version,
+            "path": self.path,
+            "schema": self.schema,
+            "source_size": self.source_size,
+            "source_mtime": self.source_mtime,
+            "collections": self.collections,
+        }
+        with open(index_path, "w") as dest:
+            json.dump(d, dest, separators=(",", ":"))
+
+    def is_current(self):
+        """
+        Returns |True| if the source file has not changed since it was
+        indexed.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return st.st_size == self.source_size and st.st_mtime == self.source_mtime
+
+    def num_collections(self):
+        """
+        Returns the number of tree collections (e.g. NEXUS "TREES" blocks) in
+        the source.
+        """
+        return len(self.collections)
+
+    def num_trees(self, collection_offset=0):
+        """
+        Returns the number of trees in the collection given by
+        ``collection_offset``.
+        """
+        return len(self._get_collection(collection_offset)["trees"])
+
+    def extract(self, collection_offset=0, start=None, stop=None, header=None):
+        """
+        Returns a string of data, in the schema of the source, consisting of
+        the trees ``start`` to ``stop`` (with the same semantics as a list
+        slice) of the collection given by ``collection_offset``. If
+        ``header`` is given, it is used as the header of the collection
+        instead of re-reading it from the source: it must be the string
+        returned by :meth:`extract_header()` for the same collection.
+        """
+        collection = self._get_collection(collection_offset)
+        trees = collection["trees"]
+        start, stop, step = slice(start, stop).indices(len(trees))
+        if header is None:
+            header = self.extract_header(collection_offset)
+        if start < stop:
+            data = header + self._read_ranges([ (trees[start][0], trees[stop-1][1]) ])
+        else:
+            data = header
+        if self.schema == "nexus":
+            data += "\nEND;\n"
+        return data
+
+    def extract_header(self, collection_offset=0):
+        """
+        Returns a string of the data that has to precede the tree statements
+        of the collection given by ``collection_offset`` when these are
+        extracted (see :meth:`extract()`): for NEXUS sources, the content
+        of the file outside of "TREES" blocks before the collection, and the
+        header of its "TREES" block; for NEWICK sources, an empty string.
+        """
+        collection = self._get_collection(collection_offset)
+        if self.schema != "nexus":
+            return ""
+        ranges = []
+        prev_end = 0
+        for c in self.collections:
+            if c is collection:
+                break
+            ranges.append( (prev_end, c["begin"]) )
+            prev_end = c["end"]
+        ranges.append( (prev_end, collection["begin"]) )
+        ranges.append( (collection["begin"], collection["header_end"]) )
+        return self._read_ranges(ranges)
+
+    def _read_ranges(self, ranges):
+        parts = []
+        with open(self.path, "rb") as src:
+            for range_start, range_end in ranges:
+                if range_end > range_start:
+                    src.seek(range_start)
+                    parts.append(src.read(range_end - range_start))
+        data = b"".join(parts).decode(locale.getpreferredencoding(False))
+        # universal newlines, as when reading the source directly (ranges
+        # start and end on statement boundaries, so never split line endings)
+        return data.replace("\r\n", "\n").replace("\r", "\n")
+
+    def _get_collection(self, collection_offset):
+        try:
+            return self.collections[collection_offset]
+        except IndexError:
+            raise IndexError("Collection offset out of range: {} (number of collections = {}, maximum valid collection offset = {})".format(collection_offset, len(self.collections), len(self.collections)-1))
+
+    ###########################################################################
+    ## Scanning
+
+    def _scan_statements(self, src):
+        """
+        Returns a list of tuples giving the start and end offsets and the
+        (upper-cased) first word of each non-empty statement in ``src``. A
+        statement is taken to start immediately after the end of the previous
+        one, so includes any leading whitespace and comments.
+        """
+        spans = []
+        buf = b""
+        base = 0
+        pos = 0
+        statement_start = 0
+        word = None
+        comment_depth = 0
+        in_quote = False
+        is_final = False
+        while True:
+            # keep one byte before the current position so that it is
+            # possible to tell whether a quote starts a token
+            keep_from = max(pos - 1, 0)
+            base += keep_from
+            pos -= keep_from
+            block = src.read(self.scan_block_size)
+            if block:
+                buf = buf[keep_from:] + block
+            else:
+                buf = buf[keep_from:]
+                is_final = True
+            buf_len = len(buf)
+            while True:
+                if comment_depth:
+                    m = self._comment_pattern.search(buf, pos)
+                    if m is None:
+                        pos = buf_len
+                        break
+                    pos = m.end()
+                    if m.group() == b"[":
+                        comment_depth += 1
+                    else:
+                        comment_depth -= 1
+                elif in_quote:
+                    idx = buf.find(b"'", pos)
+                    if idx < 0:
+                        pos = buf_len
+                        break
+                    if idx + 1 >= buf_len and not is_final:
+                        # cannot tell if this is an escaped quote yet
+                        pos = idx
+                        break
+                    if buf[idx+1:idx+2] == b"'":
+                        pos = idx + 2
+                    else:
+                        in_quote = False
+                        pos = idx + 1
+                elif word is None:
+                    pos = self._whitespace_pattern.match(buf, pos).end()
+                    if pos >= buf_len:
+                        break
+                    c = buf[pos:pos+1]
+                    if c == b"[":
+                        comment_depth = 1
+                        pos += 1
+                    elif c == b"'":
+                        word = b""
+                        in_quote = True
+                        pos += 1
+                    elif c == b";":
+                        # empty statement
+                        pos += 1
+                        statement_start = base + pos
+                    else:
+                        m = self._word_pattern.match(buf, pos)
+                        if m is None:
+                            word = c
+                            pos += 1
+                        elif m.end() >= buf_len and not is_final:
+                            break
+                        else:
+                            word = m.group().upper()
+                            pos = m.end()
+                else:
+                    m = self._scan_pattern.search(buf, pos)
+                    if m is None:
+                        pos = buf_len
+                        break
+                    c = m.group()
+                    pos = m.end()
+                    if c == b";":
+                        spans.append( (statement_start, base + pos, word) )
+                        statement_start = base + pos
+                        word = None
+                    elif c == b"[":
+                        comment_depth = 1
+                    elif m.start() == 0 or self._delimiter_pattern.match(buf, m.start()-1):
+                        in_quote = True
+            if is_final:
+                break
+        if word is not None:
+            # unterminated final statement
+            spans.append( (statement_start, base + buf_len, word) )
+        return spans
+
+    def _index_newick_statements(self, spans):
+        self.collections = [{
+            "begin": 0,
+            "header_end": 0,
+            "end": self.source_size,
+            "trees": [[start, end] for start, end, word in spans],
+            }]
+
+    def _index_nexus_statements(self, src, spans):
+        self.collections = []
+        collection = None
+        for start, end, word in spans:
+            if word == b"BEGIN" or word == b"#NEXUS":
+                src.seek(start)
+                statement = src.read(end - start).decode(locale.getpreferredencoding(False))
+                statement = self._comment_str_pattern.sub(" ", statement)
+                m = self._block_name_pattern.search(statement)
+                if m is not None and m.group(1).upper() == "TREES":
+                    collection = {
+                        "begin": start,
+                        "header_end": None,
+                        "end": None,
+                        "trees": [],
+                        }
+                    self.collections.append(collection)
+            elif collection is None:
+                continue
+            elif word == b"TREE" or word == b"UTREE":
+                if collection["header_end"] is None:
+                    collection["header_end"] = start
+                collection["trees"].append([start, end])
+            elif word == b"END" or word == b"ENDBLOCK":
+                if collection["header_end"] is None:
+                    collection["header_end"] = start
+                collection["end"] = end
+                collection = None
+        if collection is not None:
+            # unterminated block
+            if collection["header_end"] is None:
+                collection["header_end"] = self.source_size
+            collection["end"] = self.source_size
@@ -36,6 +36,42 @@ class XmlNamespaces(object):
             self.namespace_prefix_map[namespace] = [prefix]
         self.prefix_namespace_map[prefix] = namespace
 
+def iterparse_elements(source, namespace_registry=None):
+    """
+    Incrementally parses the XML document in ``source`` (a file path or a
+    file object), yielding a tuple ``(event, element, parent)`` for the start
+    (``event`` is "start") and for the end (``event`` is "end") of each
+    element, where ``element`` is the ``ElementTree.Element`` object and
+    ``parent`` is that of the enclosing element (|None| for the root
+    element). On the start of an element only its attributes are available;
+    on its end, its text and all its subelements are available.
+
+    Namespace declarations are added to ``namespace_registry`` (if given) as
+    they are encountered. Elements are *not* freed automatically: to keep the
+    memory used by the document bounded, callers should remove each element
+    from its parent (``parent.remove(element)``) once it has been processed.
+    """
+    events = "start", "end", "start-ns"
+    element_stack = []
+    for event, elem in ElementTree.iterparse(source, events):
+        if event == "start":
+            if element_stack:
+                parent = element_stack[-1]
+            else:
+                parent = None
+            element_stack.append(elem)
+            yield event, elem, parent
+        elif event == "end":
+            element_stack.pop()
+            if element_stack:
+                parent = element_stack[-1]
+            else:
+                parent = None
+            yield event, elem, parent
+        elif namespace_registry is not None:
+            prefix, namespace = elem
+            namespace_registry.add_namespace(prefix=prefix, namespace=namespace)
+
 class XmlObject(object):
 
     def __init__(self):
@@ -21,6 +21,7 @@ Infrastructure for phylogenetic data objects.
 """
 
 import os
+import io
 import copy
 import sys
 import collections
@@ -33,6 +34,7 @@ from dendropy.utility import textprocessing
 from dendropy.utility import urlio
 from dendropy.utility import error
 from dendropy.utility import deprecate
+from dendropy.utility import filesys
 
 ##############################################################################
 ## Keyword Processor
@@ -53,6 +55,30 @@ def _extract_serialization_target_keyword(kwargs, target_type):
     schema = kwargs.pop("schema")
     return found_kw[0], target, schema
 
+def _is_binary_schema(schema):
+    from dendropy import dataio
+    return dataio.is_binary_schema(schema)
+
+def _open_path_for_reading(path, schema, kwargs):
+    use_mmap = kwargs.pop("use_mmap", False)
+    if _is_binary_schema(schema):
+        return filesys.open_binary_file(path, "r")
+    return filesys.open_text_file(path, "r", use_mmap=use_mmap)
+
+def _new_string_stream(schema, src=None):
+    """
+    Returns a file-like object reading the data ``src`` or, if ``src`` is
+    |None|, to which data is to be written, which is in binary mode if
+    ``schema`` is a binary schema.
+    """
+    if _is_binary_schema(schema):
+        stream_type = io.BytesIO
+    else:
+        stream_type = StringIO
+    if src is None:
+        return stream_type()
+    return stream_type(src)
+
 ##############################################################################
 ## DataObject
 
@@ -62,6 +88,9 @@ class DataObject(object):
     Base class for all phylogenetic data objects.
     """
 
+    # no instance dictionary is imposed on derived classes that declare slots
+    __slots__ = ()
+
     def __init__(self, label=None):
         self._label = None
         if label is not None:
@@ -112,6 +141,82 @@ class DataObject(object):
         """
         raise NotImplementedError
 
+##############################################################################
+## Slots
+
+# Classes of which there are many instances (e.g., |Node|, |Edge| and
+# |Bipartition|) store their attributes in slots rather than in an instance
+# dictionary, which is only created if other attributes are set on an object.
+# As objects with slots are only pickled with protocols 0 and 1 if they define
+# ``__getstate__()``, these classes get and set their state with
+# ``get_slots_state()`` and ``set_slots_state()``.
+
+_SLOT_NAMES = {}
+
+def get_slot_names(cls):
+    """
+    Returns a list of the names of the slots declared by ``cls`` and its base
+    classes, other than those of the instance dictionary and of weak
+    references (if any).
+    """
+    try:
+        return _SLOT_NAMES[cls]
+    except KeyError:
+        pass
+    names = []
+    for c in cls.__mro__:
+        slots = c.__dict__.get("__slots__", ())
+        if textprocessing.is_str_type(slots):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    _SLOT_NAMES[cls] = names
+    return names
+
+def get_instance_dict(obj):
+    """
+    Returns the instance dictionary of ``obj``, or an empty dictionary if it
+    has none. Objects of classes with slots (e.g., |Node| and |Edge|) only
+    get an instance dictionary when an attribute other than those of the
+    slots is set, or when the dictionary is read: an empty dictionary that
+    is created by reading it here is discarded again.
+    """
+    try:
+        instance_dict = obj.__dict__
+    except AttributeError:
+        return {}
+    if not instance_dict and get_slot_names(obj.__class__):
+        del obj.__dict__
+    return instance_dict
+
+def get_slots_state(obj):
+    """
+    Returns the state of ``obj`` for pickling: a dictionary of the values of
+    the slots that are set and of the attributes in the instance dictionary
+    (if any).
+    """
+    state = dict(get_instance_dict(obj))
+    for name in get_slot_names(obj.__class__):
+        try:
+            state[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    return state
+
+def set_slots_state(obj, state):
+    """
+    Restores the state of ``obj`` from a dictionary returned by
+    ``get_slots_state()``: values of slots are set as attributes, and the
+    others are added to the instance dictionary.
+    """
+    slot_names = get_slot_names(obj.__class__)
+    for name, value in state.items():
+        if name in slot_names:
+            object.__setattr__(obj, name, value)
+        else:
+            obj.__dict__[name] = value
+
 ##############################################################################
 ## Deserializable
 
@@ -204,7 +309,12 @@ class Deserializable(object):
             Arguments to customize parsing, instantiation, processing, and
             accession of objects read from the data source, including schema-
             or format-specific handling. These will be passed to the underlying
-            schema-specific reader for handling.
+            schema-specific reader for handling. In addition, if
+            ``use_mmap`` is |True|, then the file will be read through a
+            memory map (see :class:`~dendropy.utility.filesys.MappedTextFile`)
+            instead of being opened as a regular file. Files compressed using
+            gzip, bzip2 or xz are detected and decompressed as they are read
+            (see :func:`~dendropy.utility.filesys.open_text_file`).
 
         Returns
         -------
@@ -212,7 +322,7 @@ class Deserializable(object):
             New instance of object, constructed and populated from data given
             in source.
         """
-        with open(src, "r", newline=None) as fsrc:
+        with _open_path_for_reading(src, schema, kwargs) as fsrc:
             return cls._parse_and_create_from_stream(stream=fsrc,
                     schema=schema,
                     **kwargs)
@@ -240,7 +350,7 @@ class Deserializable(object):
             New instance of object, constructed and populated from data given
             in source.
         """
-        ssrc = StringIO(src)
+        ssrc = _new_string_stream(schema, src)
         return cls._parse_and_create_from_stream(stream=ssrc,
                 schema=schema,
                 **kwargs)
@@ -396,7 +506,12 @@ class MultiReadable(object):
             Arguments to customize parsing, instantiation, processing, and
             accession of objects read from the data source, including schema-
             or format-specific handling. These will be passed to the underlying
-            schema-specific reader for handling.
+            schema-specific reader for handling. In addition, if
+            ``use_mmap`` is |True|, then the file will be read through a
+            memory map (see :class:`~dendropy.utility.filesys.MappedTextFile`)
+            instead of being opened as a regular file. Files compressed using
+            gzip, bzip2 or xz are detected and decompressed as they are read
+            (see :func:`~dendropy.utility.filesys.open_text_file`).
 
         Returns
         -------
@@ -409,7 +524,7 @@ class MultiReadable(object):
                 - |CharacterMatrix|: number of sequences
                 - |DataSet|: ``tuple`` (number of taxon namespaces, number of tree lists, number of matrices)
         """
-        with open(src, "r", newline=None) as fsrc:
+        with _open_path_for_reading(src, schema, kwargs) as fsrc:
             return self._parse_and_add_from_stream(stream=fsrc, schema=schema, **kwargs)
 
     def read_from_string(self, src, schema, **kwargs):
@@ -439,7 +554,7 @@ class MultiReadable(object):
                 - |CharacterMatrix|: number of sequences
                 - |DataSet|: ``tuple`` (number of taxon namespaces, number of tree lists, number of matrices)
         """
-        s = StringIO(src)
+        s = _new_string_stream(schema, src)
         return self._parse_and_add_from_stream(stream=s, schema=schema, **kwargs)
 
     def read_from_url(self, src, schema, **kwargs):
@@ -596,9 +711,16 @@ class Serializable(object):
 
     def write_to_path(self, dest, schema, **kwargs):
         """
-        Writes to file specified by ``dest``.
+        Writes to file specified by ``dest``. If the name of the file has the
+        extension ".gz", ".bz2" or ".xz", then the data is compressed (using
+        gzip, bzip2 or xz, respectively) as it is written.
         """
-        with open(os.path.expandvars(os.path.expanduser(dest)), "w") as f:
+        dest = os.path.expandvars(os.path.expanduser(dest))
+        if _is_binary_schema(schema):
+            f = filesys.open_binary_file(dest, "w")
+        else:
+            f = filesys.open_text_file(dest, "w")
+        with f:
             return self._format_and_write_to_stream(stream=f, schema=schema, **kwargs)
 
     def as_string(self, schema, **kwargs):
@@ -617,8 +739,11 @@ class Serializable(object):
             value passed as the "``schema``" argument. See "|Schemas|" for more
             details.
 
+        For binary schemas (e.g., "binary-trees"), the data is returned as
+        bytes.
+
         """
-        s = StringIO()
+        s = _new_string_stream(schema)
         self._format_and_write_to_stream(stream=s, schema=schema, **kwargs)
         return s.getvalue()
 
@@ -631,9 +756,14 @@ class Annotable(object):
     or other information as metadata should subclass.
     """
 
+    # no instance dictionary is imposed on derived classes that declare slots
+    __slots__ = ()
+
     def _get_annotations(self):
         if not hasattr(self, "_annotations"):
             self._annotations = AnnotationSet(self)
+        elif not isinstance(self._annotations, AnnotationSet):
+            self._parse_deferred_annotations()
         return self._annotations
     def _set_annotations(self, annotations):
         if hasattr(self, "_annotations") \
@@ -651,9 +781,41 @@ class Annotable(object):
     annotations = property(_get_annotations, _set_annotations)
 
     def _has_annotations(self):
-        return hasattr(self, "_annotations") and len(self._annotations) > 0
+        return hasattr(self, "_annotations") and len(self.annotations) > 0
     has_annotations = property(_has_annotations)
 
+    def add_deferred_annotations(self, source, parse_fn):
+        """
+        Registers a source of annotations (e.g., a metadata comment) that is
+        only parsed into |Annotation| objects, by calling
+        "``parse_fn(source, annotations)``" (which is expected to add the
+        annotations to the |AnnotationSet| object ``annotations``), when the
+        ``annotations`` attribute of ``self`` is first accessed. Until then,
+        the sources are kept, in the order in which they are registered, in
+        place of the |AnnotationSet| object, so that objects whose annotations
+        are never accessed do not pay the cost of parsing them.
+
+        Parameters
+        ----------
+        source : object
+            The source of the annotations.
+        parse_fn : function object
+            The function that adds the annotations parsed from ``source`` to
+            an |AnnotationSet| object.
+        """
+        if not hasattr(self, "_annotations"):
+            self._annotations = [(source, parse_fn)]
+        elif isinstance(self._annotations, AnnotationSet):
+            parse_fn(source, self._annotations)
+        else:
+            self._annotations.append((source, parse_fn))
+
+    def _parse_deferred_annotations(self):
+        deferred_annotations = self._annotations
+        self._annotations = AnnotationSet(self)
+        for source, parse_fn in deferred_annotations:
+            parse_fn(source, self._annotations)
+
     def copy_annotations_from(self,
             other,
             attribute_object_mapper=None):
@@ -705,7 +867,7 @@ class Annotable(object):
         if hasattr(other, "_annotations"):
             if attribute_object_mapper is None:
                 attribute_object_mapper = {id(object):self}
-            for a1 in other._annotations:
+            for a1 in other.annotations:
                 a2 = a1.clone(attribute_object_mapper=attribute_object_mapper)
                 if a2.is_attribute and a2._value[0] is other:
                     a2._value = (attribute_object_mapper.get(id(other), other), a2._value[1])
@@ -725,7 +887,7 @@ class Annotable(object):
                 raise TypeError("Cannot deep-copy annotations from different type (unable to assume object equivalence in dynamic or nested annotations)")
             if memo is None:
                 memo = {}
-            for a1 in other._annotations:
+            for a1 in other.annotations:
                 a2 = copy.deepcopy(a1, memo=memo)
                 memo[id(a1)] = a2
                 if a2.is_attribute and a1._value[0] is other:
@@ -775,13 +937,20 @@ class Annotable(object):
             # store
             memo[id(self)] = other
         # copy other attributes first, skipping annotations
-        for k in self.__dict__:
+        for k in get_slot_names(self.__class__):
+            if k == "_annotations" or hasattr(other, k) or not hasattr(self, k):
+                continue
+            v = getattr(self, k)
+            setattr(other, k, copy.deepcopy(v, memo))
+            memo[id(v)] = getattr(other, k)
+        self_dict = get_instance_dict(self)
+        for k in self_dict:
             if k == "_annotations":
                 continue
             if k in other.__dict__:
                 continue
-            other.__dict__[k] = copy.deepcopy(self.__dict__[k], memo)
-            memo[id(self.__dict__[k])] = other.__dict__[k]
+            other.__dict__[k] = copy.deepcopy(self_dict[k], memo)
+            memo[id(self_dict[k])] = other.__dict__[k]
             # assert id(self.__dict__[k]) in memo
         # create annotations
         other.deep_copy_annotations_from(self, memo)
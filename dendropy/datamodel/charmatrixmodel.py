@@ -28,6 +28,7 @@ from dendropy.utility import textprocessing
 from dendropy.utility import error
 from dendropy.utility import deprecate
 from dendropy.utility import container
+from dendropy.utility import filesys
 from dendropy.datamodel import charstatemodel
 from dendropy.datamodel.charstatemodel import DNA_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import RNA_STATE_ALPHABET
@@ -516,11 +517,16 @@ class CharacterMatrix(
             return taxon_namespace
         label = kwargs.pop("label", None)
         kwargs["data_type"] = cls.data_type
+        if kwargs.get("packed", False):
+            from dendropy.datamodel.packedcharmatrixmodel import new_packed_char_matrix
+            char_matrix_factory = new_packed_char_matrix
+        else:
+            char_matrix_factory = new_char_matrix
         reader = dataio.get_reader(schema, **kwargs)
         char_matrices = reader.read_char_matrices(
                 stream=stream,
                 taxon_namespace_factory=tns_factory,
-                char_matrix_factory=new_char_matrix,
+                char_matrix_factory=char_matrix_factory,
                 state_alphabet_factory=charstatemodel.StateAlphabet,
                 global_annotations_target=None)
         if len(char_matrices) == 0:
@@ -568,6 +574,14 @@ class CharacterMatrix(
             - **matrix_offset** (*int*) -- 0-based index of character block or
               matrix in source to be parsed. If not specified then the
               first matrix (offset = 0) is assumed.
+            - **packed** (*bool*) -- If |True|, then the sequences are read
+              into compact arrays of state indexes, and a
+              :class:`~dendropy.datamodel.packedcharmatrixmodel.PackedCharacterMatrix`
+              is returned instead of a |CharacterMatrix| object (FASTA,
+              PHYLIP and NEXUS schemas, discrete data types only). This is much faster
+              and uses much less memory than reading a full matrix, which can
+              be obtained from the result on demand using
+              :meth:`PackedCharacterMatrix.to_char_matrix()`.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -672,7 +686,7 @@ class CharacterMatrix(
         character matrix. Component parts will be recorded as character
         subsets.
         """
-        streams = [open(path, "rU") for path in paths]
+        streams = [filesys.open_text_file(path, "r") for path in paths]
         return cls.concatenate_from_streams(streams, schema, **kwargs)
     concatenate_from_paths = classmethod(concatenate_from_paths)
 
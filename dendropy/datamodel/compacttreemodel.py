@@ -0,0 +1,546 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+This module provides a compact, array-based representation of the topology
+of a tree, as an alternative to the full |Node| and |Edge| object model.
+"""
+
+import array
+import collections
+from dendropy.utility import bitprocessing
+from dendropy.utility import constants
+from dendropy.utility import error
+from dendropy.datamodel import basemodel
+from dendropy.datamodel import taxonmodel
+
+##############################################################################
+### CompactTree
+
+class CompactTree(
+        taxonmodel.TaxonNamespaceAssociated,
+        basemodel.DataObject):
+    """
+    A tree represented only by its structure: the parent of each node, the
+    lengths of the edges subtending the nodes, and the taxa associated with
+    the leaves.
+
+    Nodes are identified by their (0-based) indexes, and are stored in
+    preorder, i.e. the seed node is node 0 and every node comes before all of
+    its descendents, so that a reverse iteration over the indexes visits the
+    nodes in postorder. The structure is stored in the following attributes:
+
+        ``parent_indexes``
+            An ``array.array`` of integers giving the index of the parent of
+            each node (-1 for the seed node).
+        ``edge_lengths``
+            An ``array.array`` of floats giving the length of the edge
+            subtending each node, with missing lengths given by NaN.
+        ``node_taxa``
+            A list of the |Taxon| object associated with each node, or
+            |None| for nodes without taxa.
+
+    The children of each node can be obtained as arrays of child offsets and
+    child indexes (see :meth:`CompactTree.child_index_arrays()`), and the
+    taxa as an array of their indexes in the |TaxonNamespace| (see
+    :meth:`CompactTree.taxon_indexes()`). Traversals, bipartition encoding
+    and metrics (e.g., :meth:`CompactTree.length()`,
+    :meth:`CompactTree.calc_node_ages()` or, in
+    :mod:`~dendropy.calculate.treemeasure` and
+    :mod:`~dendropy.calculate.treecompare`, Colless' and Sackin's indexes and
+    Robinson-Foulds distances) are calculated directly on the arrays.
+
+    Node labels, comments and annotations are not represented. Objects of this
+    class are typically produced by reading trees with
+    "``structure_only=True``" (see :meth:`Tree.get()`), or from a |Tree|
+    using :meth:`CompactTree.from_tree()`, and can be converted into a full
+    |Tree| using :meth:`CompactTree.to_tree()`.
+    """
+
+    def from_tree(cls, tree):
+        """
+        Creates and returns a |CompactTree| with the same structure, edge
+        lengths, taxa (of all nodes), label, rooting state and weight as the
+        |Tree| ``tree``, referencing the same |TaxonNamespace| and |Taxon|
+        objects, with the nodes in the order in which they are visited by
+        :meth:`Tree.preorder_node_iter()`.
+
+        Parameters
+        ----------
+        tree : |Tree|
+            The tree to represent.
+
+        Returns
+        -------
+        t : |CompactTree|
+            A new |CompactTree| object.
+        """
+        compact_tree = cls(
+                label=tree.label,
+                taxon_namespace=tree.taxon_namespace,
+                is_rooted=tree.is_rooted,
+                weight=tree.weight)
+        nan = float("nan")
+        parent_indexes = []
+        edge_lengths = []
+        node_taxa = []
+        node_indexes = {}
+        for node in tree.preorder_node_iter():
+            parent_node = node._parent_node
+            node_indexes[id(node)] = len(parent_indexes)
+            if parent_node is None:
+                parent_indexes.append(-1)
+            else:
+                parent_indexes.append(node_indexes[id(parent_node)])
+            length = node.edge.length
+            edge_lengths.append(nan if length is None else length)
+            node_taxa.append(node.taxon)
+        compact_tree.parent_indexes = array.array("l", parent_indexes)
+        compact_tree.edge_lengths = array.array("d", edge_lengths)
+        compact_tree.node_taxa = node_taxa
+        return compact_tree
+    from_tree = classmethod(from_tree)
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        label : string
+            The label or description of the new tree.
+        taxon_namespace : |TaxonNamespace|
+            The |TaxonNamespace| object that the new tree will reference.
+        is_rooted : bool
+            Rooting state of the new tree.
+        weight : numeric
+            Weight of the new tree.
+        """
+        basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
+        taxonmodel.TaxonNamespaceAssociated.__init__(self,
+                taxon_namespace=taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None))
+        self.is_rooted = kwargs.pop("is_rooted", None)
+        self.weight = kwargs.pop("weight", None)
+        self.parent_indexes = array.array("l", (-1,))
+        self.edge_lengths = array.array("d", (float("nan"),))
+        self.node_taxa = [None]
+        if kwargs:
+            raise TypeError("Unrecognized or unsupported arguments: {}".format(kwargs))
+
+    def num_nodes(self):
+        """
+        Returns the number of nodes on the tree.
+        """
+        return len(self.parent_indexes)
+
+    def child_index_arrays(self):
+        """
+        Returns the children of all the nodes as a pair of arrays of
+        integers, ``child_offsets`` and ``child_indexes``, such that the
+        indexes of the children of the node with index ``idx`` are
+        ``child_indexes[child_offsets[idx]:child_offsets[idx+1]]``, in order.
+
+        Returns
+        -------
+        child_offsets : ``array.array``
+            Offsets in ``child_indexes`` of the children of each node, with
+            one more element than there are nodes.
+        child_indexes : ``array.array``
+            Indexes of the children of the nodes.
+        """
+        parent_indexes = self.parent_indexes
+        num_nodes = len(parent_indexes)
+        child_offsets = array.array("l", [0]) * (num_nodes + 1)
+        for parent_idx in parent_indexes:
+            # the parent of the seed node, -1, is counted as the last node
+            child_offsets[parent_idx] += 1
+        offset = 0
+        for idx in range(num_nodes):
+            num_children = child_offsets[idx]
+            child_offsets[idx] = offset
+            offset += num_children
+        child_offsets[num_nodes] = offset
+        child_indexes = array.array("l", [0]) * offset
+        next_offsets = child_offsets[:]
+        # the children of each node are found in order, as the nodes are in
+        # preorder
+        for idx in range(1, num_nodes):
+            parent_idx = parent_indexes[idx]
+            child_indexes[next_offsets[parent_idx]] = idx
+            next_offsets[parent_idx] += 1
+        return child_offsets, child_indexes
+
+    def taxon_indexes(self):
+        """
+        Returns an ``array.array`` of the (0-based) index in
+        ``self.taxon_namespace`` of the taxon of each node, or -1 for nodes
+        without taxa.
+        """
+        taxon_index_map = dict((taxon, idx) for idx, taxon in enumerate(self.taxon_namespace))
+        return array.array("l", [-1 if taxon is None else taxon_index_map[taxon] for taxon in self.node_taxa])
+
+    def _is_internal_flags(self):
+        # whether each node has children
+        is_internal = [False] * len(self.parent_indexes)
+        for parent_idx in self.parent_indexes:
+            if parent_idx >= 0:
+                is_internal[parent_idx] = True
+        return is_internal
+
+    ###########################################################################
+    ### Traversals
+
+    def preorder_node_indexes(self):
+        """
+        Returns a list of the indexes of the nodes in preorder, i.e., all the
+        indexes in order.
+        """
+        return list(range(len(self.parent_indexes)))
+
+    def postorder_node_indexes(self):
+        """
+        Returns a list of the indexes of the nodes in postorder, with the
+        children of each node visited in order (as by
+        :meth:`Tree.postorder_node_iter()`).
+        """
+        child_offsets, child_indexes = self.child_index_arrays()
+        # the reverse of a preorder traversal in which the children of each
+        # node are visited in reverse order
+        indexes = []
+        stack = [0]
+        while stack:
+            idx = stack.pop()
+            indexes.append(idx)
+            stack.extend(child_indexes[child_offsets[idx]:child_offsets[idx+1]])
+        indexes.reverse()
+        return indexes
+
+    def levelorder_node_indexes(self):
+        """
+        Returns a list of the indexes of the nodes in level order (as by
+        :meth:`Tree.levelorder_node_iter()`).
+        """
+        child_offsets, child_indexes = self.child_index_arrays()
+        indexes = [0]
+        for idx in indexes:
+            indexes.extend(child_indexes[child_offsets[idx]:child_offsets[idx+1]])
+        return indexes
+
+    def leaf_node_indexes(self):
+        """
+        Returns a list of the indexes of the leaf nodes of the tree, in
+        preorder.
+        """
+        is_internal = self._is_internal_flags()
+        return [idx for idx in range(len(is_internal)) if not is_internal[idx]]
+
+    def internal_node_indexes(self, exclude_seed_node=False):
+        """
+        Returns a list of the indexes of the internal nodes of the tree, in
+        preorder, excluding the seed node if ``exclude_seed_node`` is |True|.
+        """
+        is_internal = self._is_internal_flags()
+        start = 1 if exclude_seed_node else 0
+        return [idx for idx in range(start, len(is_internal)) if is_internal[idx]]
+
+    def child_node_indexes(self, node_index):
+        """
+        Returns a list of the indexes of the children of the node with index
+        ``node_index``, in order. To look up the children of many nodes, use
+        :meth:`CompactTree.child_index_arrays()`.
+        """
+        parent_indexes = self.parent_indexes
+        return [idx for idx in range(node_index + 1, len(parent_indexes))
+                if parent_indexes[idx] == node_index]
+
+    def ancestor_node_indexes(self, node_index, inclusive=False):
+        """
+        Returns a list of the indexes of the ancestors of the node with index
+        ``node_index``, starting with its parent (or with itself if
+        ``inclusive`` is |True|) and ending with the seed node.
+        """
+        parent_indexes = self.parent_indexes
+        indexes = []
+        idx = node_index if inclusive else parent_indexes[node_index]
+        while idx >= 0:
+            indexes.append(idx)
+            idx = parent_indexes[idx]
+        return indexes
+
+    ###########################################################################
+    ### Metrics
+
+    def length(self):
+        """
+        Returns the sum of the edge lengths of the tree, with missing lengths
+        counting as 0.
+        """
+        return sum(length for length in self.edge_lengths if length == length)
+
+    def calc_node_root_distances(self):
+        """
+        Returns a list of the sums of the edge lengths from each node to the
+        seed node, indexed by node index, with missing lengths counting as 0.
+        """
+        parent_indexes = self.parent_indexes
+        edge_lengths = self.edge_lengths
+        distances = [0.0] * len(parent_indexes)
+        for idx in range(1, len(parent_indexes)):
+            length = edge_lengths[idx]
+            if length == length:
+                distances[idx] = distances[parent_indexes[idx]] + length
+            else:
+                distances[idx] = distances[parent_indexes[idx]]
+        return distances
+
+    def max_distance_from_root(self):
+        """
+        Returns the distance of the leaf furthest from the seed node.
+        """
+        distances = self.calc_node_root_distances()
+        return max(distances[idx] for idx in self.leaf_node_indexes())
+
+    def calc_node_ages(self,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            is_force_max_age=False,
+            is_force_min_age=False):
+        """
+        Returns a list of the ages of the nodes (the sums of edge lengths from
+        each node to its leaves, with missing lengths counting as 0), indexed
+        by node index. As with :meth:`Tree.calc_node_ages()`, the age of each
+        internal node is given by its first child unless
+        ``is_force_max_age`` or ``is_force_min_age`` is |True|, and an
+        exception is raised if the paths through the other children differ
+        by more than ``ultrametricity_precision`` (unless this is negative,
+        |False| or |None|).
+
+        Parameters
+        ----------
+        ultrametricity_precision : numeric or bool or None
+            Maximum deviation from ultrametricity allowed.
+        is_force_max_age: bool
+            If |True|, each node is given the oldest age given its children.
+        is_force_min_age: bool
+            If |True|, each node is given the youngest age given its children.
+
+        Returns
+        -------
+        a : list[float]
+            The age of each node.
+        """
+        if is_force_max_age and is_force_min_age:
+            raise ValueError("Cannot specify both 'is_force_max_age' and 'is_force_min_age'")
+        check_ultrametricity = not (is_force_max_age
+                or is_force_min_age
+                or ultrametricity_precision is None
+                or ultrametricity_precision is False
+                or ultrametricity_precision < 0)
+        parent_indexes = self.parent_indexes
+        edge_lengths = self.edge_lengths
+        num_nodes = len(parent_indexes)
+        ages = [0.0] * num_nodes
+        # the age given by the first child, and the youngest and oldest ages
+        # given by any child, of each node
+        first_child_ages = [None] * num_nodes
+        min_child_ages = [None] * num_nodes
+        max_child_ages = [None] * num_nodes
+        # children come after their parents, and the first child of a node
+        # comes before its siblings
+        for idx in range(num_nodes - 1, -1, -1):
+            if min_child_ages[idx] is not None:
+                if is_force_max_age:
+                    ages[idx] = max_child_ages[idx]
+                elif is_force_min_age:
+                    ages[idx] = min_child_ages[idx]
+                else:
+                    age = first_child_ages[idx]
+                    ages[idx] = age
+                    if check_ultrametricity:
+                        d = max(age - min_child_ages[idx], max_child_ages[idx] - age)
+                        if d > ultrametricity_precision:
+                            raise error.UltrametricityError("Tree is not ultrametric within threshold of {threshold}: {deviance} (children of node {node})".format(
+                                threshold=ultrametricity_precision,
+                                deviance=d,
+                                node=idx))
+            parent_idx = parent_indexes[idx]
+            if parent_idx < 0:
+                continue
+            length = edge_lengths[idx]
+            if length == length:
+                age = ages[idx] + length
+            else:
+                age = ages[idx]
+            first_child_ages[parent_idx] = age
+            if min_child_ages[parent_idx] is None:
+                min_child_ages[parent_idx] = age
+                max_child_ages[parent_idx] = age
+            elif age < min_child_ages[parent_idx]:
+                min_child_ages[parent_idx] = age
+            elif age > max_child_ages[parent_idx]:
+                max_child_ages[parent_idx] = age
+        return ages
+
+    ###########################################################################
+    ### Bipartitions
+
+    def edge_length(self, node_index):
+        """
+        Returns the length of the edge subtending the node with index
+        ``node_index``, or |None| if the edge does not have a length.
+        """
+        length = self.edge_lengths[node_index]
+        if length != length:
+            return None
+        return length
+
+    def encode_split_bitmasks(self,
+            suppress_unifurcations=True,
+            collapse_unrooted_basal_bifurcation=True):
+        """
+        Calculates the split bitmasks of the bipartitions of this tree
+        directly from its arrays, without building |Node|, |Edge| or
+        |Bipartition| objects.
+
+        The bipartitions are those that :meth:`Tree.encode_bipartitions()`
+        would calculate on the corresponding |Tree| (with unifurcations and,
+        for unrooted trees, a basal bifurcation being collapsed in the same
+        way, and with their edge lengths merged in the same way), but this
+        tree itself is not modified.
+
+        Parameters
+        ----------
+        suppress_unifurcations : bool
+            If |True|, nodes of outdegree 1 are not considered, with the
+            lengths of their edges added to those of their children.
+        collapse_unrooted_basal_bifurcation: bool
+            If |True|, then a basal bifurcation on an unrooted tree will be
+            treated as a trifurcation.
+
+        Returns
+        -------
+        s : list[integer]
+            The split bitmasks of the bipartitions, with descendent
+            bipartitions coming before their ancestors.
+        e : list[numeric]
+            The lengths of the edges corresponding to the bipartitions, with
+            |None| for edges without lengths.
+        m : integer
+            The leafset bitmask of the whole tree.
+        """
+        parent_indexes = self.parent_indexes
+        num_nodes = len(parent_indexes)
+        taxon_bitmask = self.taxon_namespace.taxon_bitmask
+        num_children = collections.Counter(parent_indexes)
+        edge_lengths = [None if x != x else x for x in self.edge_lengths]
+        leafset_bitmasks = [0] * num_nodes
+        # the node that takes the place of each node when unifurcations are
+        # suppressed
+        effective_nodes = list(range(num_nodes))
+        collapsed_node = None
+        if (collapse_unrooted_basal_bifurcation
+                and not self.is_rooted
+                and num_children[0] == 2):
+            c0 = 1
+            c1 = next(idx for idx in range(2, num_nodes) if parent_indexes[idx] == 0)
+            if num_children[c1] >= 2:
+                to_keep, collapsed_node = c0, c1
+            elif num_children[c0] >= 2:
+                collapsed_node, to_keep = c0, c1
+            if collapsed_node is not None:
+                if edge_lengths[to_keep] is not None and edge_lengths[collapsed_node] is not None:
+                    edge_lengths[to_keep] += edge_lengths[collapsed_node]
+        nodes = []
+        for idx in range(num_nodes - 1, -1, -1):
+            n = num_children[idx]
+            if n == 0:
+                taxon = self.node_taxa[idx]
+                if taxon is not None:
+                    leafset_bitmasks[idx] = taxon_bitmask(taxon)
+                nodes.append(idx)
+            elif n == 1 and suppress_unifurcations:
+                # the single child has already been visited and recorded as
+                # the last child of this node
+                child = effective_nodes[last_child]
+                effective_nodes[idx] = child
+                if edge_lengths[idx] is not None:
+                    if edge_lengths[child] is None:
+                        edge_lengths[child] = edge_lengths[idx]
+                    else:
+                        edge_lengths[child] += edge_lengths[idx]
+            elif idx != collapsed_node:
+                nodes.append(idx)
+            parent_idx = parent_indexes[idx]
+            if parent_idx >= 0:
+                leafset_bitmasks[parent_idx] |= leafset_bitmasks[idx]
+            last_child = idx
+        tree_leafset_bitmask = leafset_bitmasks[0]
+        if self.is_rooted:
+            split_bitmasks = [leafset_bitmasks[idx] for idx in nodes]
+        else:
+            lowest_relevant_bit = bitprocessing.least_significant_set_bit(tree_leafset_bitmask)
+            split_bitmasks = []
+            for idx in nodes:
+                leafset_bitmask = leafset_bitmasks[idx]
+                if leafset_bitmask & lowest_relevant_bit:
+                    split_bitmasks.append((~leafset_bitmask) & tree_leafset_bitmask)
+                else:
+                    split_bitmasks.append(leafset_bitmask & tree_leafset_bitmask)
+        return split_bitmasks, [edge_lengths[idx] for idx in nodes], tree_leafset_bitmask
+
+    def to_tree(self, tree_type=None):
+        """
+        Returns a full |Tree| with the same structure, edge lengths, taxa,
+        label and rooting state as this tree. The new tree references the same
+        |TaxonNamespace| and |Taxon| objects as this tree.
+
+        Parameters
+        ----------
+        tree_type : type
+            The class of the tree to create; defaults to |Tree|.
+
+        Returns
+        -------
+        t : |Tree|
+            A new |Tree| object.
+        """
+        if tree_type is None:
+            from dendropy.datamodel.treemodel import Tree
+            tree_type = Tree
+        tree = tree_type(label=self.label, taxon_namespace=self.taxon_namespace)
+        tree.is_rooted = self.is_rooted
+        tree.weight = self.weight
+        node_factory = tree.node_factory
+        edge_lengths = self.edge_lengths
+        node_taxa = self.node_taxa
+        nodes = [tree.seed_node]
+        for idx, parent_idx in enumerate(self.parent_indexes):
+            if idx == 0:
+                node = tree.seed_node
+            else:
+                node = node_factory()
+                nodes[parent_idx].add_child(node)
+                nodes.append(node)
+            length = edge_lengths[idx]
+            if length == length:
+                node.edge.length = length
+            if node_taxa[idx] is not None:
+                node.taxon = node_taxa[idx]
+        return tree
+
+    def __repr__(self):
+        return "<{} object at {}: {} nodes>".format(self.__class__.__name__,
+                hex(id(self)),
+                len(self.parent_indexes))
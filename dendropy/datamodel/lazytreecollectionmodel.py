@@ -0,0 +1,297 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+This module provides a read-only collection of the trees in a file, with the
+trees being parsed only when they are accessed, as an alternative to reading
+all the trees into a |TreeList|.
+"""
+
+import collections
+from dendropy.utility import error
+from dendropy.datamodel import basemodel
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import treemodel
+from dendropy.datamodel import treecollectionmodel
+from dendropy.datamodel.compacttreemodel import CompactTree
+from dendropy import dataio
+
+##############################################################################
+### LazyTreeList
+
+class LazyTreeList(
+        taxonmodel.TaxonNamespaceAssociated,
+        basemodel.DataObject):
+    """
+    A read-only sequence of the trees of a collection of trees in a NEWICK or
+    NEXUS file, in which only the byte offsets of the tree statements are held
+    (see :class:`~dendropy.dataio.treeindex.TreeSourceIndex`), and trees are
+    parsed when they are accessed by index, slice or iteration.
+
+    The most recently accessed trees are kept in a least-recently-used cache
+    of ``cache_size`` trees, so that repeatedly accessing the same trees
+    returns the same objects without parsing them again, while the memory
+    used is bounded by the size of the cache rather than the number of trees
+    in the file. All the trees reference the same |TaxonNamespace|,
+    ``self.taxon_namespace``.
+
+    Taxa are added to the taxon namespace in the order in which they are
+    first found, as when reading the trees into a |TreeList|, as long as the
+    trees are accessed in order. With a ``tree_offset``, unless the taxa
+    are defined before the trees (e.g., by a NEXUS "TAXA" block or
+    "TRANSLATE" statement), the skipped trees are parsed once on the first
+    access to add their taxa first, so that taxon indexes and bipartition
+    bitmasks are the same as with ``TreeList.get(..., tree_offset=...)``.
+    Trees accessed out of order (e.g., ``trees[-1]`` first) can add taxa in
+    a different order.
+
+    Usage::
+
+        trees = dendropy.LazyTreeList(
+                path="posterior.nex",
+                schema="nexus",
+                tree_offset=1000)
+        print(len(trees))
+        tree = trees[5000]
+        for tree in trees:
+            print(tree.length())
+
+    """
+
+    # number of tree statements parsed at a time when iterating over the trees
+    iteration_batch_size = 64
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        path : string
+            Path to the NEWICK or NEXUS file of the trees.
+        schema : string
+            The schema of the file: "newick" or "nexus".
+        collection_offset : integer
+            0-based index of the collection of trees (e.g., NEXUS "TREES"
+            block) in the file. Defaults to 0.
+        tree_offset : integer
+            Number of trees at the start of the collection to skip (e.g., the
+            burn-in): the tree at index 0 of the sequence is the tree at
+            position ``tree_offset`` in the collection. The taxa of the
+            skipped trees are still added to the taxon namespace (see
+            above). Defaults to 0.
+        cache_size : integer
+            The maximum number of recently accessed trees to keep. Defaults to
+            100.
+        label : string
+            The label or description of the new collection.
+        taxon_namespace : |TaxonNamespace|
+            The |TaxonNamespace| object that the trees will reference. If not
+            given, a new one will be created.
+        save_tree_index : boolean
+            If |True| (default), then the index of the file is stored in a
+            file next to it for reuse (see
+            :meth:`TreeSourceIndex.get_for_path()`).
+        \*\*kwargs : keyword arguments
+            All other keyword arguments are passed to the reader when parsing
+            trees (e.g., "``rooting``", or "``structure_only``" to obtain
+            |CompactTree| objects instead of |Tree| objects).
+        """
+        path = kwargs.pop("path", None)
+        schema = kwargs.pop("schema", None)
+        if path is None:
+            raise error.UnspecifiedSourceError("Path to data source must be specified using 'path' keyword argument")
+        if schema is None:
+            raise error.UnspecifiedSchemaError("Schema must be specified using 'schema' keyword argument")
+        collection_offset = kwargs.pop("collection_offset", 0)
+        tree_offset = kwargs.pop("tree_offset", 0)
+        cache_size = kwargs.pop("cache_size", 100)
+        save_tree_index = kwargs.pop("save_tree_index", True)
+        basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
+        taxonmodel.TaxonNamespaceAssociated.__init__(self,
+                taxon_namespace=taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None))
+        if cache_size < 1:
+            raise ValueError("'cache_size' must be at least 1: {}".format(cache_size))
+        # check the reader arguments now rather than on the first access
+        dataio.get_reader(schema, **kwargs)
+        self.schema = schema
+        self.cache_size = cache_size
+        self.tree_index = dataio.treeindex.TreeSourceIndex.get_for_path(path, schema, save=save_tree_index)
+        num_trees = self.tree_index.num_trees(collection_offset)
+        if tree_offset < 0 or (tree_offset > 0 and tree_offset >= num_trees):
+            raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, num_trees, num_trees-1))
+        self.collection_offset = collection_offset
+        self.tree_offset = tree_offset
+        if kwargs.get("structure_only", False):
+            self.tree_type = CompactTree
+        else:
+            self.tree_type = treemodel.Tree
+        self._reader_kwargs = kwargs
+        self._num_trees = num_trees - tree_offset
+        self._header = None
+        self._tree_cache = collections.OrderedDict()
+
+    ###########################################################################
+    ### Tree Access
+
+    def __len__(self):
+        """
+        Number of trees in the collection.
+        """
+        return self._num_trees
+
+    def __getitem__(self, index):
+        """
+        If ``index`` is an integer, then the tree at position ``index`` is
+        returned. If ``index`` is a slice, then a |TreeList| of the trees in
+        the positions given by the slice is returned, with the trees that are
+        not in the cache being parsed together.
+
+        Parameters
+        ----------
+        index : integer or slice
+            Index or slice.
+
+        Returns
+        -------
+        t : |Tree| (or |CompactTree|) object or |TreeList| object
+
+        """
+        if isinstance(index, slice):
+            tree_list = treecollectionmodel.TreeList(taxon_namespace=self.taxon_namespace, tree_type=self.tree_type)
+            tree_list._trees.extend(self._get_trees(range(*index.indices(self._num_trees))))
+            return tree_list
+        if index < 0:
+            index += self._num_trees
+        if index < 0 or index >= self._num_trees:
+            raise IndexError("Tree index out of range: {} (number of trees = {})".format(index, self._num_trees))
+        return self._get_trees([index])[0]
+
+    def __iter__(self):
+        """
+        Returns an iterator over the trees, which are parsed
+        ``iteration_batch_size`` at a time (unless they are in the cache).
+        """
+        for start in range(0, self._num_trees, self.iteration_batch_size):
+            stop = min(start + self.iteration_batch_size, self._num_trees)
+            for tree in self._get_trees(range(start, stop)):
+                yield tree
+
+    def num_cached_trees(self):
+        """
+        Returns the number of trees currently in the cache.
+        """
+        return len(self._tree_cache)
+
+    def clear_cache(self):
+        """
+        Discards all trees in the cache.
+        """
+        self._tree_cache.clear()
+
+    def _get_trees(self, indexes):
+        """
+        Returns a list of the trees at the positions given by ``indexes``,
+        taking them from the cache if possible, and otherwise parsing them,
+        with each run of consecutive positions parsed together.
+        """
+        tree_cache = self._tree_cache
+        trees = {}
+        missing = set()
+        for idx in indexes:
+            tree = tree_cache.pop(idx, None)
+            if tree is None:
+                missing.add(idx)
+            else:
+                # re-inserted as most recently used
+                tree_cache[idx] = tree
+                trees[idx] = tree
+        run_start = None
+        run_stop = None
+        for idx in sorted(missing):
+            if idx != run_stop:
+                if run_start is not None:
+                    self._parse_trees(run_start, run_stop, trees)
+                run_start = idx
+            run_stop = idx + 1
+        if run_start is not None:
+            self._parse_trees(run_start, run_stop, trees)
+        return [trees[idx] for idx in indexes]
+
+    def _parse_trees(self, start, stop, trees):
+        """
+        Parses the trees at positions ``start`` to ``stop``, adding them to
+        the dictionary ``trees`` and the cache.
+        """
+        if not self.tree_index.is_current():
+            raise IOError("Data source has been modified: '{}'".format(self.tree_index.path))
+        if self._header is None:
+            self._header = self.tree_index.extract_header(self.collection_offset)
+            if self.tree_offset > 0:
+                self._add_skipped_tree_taxa()
+        data = self.tree_index.extract(
+                collection_offset=self.collection_offset,
+                start=start + self.tree_offset,
+                stop=stop + self.tree_offset,
+                header=self._header)
+        tree_list = treecollectionmodel.TreeList.get(
+                data=data,
+                schema=self.schema,
+                collection_offset=0,
+                taxon_namespace=self.taxon_namespace,
+                **self._reader_kwargs)
+        if len(tree_list) != stop - start:
+            raise error.DataParseError(message="Expecting {} trees but found {}: data source has been modified or is not supported".format(stop - start, len(tree_list)))
+        tree_cache = self._tree_cache
+        for idx, tree in zip(range(start, stop), tree_list):
+            trees[idx] = tree
+            tree_cache[idx] = tree
+        while len(tree_cache) > self.cache_size:
+            tree_cache.popitem(last=False)
+
+    def _add_skipped_tree_taxa(self):
+        """
+        Adds the taxa of the trees skipped by ``tree_offset`` to the taxon
+        namespace, as when reading the trees into a |TreeList|, unless the
+        taxa are defined before the trees, by parsing the skipped trees
+        ``iteration_batch_size`` at a time.
+        """
+        taxon_namespace = self.taxon_namespace
+        if self._header.strip():
+            num_taxa = len(taxon_namespace)
+            treecollectionmodel.TreeList.get(
+                    data=self.tree_index.extract(
+                        collection_offset=self.collection_offset,
+                        start=0,
+                        stop=0,
+                        header=self._header),
+                    schema=self.schema,
+                    taxon_namespace=taxon_namespace,
+                    **self._reader_kwargs)
+            if len(taxon_namespace) > num_taxa:
+                return
+        for start in range(0, self.tree_offset, self.iteration_batch_size):
+            stop = min(start + self.iteration_batch_size, self.tree_offset)
+            treecollectionmodel.TreeList.get(
+                    data=self.tree_index.extract(
+                        collection_offset=self.collection_offset,
+                        start=start,
+                        stop=stop,
+                        header=self._header),
+                    schema=self.schema,
+                    collection_offset=0,
+                    taxon_namespace=taxon_namespace,
+                    **self._reader_kwargs)
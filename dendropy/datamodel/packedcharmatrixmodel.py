@@ -0,0 +1,317 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+This module provides a compact representation of discrete character data,
+with the sequences stored as arrays of state indexes, as an alternative to
+the full |CharacterMatrix| object model.
+"""
+
+import collections
+from dendropy.datamodel import basemodel
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import charstatemodel
+
+##############################################################################
+### PackedCharacterMatrix
+
+class PackedCharacterMatrix(
+        taxonmodel.TaxonNamespaceAssociated,
+        basemodel.DataObject):
+    """
+    A matrix of discrete character data in which the sequence of each taxon
+    is stored as a ``bytearray`` of the indexes of its states in the default
+    state alphabet of the matrix, with one byte per character instead of one
+    reference to a |StateIdentity| object (and its associated character type
+    and annotation slots) per character.
+
+    The state with index ``i`` is given by ``self.states[i]``, and the
+    sequences are accessed by |Taxon| (or the index of the |Taxon| in the
+    taxon namespace) as with a |CharacterMatrix|. Character types, character
+    subsets and annotations are not represented. Objects of this class are
+    typically produced by reading FASTA, PHYLIP or NEXUS data with "``packed=True``"
+    (see :meth:`CharacterMatrix.get()`), and can be converted into a full
+    |CharacterMatrix| of the corresponding data type using
+    :meth:`PackedCharacterMatrix.to_char_matrix()`.
+    """
+
+    # Index used in the symbol lookup table for unrecognized symbols.
+    _INVALID_STATE_INDEX = 255
+    _INVALID_STATE_INDEX_BYTE = bytes(bytearray([_INVALID_STATE_INDEX]))
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        data_type : string
+            The type of data: "dna", "rna", "nucleotide", "protein",
+            "restriction", "infinite", or "standard".
+        label : string
+            The label or description of the new matrix.
+        taxon_namespace : |TaxonNamespace|
+            The |TaxonNamespace| object that the new matrix will reference.
+        default_state_alphabet : |StateAlphabet|
+            The |StateAlphabet| of the characters ("standard" data type
+            **only**). If not given, an alphabet with the state symbols 0-9
+            will be created, as for a |StandardCharacterMatrix|.
+        """
+        from dendropy.datamodel import charmatrixmodel
+        basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
+        taxonmodel.TaxonNamespaceAssociated.__init__(self,
+                taxon_namespace=taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None))
+        self.data_type = kwargs.pop("data_type", None)
+        matrix_type = charmatrixmodel.get_char_matrix_type(self.data_type)
+        default_state_alphabet = kwargs.pop("default_state_alphabet", None)
+        if issubclass(matrix_type, charmatrixmodel.FixedAlphabetCharacterMatrix):
+            if default_state_alphabet is not None:
+                raise ValueError("Cannot specify 'default_state_alphabet' with data type of '{}'".format(self.data_type))
+            default_state_alphabet = matrix_type.datatype_alphabet
+        elif matrix_type is charmatrixmodel.StandardCharacterMatrix:
+            if default_state_alphabet is None:
+                default_state_alphabet = charstatemodel.new_standard_state_alphabet()
+        else:
+            raise ValueError("Data type of '{}' cannot be represented as state indexes".format(self.data_type))
+        if kwargs:
+            raise TypeError("Unrecognized or unsupported arguments: {}".format(kwargs))
+        self._taxon_sequence_map = collections.OrderedDict()
+        self._default_state_alphabet = None
+        self.default_state_alphabet = default_state_alphabet
+
+    def _get_default_state_alphabet(self):
+        """
+        The |StateAlphabet| of the states whose indexes are stored in the
+        sequences.
+        """
+        return self._default_state_alphabet
+    def _set_default_state_alphabet(self, state_alphabet):
+        if len(state_alphabet.states) >= PackedCharacterMatrix._INVALID_STATE_INDEX:
+            raise ValueError("State alphabet has too many states ({}) to be stored as bytes".format(
+                len(state_alphabet.states)))
+        self._default_state_alphabet = state_alphabet
+        self._symbol_index_map = None
+        self._symbol_index_table = None
+    default_state_alphabet = property(_get_default_state_alphabet, _set_default_state_alphabet)
+
+    def _get_states(self):
+        """
+        The |StateIdentity| objects of the default state alphabet, in the
+        order of their indexes.
+        """
+        return self._default_state_alphabet.states
+    states = property(_get_states)
+
+    def _compile_symbol_lookup_mappings(self):
+        self._symbol_index_map = {}
+        table = bytearray([PackedCharacterMatrix._INVALID_STATE_INDEX] * 256)
+        for symbol, state in self.default_state_alphabet.full_symbol_state_map.items():
+            if symbol is None:
+                continue
+            self._symbol_index_map[symbol] = state.index
+            if len(symbol) == 1 and ord(symbol) < 128:
+                table[ord(symbol)] = state.index
+        self._symbol_index_table = bytes(table)
+
+    ###########################################################################
+    ### Sequence Access
+
+    def _resolve_key(self, key):
+        if isinstance(key, int):
+            return self.taxon_namespace[key]
+        return key
+
+    def __len__(self):
+        """
+        Number of sequences in matrix.
+        """
+        return len(self._taxon_sequence_map)
+
+    def __iter__(self):
+        """
+        Returns an iterator over the |Taxon| objects of the sequences, in the
+        order in which the sequences were added.
+        """
+        return iter(self._taxon_sequence_map)
+
+    def __contains__(self, key):
+        return self._resolve_key(key) in self._taxon_sequence_map
+
+    def __getitem__(self, key):
+        """
+        Returns the ``bytearray`` of state indexes of the sequence of the
+        |Taxon| object ``key`` (or the |Taxon| object with index ``key`` in
+        the taxon namespace). If there is no sequence for the |Taxon| object,
+        then a new, empty one is created.
+        """
+        taxon = self._resolve_key(key)
+        try:
+            return self._taxon_sequence_map[taxon]
+        except KeyError:
+            return self.new_sequence(taxon)
+
+    def __setitem__(self, key, state_indexes):
+        """
+        Sets the sequence of the |Taxon| object ``key`` (or the |Taxon| object
+        with index ``key`` in the taxon namespace) to ``state_indexes``.
+        """
+        taxon = self._resolve_key(key)
+        if taxon not in self.taxon_namespace:
+            raise ValueError(repr(key))
+        if not isinstance(state_indexes, bytearray):
+            state_indexes = bytearray(state_indexes)
+        self._taxon_sequence_map[taxon] = state_indexes
+
+    def __delitem__(self, key):
+        del self._taxon_sequence_map[self._resolve_key(key)]
+
+    def new_sequence(self, taxon, state_indexes=None):
+        """
+        Creates and returns a new sequence of state indexes, initially
+        consisting of ``state_indexes`` if given, associated with |Taxon|
+        object ``taxon``.
+        """
+        if taxon in self._taxon_sequence_map:
+            raise ValueError("Character values vector for taxon {} already exists".format(repr(taxon)))
+        if taxon not in self.taxon_namespace:
+            raise ValueError("Taxon {} is not in object taxon namespace".format(repr(taxon)))
+        seq = bytearray(state_indexes) if state_indexes is not None else bytearray()
+        self._taxon_sequence_map[taxon] = seq
+        return seq
+
+    def items(self):
+        """
+        Returns an iterator over pairs of |Taxon| objects and their sequences.
+        """
+        return iter(self._taxon_sequence_map.items())
+
+    def _get_max_sequence_size(self):
+        """
+        Maximum number of characters across all sequences in matrix.
+        """
+        return max([len(s) for s in self._taxon_sequence_map.values()] or [0])
+    max_sequence_size = property(_get_max_sequence_size)
+
+    def sequence_states(self, key):
+        """
+        Returns a list of the |StateIdentity| objects of the sequence of the
+        |Taxon| object ``key`` (or the |Taxon| object with index ``key`` in
+        the taxon namespace).
+        """
+        states = self.states
+        return [states[idx] for idx in self._taxon_sequence_map[self._resolve_key(key)]]
+
+    def symbols_as_string(self, key, sep=""):
+        """
+        Returns the symbols of the states of the sequence of the |Taxon|
+        object ``key`` (or the |Taxon| object with index ``key`` in the taxon
+        namespace) as a single string, separated by ``sep``.
+        """
+        symbols = [str(state) for state in self.states]
+        return sep.join([symbols[idx] for idx in self._taxon_sequence_map[self._resolve_key(key)]])
+
+    ###########################################################################
+    ### Symbol Translation
+
+    def state_indexes_for_symbols(self, symbols, ignore_chars=""):
+        """
+        Translates a string of state symbols into the indexes of the
+        corresponding states. Single-character ASCII symbols are translated
+        in bulk using a lookup table instead of being looked up one at a
+        time.
+
+        Parameters
+        ----------
+        symbols : string
+            The symbols to translate.
+        ignore_chars : string
+            Characters in ``symbols`` to skip (e.g., whitespace).
+
+        Returns
+        -------
+        b : ``bytearray``
+            The indexes of the states.
+
+        Raises
+        ------
+        ValueError
+            If ``symbols`` includes a symbol (other than those in
+            ``ignore_chars``) that is not recognized by the state alphabet of
+            the matrix.
+        """
+        if self._symbol_index_table is None:
+            self._compile_symbol_lookup_mappings()
+        try:
+            encoded = symbols.encode("ascii")
+            state_indexes = encoded.translate(self._symbol_index_table, ignore_chars.encode("ascii"))
+        except UnicodeError:
+            pass
+        else:
+            if state_indexes.find(PackedCharacterMatrix._INVALID_STATE_INDEX_BYTE) < 0:
+                return bytearray(state_indexes)
+        symbol_index_map = self._symbol_index_map
+        state_indexes = bytearray()
+        for symbol in symbols:
+            if symbol in ignore_chars:
+                continue
+            try:
+                state_indexes.append(symbol_index_map[symbol])
+            except KeyError:
+                raise ValueError("Unrecognized sequence symbol '{}'".format(symbol))
+        return state_indexes
+
+    ###########################################################################
+    ### Conversion
+
+    def to_char_matrix(self, char_matrix_type=None):
+        """
+        Returns a full |CharacterMatrix| with the same sequences, taxa and
+        label as this matrix. The new matrix references the same
+        |TaxonNamespace|, |Taxon| and |StateIdentity| objects as this matrix.
+
+        Parameters
+        ----------
+        char_matrix_type : type
+            The class of the matrix to create; defaults to the
+            |CharacterMatrix| class of the data type of this matrix (e.g.,
+            |DnaCharacterMatrix| for DNA data).
+
+        Returns
+        -------
+        m : |CharacterMatrix|
+            A new |CharacterMatrix| object.
+        """
+        from dendropy.datamodel import charmatrixmodel
+        if char_matrix_type is None:
+            char_matrix_type = charmatrixmodel.get_char_matrix_type(self.data_type)
+        if issubclass(char_matrix_type, charmatrixmodel.FixedAlphabetCharacterMatrix):
+            char_matrix = char_matrix_type(label=self.label, taxon_namespace=self.taxon_namespace)
+        else:
+            char_matrix = char_matrix_type(label=self.label,
+                    taxon_namespace=self.taxon_namespace,
+                    default_state_alphabet=self.default_state_alphabet)
+        states = self.states
+        for taxon, state_indexes in self._taxon_sequence_map.items():
+            char_matrix[taxon].extend([states[idx] for idx in state_indexes])
+        return char_matrix
+
+    def __repr__(self):
+        return "<{} object at {}: {} sequences>".format(self.__class__.__name__,
+                hex(id(self)),
+                len(self._taxon_sequence_map))
+
+def new_packed_char_matrix(data_type, **kwargs):
+    return PackedCharacterMatrix(data_type=data_type, **kwargs)
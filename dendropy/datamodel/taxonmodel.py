@@ -541,7 +541,6 @@ class TaxonNamespace(
         self._accession_index_taxon_map = {}
         self._taxa = []
         self._taxon_accession_index_map = {}
-        self._taxon_bitmask_map = {}
         # self._split_bitmask_taxon_map = {}
         self._current_accession_count = 0
         if len(args) > 1:
@@ -880,10 +879,6 @@ class TaxonNamespace(
         if idx is not None:
             self._accession_index_taxon_map.pop(idx, None)
             self._taxon_accession_index_map.pop(taxon, None)
-        bm = self._taxon_bitmask_map.pop(taxon, None)
-        if bm is not None:
-            # self._split_bitmask_taxon_map.pop(bm, None)
-            self._taxon_accession_index_map.pop(taxon, None)
 
     def remove(self, taxon):
         deprecate.dendropy_deprecation_warning(
@@ -991,7 +986,6 @@ class TaxonNamespace(
         del self._taxa[:]
         self._accession_index_taxon_map.clear()
         self._taxon_accession_index_map.clear()
-        self._taxon_bitmask_map.clear()
         # self._split_bitmask_taxon_map.clear()
 
     ### Look-up and Retrieval of Taxa
@@ -1365,18 +1359,10 @@ class TaxonNamespace(
         h : integer
             Split hash bitmask value for node associated with |Taxon| object ``taxon``.
         """
-        # i = self._taxa.index(taxon)
-        # m = 1 << i
-        # return m
-        try:
-            return self._taxon_bitmask_map[taxon]
-        except KeyError:
-            i = self._taxon_accession_index_map[taxon]
-            # i = self._taxa.index(taxon)
-            m = 1 << i
-            self._taxon_bitmask_map[taxon] = m
-            # self._split_bitmask_taxon_map[m] = taxon
-            return m
+        # bitmasks are not cached: with many taxa, storing one for each taxon
+        # costs far more memory (quadratic in the number of taxa) than
+        # shifting costs time
+        return 1 << self._taxon_accession_index_map[taxon]
 
     def accession_index(self, taxon):
         """
@@ -1422,10 +1408,9 @@ class TaxonNamespace(
             taxa = kwargs["taxa"]
         else:
             taxa = self.get_taxa(**kwargs)
-        bitmask = 0
-        for taxon in taxa:
-            bitmask |= self.taxon_bitmask(taxon)
-        return bitmask
+        taxon_accession_index_map = self._taxon_accession_index_map
+        return bitprocessing.get_bitmask_backend().bitmask_from_indexes(
+                taxon_accession_index_map[taxon] for taxon in taxa)
 
     def taxa_bipartition(self, **kwargs):
         """
@@ -1477,13 +1462,9 @@ class TaxonNamespace(
             List of |Taxon| objects specified or spanned by
             ``bitmask``.
         """
-        taxa = []
-        while bitmask:
-            if bitmask & 1:
-                taxa.append(self._accession_index_taxon_map[index])
-            bitmask = bitmask >> 1
-            index += 1
-        return taxa
+        accession_index_taxon_map = self._accession_index_taxon_map
+        return [accession_index_taxon_map[idx + index]
+                for idx in bitprocessing.indexes_of_set_bits(bitmask)]
 
     def bitmask_as_newick_string(self,
             bitmask,
@@ -30,10 +30,12 @@ from dendropy.utility import error
 from dendropy.utility import bitprocessing
 from dendropy.utility import deprecate
 from dendropy.utility import constants
+from dendropy.utility.textprocessing import StringIO
 from dendropy.calculate import statistics
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy.datamodel import treemodel
+from dendropy.datamodel.compacttreemodel import CompactTree
 from dendropy import dataio
 
 ##############################################################################
@@ -152,13 +154,36 @@ class TreeList(
         tree_list = kwargs.pop("tree_list", None)
         taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
         label = kwargs.pop("label", None)
+        use_tree_index = kwargs.pop("use_tree_index", False)
+        if tree_list is not None and issubclass(tree_list.tree_type, CompactTree):
+            kwargs["structure_only"] = True
+        structure_only = kwargs.get("structure_only", False)
+        if tree_list is not None and structure_only and not issubclass(tree_list.tree_type, CompactTree):
+            raise TypeError("Cannot read trees with 'structure_only' into a TreeList of full trees: create the TreeList with 'tree_type=CompactTree'")
+
+        if use_tree_index and (collection_offset is not None or tree_offset is not None):
+            # only the selected trees are read from the source
+            tree_index = dataio.treeindex.TreeSourceIndex.get_for_stream(stream, schema)
+            if collection_offset is None:
+                collection_offset = 0
+            num_trees = tree_index.num_trees(collection_offset)
+            if tree_offset is not None and tree_offset >= num_trees:
+                raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, num_trees, num_trees-1))
+            stream = StringIO(tree_index.extract(
+                    collection_offset=collection_offset,
+                    start=tree_offset))
+            collection_offset = 0
+            tree_offset = None
 
         # get the reader
         reader = dataio.get_reader(schema, **kwargs)
 
         # Accommodate an existing TreeList object being passed
         if tree_list is None:
-            tree_list = cls(label=label, taxon_namespace=taxon_namespace)
+            if structure_only:
+                tree_list = cls(label=label, taxon_namespace=taxon_namespace, tree_type=CompactTree)
+            else:
+                tree_list = cls(label=label, taxon_namespace=taxon_namespace)
 
         if collection_offset is None and tree_offset is not None:
             collection_offset = 0
@@ -175,7 +200,7 @@ class TreeList(
             tree_lists = reader.read_tree_lists(
                         stream=stream,
                         taxon_namespace_factory=tree_list._taxon_namespace_pseudofactory,
-                        tree_list_factory=tree_list.__class__,
+                        tree_list_factory=tree_list._tree_list_factory,
                         global_annotations_target=None)
             # if collection_offset < 0:
             #     raise IndexError("Collection offset out of range: {} (minimum valid tree offset = 0)".format(collection_offset))
@@ -244,6 +269,23 @@ class TreeList(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **use_tree_index** (*bool*) -- If |True|, and the data source is
+              a NEWICK or NEXUS file given by path, then an index of the
+              byte offsets of the tree statements in the file (see
+              :class:`~dendropy.dataio.treeindex.TreeSourceIndex`) is used to
+              read just the trees from ``tree_offset`` onwards, without
+              parsing the trees that precede them. The index is built on
+              first use and stored in a file next to the data source for
+              subsequent reuse. Only the taxa referenced by the selected
+              trees (or defined before the selected tree collection) will be
+              accessioned.
+            - **structure_only** (*bool*) -- If |True|, then only the
+              structure of the trees (topology, edge lengths, leaf taxa and
+              rooting state) is read, and the trees are
+              :class:`~dendropy.datamodel.compacttreemodel.CompactTree`
+              objects instead of |Tree| objects (NEWICK and NEXUS schemas
+              only). This is much faster than reading full trees, which
+              can be obtained on demand using :meth:`CompactTree.to_tree()`.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -509,6 +551,13 @@ class TreeList(
             self.label = kwargs["label"]
         return self
 
+    def _tree_list_factory(self, **kwargs):
+        """
+        Factory for new |TreeList| objects of the same class and tree type
+        as ``self``.
+        """
+        return self.__class__(tree_type=self.tree_type, **kwargs)
+
     def _parse_and_add_from_stream(self,
             stream,
             schema,
@@ -598,6 +647,24 @@ class TreeList(
         """
         if "taxon_namespace" in kwargs and kwargs['taxon_namespace'] is not self.taxon_namespace:
             raise TypeError("Cannot change ``taxon_namespace`` when reading into an existing TreeList")
+        num_processes = kwargs.pop("num_processes", None)
+        if num_processes is not None and num_processes > 1:
+            if kwargs.get("structure_only", False) or issubclass(self.tree_type, CompactTree):
+                raise TypeError("'structure_only' is not supported when reading using multiple processes")
+            if collection_offset is not None or tree_offset is not None:
+                raise TypeError("'collection_offset' and 'tree_offset' are not supported when reading using multiple processes")
+            kwargs.pop("taxon_namespace", None)
+            kwargs.pop("use_tree_index", None)
+            cur_size = len(self._trees)
+            tree_yielder = self.tree_type.yield_from_files(
+                    files=[stream],
+                    schema=schema,
+                    taxon_namespace=self.taxon_namespace,
+                    num_processes=num_processes,
+                    **kwargs)
+            for tree in tree_yielder:
+                self._trees.append(tree)
+            return len(self._trees) - cur_size
         kwargs["taxon_namespace"] = self.taxon_namespace
         kwargs["tree_list"] = self
         cur_size = len(self._trees)
@@ -641,6 +708,28 @@ class TreeList(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **use_tree_index** (*bool*) -- If |True|, and the data source is
+              a NEWICK or NEXUS file given by path, then an index of the
+              byte offsets of the tree statements in the file (see
+              :class:`~dendropy.dataio.treeindex.TreeSourceIndex`) is used to
+              read just the trees from ``tree_offset`` onwards, without
+              parsing the trees that precede them. The index is built on
+              first use and stored in a file next to the data source for
+              subsequent reuse. Only the taxa referenced by the selected
+              trees (or defined before the selected tree collection) will be
+              accessioned.
+            - **num_processes** (*int*) -- If greater than 1, the data source
+              will be parsed in parallel by this number of worker processes
+              (see :meth:`Tree.yield_from_files()`); only the trees (and their
+              taxa) are read, and ``collection_offset`` and ``tree_offset``
+              are not supported.
+            - **structure_only** (*bool*) -- If |True|, then only the
+              structure of the trees (topology, edge lengths, leaf taxa and
+              rooting state) is read, and the trees are
+              :class:`~dendropy.datamodel.compacttreemodel.CompactTree`
+              objects instead of |Tree| objects (NEWICK and NEXUS schemas
+              only). This requires a |TreeList| created with
+              "``tree_type=CompactTree``", and is implied for such lists.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -1331,8 +1420,10 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
 
         Parameters
         ----------
-        tree : a |Tree| object.
-            The tree on which to count the splits.
+        tree : a |Tree| or |CompactTree| object.
+            The tree on which to count the splits. If a |CompactTree| and node
+            ages are ignored, the splits are calculated directly from its
+            arrays, without building a full |Tree|.
         is_bipartitions_updated : bool
             If |False| [default], then the tree will have its splits encoded or
             updated. Otherwise, if |True|, then the tree is assumed to have its
@@ -1348,6 +1439,16 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
             A list of node age values from ``tree``.
         """
         assert tree.taxon_namespace is self.taxon_namespace
+        if isinstance(tree, CompactTree):
+            if self.ignore_node_ages:
+                split_bitmasks, edge_lengths, _ = tree.encode_split_bitmasks()
+                return self._count_split_bitmasks(
+                        tree=tree,
+                        split_bitmasks=split_bitmasks,
+                        edge_lengths=edge_lengths,
+                        default_edge_length_value=default_edge_length_value)
+            tree = tree.to_tree()
+            is_bipartitions_updated = False
         self.total_trees_counted += 1
         if not self.ignore_node_ages:
             if self.taxon_label_age_map:
@@ -1405,6 +1506,41 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
                 sna = None
         return splits, edge_lengths, node_ages
 
+    def _count_split_bitmasks(self,
+            tree,
+            split_bitmasks,
+            edge_lengths,
+            default_edge_length_value=None):
+        """
+        Adds the given split bitmasks and corresponding edge lengths (e.g., as
+        calculated by :meth:`CompactTree.encode_split_bitmasks()`) of ``tree``
+        to the totals. Node ages are not counted.
+        """
+        self.total_trees_counted += 1
+        if tree.weight is not None and self.use_tree_weights:
+            weight_to_use = float(tree.weight)
+        else:
+            weight_to_use = 1.0
+        self.sum_of_tree_weights += weight_to_use
+        if tree.is_rooted:
+            self.tree_rooting_types_counted.add(True)
+        else:
+            self.tree_rooting_types_counted.add(False)
+        split_counts = self.split_counts
+        counted_edge_lengths = []
+        if self.ignore_edge_lengths:
+            for split in split_bitmasks:
+                split_counts[split] += weight_to_use
+        else:
+            split_edge_lengths = self.split_edge_lengths
+            for split, elen in zip(split_bitmasks, edge_lengths):
+                split_counts[split] += weight_to_use
+                if elen is None:
+                    elen = default_edge_length_value
+                split_edge_lengths.setdefault(split, []).append(elen)
+                counted_edge_lengths.append(elen)
+        return split_bitmasks, counted_edge_lengths, []
+
     def splits_considered(self):
         """
         Returns 4 values:
@@ -1420,10 +1556,14 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
         num_nt_splits = 0
         num_nt_unique_splits = 0
         taxa_mask = self.taxon_namespace.all_taxa_bitmask()
+        # a split is trivial if fewer than two taxa are on either of its sides
+        num_set_bits = bitprocessing.get_bitmask_backend().num_set_bits
+        num_taxa = num_set_bits(taxa_mask)
         for s in self.split_counts:
             num_unique_splits += 1
             num_splits += self.split_counts[s]
-            if not treemodel.Bipartition.is_trivial_bitmask(s, taxa_mask):
+            k = num_set_bits(s & taxa_mask)
+            if k > 1 and num_taxa - k > 1:
                 num_nt_unique_splits += 1
                 num_nt_splits += self.split_counts[s]
         return num_splits, num_unique_splits, num_nt_splits, num_nt_unique_splits
@@ -2278,10 +2418,13 @@ class TreeArray(
 
         Parameters
         ----------
-        tree : |Tree|
-            A |Tree| instance. This must have the same rooting state as
-            all the other trees accessioned into this collection as well as
-            that of ``self.is_rooted_trees``.
+        tree : |Tree| or |CompactTree|
+            A |Tree| or |CompactTree| instance. This must have the same
+            rooting state as all the other trees accessioned into this
+            collection as well as that of ``self.is_rooted_trees``. If a
+            |CompactTree| and node ages are ignored, the splits are
+            calculated directly from its arrays, without building a full
+            |Tree|.
         is_bipartitions_updated : bool
             If |False| [default], then the tree will have its splits encoded or
             updated. Otherwise, if |True|, then the tree is assumed to have its
@@ -2301,10 +2444,22 @@ class TreeArray(
         if self.taxon_namespace is not tree.taxon_namespace:
             raise error.TaxonNamespaceIdentityError(self, tree)
         self.validate_rooting(tree.is_rooted)
-        splits, edge_lengths, node_ages = self._split_distribution.count_splits_on_tree(
-                tree=tree,
-                is_bipartitions_updated=is_bipartitions_updated,
-                default_edge_length_value=self.default_edge_length_value)
+        if isinstance(tree, CompactTree) and not self.ignore_node_ages:
+            tree = tree.to_tree()
+            is_bipartitions_updated = False
+        if isinstance(tree, CompactTree):
+            splits, edge_lengths, tree_leafset_bitmask = tree.encode_split_bitmasks()
+            splits, edge_lengths, node_ages = self._split_distribution._count_split_bitmasks(
+                    tree=tree,
+                    split_bitmasks=splits,
+                    edge_lengths=edge_lengths,
+                    default_edge_length_value=self.default_edge_length_value)
+        else:
+            splits, edge_lengths, node_ages = self._split_distribution.count_splits_on_tree(
+                    tree=tree,
+                    is_bipartitions_updated=is_bipartitions_updated,
+                    default_edge_length_value=self.default_edge_length_value)
+            tree_leafset_bitmask = tree.seed_node.edge.bipartition.leafset_bitmask
 
         # pre-process splits
         splits = tuple(splits)
@@ -2327,13 +2482,12 @@ class TreeArray(
         if index is None:
             index = len(self._tree_split_bitmasks)
             self._tree_split_bitmasks.append(splits)
-            self._tree_leafset_bitmasks.append(tree.seed_node.edge.bipartition.leafset_bitmask)
+            self._tree_leafset_bitmasks.append(tree_leafset_bitmask)
             self._tree_edge_lengths.append(edge_lengths)
             self._tree_weights.append(weight_to_use)
         else:
             self._tree_split_bitmasks.insert(index, splits)
-            self._tree_leafset_bitmasks.insert(index,
-                    tree.seed_node.edge.bipartition.leafset_bitmask)
+            self._tree_leafset_bitmasks.insert(index, tree_leafset_bitmask)
             self._tree_edge_lengths.insert(index, edge_lengths)
             self._tree_weights.insert(index, weight_to_use)
         return index, splits, edge_lengths, weight_to_use
@@ -2382,28 +2536,25 @@ class TreeArray(
             The data format of the source. E.g., "nexus", "newick", "nexml".
         \*\*kwargs : keyword arguments
             These will be passed directly to the underlying schema-specific
-            reader implementation.
+            reader implementation. In particular, ``tree_offset`` and
+            ``tree_stride`` can be used to skip trees at the beginning of
+            each source and to thin the remaining ones, respectively (see
+            :meth:`Tree.yield_from_files()`). If node ages are ignored,
+            passing ``structure_only=True`` (for the "newick" and "nexus"
+            schemas) will have the splits calculated directly from the
+            structures of the trees, without building full |Tree| objects.
         """
         if "taxon_namespace" in kwargs:
             if kwargs["taxon_namespace"] is not self.taxon_namespace:
                 raise ValueError("TaxonNamespace object passed as keyword argument is not the same as self's TaxonNamespace reference")
             kwargs.pop("taxon_namespace")
-        target_tree_offset = kwargs.pop("tree_offset", 0)
         tree_yielder = self.tree_type.yield_from_files(
                 files=files,
                 schema=schema,
                 taxon_namespace=self.taxon_namespace,
                 **kwargs)
-        current_source_index = None
-        current_tree_offset = None
-        for tree_idx, tree in enumerate(tree_yielder):
-            current_yielder_index = tree_yielder.current_file_index
-            if current_source_index != current_yielder_index:
-                current_source_index = current_yielder_index
-                current_tree_offset = 0
-            if current_tree_offset >= target_tree_offset:
-                self.add_tree(tree=tree, is_bipartitions_updated=False)
-            current_tree_offset += 1
+        for tree in tree_yielder:
+            self.add_tree(tree=tree, is_bipartitions_updated=False)
 
     def _parse_and_add_from_stream(self,
             stream,
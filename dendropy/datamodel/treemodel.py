@@ -141,6 +141,17 @@ class Bipartition(object):
 
     """
 
+    __slots__ = (
+        "_split_bitmask",
+        "_leafset_bitmask",
+        "_tree_leafset_bitmask",
+        "_lowest_relevant_bit",
+        "_is_rooted",
+        "is_mutable",
+        "__dict__",
+        "__weakref__",
+        )
+
     def normalize_bitmask(bitmask, fill_bitmask, lowest_relevant_bit):
         if bitmask & lowest_relevant_bit:
             return (~bitmask) & fill_bitmask             # force least-significant bit to 0
@@ -264,6 +275,12 @@ class Bipartition(object):
         # return self._split_bitmask == other._split_bitmask
         return (self._split_bitmask is not None and self._split_bitmask == other._split_bitmask) or (self._split_bitmask is other._split_bitmask)
 
+    def __getstate__(self):
+        return basemodel.get_slots_state(self)
+
+    def __setstate__(self, state):
+        basemodel.set_slots_state(self, state)
+
     ##############################################################################
     ## All properties are publically read-only if not mutable
 
@@ -725,6 +742,18 @@ class Edge(
     An :term:``edge`` on a :term:``tree``.
     """
 
+    __slots__ = (
+        "_label",
+        "_annotations",
+        "_head_node",
+        "rootedge",
+        "length",
+        "_bipartition",
+        "comments",
+        "__dict__",
+        "__weakref__",
+        )
+
     ###########################################################################
     ### Life-cycle and Identity
 
@@ -772,6 +801,12 @@ class Edge(
     def __eq__(self, other):
         return self is other
 
+    def __getstate__(self):
+        return basemodel.get_slots_state(self)
+
+    def __setstate__(self, state):
+        basemodel.set_slots_state(self, state)
+
     ###########################################################################
     ### Basic Structure
 
@@ -863,6 +898,7 @@ class Edge(
         new_head_node = old_tail_node
         grandparent = old_tail_node._parent_node
         if grandparent is not None:
+            _node_structure_version[0] += 1
             for idx, ch in enumerate(grandparent._child_nodes):
                 if ch is old_tail_node:
                     grandparent._child_nodes[idx] = old_head_node
@@ -969,13 +1005,39 @@ class Edge(
 ##############################################################################
 ### Node
 
+# A count of the structural edits of all nodes (i.e., of child nodes being
+# added, removed or reordered), kept in a list so that it can be updated
+# without rebinding a global name or modifying a class. Trees only reuse their
+# cached traversal orders for as long as it is unchanged.
+_node_structure_version = [0]
+
 class Node(
         basemodel.DataObject,
         basemodel.Annotable):
     """
     A :term:|Node| on a :term:|Tree|.
+
+    The attributes of |Node| objects are stored in slots rather than in an
+    instance dictionary, which is only created if other attributes (e.g.,
+    ones used by client code to store values calculated on the nodes) are
+    set on an object.
     """
 
+    __slots__ = (
+        "_label",
+        "_annotations",
+        "taxon",
+        "age",
+        "_edge",
+        "_child_nodes",
+        "_parent_node",
+        "comments",
+        "root_distance",
+        "_distance_from_tip",
+        "__dict__",
+        "__weakref__",
+        )
+
     ###########################################################################
     ### Life-cycle
 
@@ -1039,6 +1101,12 @@ class Node(
         # IMPORTANT LESSON LEARNED: if you define __hash__, you *must* define __eq__
         return self is other
 
+    def __getstate__(self):
+        return basemodel.get_slots_state(self)
+
+    def __setstate__(self, state):
+        basemodel.set_slots_state(self, state)
+
     def __repr__(self):
         return "<{} object at {}: '{}' ({})>".format(self.__class__.__name__, hex(id(self)), self._label, repr(self.taxon))
 
@@ -1612,6 +1680,7 @@ class Node(
         """
         assert node is not self, "Cannot add node as child of itself"
         assert self._parent_node is not node, "Cannot add a node's parent as its child: remove the node from its parent's child set first"
+        _node_structure_version[0] += 1
         node._parent_node = self
         if node not in self._child_nodes:
             self._child_nodes.append(node)
@@ -1638,6 +1707,7 @@ class Node(
         |Node|
             The node that was added.
         """
+        _node_structure_version[0] += 1
         node._parent_node = self
         try:
             cur_index = self._child_nodes.index(node)
@@ -1722,6 +1792,7 @@ class Node(
             raise ValueError("Tried to remove an non-existing or null node")
         children = self._child_nodes
         if node in children:
+            _node_structure_version[0] += 1
             node._parent_node = None
             node.edge.tail_node = None
             index = children.index(node)
@@ -1767,6 +1838,7 @@ class Node(
         """
         Removes all child nodes.
         """
+        _node_structure_version[0] += 1
         del self._child_nodes[:] # list.clear() is not in Python 2.7
 
     def reversible_remove_child(self, node, suppress_unifurcations=False):
@@ -1790,6 +1862,7 @@ class Node(
         except:
             raise ValueError("Tried to remove a node that is not listed as a child")
         removed = [(node, self, pos, [], None)]
+        _node_structure_version[0] += 1
         node._parent_node = None
         node.edge.tail_node = None
         children.remove(node)
@@ -1918,6 +1991,7 @@ class Node(
         if new_edge is self._edge:
             return
         if self._parent_node is not None:
+            _node_structure_version[0] += 1
             try:
                 self._parent_node._child_nodes.remove(self)
             except ValueError:
@@ -1987,6 +2061,7 @@ class Node(
         return self._parent_node
     def _set_parent_node(self, parent):
         """Sets the parent node of this node."""
+        _node_structure_version[0] += 1
         if self._parent_node is not None:
             try:
                 self._parent_node._child_nodes.remove(self)
@@ -2517,6 +2592,75 @@ class Node(
 ##############################################################################
 ### Tree
 
+class _NodeTraversalCache(object):
+    """
+    Lists of the nodes of a tree in pre-order, post-order and level-order
+    sequence, and of its leaves, built when first needed and reused for as
+    long as the seed node of the tree is the same node and no node structure
+    has been edited (see ``_node_structure_version``).
+
+    Copies of a cache, including those made when its tree is copied or
+    pickled, are always empty.
+    """
+
+    __slots__ = ("seed_node", "structure_version", "node_lists")
+
+    def __init__(self):
+        self.clear()
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+    def clear(self):
+        self.seed_node = None
+        self.structure_version = None
+        self.node_lists = {}
+
+    def node_list(self, seed_node, order):
+        """
+        Returns the list of nodes of the tree seeded at ``seed_node`` in
+        ``order``, one of "preorder", "postorder", "levelorder" or "leaf".
+        The list returned must not be modified.
+        """
+        if (seed_node is not self.seed_node
+                or self.structure_version != _node_structure_version[0]):
+            self.seed_node = seed_node
+            self.structure_version = _node_structure_version[0]
+            self.node_lists = {}
+        try:
+            return self.node_lists[order]
+        except KeyError:
+            pass
+        if order == "preorder":
+            nodes = []
+            stack = [seed_node]
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+                stack.extend(reversed(node._child_nodes))
+        elif order == "postorder":
+            # each node is visited before its descendants, and children
+            # from last to first, so that the reversed sequence is post-order
+            nodes = []
+            stack = [seed_node]
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+                stack.extend(node._child_nodes)
+            nodes.reverse()
+        elif order == "levelorder":
+            nodes = [seed_node]
+            idx = 0
+            while idx < len(nodes):
+                nodes.extend(nodes[idx]._child_nodes)
+                idx += 1
+        elif order == "leaf":
+            nodes = [nd for nd in self.node_list(seed_node, "postorder") if not nd._child_nodes]
+        else:
+            raise ValueError("Unrecognized traversal order: '{}'".format(order))
+        self.node_lists[order] = nodes
+        return nodes
+
 class Tree(
         taxonmodel.TaxonNamespaceAssociated,
         basemodel.Annotable,
@@ -2621,8 +2765,14 @@ class Tree(
                 taxon_namespace.label = label
             return taxon_namespace
 
-        tree_list_factory = lambda label, taxon_namespace: TreeList(label=label, taxon_namespace=taxon_namespace, tree_type=cls)
+        if kwargs.get("structure_only", False):
+            from dendropy.datamodel.compacttreemodel import CompactTree
+            tree_type = CompactTree
+        else:
+            tree_type = cls
+        tree_list_factory = lambda label, taxon_namespace: TreeList(label=label, taxon_namespace=taxon_namespace, tree_type=tree_type)
         label = kwargs.pop("label", None)
+        use_tree_index = kwargs.pop("use_tree_index", False)
         reader = dataio.get_reader(schema, **kwargs)
         # if collection_offset is None and tree_offset is not None:
         #     raise TypeError("Cannot specify ``tree_offset`` without specifying ``collection_offset``")
@@ -2630,6 +2780,25 @@ class Tree(
             collection_offset = 0
         if tree_offset is None:
             tree_offset = 0
+        if use_tree_index:
+            # only the selected tree is read from the source
+            tree_index = dataio.treeindex.TreeSourceIndex.get_for_stream(stream, schema)
+            if tree_index.num_collections() == 0:
+                raise ValueError("No trees in data source")
+            num_trees = tree_index.num_trees(collection_offset)
+            if num_trees == 0:
+                raise ValueError("No trees available at requested location in data source")
+            tree_idx = tree_offset
+            if tree_idx < 0:
+                tree_idx += num_trees
+            if tree_idx < 0 or tree_idx >= num_trees:
+                raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, num_trees, num_trees-1))
+            stream = StringIO(tree_index.extract(
+                    collection_offset=collection_offset,
+                    start=tree_idx,
+                    stop=tree_idx+1))
+            collection_offset = 0
+            tree_offset = 0
         tree_lists = reader.read_tree_lists(
                     stream=stream,
                     taxon_namespace_factory=tns_factory,
@@ -2679,6 +2848,21 @@ class Tree(
             - **tree_offset** (*int*) -- 0-based index of tree within the
               collection specified by ``collection_offset`` to be parsed. If
               not specified, then the first tree (offset = 0) is assumed.
+            - **use_tree_index** (*bool*) -- If |True|, and the data source is
+              a NEWICK or NEXUS file given by path, then an index of the
+              byte offsets of the tree statements in the file (see
+              :class:`~dendropy.dataio.treeindex.TreeSourceIndex`) is used to
+              read just the requested tree, without parsing the trees that
+              precede it. The index is built on first use and stored in a
+              file next to the data source for subsequent reuse.
+            - **structure_only** (*bool*) -- If |True|, then only the
+              structure of the tree (topology, edge lengths, leaf taxa and
+              rooting state) is read, and a
+              :class:`~dendropy.datamodel.compacttreemodel.CompactTree` is
+              returned instead of a |Tree| object (NEWICK and NEXUS schemas
+              only). This is much faster than reading a full tree, which can
+              be obtained from the result on demand using
+              :meth:`CompactTree.to_tree()`.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -2762,6 +2946,41 @@ class Tree(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        num_processes : integer, default: |None|
+            If greater than 1, then the sources will be parsed in parallel by
+            this number of worker processes (with NEWICK files being split
+            into chunks of tree statements, so that even a single large file
+            is parsed in parallel). Trees are still yielded in the order in
+            which they are found in the sources. See
+            :class:`~dendropy.dataio.parallelyielder.ParallelTreeDataYielder`
+            for details. Otherwise, the sources will be parsed sequentially
+            in the current process.
+        tree_offset : integer, default: 0
+            Number of trees at the beginning of each source to skip (e.g., as
+            burn-in). With the "newick" and "nexus" schemas, these trees are
+            not parsed: the sources are only scanned for the ends of their
+            tree statements.
+        tree_stride : integer, default: 1
+            Only every ``tree_stride``-th tree of each source following the
+            first ``tree_offset`` trees will be yielded (e.g., to thin a
+            sample of trees), with the trees in between skipped as with
+            ``tree_offset``. The (0-based) position in its source of the tree
+            most recently yielded is available as the ``current_tree_offset``
+            attribute of the iterator.
+        structure_only : bool, default: |False|
+            If |True|, then only the structures of the trees are read, and
+            :class:`~dendropy.datamodel.compacttreemodel.CompactTree` objects
+            are yielded instead of |Tree| objects (only supported by the
+            "newick" and "nexus" schemas). These can be passed directly to
+            :meth:`TreeArray.add_tree()` and
+            :meth:`SplitDistribution.count_splits_on_tree()`, which then
+            calculate the splits of the trees without building |Node|,
+            |Edge| or |Bipartition| objects.
+        parse_cache : :class:`~dendropy.dataio.parsecache.TreeParseCache`, default: |None|
+            With the "newick" schema, a cache of the trees built from tree
+            statements, so that trees for statements that have already been
+            read (e.g., identical samples of a posterior distribution) are
+            built from the cache instead of being parsed again.
         \*\*kwargs : keyword arguments
             These will be passed directly to the schema-parser implementation.
 
@@ -2804,17 +3023,95 @@ class Tree(
                 taxon_namespace = taxonmodel.TaxonNamespace()
         else:
             assert "taxon_set" not in kwargs
-        if "tree_offset" in kwargs:
-            raise TypeError("'tree_offset' is not supported: trees should be skipped/discarded on the client code side")
+        if kwargs.get("structure_only", False):
+            from dendropy.datamodel.compacttreemodel import CompactTree
+            tree_type = CompactTree
+        else:
+            tree_type = cls
         tree_yielder = dataio.get_tree_yielder(
                 files,
                 schema,
                 taxon_namespace=taxon_namespace,
-                tree_type=cls,
+                tree_type=tree_type,
                 **kwargs)
         return tree_yielder
     yield_from_files = classmethod(yield_from_files)
 
+    def async_yield_from_files(cls,
+            files,
+            schema,
+            taxon_namespace=None,
+            **kwargs):
+        """
+        Asynchronous counterpart of :meth:`Tree.yield_from_files()`, for use
+        in ``async for`` statements with ``asyncio`` (Python 3.5 or later).
+
+        The trees are parsed in a worker thread, so that the event loop is
+        not blocked while large tree statements are parsed. Besides file
+        paths and file-like objects, the sources may be asynchronous streams
+        (i.e., objects with a coroutine method ``read(n)``, such as the
+        ``asyncio.StreamReader`` objects of pipes or sockets), the data of
+        which is parsed as it arrives. See
+        :class:`~dendropy.dataio.asyncyielder.AsyncTreeDataYielder` for
+        details.
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths, file-like objects open for reading, or asynchronous
+            streams.
+        schema : string
+            The name of the data format (e.g., "newick" or "nexus").
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        encoding : string, default: "utf-8"
+            The encoding of the data of asynchronous streams.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the schema-parser implementation
+            (see :meth:`Tree.yield_from_files()`).
+
+        Returns
+        -------
+        y : :class:`~dendropy.dataio.asyncyielder.AsyncTreeDataYielder`
+            Asynchronous iterator over the trees of the sources.
+
+        Examples
+        --------
+
+        ::
+
+            async def print_tree_lengths(command):
+                proc = await asyncio.create_subprocess_exec(*command,
+                        stdout=asyncio.subprocess.PIPE)
+                tree_yielder = dendropy.Tree.async_yield_from_files(
+                        files=[proc.stdout],
+                        schema="newick")
+                async for tree in tree_yielder:
+                    print(tree.length())
+                await proc.wait()
+
+        """
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
+            if taxon_namespace is None:
+                taxon_namespace = taxonmodel.TaxonNamespace()
+        else:
+            assert "taxon_set" not in kwargs
+        if kwargs.get("structure_only", False):
+            from dendropy.datamodel.compacttreemodel import CompactTree
+            tree_type = CompactTree
+        else:
+            tree_type = cls
+        return dataio.asyncyielder.AsyncTreeDataYielder(
+                files=files,
+                schema=schema,
+                taxon_namespace=taxon_namespace,
+                tree_type=tree_type,
+                **kwargs)
+    async_yield_from_files = classmethod(async_yield_from_files)
+
     def from_bipartition_encoding(
             cls,
             bipartition_encoding,
@@ -3157,6 +3454,7 @@ class Tree(
             self.weight = None
             self.length_type = None
             self._seed_node = None
+            self._traversal_cache = _NodeTraversalCache()
             self.seed_node = None
             self.bipartition_encoding = None
             self._split_bitmask_edge_map = None
@@ -4030,6 +4328,30 @@ class Tree(
     ###########################################################################
     ### Node iterators
 
+    def _get_traversal_node_list(self, order):
+        # The traversal orders of the tree are cached and reused until the
+        # structure of any node is edited, so that repeated traversals of an
+        # unchanged tree are just iterations over lists.
+        try:
+            traversal_cache = self._traversal_cache
+        except AttributeError:
+            traversal_cache = _NodeTraversalCache()
+            self._traversal_cache = traversal_cache
+        return traversal_cache.node_list(self._seed_node, order)
+
+    def _traversal_node_iter(self, order, filter_fn=None):
+        nodes = self._get_traversal_node_list(order)
+        if filter_fn is None:
+            return iter(nodes)
+        return (nd for nd in nodes if filter_fn(nd))
+
+    def _traversal_internal_node_iter(self, order, filter_fn=None, exclude_seed_node=False):
+        nodes = self._get_traversal_node_list(order)
+        return (nd for nd in nodes
+                if (not exclude_seed_node or nd._parent_node is not None)
+                and nd._child_nodes
+                and (filter_fn is None or filter_fn(nd)))
+
     def __iter__(self):
         """
         Iterate over nodes on tree in pre-order.
@@ -4071,7 +4393,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes in ``self`` in pre-order sequence.
         """
-        return self.seed_node.preorder_iter(filter_fn=filter_fn)
+        return self._traversal_node_iter("preorder", filter_fn=filter_fn)
 
     def preorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4100,7 +4422,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding the internal nodes of ``self``.
         """
-        return self.seed_node.preorder_internal_node_iter(filter_fn=filter_fn,
+        return self._traversal_internal_node_iter("preorder", filter_fn=filter_fn,
                 exclude_seed_node=exclude_seed_node)
 
     def postorder_node_iter(self, filter_fn=None):
@@ -4125,7 +4447,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding the nodes in ``self`` in post-order sequence.
         """
-        return self.seed_node.postorder_iter(filter_fn=filter_fn)
+        return self._traversal_node_iter("postorder", filter_fn=filter_fn)
 
     def postorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4155,7 +4477,7 @@ class Tree(
             An iterator yielding the internal nodes of ``self`` in post-order
             sequence.
         """
-        return self.seed_node.postorder_internal_node_iter(filter_fn=filter_fn,
+        return self._traversal_internal_node_iter("postorder", filter_fn=filter_fn,
                 exclude_seed_node=exclude_seed_node)
 
     def levelorder_node_iter(self, filter_fn=None):
@@ -4180,7 +4502,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes of ``self`` in level-order sequence.
         """
-        return self.seed_node.levelorder_iter(filter_fn=filter_fn)
+        return self._traversal_node_iter("levelorder", filter_fn=filter_fn)
 
     def level_order_node_iter(self, filter_fn=None):
         """
@@ -4236,7 +4558,7 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding leaf nodes in ``self``.
         """
-        return self.seed_node.leaf_iter(filter_fn=filter_fn)
+        return self._traversal_node_iter("leaf", filter_fn=filter_fn)
 
     def leaf_iter(self, filter_fn=None):
         """
@@ -4392,14 +4714,10 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes in ``self`` in pre-order sequence.
         """
-        # NOTE: from-scratch implementation here instead of wrapping
-        # `preorder_node_iter()`for efficiency
-        stack = [self.seed_node._edge]
-        while stack:
-            edge = stack.pop()
+        for nd in self._get_traversal_node_list("preorder"):
+            edge = nd._edge
             if filter_fn is None or filter_fn(edge):
                 yield edge
-            stack.extend(n._edge for n in reversed(edge._head_node._child_nodes))
 
     def preorder_internal_edge_iter(self, filter_fn=None, exclude_seed_edge=False):
         """
@@ -4464,33 +4782,10 @@ class Tree(
             An iterator yielding the edges in ``self`` in post-order sequence.
 
         """
-        # NOTE: custom implementation here instead of wrapping
-        # `postorder_node_iter()`for efficiency
-
-        # stack = [(self.seed_node._edge, False)]
-        # while stack:
-        #     edge, state = stack.pop(0)
-        #     if state:
-        #         if filter_fn is None or filter_fn(edge):
-        #             yield edge
-        #     else:
-        #         stack.insert(0, (edge, True))
-        #         child_edges = [(n._edge, False) for n in edge._head_node._child_nodes]
-        #         child_edges.extend(stack)
-        #         stack = child_edges
-
-        ## Prefer `pop()` to `pop(0)`.
-        ## Thanks to Mark T. Holder
-        ## From peyotl commits: d1ffef2 + 19fdea1
-        stack = [(self.seed_node._edge, False)]
-        while stack:
-            edge, state = stack.pop()
-            if state:
-                if filter_fn is None or filter_fn(edge):
-                    yield edge
-            else:
-                stack.append((edge, True))
-                stack.extend([(n._edge, False) for n in reversed(edge._head_node._child_nodes)])
+        for nd in self._get_traversal_node_list("postorder"):
+            edge = nd._edge
+            if filter_fn is None or filter_fn(edge):
+                yield edge
 
     def postorder_internal_edge_iter(self, filter_fn=None, exclude_seed_edge=False):
         """
@@ -4554,12 +4849,10 @@ class Tree(
         :py:class:`collections.Iterator` [|Edge|]
             An iterator yielding edges of ``self`` in level-order sequence.
         """
-        if filter_fn is not None:
-            f = lambda x : filter_fn(x.edge)
-        else:
-            f = None
-        for nd in self.seed_node.levelorder_iter(filter_fn=f):
-            yield nd.edge
+        for nd in self._get_traversal_node_list("levelorder"):
+            edge = nd._edge
+            if filter_fn is None or filter_fn(edge):
+                yield edge
 
     def level_order_edge_iter(self, filter_fn=None):
         """
@@ -4620,12 +4913,10 @@ class Tree(
         :py:class:`collections.Iterator` [|Edge|]
             An iterator yielding leaf edges in ``self``.
         """
-        if filter_fn is not None:
-            f = lambda x : filter_fn(x.edge)
-        else:
-            f = None
-        for nd in self.seed_node.leaf_iter(filter_fn=f):
-            yield nd.edge
+        for nd in self._get_traversal_node_list("leaf"):
+            edge = nd._edge
+            if filter_fn is None or filter_fn(edge):
+                yield edge
 
     ###########################################################################
     ### Taxa Management
@@ -4833,7 +5124,10 @@ class Tree(
         'new_seed_node', but it does not actually change the tree's rooting
         state.  If ``update_bipartitions`` is True, then the edges'
         ``bipartition_bitmask`` and the tree's ``bipartition_edge_map`` attributes
-        will be updated. If the *old* root of the tree had an outdegree of 2,
+        will be updated. If ``update_bipartitions`` is "incremental" and the
+        bipartitions of the tree are current, then only those of the edges
+        on the path between the old and the new seed nodes are recalculated
+        (see :meth:`Tree.update_bipartitions_at()`). If the *old* root of the tree had an outdegree of 2,
         then after this operation, it will have an outdegree of one. In this
         case, unless ``suppress_unifurcations`` is False, then it will be removed
         from the tree.
@@ -4864,6 +5158,10 @@ class Tree(
         #     debug_children = ", ".join(debug_children)
         #     print("    Children (Node Parent, Edge Tail Node Parent): {}".format(debug_children))
 
+        if update_bipartitions == "incremental" and self.bipartition_encoding:
+            edited_nodes = list(new_seed_node.ancestor_iter(inclusive=True))
+        else:
+            edited_nodes = None
         if self.seed_node is new_seed_node:
             # do not just return: allow for updating of bipartitions,
             # collapsing of unifurcations, collapsing of unrooted basal
@@ -4901,7 +5199,7 @@ class Tree(
                         new_seed_node.add_child(ch)
             self.seed_node = new_seed_node
 
-        if update_bipartitions:
+        if update_bipartitions and edited_nodes is None:
             self.encode_bipartitions(
                     suppress_unifurcations=suppress_unifurcations,
                     collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation)
@@ -4912,6 +5210,8 @@ class Tree(
                 self.collapse_basal_bifurcation()
             if suppress_unifurcations:
                 self.suppress_unifurcations()
+            if edited_nodes is not None:
+                self.update_bipartitions_at(edited_nodes)
 
         return self.seed_node
 
@@ -4922,6 +5222,9 @@ class Tree(
         Assumes that ``outgroup_node`` and ``outgroup_node._parent_node`` and are in the tree/
         If ``update_bipartitions`` is True, then the edges' ``bipartition`` and the tree's
         ``bipartition_encoding`` attributes will be updated.
+        If it is "incremental", then only the bipartitions of the edges on the
+        path between the old and the new seed nodes are recalculated (see
+        :meth:`Tree.reseed_at()`).
         If the *old* root of the tree had an outdegree of 2, then after this
         operation, it will have an outdegree of one. In this case, unless
         ``suppress_unifurcations`` is False, then it will be
@@ -4945,16 +5248,25 @@ class Tree(
         'new_seed_node', *and* changes the tree's rooting state.
         If ``update_bipartitions`` is True, then the edges' ``bipartition`` and the tree's
         ``bipartition_encoding`` attributes will be updated.
+        If it is "incremental", then only the bipartitions of the edges on the
+        path between the old and the new seed nodes are recalculated (see
+        :meth:`Tree.reseed_at()`).
         If the *old* root of the tree had an outdegree of 2, then after this
         operation, it will have an outdegree of one. In this case, unless
         ``suppress_unifurcations`` is False, then it will be
         removed from the tree.
         """
+        if update_bipartitions == "incremental" and self.bipartition_encoding:
+            edited_nodes = list(new_root_node.ancestor_iter(inclusive=True))
+        else:
+            edited_nodes = None
         self.reseed_at(new_seed_node=new_root_node,
                 update_bipartitions=False,
                 suppress_unifurcations=suppress_unifurcations)
         self.is_rooted = True
-        if update_bipartitions:
+        if edited_nodes is not None:
+            self.update_bipartitions_at(edited_nodes)
+        elif update_bipartitions:
             self.update_bipartitions(suppress_unifurcations=suppress_unifurcations)
         return self.seed_node
 
@@ -4972,6 +5284,9 @@ class Tree(
         assigned to the old child of the original edge.
         If ``update_bipartitions`` is True, then the edges' ``bipartition`` and the tree's
         ``bipartition_encoding`` attributes will be updated.
+        If it is "incremental", then only the bipartitions of the edges on the
+        path between the old and the new seed nodes are recalculated (see
+        :meth:`Tree.reseed_at()`).
         If the *old* root of the tree had an outdegree of 2, then after this
         operation, it will have an outdegree of one. In this case, unless
         ``suppress_unifurcations`` is False, then it will be
@@ -5194,15 +5509,30 @@ class Tree(
             suppress_unifurcations=True):
         """
         Removes subtree starting at ``node`` from tree.
+
+        If ``update_bipartitions`` is "incremental" and the bipartitions of the
+        tree are current, then only those of the edges on the path from the
+        parent of ``node`` to the seed node are recalculated (see
+        :meth:`Tree.update_bipartitions_at()`).
         """
         if not node:
             raise ValueError("Tried to remove an non-existing or null node")
         if node._parent_node is None:
             raise TypeError('Node has no parent and is implicit root: cannot be pruned')
-        node._parent_node.remove_child(node)
+        parent_node = node._parent_node
+        if update_bipartitions == "incremental" and self.bipartition_encoding:
+            # ancestors that are then suppressed as unifurcations are no
+            # longer in the tree, and are skipped when updating the
+            # bipartitions
+            edited_nodes = list(parent_node.ancestor_iter(inclusive=True))
+        else:
+            edited_nodes = None
+        parent_node.remove_child(node)
         if suppress_unifurcations:
             self.suppress_unifurcations()
-        if update_bipartitions:
+        if edited_nodes is not None:
+            self.update_bipartitions_at(edited_nodes)
+        elif update_bipartitions:
             self.update_bipartitions()
 
     def filter_leaf_nodes(
@@ -5431,6 +5761,7 @@ class Tree(
                     total += node_desc_counts[child]
                 total += len(nd._child_nodes)
                 node_desc_counts[nd] = total
+                _node_structure_version[0] += 1
                 nd._child_nodes.sort(key=lambda n: node_desc_counts[n], reverse=not ascending)
 
     def truncate_from_root(self, distance_from_root):
@@ -5879,6 +6210,163 @@ class Tree(
         """
         self.encode_bipartitions(*args, **kwargs)
 
+    def _encode_leafset_bitmask_for_edge(self, edge):
+        head_node = edge._head_node
+        leafset_bitmask = 0
+        if head_node._child_nodes:
+            for child in head_node._child_nodes:
+                leafset_bitmask |= child.edge.bipartition._leafset_bitmask
+        elif head_node.taxon:
+            leafset_bitmask = self._taxon_namespace.taxon_bitmask(head_node.taxon)
+        edge.bipartition = Bipartition(compile_bipartition=False, is_mutable=True)
+        edge.bipartition._leafset_bitmask = leafset_bitmask
+        edge.bipartition._is_rooted = self._is_rooted
+        return edge
+
+    def update_bipartitions_at(self, nodes, is_bipartitions_mutable=False):
+        """
+        Updates the bipartitions of this tree after local edits of its
+        structure, recalculating only those of the edges on the paths from
+        ``nodes`` to the seed node.
+
+        The bipartitions of the tree must have been current before the edits
+        (e.g., as calculated by :meth:`Tree.encode_bipartitions()` or by a
+        previous call to this method), and ``nodes`` must include every node
+        of the tree whose child nodes have been added, removed or replaced
+        (e.g., after a subtree-prune-and-regraft move, the old and new parent
+        nodes of the subtree, after a nearest-neighbor interchange, the two
+        nodes whose children have been exchanged, or after collapsing an edge
+        with :meth:`Edge.collapse()`, the tail node of the edge). Nodes that are no
+        longer in the tree are ignored, as are nodes whose bipartitions are
+        recalculated anyway because they are ancestors of other nodes. Nodes
+        added to the tree are encoded along with their subtrees if they have
+        not been encoded before.
+
+        Edge bipartitions are only calculated for the paths from the edited
+        nodes to the seed node, at a cost proportional to the depth of the
+        edited nodes. If the edits change the leafset of the tree (e.g., by
+        pruning taxa) or if the rooting state of the tree has changed, then
+        the splits of all bipartitions are normalized again, but leafset
+        bitmasks are still only recalculated on the paths. The list of
+        bipartitions assigned to ``self.bipartition_encoding`` is always a
+        new list, in the order of :meth:`Tree.encode_bipartitions()`, which
+        is collected in a postorder traversal of the tree. Each update
+        therefore still takes time linear in the size of the tree, but
+        without creating a |Bipartition| for every edge, so that a sequence
+        of local edits (e.g., the moves of an MCMC sampler) is followed
+        several times faster than by calling
+        :meth:`Tree.encode_bipartitions()` after every edit.
+
+        Unlike :meth:`Tree.encode_bipartitions()`, this does not suppress
+        unifurcations or collapse the basal bifurcation of unrooted trees:
+        the tree is encoded as it is. If there are no bipartitions (i.e.,
+        ``self.bipartition_encoding`` is empty or |None|), then all
+        bipartitions are calculated.
+
+        Parameters
+        ----------
+        nodes : iterable[|Node|]
+            The nodes whose child nodes have been edited.
+        is_bipartitions_mutable : bool
+            By default, the |Bipartition| instances coded will be locked
+            or frozen, allowing their use in hashing containers such as
+            dictionary (keys) and sets. To allow modification of values, the
+            ``is_mutable`` attribute must be set to |True|.
+
+        Returns
+        -------
+        list[|Bipartition|]
+            A list of |Bipartition| objects of this |Tree|
+            representing the structure of this tree.
+
+        Examples
+        --------
+
+        ::
+
+            tree.encode_bipartitions()
+            # regraft the subtree at ``node`` onto ``target.edge``
+            old_parent = node.parent_node
+            old_parent.remove_child(node)
+            new_parent = dendropy.Node()
+            target.parent_node.add_child(new_parent)
+            target.parent_node.remove_child(target)
+            new_parent.add_child(target)
+            new_parent.add_child(node)
+            tree.update_bipartitions_at([old_parent, new_parent])
+
+        """
+        old_encoding = self.bipartition_encoding
+        if not old_encoding:
+            return self.encode_bipartitions(
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=False,
+                    is_bipartitions_mutable=is_bipartitions_mutable)
+        self._bipartition_edge_map = None
+        seed_node = self._seed_node
+
+        # depths of the nodes on the paths to the seed node, keyed by node id
+        node_depths = {}
+        path_nodes = []
+        for node in list(nodes) + [seed_node]:
+            if node is None:
+                continue
+            path = []
+            nd = node
+            while nd is not None and id(nd) not in node_depths:
+                path.append(nd)
+                nd = nd._parent_node
+            if nd is None:
+                if path[-1] is not seed_node:
+                    # not (or no longer) in the tree
+                    continue
+                depth = -1
+            else:
+                depth = node_depths[id(nd)]
+            for nd in reversed(path):
+                depth += 1
+                node_depths[id(nd)] = depth
+                path_nodes.append((depth, nd))
+        path_nodes.sort(key=lambda x: x[0], reverse=True)
+
+        # leafsets of the edges on the paths, each edge after those of its
+        # child nodes
+        encoded_edges = []
+        for depth, node in path_nodes:
+            for child in node._child_nodes:
+                if id(child) in node_depths:
+                    continue
+                bipartition = child._edge._bipartition
+                if bipartition is None or bipartition._tree_leafset_bitmask is None:
+                    # not encoded in this tree (e.g., a new node)
+                    for nd in child.postorder_iter():
+                        encoded_edges.append(self._encode_leafset_bitmask_for_edge(nd._edge))
+            encoded_edges.append(self._encode_leafset_bitmask_for_edge(node._edge))
+
+        postorder_nodes = self._get_traversal_node_list("postorder")
+        old_bipartition = old_encoding[-1]
+        if (seed_node._edge._bipartition._leafset_bitmask != old_bipartition._tree_leafset_bitmask
+                or bool(self._is_rooted) != bool(old_bipartition._is_rooted)):
+            # all splits are normalized against the leafset of the tree
+            encoded_edge_ids = set(id(edge) for edge in encoded_edges)
+            encoded_edges = []
+            for nd in postorder_nodes:
+                edge = nd._edge
+                if id(edge) not in encoded_edge_ids:
+                    leafset_bitmask = edge.bipartition._leafset_bitmask
+                    edge.bipartition = Bipartition(compile_bipartition=False, is_mutable=True)
+                    edge.bipartition._leafset_bitmask = leafset_bitmask
+                    edge.bipartition._is_rooted = self._is_rooted
+                encoded_edges.append(edge)
+        if is_bipartitions_mutable:
+            _compile_bipartition = self._compile_mutable_bipartition_for_edge
+        else:
+            _compile_bipartition = self._compile_immutable_bipartition_for_edge
+        for edge in encoded_edges:
+            _compile_bipartition(edge)
+        self.bipartition_encoding = [nd._edge._bipartition for nd in postorder_nodes]
+        return self.bipartition_encoding
+
     def encode_splits(self, *args, **kwargs):
         """
         Recalculates bipartition hashes for tree.
@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking the bitmask operations that scale with the number of taxa --
+building the bitmask of a set of taxa, listing the taxa of a bitmask,
+counting set bits and OR-reducing many bitmasks -- with each bitmask backend,
+and, for comparison, with bit-at-a-time loops over Python integers.
+"""
+
+import sys
+import random
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.utility import bitprocessing
+
+import dendropy
+
+def loop_bitmask_from_indexes(indexes):
+    bitmask = 0
+    for idx in indexes:
+        bitmask |= 1 << idx
+    return bitmask
+
+def loop_set_bit_indexes(bitmask):
+    indexes = []
+    idx = 0
+    while bitmask:
+        if bitmask & 1:
+            indexes.append(idx)
+        bitmask >>= 1
+        idx += 1
+    return indexes
+
+def loop_num_set_bits(bitmask):
+    return bin(bitmask).count("1")
+
+def loop_union(bitmasks):
+    bitmask = 0
+    for b in bitmasks:
+        bitmask |= b
+    return bitmask
+
+class LoopBitmaskBackend(object):
+    name = "loop"
+    bitmask_from_indexes = staticmethod(loop_bitmask_from_indexes)
+    set_bit_indexes = staticmethod(loop_set_bit_indexes)
+    num_set_bits = staticmethod(loop_num_set_bits)
+    union = staticmethod(loop_union)
+
+def operations(backend, indexes, bitmasks):
+    return [
+        ("from indexes", lambda: backend.bitmask_from_indexes(indexes)),
+        ("set indexes", lambda: backend.set_bit_indexes(bitmasks[0])),
+        ("count bits", lambda: [backend.num_set_bits(b) for b in bitmasks]),
+        ("union", lambda: backend.union(bitmasks)),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-taxa",
+            type=int,
+            nargs="+",
+            default=[1000, 10000, 100000],
+            help="Numbers of taxa (default=%(default)s).")
+    parser.add_argument("-b", "--num-bitmasks",
+            type=int,
+            default=100,
+            help="Number of bitmasks counted and OR-reduced (default=%(default)s).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=3,
+            help="Repeat each measurement this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    backends = [LoopBitmaskBackend(), bitprocessing.IntBitmaskBackend()]
+    if bitprocessing.numpy is not None:
+        backends.append(bitprocessing.NumpyBitmaskBackend())
+    else:
+        messenger.info("NumPy is not installed: skipping the 'numpy' backend")
+    results = []
+    for num_taxa in args.num_taxa:
+        messenger.info("Processing: {} taxa".format(num_taxa))
+        indexes = rng.sample(range(num_taxa), num_taxa // 2)
+        bitmasks = [rng.getrandbits(num_taxa) for idx in range(args.num_bitmasks)]
+        for backend in backends:
+            row = [num_taxa, backend.name]
+            for desc, f in operations(backend, indexes, bitmasks):
+                row.append(min(timeit.Timer(f).repeat(args.repeat, 1)))
+            results.append(row)
+        # the calls through the taxon namespace use the current backend
+        tns = dendropy.TaxonNamespace(["T{}".format(idx) for idx in range(num_taxa)])
+        taxa = [tns[idx] for idx in indexes]
+        for backend in backends[1:]:
+            previous_backend = bitprocessing.set_bitmask_backend(backend)
+            row = [num_taxa, "taxa/" + backend.name]
+            bitmask = tns.taxa_bitmask(taxa=taxa)
+            row.append(min(timeit.Timer(lambda: tns.taxa_bitmask(taxa=taxa)).repeat(args.repeat, 1)))
+            row.append(min(timeit.Timer(lambda: tns.bitmask_taxa_list(bitmask)).repeat(args.repeat, 1)))
+            row.extend([float("nan")] * 2)
+            results.append(row)
+            bitprocessing.set_bitmask_backend(previous_backend)
+
+    messenger.info("Benchmarking complete")
+    header_template = "{:>8}  {:12}" + "  {:>14}" * 4 + "\n"
+    result_template = "{:>8}  {:12}" + "  {:>14.6f}" * 4 + "\n"
+    sys.stdout.write("Seconds:\n")
+    sys.stdout.write(header_template.format("Taxa", "Backend", "From indexes", "Set indexes", "Count bits", "Union"))
+    for row in results:
+        sys.stdout.write(result_template.format(*row))
+
+if __name__ == "__main__":
+    main()
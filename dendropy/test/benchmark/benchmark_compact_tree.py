@@ -0,0 +1,132 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking traversals and calculations on large random trees represented by
+|Tree| and by |CompactTree| objects (and, where available, the memory
+allocated for each representation).
+"""
+
+import sys
+import gc
+import random
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.calculate import treecompare
+from dendropy.calculate import treemeasure
+
+import dendropy
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+CALCULATIONS = [
+    ("Postorder", lambda t: list(t.postorder_node_iter()), lambda t: t.postorder_node_indexes()),
+    ("Length", lambda t: t.length(), lambda t: t.length()),
+    ("Ages", lambda t: t.calc_node_ages(), lambda t: t.calc_node_ages()),
+    ("Colless", treemeasure.colless_tree_imbalance, treemeasure.colless_tree_imbalance),
+    ("Sackin", treemeasure.sackin_index, treemeasure.sackin_index),
+]
+
+def random_tree(num_leaves, taxon_namespace, rng):
+    # a random ultrametric tree built by joining random pairs of subtrees
+    nodes = [("T{}".format(idx+1), 0.0) for idx in range(num_leaves)]
+    while len(nodes) > 1:
+        idx = rng.randrange(len(nodes))
+        node = nodes[idx]
+        nodes[idx] = nodes[-1]
+        nodes.pop()
+        idx = rng.randrange(len(nodes))
+        age = max(node[1], nodes[idx][1]) + rng.random()
+        nodes[idx] = ("({}:{:.6f},{}:{:.6f})".format(
+                node[0], age - node[1], nodes[idx][0], age - nodes[idx][1]), age)
+    return dendropy.Tree.get(data="[&R] " + nodes[0][0] + ";",
+            schema="newick",
+            taxon_namespace=taxon_namespace,
+            parser_engine="statement")
+
+def allocated_size(fn):
+    if tracemalloc is None:
+        return float("nan")
+    gc.collect()
+    tracemalloc.start()
+    obj = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size / (1024.0 * 1024.0)
+
+def calculation_fn_factory(calculation, tree):
+    def f():
+        calculation(tree)
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-leaves",
+            type=int,
+            default=100000,
+            help="Number of leaves of the tree (default=%(default)s).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=3,
+            help="Repeat each calculation this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    taxon_namespace = dendropy.TaxonNamespace()
+    messenger.info("Processing: tree of {} leaves".format(args.num_leaves))
+    tree = random_tree(args.num_leaves, taxon_namespace, rng)
+    compact_tree = dendropy.CompactTree.from_tree(tree)
+    tree_sizes = [
+        allocated_size(compact_tree.to_tree),
+        allocated_size(lambda: dendropy.CompactTree.from_tree(tree)),
+        ]
+    results = []
+    for desc, tree_calculation, compact_tree_calculation in CALCULATIONS:
+        row = [desc]
+        for t, calculation in ((tree, tree_calculation), (compact_tree, compact_tree_calculation)):
+            timer = timeit.Timer(calculation_fn_factory(calculation, t))
+            row.append(min(timer.repeat(args.repeat, 1)))
+        results.append(row)
+    other_tree = dendropy.CompactTree.from_tree(random_tree(args.num_leaves, taxon_namespace, rng))
+    row = ["RF distance"]
+    for t1, t2 in ((tree, other_tree.to_tree()), (compact_tree, other_tree)):
+        timer = timeit.Timer(lambda: treecompare.symmetric_difference(t1, t2))
+        row.append(min(timer.repeat(args.repeat, 1)))
+    results.append(row)
+
+    messenger.info("Benchmarking complete")
+    sys.stdout.write("Megabytes allocated per tree:\n")
+    sys.stdout.write("{:12}  {:>12}  {:>12}\n".format("", "Tree", "CompactTree"))
+    sys.stdout.write("{:12}  {:>12.2f}  {:>12.2f}\n".format("Allocated", *tree_sizes))
+    sys.stdout.write("Seconds per calculation:\n")
+    sys.stdout.write("{:12}  {:>12}  {:>12}\n".format("Calculation", "Tree", "CompactTree"))
+    for row in results:
+        sys.stdout.write("{:12}  {:>12.6f}  {:>12.6f}\n".format(*row))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking the updating of the bipartitions of large random trees after
+each of a sequence of random nearest-neighbor-interchange (NNI) and
+subtree-prune-and-regraft (SPR) moves, by encoding all bipartitions again and
+by only updating those on the paths from the edited nodes to the root.
+"""
+
+import sys
+import random
+import timeit
+import argparse
+from dendropy.utility import messaging
+
+import dendropy
+
+def random_tree(num_leaves, rng):
+    # a random ultrametric tree built by joining random pairs of subtrees
+    nodes = [("T{}".format(idx+1), 0.0) for idx in range(num_leaves)]
+    while len(nodes) > 1:
+        idx = rng.randrange(len(nodes))
+        node = nodes[idx]
+        nodes[idx] = nodes[-1]
+        nodes.pop()
+        idx = rng.randrange(len(nodes))
+        age = max(node[1], nodes[idx][1]) + rng.random()
+        nodes[idx] = ("({}:{:.6f},{}:{:.6f})".format(
+                node[0], age - node[1], nodes[idx][0], age - nodes[idx][1]), age)
+    return dendropy.Tree.get(data="[&R] " + nodes[0][0] + ";",
+            schema="newick",
+            parser_engine="statement")
+
+def nearest_neighbor_interchange(tree, rng):
+    nodes = tree.internal_nodes(exclude_seed_node=True)
+    node = rng.choice(nodes)
+    parent = node.parent_node
+    sibling = rng.choice([nd for nd in parent.child_nodes() if nd is not node])
+    child = rng.choice(node.child_nodes())
+    node.remove_child(child)
+    parent.remove_child(sibling)
+    node.add_child(sibling)
+    parent.add_child(child)
+    return [node, parent]
+
+def subtree_prune_and_regraft(tree, rng):
+    # a leaf is regrafted, so that the tree stays bifurcating
+    leaf = rng.choice(tree.leaf_nodes())
+    old_parent = leaf.parent_node
+    if old_parent.parent_node is None:
+        return []
+    grandparent = old_parent.parent_node
+    sibling = [nd for nd in old_parent.child_nodes() if nd is not leaf][0]
+    old_parent.remove_child(leaf)
+    old_parent.remove_child(sibling)
+    grandparent.remove_child(old_parent)
+    grandparent.add_child(sibling)
+    target = rng.choice([nd for nd in tree.preorder_node_iter() if nd.parent_node is not None])
+    target_parent = target.parent_node
+    target_parent.remove_child(target)
+    target_parent.add_child(old_parent)
+    old_parent.add_child(target)
+    old_parent.add_child(leaf)
+    return [grandparent, old_parent]
+
+MOVES = [
+    ("NNI", nearest_neighbor_interchange),
+    ("SPR", subtree_prune_and_regraft),
+]
+
+def move_sequence_fn_factory(tree, move, num_moves, is_incremental, random_seed):
+    def f():
+        rng = random.Random(random_seed)
+        for idx in range(num_moves):
+            edited_nodes = move(tree, rng)
+            if is_incremental:
+                tree.update_bipartitions_at(edited_nodes)
+            else:
+                tree.encode_bipartitions()
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-leaves",
+            type=int,
+            default=10000,
+            help="Number of leaves of the tree (default=%(default)s).")
+    parser.add_argument("-m", "--num-moves",
+            type=int,
+            default=100,
+            help="Number of moves in each sequence (default=%(default)s).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=3,
+            help="Repeat each sequence this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    messenger.info("Processing: tree of {} leaves".format(args.num_leaves))
+    tree = random_tree(args.num_leaves, rng)
+    results = []
+    for desc, move in MOVES:
+        row = [desc]
+        for is_incremental in (False, True):
+            tree.encode_bipartitions()
+            timer = timeit.Timer(move_sequence_fn_factory(tree, move, args.num_moves, is_incremental, args.random_seed))
+            row.append(min(timer.repeat(args.repeat, 1)) / args.num_moves)
+        results.append(row)
+
+    messenger.info("Benchmarking complete")
+    sys.stdout.write("Seconds per move:\n")
+    sys.stdout.write("{:12}  {:>12}  {:>12}\n".format("Move", "Full", "Incremental"))
+    for row in results:
+        sys.stdout.write("{:12}  {:>12.6f}  {:>12.6f}\n".format(*row))
+
+if __name__ == "__main__":
+    main()
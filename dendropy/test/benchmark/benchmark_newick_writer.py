@@ -0,0 +1,142 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking tree writing.
+"""
+
+import sys
+import os
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.utility.textprocessing import StringIO
+from dendropy.test.support import pathmap
+
+import dendropy
+
+TREE_FILENAMES = [
+    "APG_Angiosperms.newick",
+    "GEBA.tree.newick",
+    "feb032009.trees.newick",
+    "Bininda-emonds_2007_mammals.newick",
+    "Jetz_et_al_2012_Aves.sample.tree.newick",
+    "Smith_2001_angiosperms.newick",
+    "dendropy-test-trees-n33-unrooted-x100a.newick",
+        ]
+
+WRITER_ENGINES = ["standard", "streaming"]
+
+def tree_writing_fn_factory(trees, writer_engine="standard", **kwargs):
+    def f():
+        dest = StringIO()
+        trees.write(file=dest,
+                schema="newick",
+                writer_engine=writer_engine,
+                **kwargs)
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-f", "--target-file",
+            type=str,
+            dest="target_files",
+            default=[],
+            action="append",
+            help="""Path to file of trees to be written; option may be specified multiple times for multiple files. If not specified, default target set will be used.""")
+    parser.add_argument("-e", "--engine",
+            type=str,
+            dest="engines",
+            default=[],
+            choices=WRITER_ENGINES,
+            action="append",
+            help="Writer engine to benchmark (default: all engines); option may be specified multiple times.")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=10,
+            help="Repeat each writing this number of times (default=%(default)s).")
+    parser.add_argument("--annotations",
+            action="store_true",
+            default=False,
+            help="Write metadata annotations (extracted from comments in the source) and item comments.")
+    parser.add_argument("--delimited-output",
+            action="store_true",
+            default=False,
+            help="Output in tab-delimited instead of aligned format")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+
+    src_descs = []
+    src_paths = []
+    results = []
+
+    if args.target_files:
+        for f in args.target_files:
+            ff = os.path.expanduser(os.path.expandvars(f))
+            src_paths.append(ff)
+            src_descs.append( ("User", f) )
+    else:
+        messenger.info("No sources specified: adding default benchmark target set")
+        for f in TREE_FILENAMES:
+            ff = pathmap.tree_source_path(f)
+            src_paths.append(ff)
+            src_descs.append( ("Default", f) )
+
+    if args.annotations:
+        writer_kwargs = {"suppress_annotations": False, "suppress_item_comments": False}
+    else:
+        writer_kwargs = {}
+    engines = args.engines if args.engines else WRITER_ENGINES
+    for src_path, src_desc in zip(src_paths, src_descs):
+        messenger.info("Processing: '{}'".format(src_desc[1]))
+        trees = dendropy.TreeList.get(path=src_path,
+                schema="newick",
+                extract_comment_metadata=args.annotations,
+                parser_engine="statement")
+        engine_results = []
+        for engine in engines:
+            t = timeit.Timer(tree_writing_fn_factory(trees, writer_engine=engine, **writer_kwargs))
+            result = min(t.repeat(args.repeat, 1))
+            messenger.info("Best time (of {} repetions) using '{}' engine: {:.10f} seconds".format(args.repeat, engine, result))
+            engine_results.append(result)
+        results.append(engine_results)
+
+    messenger.info("Benchmarking complete: all files processed")
+
+    if args.delimited_output:
+        result_template = "{}\t{}" + "\t{:.10f}" * len(engines) + "\n"
+        header_template = "{}\t{}" + "\t{}" * len(engines) + "\n"
+    else:
+        max_len1 = max(len(r[0]) for r in src_descs)
+        max_len2 = max(len(r[1]) for r in src_descs)
+        col1 = "{{:{}}}".format(max_len1)
+        col2 = "{{:{}}}".format(max_len2)
+        result_template = "[" + col1 + "]  " + col2 + "  {:>12.6f}" * len(engines) + "\n"
+        header_template = col1 + "    " + col2 + "  {:>12}" * len(engines) + "\n"
+    sys.stdout.write(header_template.format("Type", "File", *engines))
+    for result, src_desc in zip(results, src_descs):
+        sys.stdout.write(result_template.format(src_desc[0], src_desc[1], *result))
+    if len(engines) > 1:
+        total_times = [sum(r[idx] for r in results) for idx in range(len(engines))]
+        for engine, total_time in zip(engines[1:], total_times[1:]):
+            messenger.info("Overall speed-up of '{}' relative to '{}': {:.2f}x".format(
+                engine, engines[0], total_times[0] / total_time))
+
+if __name__ == "__main__":
+    main()
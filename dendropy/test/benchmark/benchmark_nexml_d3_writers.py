@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking the writing of large random trees in the NeXML and D3 schemas
+(and, for comparison, NEWICK) to a file.
+"""
+
+import sys
+import os
+import random
+import tempfile
+import timeit
+import argparse
+from dendropy.utility import messaging
+
+import dendropy
+
+SCHEMAS = ["newick", "nexml", "d3"]
+
+def random_tree(num_leaves, rng):
+    # a random tree built by joining random pairs of subtrees
+    nodes = ["T{}:{:.6f}".format(idx+1, rng.random()) for idx in range(num_leaves)]
+    while len(nodes) > 1:
+        idx = rng.randrange(len(nodes))
+        node = nodes[idx]
+        nodes[idx] = nodes[-1]
+        nodes.pop()
+        idx = rng.randrange(len(nodes))
+        nodes[idx] = "({},{}):{:.6f}".format(node, nodes[idx], rng.random())
+    return dendropy.Tree.get(data=nodes[0] + ";",
+            schema="newick",
+            parser_engine="statement")
+
+def tree_writing_fn_factory(tree, schema, dest_path):
+    def f():
+        with open(dest_path, "w") as dest:
+            tree.write(file=dest, schema=schema)
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-leaves",
+            type=int,
+            dest="num_leaves",
+            default=[],
+            action="append",
+            help="Number of leaves of the tree to be written; option may be specified multiple times (default: 1000, 10000 and 100000).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=3,
+            help="Repeat each writing this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    num_leaves_list = args.num_leaves if args.num_leaves else [1000, 10000, 100000]
+    dest_fd, dest_path = tempfile.mkstemp()
+    os.close(dest_fd)
+    results = []
+    try:
+        for num_leaves in num_leaves_list:
+            messenger.info("Processing: tree of {} leaves".format(num_leaves))
+            tree = random_tree(num_leaves, rng)
+            row = [num_leaves]
+            for schema in SCHEMAS:
+                t = timeit.Timer(tree_writing_fn_factory(tree, schema, dest_path))
+                row.append(min(t.repeat(args.repeat, 1)))
+            results.append(row)
+    finally:
+        os.remove(dest_path)
+
+    messenger.info("Benchmarking complete")
+    header_template = "{:>10}" + "  {:>12}" * len(SCHEMAS) + "\n"
+    result_template = "{:>10}" + "  {:>12.6f}" * len(SCHEMAS) + "\n"
+    sys.stdout.write("Seconds per tree:\n")
+    sys.stdout.write(header_template.format("Leaves", *SCHEMAS))
+    for row in results:
+        sys.stdout.write(result_template.format(*row))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking the parsing of NEXUS DNA character matrices token by token, and
+row by row into full matrices (in worker processes) and packed matrices (in
+the main process and in worker processes).
+"""
+
+import sys
+import random
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.utility.textprocessing import StringIO
+
+import dendropy
+
+def compose_nexus(num_taxa, num_chars, interleave, rng):
+    sequences = ["".join(rng.choice("ACGT-") for idx in range(num_chars)) for taxon_idx in range(num_taxa)]
+    parts = ["#NEXUS\n\nBEGIN CHARACTERS;\n    DIMENSIONS NTAX={} NCHAR={};\n".format(num_taxa, num_chars)]
+    if interleave:
+        parts.append("    FORMAT DATATYPE=DNA GAP=- INTERLEAVE;\n    MATRIX\n")
+        for start in range(0, num_chars, interleave):
+            for taxon_idx, sequence in enumerate(sequences):
+                parts.append("T{} {}\n".format(taxon_idx+1, sequence[start:start+interleave]))
+            parts.append("\n")
+    else:
+        parts.append("    FORMAT DATATYPE=DNA GAP=-;\n    MATRIX\n")
+        for taxon_idx, sequence in enumerate(sequences):
+            parts.append("T{} {}\n".format(taxon_idx+1, sequence))
+    parts.append("    ;\nEND;\n")
+    return "".join(parts)
+
+def parsing_fn_factory(data, kwargs):
+    def f():
+        dendropy.DnaCharacterMatrix.get(file=StringIO(data), schema="nexus", **kwargs)
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-taxa",
+            type=int,
+            default=100,
+            help="Number of taxa (default=%(default)s).")
+    parser.add_argument("-c", "--num-chars",
+            type=int,
+            default=100000,
+            help="Number of characters (default=%(default)s).")
+    parser.add_argument("-p", "--num-processes",
+            type=int,
+            default=4,
+            help="Number of worker processes (default=%(default)s).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=3,
+            help="Repeat each measurement this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    methods = [
+        ("Tokens", {"tokenizer_engine": "buffered"}),
+        ("Rows (workers)", {"tokenizer_engine": "buffered", "num_processes": args.num_processes}),
+        ("Packed", {"tokenizer_engine": "buffered", "packed": True}),
+        ("Packed (workers)", {"tokenizer_engine": "buffered", "packed": True, "num_processes": args.num_processes}),
+    ]
+    results = []
+    for interleave in (0, 1000):
+        desc = "interleaved" if interleave else "sequential"
+        messenger.info("Processing: {} matrix of {} taxa and {} characters".format(desc, args.num_taxa, args.num_chars))
+        data = compose_nexus(args.num_taxa, args.num_chars, interleave, rng)
+        row = [desc]
+        for method_desc, kwargs in methods:
+            t = timeit.Timer(parsing_fn_factory(data, kwargs))
+            row.append(min(t.repeat(args.repeat, 1)))
+        results.append(row)
+
+    messenger.info("Benchmarking complete")
+    header_template = "{:12}" + "  {:>16}" * len(methods) + "\n"
+    result_template = "{:12}" + "  {:>16.6f}" * len(methods) + "\n"
+    sys.stdout.write("Seconds per matrix:\n")
+    sys.stdout.write(header_template.format("Matrix", *[method_desc for method_desc, kwargs in methods]))
+    for row in results:
+        sys.stdout.write(result_template.format(*row))
+
+if __name__ == "__main__":
+    main()
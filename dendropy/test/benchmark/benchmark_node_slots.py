@@ -0,0 +1,172 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking the memory allocated for, and traversals and calculations on,
+large random trees with the slotted layout of |Node|, |Edge| and
+|Bipartition| objects, and with the dictionary-backed layout (i.e., the same
+classes without slots).
+"""
+
+import sys
+import gc
+import random
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.datamodel import treemodel
+
+import dendropy
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+def dict_backed_class(cls):
+    # a copy of ``cls`` without slots, so that its attributes are stored in
+    # an instance dictionary
+    excluded = set(cls.__slots__)
+    namespace = dict((k, v) for k, v in cls.__dict__.items() if k not in excluded and k != "__slots__")
+    return type(cls.__name__, cls.__bases__, namespace)
+
+DictEdge = dict_backed_class(treemodel.Edge)
+DictBipartition = dict_backed_class(treemodel.Bipartition)
+
+class DictNode(dict_backed_class(treemodel.Node)):
+
+    def __init__(self, **kwargs):
+        edge_length = kwargs.pop("edge_length", None)
+        super(DictNode, self).__init__(**kwargs)
+        self.edge = DictEdge(head_node=self, length=edge_length)
+
+class DictTree(dendropy.Tree):
+
+    def node_factory(cls, **kwargs):
+        return DictNode(**kwargs)
+    node_factory = classmethod(node_factory)
+
+def random_tree(num_leaves, rng):
+    # a random ultrametric tree built by joining random pairs of subtrees
+    nodes = [("T{}".format(idx+1), 0.0) for idx in range(num_leaves)]
+    while len(nodes) > 1:
+        idx = rng.randrange(len(nodes))
+        node = nodes[idx]
+        nodes[idx] = nodes[-1]
+        nodes.pop()
+        idx = rng.randrange(len(nodes))
+        age = max(node[1], nodes[idx][1]) + rng.random()
+        nodes[idx] = ("({}:{:.6f},{}:{:.6f})".format(
+                node[0], age - node[1], nodes[idx][0], age - nodes[idx][1]), age)
+    return dendropy.Tree.get(data="[&R] " + nodes[0][0] + ";",
+            schema="newick",
+            structure_only=True)
+
+def allocated_size(fn):
+    if tracemalloc is None:
+        return float("nan")
+    gc.collect()
+    tracemalloc.start()
+    obj = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size / (1024.0 * 1024.0)
+
+def bipartitions_fn_factory(bipartition_type, tree):
+    # the bitmasks are those of the bipartitions of ``tree``, so that only
+    # the bipartition objects are allocated
+    bipartitions = [nd.edge.bipartition for nd in tree]
+    def f():
+        return [bipartition_type(bitmask=b.split_bitmask,
+                    leafset_bitmask=b.leafset_bitmask,
+                    tree_leafset_bitmask=b.tree_leafset_bitmask,
+                    is_rooted=b.is_rooted,
+                    compile_bipartition=False,
+                    is_mutable=False)
+                for b in bipartitions]
+    return f
+
+def preorder_lengths(tree):
+    for nd in tree.preorder_node_iter():
+        nd.edge.length
+
+def postorder_labels(tree):
+    for nd in tree.postorder_node_iter():
+        nd.taxon, nd.label
+
+CALCULATIONS = [
+    ("Preorder", preorder_lengths),
+    ("Postorder", postorder_labels),
+    ("Ages", lambda t: t.calc_node_ages()),
+    ("Bipartitions", lambda t: t.encode_bipartitions()),
+]
+
+def calculation_fn_factory(calculation, tree):
+    def f():
+        calculation(tree)
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-leaves",
+            type=int,
+            default=100000,
+            help="Number of leaves of the tree (default=%(default)s).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=3,
+            help="Repeat each calculation this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    messenger.info("Processing: tree of {} leaves".format(args.num_leaves))
+    compact_tree = random_tree(args.num_leaves, rng)
+    layouts = [("Slots", dendropy.Tree, treemodel.Bipartition), ("Dictionaries", DictTree, DictBipartition)]
+    trees = [compact_tree.to_tree(tree_type=tree_type) for desc, tree_type, bipartition_type in layouts]
+    trees[0].encode_bipartitions()
+    sizes = [
+        ["Tree"] + [allocated_size(lambda: compact_tree.to_tree(tree_type=tree_type)) for desc, tree_type, bipartition_type in layouts],
+        ["Bipartitions"] + [allocated_size(bipartitions_fn_factory(bipartition_type, trees[0])) for desc, tree_type, bipartition_type in layouts],
+        ]
+    results = []
+    for desc, calculation in CALCULATIONS:
+        row = [desc]
+        for tree in trees:
+            timer = timeit.Timer(calculation_fn_factory(calculation, tree))
+            row.append(min(timer.repeat(args.repeat, 1)))
+        results.append(row)
+
+    messenger.info("Benchmarking complete")
+    header_template = "{:12}" + "  {:>12}" * len(layouts) + "\n"
+    sys.stdout.write("Megabytes allocated:\n")
+    sys.stdout.write(header_template.format("Objects", *[desc for desc, tree_type, bipartition_type in layouts]))
+    for row in sizes:
+        sys.stdout.write(("{:12}" + "  {:>12.2f}" * len(layouts) + "\n").format(*row))
+    sys.stdout.write("Seconds per calculation:\n")
+    sys.stdout.write(header_template.format("Calculation", *[desc for desc, tree_type, bipartition_type in layouts]))
+    for row in results:
+        sys.stdout.write(("{:12}" + "  {:>12.6f}" * len(layouts) + "\n").format(*row))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking the look-up of taxa from the symbols of NEXUS tree statements,
+reporting the cost per tree of the look-ups alone (using the compiled symbol
+map and, for comparison, successive look-ups in the translate token, label
+and taxon number mappings), and of parsing the trees.
+"""
+
+import sys
+import random
+import functools
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.utility import textprocessing
+from dendropy.utility.textprocessing import StringIO
+from dendropy.dataio import nexusprocessing
+
+import dendropy
+
+def random_newick(symbols, rng):
+    nodes = list(symbols)
+    while len(nodes) > 1:
+        idx = rng.randrange(len(nodes))
+        node = nodes[idx]
+        nodes[idx] = nodes[-1]
+        nodes.pop()
+        idx = rng.randrange(len(nodes))
+        nodes[idx] = "({},{})".format(node, nodes[idx])
+    return nodes[0] + ";"
+
+def compose_nexus(labels, num_trees, use_translate, rng):
+    parts = ["#NEXUS\n\nBEGIN TAXA;\n    DIMENSIONS NTAX={};\n    TAXLABELS\n".format(len(labels))]
+    for label in labels:
+        parts.append("        {}\n".format(label))
+    parts.append("    ;\nEND;\n\nBEGIN TREES;\n")
+    if use_translate:
+        parts.append("    TRANSLATE\n")
+        parts.append(",\n".join("        {} {}".format(idx+1, label) for idx, label in enumerate(labels)))
+        parts.append(";\n")
+        symbols = [str(idx+1) for idx in range(len(labels))]
+    else:
+        # symbols in a different case from the labels
+        symbols = [label.upper() for label in labels]
+    for tree_idx in range(num_trees):
+        parts.append("    TREE tree{} = [&U] {}\n".format(tree_idx+1, random_newick(symbols, rng)))
+    parts.append("END;\n")
+    return "".join(parts), symbols
+
+def successive_lookup(mapper, symbol):
+    # resolution through each of the mappings in turn
+    if not textprocessing.is_str_type(symbol):
+        symbol = str(symbol)
+    try:
+        return mapper.token_taxon_map[symbol]
+    except KeyError:
+        pass
+    try:
+        return mapper.label_taxon_map[symbol]
+    except KeyError:
+        pass
+    if mapper.enable_lookup_by_taxon_number:
+        try:
+            return mapper.number_taxon_map[symbol]
+        except KeyError:
+            pass
+    return None
+
+def lookup_fn_factory(symbols, lookup):
+    def f():
+        for symbol in symbols:
+            lookup(symbol)
+    return f
+
+def parsing_fn_factory(data):
+    def f():
+        dendropy.TreeList.get(file=StringIO(data), schema="nexus")
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-taxa",
+            type=int,
+            default=10000,
+            help="Number of taxa (default=%(default)s).")
+    parser.add_argument("-t", "--num-trees",
+            type=int,
+            default=5,
+            help="Number of trees (default=%(default)s).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=5,
+            help="Repeat each measurement this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    labels = ["Taxon_{}".format(idx+1) for idx in range(args.num_taxa)]
+    results = []
+    for use_translate in (True, False):
+        desc = "translate tokens" if use_translate else "taxon labels"
+        messenger.info("Processing: {} trees of {} taxa referenced by {}".format(args.num_trees, args.num_taxa, desc))
+        data, symbols = compose_nexus(labels, args.num_trees, use_translate, rng)
+        tns = dendropy.TaxonNamespace(labels)
+        mapper = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns)
+        if use_translate:
+            for symbol, taxon in zip(symbols, tns):
+                mapper.add_translate_token(symbol, taxon)
+        row = [desc]
+        # the compiled symbol map is used by the look-up function called by
+        # the tree parser
+        for lookup in (functools.partial(successive_lookup, mapper), mapper.require_taxon_for_symbol):
+            t = timeit.Timer(lookup_fn_factory(symbols, lookup))
+            row.append(min(t.repeat(args.repeat, 1)))
+        mapper.restore_taxon_namespace_mutability()
+        t = timeit.Timer(parsing_fn_factory(data))
+        row.append(min(t.repeat(args.repeat, 1)) / args.num_trees)
+        results.append(row)
+
+    messenger.info("Benchmarking complete")
+    header_template = "{:18}" + "  {:>18}" * 3 + "\n"
+    result_template = "{:18}" + "  {:>18.6f}" * 3 + "\n"
+    sys.stdout.write("Seconds per tree:\n")
+    sys.stdout.write(header_template.format("Symbols", "Successive look-up", "Compiled look-up", "Parsing"))
+    for row in results:
+        sys.stdout.write(result_template.format(*row))
+
+if __name__ == "__main__":
+    main()
@@ -49,15 +49,18 @@ CHAR_FILENAMES = [
     "angiosperms.chars.nexus",
         ]
 
-def tokenizing_fn_factory(src_paths, verbose=False):
+TOKENIZER_ENGINES = ["standard", "buffered"]
+
+def tokenizing_fn_factory(src_paths, tokenizer_engine="standard", verbose=False):
     def f():
         for src_path in src_paths:
             if verbose:
                 sys.stderr.write("  .. {}\n".format(src_path))
-            src = open(src_path, "rU")
-            nt = nexusprocessing.NexusTokenizer(src)
-            for token in nt:
-                pass
+            with open(src_path, "r") as src:
+                nt = nexusprocessing.create_nexus_tokenizer(src,
+                        tokenizer_engine=tokenizer_engine)
+                for token in nt:
+                    pass
     return f
 
 def main():
@@ -75,6 +78,13 @@ def main():
             choices=["trees", "chars", "all"],
             action="append",
             help="Input data file types (default='all' if '-f'/'--file' argument not given); option may be specified multiple times.")
+    parser.add_argument("-e", "--engine",
+            type=str,
+            dest="engines",
+            default=[],
+            choices=TOKENIZER_ENGINES,
+            action="append",
+            help="Tokenizer engine to benchmark (default: all engines); option may be specified multiple times.")
     parser.add_argument("-r", "--repeat",
             type=int,
             default=10,
@@ -113,28 +123,37 @@ def main():
             src_paths.append(ff)
             src_descs.append( ("Alignment", f) )
 
+    engines = args.engines if args.engines else TOKENIZER_ENGINES
     for src_path, src_desc in zip(src_paths, src_descs):
         messenger.info("Processing: '{}'".format(src_desc[1]))
-        t = timeit.Timer(tokenizing_fn_factory([src_path]))
-        result = min(t.repeat(args.repeat, 1))
-        messenger.info("Best time (of {} repetions): {:.10f} seconds".format(args.repeat, result))
-        results.append(result)
+        engine_results = []
+        for engine in engines:
+            t = timeit.Timer(tokenizing_fn_factory([src_path], tokenizer_engine=engine))
+            result = min(t.repeat(args.repeat, 1))
+            messenger.info("Best time (of {} repetions) using '{}' engine: {:.10f} seconds".format(args.repeat, engine, result))
+            engine_results.append(result)
+        results.append(engine_results)
 
     messenger.info("Benchmarking complete: all files processed")
 
     if args.delimited_output:
-        result_template = "{}\t{}\t{:.10f}\n"
-        header_template = "{}\t{}\t{}\n"
+        result_template = "{}\t{}" + "\t{:.10f}" * len(engines) + "\n"
+        header_template = "{}\t{}" + "\t{}" * len(engines) + "\n"
     else:
         max_len1 = max(len(r[0]) for r in src_descs)
         max_len2 = max(len(r[1]) for r in src_descs)
         col1 = "{{:{}}}".format(max_len1)
         col2 = "{{:{}}}".format(max_len2)
-        result_template = "[" + col1 + "]  " + col2 + "  {:.10f}\n"
-        header_template = col1 + "    " + col2 + "  {}\n"
-    sys.stdout.write(header_template.format("Type", "File", "Seconds"))
+        result_template = "[" + col1 + "]  " + col2 + "  {:>12.6f}" * len(engines) + "\n"
+        header_template = col1 + "    " + col2 + "  {:>12}" * len(engines) + "\n"
+    sys.stdout.write(header_template.format("Type", "File", *engines))
     for result, src_desc in zip(results, src_descs):
-        sys.stdout.write(result_template.format(src_desc[0], src_desc[1], result))
+        sys.stdout.write(result_template.format(src_desc[0], src_desc[1], *result))
+    if len(engines) > 1:
+        total_times = [sum(r[idx] for r in results) for idx in range(len(engines))]
+        for engine, total_time in zip(engines[1:], total_times[1:]):
+            messenger.info("Overall speed-up of '{}' relative to '{}': {:.2f}x".format(
+                engine, engines[0], total_times[0] / total_time))
 
 if __name__ == "__main__":
     main()
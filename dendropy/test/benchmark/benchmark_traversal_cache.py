@@ -0,0 +1,102 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking traversals and calculations on a large random tree when the
+traversal orders cached by the tree are reused, and when they are rebuilt for
+each calculation (as they are after every edit of the tree).
+"""
+
+import sys
+import random
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.calculate import treemeasure
+
+import dendropy
+
+CALCULATIONS = [
+    ("Preorder", lambda t: list(t.preorder_node_iter())),
+    ("Postorder", lambda t: list(t.postorder_node_iter())),
+    ("Leaves", lambda t: t.leaf_nodes()),
+    ("Edges", lambda t: list(t.postorder_edge_iter())),
+    ("Length", lambda t: t.length()),
+    ("Ages", lambda t: t.calc_node_ages()),
+    ("Sackin", treemeasure.sackin_index),
+]
+
+def random_tree(num_leaves, rng):
+    # a random ultrametric tree built by joining random pairs of subtrees
+    nodes = [("T{}".format(idx+1), 0.0) for idx in range(num_leaves)]
+    while len(nodes) > 1:
+        idx = rng.randrange(len(nodes))
+        node = nodes[idx]
+        nodes[idx] = nodes[-1]
+        nodes.pop()
+        idx = rng.randrange(len(nodes))
+        age = max(node[1], nodes[idx][1]) + rng.random()
+        nodes[idx] = ("({}:{:.6f},{}:{:.6f})".format(
+                node[0], age - node[1], nodes[idx][0], age - nodes[idx][1]), age)
+    return dendropy.Tree.get(data="[&R] " + nodes[0][0] + ";",
+            schema="newick",
+            parser_engine="statement")
+
+def calculation_fn_factory(calculation, tree, is_rebuilt):
+    def f():
+        if is_rebuilt:
+            tree._traversal_cache.clear()
+        calculation(tree)
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-leaves",
+            type=int,
+            default=100000,
+            help="Number of leaves of the tree (default=%(default)s).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=5,
+            help="Repeat each calculation this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    messenger.info("Processing: tree of {} leaves".format(args.num_leaves))
+    tree = random_tree(args.num_leaves, rng)
+    results = []
+    for desc, calculation in CALCULATIONS:
+        row = [desc]
+        for is_rebuilt in (False, True):
+            timer = timeit.Timer(calculation_fn_factory(calculation, tree, is_rebuilt))
+            row.append(min(timer.repeat(args.repeat, 1)))
+        results.append(row)
+
+    messenger.info("Benchmarking complete")
+    sys.stdout.write("Seconds per calculation:\n")
+    sys.stdout.write("{:12}  {:>12}  {:>12}\n".format("Calculation", "Cached", "Rebuilt"))
+    for row in results:
+        sys.stdout.write("{:12}  {:>12.6f}  {:>12.6f}\n".format(*row))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarking the reading of redundant collections of NEWICK trees (samples of
+a small number of distinct tree statements) with and without a parse cache,
+into full trees and (with "structure_only") compact trees.
+"""
+
+import sys
+import random
+import timeit
+import argparse
+from dendropy.utility import messaging
+from dendropy.dataio import parsecache
+
+import dendropy
+
+def random_newick(num_leaves, rng):
+    nodes = ["T{}".format(idx+1) for idx in range(num_leaves)]
+    while len(nodes) > 1:
+        idx = rng.randrange(len(nodes))
+        node = nodes[idx]
+        nodes[idx] = nodes[-1]
+        nodes.pop()
+        idx = rng.randrange(len(nodes))
+        nodes[idx] = "({},{})".format(node, nodes[idx])
+    return "[&U] " + nodes[0] + ";"
+
+def reading_fn_factory(data, kwargs, use_parse_cache):
+    def f():
+        if use_parse_cache:
+            kwargs["parse_cache"] = parsecache.TreeParseCache()
+        dendropy.TreeList.get(data=data, schema="newick", parser_engine="statement", **kwargs)
+    return f
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-leaves",
+            type=int,
+            default=50,
+            help="Number of leaves of each tree (default=%(default)s).")
+    parser.add_argument("-t", "--num-trees",
+            type=int,
+            default=2000,
+            help="Number of trees (default=%(default)s).")
+    parser.add_argument("-d", "--num-distinct-trees",
+            type=int,
+            default=[],
+            dest="num_distinct_trees",
+            action="append",
+            help="Number of distinct tree statements; option may be specified multiple times (default: 10, 100 and 1000).")
+    parser.add_argument("-r", "--repeat",
+            type=int,
+            default=3,
+            help="Repeat each measurement this number of times (default=%(default)s).")
+    parser.add_argument("--random-seed",
+            type=int,
+            default=1,
+            help="Random seed (default=%(default)s).")
+    args = parser.parse_args()
+
+    messenger = messaging.ConsoleMessenger(name="-benchmark")
+    rng = random.Random(args.random_seed)
+    num_distinct_trees_list = args.num_distinct_trees if args.num_distinct_trees else [10, 100, 1000]
+    methods = [
+        ("Trees", {}, False),
+        ("Trees (cache)", {}, True),
+        ("Compact", {"structure_only": True}, False),
+        ("Compact (cache)", {"structure_only": True}, True),
+    ]
+    results = []
+    for num_distinct_trees in num_distinct_trees_list:
+        messenger.info("Processing: {} trees of {} leaves with {} distinct statements".format(args.num_trees, args.num_leaves, num_distinct_trees))
+        statements = [random_newick(args.num_leaves, rng) for idx in range(num_distinct_trees)]
+        data = "\n".join(rng.choice(statements) for idx in range(args.num_trees))
+        row = [num_distinct_trees]
+        for method_desc, kwargs, use_parse_cache in methods:
+            t = timeit.Timer(reading_fn_factory(data, dict(kwargs), use_parse_cache))
+            row.append(min(t.repeat(args.repeat, 1)))
+        results.append(row)
+
+    messenger.info("Benchmarking complete")
+    header_template = "{:>10}" + "  {:>16}" * len(methods) + "\n"
+    result_template = "{:>10}" + "  {:>16.6f}" * len(methods) + "\n"
+    sys.stdout.write("Seconds per collection:\n")
+    sys.stdout.write(header_template.format("Distinct", *[method_desc for method_desc, kwargs, use_parse_cache in methods]))
+    for row in results:
+        sys.stdout.write(result_template.format(*row))
+
+if __name__ == "__main__":
+    main()
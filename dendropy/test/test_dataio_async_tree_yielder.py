@@ -0,0 +1,233 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for asynchronous tree iteration.
+"""
+
+import os
+import sys
+import threading
+import unittest
+import dendropy
+from dendropy.utility import error
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+@unittest.skipIf(asyncio is None or sys.version_info < (3, 5),
+        "asynchronous iteration requires Python 3.5 or later")
+class AsyncTreeYielderTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.writer_threads = []
+        self.transports = []
+
+    def tearDown(self):
+        for thread in self.writer_threads:
+            thread.join()
+        for transport in self.transports:
+            transport.close()
+        # let the transports finish closing their pipes
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def open_pipe_stream(self, chunks):
+        """
+        Returns a StreamReader connected to a pipe, into which ``chunks`` (a
+        list of bytes, or of ``threading.Event`` objects to wait for)
+        are written by another thread.
+        """
+        read_fd, write_fd = os.pipe()
+        reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(reader)
+        transport, _ = self.loop.run_until_complete(self.loop.connect_read_pipe(
+                lambda: protocol,
+                os.fdopen(read_fd, "rb")))
+        self.transports.append(transport)
+        def write():
+            try:
+                for chunk in chunks:
+                    if isinstance(chunk, threading.Event):
+                        chunk.wait(5)
+                    else:
+                        os.write(write_fd, chunk)
+            finally:
+                os.close(write_fd)
+        thread = threading.Thread(target=write)
+        thread.start()
+        self.writer_threads.append(thread)
+        return reader
+
+    def split(self, data, size):
+        return [data[idx:idx+size] for idx in range(0, len(data), size)]
+
+    def next_tree(self, tree_yielder):
+        return self.loop.run_until_complete(tree_yielder.__anext__())
+
+    def collect(self, tree_yielder):
+        self.assertIs(tree_yielder.__aiter__(), tree_yielder)
+        trees = []
+        while True:
+            try:
+                trees.append(self.next_tree(tree_yielder))
+            except StopAsyncIteration:
+                break
+        tree_yielder.close()
+        return trees
+
+    def tree_strings(self, trees):
+        return [t.as_string("newick") for t in trees]
+
+    def test_pipe_streams(self):
+        for filename, schema, kwargs in (
+                ("dendropy-test-trees-n33-unrooted-x10a.newick", "newick", {}),
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.nexus", "nexus", {"tree_offset": 3}),
+                ("pythonidae.mb.run1.t", "nexus", {"tree_offset": 10, "tree_stride": 7}),
+                ):
+            path = pathmap.tree_source_path(filename)
+            expected = list(dendropy.Tree.yield_from_files(
+                    files=[path, path],
+                    schema=schema,
+                    **kwargs))
+            with open(path, "rb") as src:
+                data = src.read()
+            tree_yielder = dendropy.Tree.async_yield_from_files(
+                    files=[self.open_pipe_stream(self.split(data, 997)), path],
+                    schema=schema,
+                    **kwargs)
+            trees = self.collect(tree_yielder)
+            self.assertEqual(len(trees), len(expected))
+            self.assertEqual(self.tree_strings(trees), self.tree_strings(expected))
+            for tree in trees:
+                self.assertIs(tree.taxon_namespace, tree_yielder.taxon_namespace)
+
+    def test_split_characters(self):
+        # each multi-byte character is split across two reads
+        data = u"(\u00e4\u00f6:1,(b:2,c:3):4);\n(c,(\u00e4\u00f6,b));\n".encode("utf-8")
+        tree_yielder = dendropy.Tree.async_yield_from_files(
+                files=[self.open_pipe_stream(self.split(data, 1))],
+                schema="newick")
+        trees = self.collect(tree_yielder)
+        self.assertEqual([t.label for t in tree_yielder.taxon_namespace], [u"\u00e4\u00f6", "b", "c"])
+        self.assertEqual(self.tree_strings(trees), [
+                u"(\u00e4\u00f6:1.0,(b:2.0,c:3.0):4.0);\n",
+                u"(c,(\u00e4\u00f6,b));\n"])
+
+    def test_trees_yielded_as_they_arrive(self):
+        # the second tree is written only after a callback scheduled on the
+        # event loop has been run while waiting for it, so the event loop
+        # must not be blocked while waiting for the data
+        callback_event = threading.Event()
+        tree_yielder = dendropy.Tree.async_yield_from_files(
+                files=[self.open_pipe_stream([b"((a,b),(c,d));\n((a,", callback_event, b"c),(b,d));\n"])],
+                schema="newick")
+        self.assertEqual(self.next_tree(tree_yielder).as_string("newick"), "((a,b),(c,d));\n")
+        self.loop.call_later(0.05, callback_event.set)
+        self.assertEqual(self.next_tree(tree_yielder).as_string("newick"), "((a,c),(b,d));\n")
+        self.assertTrue(callback_event.is_set())
+        self.assertEqual(tree_yielder.current_tree_offset, 1)
+        with self.assertRaises(StopAsyncIteration):
+            self.next_tree(tree_yielder)
+        with self.assertRaises(StopAsyncIteration):
+            self.next_tree(tree_yielder)
+        tree_yielder.close()
+
+    def test_tree_yielded_before_more_data(self):
+        # a tree is yielded once its statement has been received, without
+        # waiting for more data or for the end of the stream
+        for schema, data in (
+                ("newick", b"((a,b),(c,d));\n"),
+                ("nexus", b"#NEXUS\nBEGIN TREES;\n    TREE 1 = ((a,b),(c,d));\n"),
+                ):
+            end_event = threading.Event()
+            tree_yielder = dendropy.Tree.async_yield_from_files(
+                    files=[self.open_pipe_stream([data, end_event])],
+                    schema=schema)
+            try:
+                tree = self.loop.run_until_complete(
+                        asyncio.wait_for(tree_yielder.__anext__(), 2))
+                self.assertEqual(tree.as_string("newick"), "((a,b),(c,d));\n")
+                self.assertFalse(end_event.is_set())
+            finally:
+                tree_yielder.close()
+                end_event.set()
+
+    def test_context_manager(self):
+        end_event = threading.Event()
+        tree_yielder = dendropy.Tree.async_yield_from_files(
+                files=[self.open_pipe_stream([b"((a,b),(c,d));\n((a,", end_event])],
+                schema="newick")
+        # as with: ``async with tree_yielder as trees: async for tree in trees: break``
+        trees = self.loop.run_until_complete(tree_yielder.__aenter__())
+        self.assertIs(trees, tree_yielder)
+        self.assertEqual(self.next_tree(trees).as_string("newick"), "((a,b),(c,d));\n")
+        self.assertFalse(self.loop.run_until_complete(tree_yielder.__aexit__(None, None, None)))
+        with self.assertRaises(StopAsyncIteration):
+            self.next_tree(tree_yielder)
+        self.loop.run_until_complete(tree_yielder.aclose())
+        end_event.set()
+
+    def test_structure_only(self):
+        path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.newick")
+        with open(path, "rb") as src:
+            data = src.read()
+        trees = self.collect(dendropy.Tree.async_yield_from_files(
+                files=[self.open_pipe_stream(self.split(data, 4096))],
+                schema="newick",
+                structure_only=True))
+        expected = dendropy.TreeList.get(path=path, schema="newick")
+        self.assertEqual(len(trees), len(expected))
+        for tree, expected_tree in zip(trees, expected):
+            self.assertIsInstance(tree, dendropy.CompactTree)
+            self.assertEqual(
+                    tree.to_tree().as_string("newick", suppress_edge_lengths=True, suppress_internal_node_labels=True),
+                    expected_tree.as_string("newick", suppress_edge_lengths=True, suppress_internal_node_labels=True))
+
+    def test_parse_error(self):
+        tree_yielder = dendropy.Tree.async_yield_from_files(
+                files=[self.open_pipe_stream([b"((a,b),(c,d));\n((a,b),(c,d);\n"])],
+                schema="newick")
+        self.assertEqual(self.next_tree(tree_yielder).as_string("newick"), "((a,b),(c,d));\n")
+        with self.assertRaises(error.DataParseError):
+            self.next_tree(tree_yielder)
+        tree_yielder.close()
+
+    def test_close_while_waiting(self):
+        callback_event = threading.Event()
+        tree_yielder = dendropy.Tree.async_yield_from_files(
+                files=[self.open_pipe_stream([b"((a,b),(c,d));\n((a,", callback_event])],
+                schema="newick")
+        self.assertEqual(self.next_tree(tree_yielder).as_string("newick"), "((a,b),(c,d));\n")
+        future = tree_yielder.__anext__()
+        self.loop.call_later(0.05, tree_yielder.close)
+        with self.assertRaises(IOError):
+            self.loop.run_until_complete(future)
+        with self.assertRaises(StopAsyncIteration):
+            self.next_tree(tree_yielder)
+        callback_event.set()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading and writing trees in the "binary-trees" schema.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.dataio import binarytreeprocessing
+from dendropy.dataio import binarytreewriter
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+class BinaryTreesRoundTripTestCase(dendropytest.ExtendedTestCase):
+
+    def tree_string(self, tree):
+        return tree.as_string("newick",
+                suppress_annotations=True,
+                suppress_item_comments=True,
+                suppress_rooting=False,
+                store_tree_weights=True)
+
+    def check_round_trip(self, filename, schema, **kwargs):
+        path = pathmap.tree_source_path(filename)
+        expected = dendropy.TreeList.get(path=path, schema=schema, **kwargs)
+        data = expected.as_string("binary-trees")
+        self.assertIsInstance(data, bytes)
+        observed = dendropy.TreeList.get(data=data, schema="binary-trees")
+        self.assertEqual([t.label for t in observed.taxon_namespace],
+                [t.label for t in expected.taxon_namespace])
+        self.assertEqual(len(observed), len(expected))
+        for t1, t2 in zip(observed, expected):
+            self.assertIs(t1.taxon_namespace, observed.taxon_namespace)
+            self.assertEqual(t1.label, t2.label)
+            self.assertEqual(t1.is_rooted, t2.is_rooted)
+            self.assertEqual(t1.weight, t2.weight)
+            self.assertEqual(self.tree_string(t1), self.tree_string(t2))
+        return expected, data
+
+    def test_newick(self):
+        self.check_round_trip("dendropy-test-trees-n33-unrooted-x100a.newick", "newick")
+
+    def test_nexus_with_node_labels(self):
+        self.check_round_trip("pythonidae.beast.summary.tre", "nexus")
+
+    def test_tree_weights_and_rooting(self):
+        tree_str = "[&R] [&W 0.25] ((a:1,b:2)x:3,(c,d)y);\n[&U] ((a,c),(b,d));\n(a,(b,(c,d)));"
+        tns = dendropy.TaxonNamespace()
+        expected = dendropy.TreeList.get(data=tree_str, schema="newick",
+                taxon_namespace=tns,
+                store_tree_weights=True)
+        observed = dendropy.TreeList.get(
+                data=expected.as_string("binary-trees"),
+                schema="binary-trees",
+                taxon_namespace=tns)
+        self.assertEqual([t.is_rooted for t in observed], [True, False, None])
+        self.assertEqual([t.weight for t in observed], [0.25, 1.0, 1.0])
+        self.assertEqual([self.tree_string(t) for t in observed],
+                [self.tree_string(t) for t in expected])
+
+    def test_structure_only(self):
+        expected, data = self.check_round_trip("cetaceans.mb.no-clock.mcmc.trees", "nexus")
+        compact_trees = dendropy.TreeList.get(data=data,
+                schema="binary-trees",
+                structure_only=True,
+                taxon_namespace=expected.taxon_namespace)
+        self.assertIs(compact_trees.tree_type, dendropy.CompactTree)
+        self.assertEqual(len(compact_trees), len(expected))
+        for compact_tree, tree in zip(compact_trees, expected):
+            self.assertIsInstance(compact_tree, dendropy.CompactTree)
+            self.assertEqual(compact_tree.num_nodes(), len(tree.nodes()))
+            self.assertEqual(
+                    self.tree_string(compact_tree.to_tree()),
+                    tree.as_string("newick",
+                        suppress_annotations=True,
+                        suppress_internal_node_labels=True,
+                        suppress_rooting=False))
+        # compact trees are written directly from their arrays
+        observed = dendropy.TreeList.get(
+                data=compact_trees.as_string("binary-trees"),
+                schema="binary-trees",
+                taxon_namespace=expected.taxon_namespace)
+        self.assertEqual([self.tree_string(t) for t in observed],
+                [self.tree_string(t.to_tree()) for t in compact_trees])
+
+    def test_multiple_tree_lists(self):
+        path = pathmap.tree_source_path("multitreeblocks.nex")
+        dataset = dendropy.DataSet.get(path=path, schema="nexus")
+        data = dataset.as_string("binary-trees")
+        observed = dendropy.DataSet.get(data=data, schema="binary-trees")
+        self.assertEqual(len(observed.tree_lists), len(dataset.tree_lists))
+        for tree_list1, tree_list2 in zip(observed.tree_lists, dataset.tree_lists):
+            self.assertEqual(tree_list1.label, tree_list2.label)
+            self.assertEqual([self.tree_string(t) for t in tree_list1],
+                    [self.tree_string(t) for t in tree_list2])
+        for collection_offset, tree_list in enumerate(dataset.tree_lists):
+            observed = dendropy.TreeList.get(data=data,
+                    schema="binary-trees",
+                    collection_offset=collection_offset,
+                    tree_offset=1)
+            self.assertEqual([self.tree_string(t) for t in observed],
+                    [self.tree_string(t) for t in tree_list[1:]])
+
+    def test_path(self):
+        path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.newick")
+        expected = dendropy.TreeList.get(path=path, schema="newick")
+        sandbox = tempfile.mkdtemp()
+        try:
+            for filename in ("trees.bin", "trees.bin.gz"):
+                dest = os.path.join(sandbox, filename)
+                expected.write(path=dest, schema="binary-trees")
+                observed = dendropy.TreeList.get(path=dest, schema="binary-trees")
+                self.assertEqual([self.tree_string(t) for t in observed],
+                        [self.tree_string(t) for t in expected])
+                observed = list(dendropy.Tree.yield_from_files(
+                        files=[dest, dest],
+                        schema="binary-trees"))
+                self.assertEqual([self.tree_string(t) for t in observed],
+                        [self.tree_string(t) for t in expected] * 2)
+        finally:
+            shutil.rmtree(sandbox)
+
+class BinaryTreesYielderTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x100a.newick")
+        self.expected = dendropy.TreeList.get(path=path, schema="newick")
+        self.data = self.expected.as_string("binary-trees")
+
+    def test_tree_offset_and_stride(self):
+        expected = [t.as_string("newick") for t in self.expected]
+        for tree_offset, tree_stride in ((0, 1), (30, 1), (3, 4), (1000, 1)):
+            tree_sources = dendropy.Tree.yield_from_files(
+                    files=[io.BytesIO(self.data), io.BytesIO(self.data)],
+                    schema="binary-trees",
+                    tree_offset=tree_offset,
+                    tree_stride=tree_stride)
+            trees = []
+            tree_offsets = []
+            for tree in tree_sources:
+                trees.append(tree.as_string("newick"))
+                tree_offsets.append(tree_sources.current_tree_offset)
+            self.assertEqual(trees, expected[tree_offset::tree_stride] * 2)
+            self.assertEqual(tree_offsets,
+                    list(range(len(expected)))[tree_offset::tree_stride] * 2)
+
+    def test_tree_array(self):
+        path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x100a.newick")
+        tns = dendropy.TaxonNamespace()
+        expected = dendropy.TreeArray(taxon_namespace=tns)
+        expected.read_from_files(files=[path], schema="newick")
+        for structure_only in (False, True):
+            observed = dendropy.TreeArray(taxon_namespace=tns)
+            observed.read_from_files(files=[io.BytesIO(self.data)],
+                    schema="binary-trees",
+                    structure_only=structure_only)
+            self.assertEqual(len(observed), len(expected))
+            for idx in range(len(expected)):
+                self.assertEqual(
+                        sorted(zip(*observed.get_split_bitmask_and_edge_tuple(idx))),
+                        sorted(zip(*expected.get_split_bitmask_and_edge_tuple(idx))))
+            self.assertEqual(observed.split_distribution.split_counts,
+                    expected.split_distribution.split_counts)
+
+    def test_write_trees(self):
+        # taxa are added to the table as they are found
+        trees = dendropy.Tree.yield_from_files(
+                files=[io.StringIO(u"((a,b),c);\n((a,d),(b,e));\n(f,(c,a));\n")],
+                schema="newick")
+        dest = io.BytesIO()
+        writer = binarytreewriter.BinaryTreeWriter()
+        writer.write_trees(trees, dest, label="streamed")
+        observed = dendropy.TreeList.get(data=dest.getvalue(), schema="binary-trees")
+        self.assertEqual(observed.label, "streamed")
+        self.assertEqual([t.label for t in observed.taxon_namespace], list("abcdef"))
+        self.assertEqual([t.as_string("newick").strip() for t in observed],
+                ["((a,b),c);", "((a,d),(b,e));", "(f,(c,a));"])
+
+class BinaryTreesErrorsTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        tree_list = dendropy.TreeList.get(data="((a,b),(c,d));", schema="newick")
+        self.data = tree_list.as_string("binary-trees")
+
+    def test_invalid_header(self):
+        for data in (b"", b"DPYTREE", b"#NEXUS\nBEGIN TREES;"):
+            with self.assertRaises(dendropy.DataParseError):
+                dendropy.TreeList.get(data=data, schema="binary-trees")
+
+    def test_unsupported_version(self):
+        data = binarytreeprocessing.FILE_HEADER.pack(
+                binarytreeprocessing.FORMAT_MAGIC,
+                binarytreeprocessing.FORMAT_VERSION + 1) + self.data[binarytreeprocessing.FILE_HEADER.size:]
+        with self.assertRaises(dendropy.DataParseError):
+            dendropy.TreeList.get(data=data, schema="binary-trees")
+
+    def test_truncated(self):
+        for size in (len(self.data) - 1, len(self.data) - 20, binarytreeprocessing.FILE_HEADER.size + 2):
+            with self.assertRaises(dendropy.DataParseError):
+                dendropy.TreeList.get(data=self.data[:size], schema="binary-trees")
+
+    def test_unknown_records_skipped(self):
+        data = self.data + binarytreeprocessing.encode_record(99, b"future data")
+        tree_list = dendropy.TreeList.get(data=data, schema="binary-trees")
+        self.assertEqual(len(tree_list), 1)
+
+if __name__ == "__main__":
+    unittest.main()
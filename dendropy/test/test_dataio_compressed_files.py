@@ -0,0 +1,170 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading and writing compressed files.
+"""
+
+import os
+import io
+import bz2
+import gzip
+import zlib
+import struct
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility import filesys
+from dendropy.dataio import parallelyielder
+from dendropy.dataio import treeindex
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+def gzip_compress(data):
+    dest = io.BytesIO()
+    f = gzip.GzipFile(fileobj=dest, mode="wb")
+    f.write(data)
+    f.close()
+    return dest.getvalue()
+
+def bgzf_compress(data, block_size=1000):
+    blocks = []
+    for start in range(0, len(data), block_size):
+        block_data = data[start:start+block_size]
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        compressed = compressor.compress(block_data) + compressor.flush()
+        blocks.append(b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff"
+                + struct.pack("<H2sHH", 6, b"BC", 2, len(compressed) + 25)
+                + compressed
+                + struct.pack("<II", zlib.crc32(block_data) & 0xffffffff, len(block_data)))
+    # end-of-file marker
+    blocks.append(b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00")
+    return b"".join(blocks)
+
+COMPRESSORS = {
+    "gz": gzip_compress,
+    "bgz": bgzf_compress,
+    "bz2": bz2.compress,
+    }
+if filesys.lzma is not None:
+    COMPRESSORS["xz"] = filesys.lzma.compress
+
+class CompressedFilesTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.tree_path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x100a.newick")
+        self.expected_trees = dendropy.TreeList.get(path=self.tree_path, schema="newick")
+        self.sandbox = tempfile.mkdtemp()
+        self.original_chunk_size = parallelyielder.ParallelTreeDataYielder.chunk_size
+
+    def tearDown(self):
+        parallelyielder.ParallelTreeDataYielder.chunk_size = self.original_chunk_size
+        shutil.rmtree(self.sandbox)
+
+    def compressed_copies(self, path):
+        with open(path, "rb") as src:
+            data = src.read()
+        copies = {}
+        for ext, compress in COMPRESSORS.items():
+            dest_path = os.path.join(self.sandbox, os.path.basename(path) + "." + ext)
+            with open(dest_path, "wb") as dest:
+                dest.write(compress(data))
+            copies[ext] = dest_path
+        return copies
+
+    def tree_strings(self, trees):
+        return [t.as_string("newick") for t in trees]
+
+    def test_detect_compression(self):
+        copies = self.compressed_copies(self.tree_path)
+        expected = {"gz": "gzip", "bgz": "gzip", "bz2": "bz2", "xz": "xz"}
+        for ext, path in copies.items():
+            self.assertEqual(filesys.detect_compression(path), expected[ext])
+        self.assertIs(filesys.detect_compression(self.tree_path), None)
+
+    def test_read_trees(self):
+        expected = self.tree_strings(self.expected_trees)
+        for ext, path in self.compressed_copies(self.tree_path).items():
+            trees = dendropy.TreeList.get(path=path, schema="newick")
+            self.assertEqual(self.tree_strings(trees), expected)
+            trees = dendropy.TreeList.get(path=path, schema="newick", use_mmap=True)
+            self.assertEqual(self.tree_strings(trees), expected)
+
+    def test_yield_trees(self):
+        expected = self.tree_strings(self.expected_trees) * 2
+        parallelyielder.ParallelTreeDataYielder.chunk_size = 5000
+        for ext, path in self.compressed_copies(self.tree_path).items():
+            for num_processes in (None, 2):
+                tree_sources = dendropy.Tree.yield_from_files(
+                        files=[path, self.tree_path],
+                        schema="newick",
+                        num_processes=num_processes)
+                self.assertEqual(self.tree_strings(tree_sources), expected)
+
+    def test_read_chars(self):
+        path = pathmap.char_source_path("pythonidae.chars.fasta")
+        expected = dendropy.DnaCharacterMatrix.get(path=path, schema="fasta")
+        for ext, compressed_path in self.compressed_copies(path).items():
+            char_matrix = dendropy.DnaCharacterMatrix.get(path=compressed_path, schema="fasta")
+            self.assertEqual(char_matrix.as_string("fasta"), expected.as_string("fasta"))
+
+    def test_write(self):
+        expected = self.expected_trees.as_string("nexus")
+        for ext, compression in (("gz", "gzip"), ("bz2", "bz2"), ("xz", "xz")):
+            if ext not in COMPRESSORS:
+                continue
+            path = os.path.join(self.sandbox, "trees.nex." + ext)
+            self.expected_trees.write(path=path, schema="nexus")
+            self.assertEqual(filesys.detect_compression(path), compression)
+            with filesys.open_text_file(path) as src:
+                self.assertEqual(src.read(), expected)
+            trees = dendropy.TreeList.get(path=path, schema="nexus")
+            self.assertEqual(self.tree_strings(trees), self.tree_strings(self.expected_trees))
+
+    def test_bgzf_block_reader(self):
+        with open(self.tree_path, "rb") as src:
+            data = src.read()
+        path = os.path.join(self.sandbox, "trees.bgz")
+        with open(path, "wb") as dest:
+            dest.write(bgzf_compress(data, block_size=100))
+        for num_threads, blocks_per_batch in ((1, 1), (1, 7), (4, None)):
+            reader = filesys.BgzfBlockReader(path,
+                    num_threads=num_threads,
+                    blocks_per_batch=blocks_per_batch)
+            with io.BufferedReader(reader) as src:
+                self.assertEqual(src.read(), data)
+
+    def test_corrupt_bgzf_block(self):
+        path = os.path.join(self.sandbox, "trees.bgz")
+        compressed = bytearray(bgzf_compress(b"((a,b),(c,d));\n" * 10))
+        # corrupt the CRC of the first block
+        compressed[struct.unpack("<H", bytes(compressed[16:18]))[0] - 7] ^= 0xff
+        with open(path, "wb") as dest:
+            dest.write(bytes(compressed))
+        with self.assertRaises(IOError):
+            with filesys.open_text_file(path) as src:
+                src.read()
+
+    def test_tree_index_not_supported(self):
+        path = self.compressed_copies(self.tree_path)["gz"]
+        with self.assertRaises(TypeError):
+            treeindex.TreeSourceIndex.build(path, "newick")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,11 +22,31 @@ Tests for D3 writing.
 
 import collections
 import unittest
+import json
 import re
 import dendropy
+from dendropy.dataio import d3writer
 from dendropy.utility.textprocessing import StringIO
 from dendropy.test.support import pathmap
 
+def _d3_node_to_newick(d3_node):
+    # as written by the NEWICK writer with the default settings
+    parts = []
+    if "children" in d3_node:
+        parts.append("(" + ",".join(_d3_node_to_newick(ch) for ch in d3_node["children"]) + ")")
+    if "name" in d3_node:
+        parts.append(d3_node["name"].replace(" ", "_"))
+    if "length" in d3_node:
+        parts.append(":{}".format(d3_node["length"]))
+    return "".join(parts)
+
+def _d3_tree_to_newick(d3_tree):
+    if "rooted" in d3_tree:
+        rooting = "[&R] " if d3_tree["rooted"] else "[&U] "
+    else:
+        rooting = ""
+    return rooting + _d3_node_to_newick(d3_tree["root"]) + ";"
+
 class D3WriterSingleTreeTest(unittest.TestCase):
 
     def test_basic(self):
@@ -36,6 +56,91 @@ class D3WriterSingleTreeTest(unittest.TestCase):
         d3_tree_str = tree.write(
                 file=s,
                 schema="d3")
+        d3_trees = [json.loads(line) for line in s.getvalue().split("\n") if line]
+        self.assertEqual([_d3_tree_to_newick(t) for t in d3_trees],
+                [t.as_string("newick").strip() for t in tree])
+
+    def test_metadata(self):
+        tree = dendropy.Tree.get(
+                data="[&R] [&W 0.5] [&gene=abc] ((a:1,b:2)x:3[&support=0.9],(c[a comment],d_1)y);",
+                schema="newick",
+                store_tree_weights=True)
+        tree.label = "tree 1"
+        d3_tree = json.loads(tree.as_string("d3",
+                suppress_annotations=False,
+                suppress_item_comments=False,
+                suppress_leaf_node_labels=False,
+                store_tree_weights=True,
+                real_value_format_specifier=".2f"))
+        self.assertEqual(d3_tree["label"], "tree 1")
+        self.assertIs(d3_tree["rooted"], True)
+        self.assertEqual(d3_tree["weight"], 0.5)
+        self.assertEqual(d3_tree["annotations"], {"gene": "abc"})
+        x, y = d3_tree["root"]["children"]
+        self.assertEqual(x["name"], "x")
+        self.assertEqual(x["length"], 3.0)
+        self.assertEqual(x["annotations"], {"support": "0.9"})
+        self.assertEqual(y["name"], "y")
+        self.assertEqual(y["children"][0], {"name": "c", "comments": ["a comment"]})
+        self.assertEqual(y["children"][1], {"name": "d 1"})
+        d3_tree = json.loads(tree.as_string("d3",
+                suppress_leaf_taxon_labels=True,
+                suppress_internal_node_labels=True,
+                edge_label_compose_fn=lambda edge: "L{}".format(edge.length)))
+        self.assertNotIn("label", d3_tree["root"])
+        self.assertEqual(d3_tree["root"]["children"][0],
+                {"length": "L3.0", "children": [{"length": "L1.0"}, {"length": "L2.0"}]})
+
+    def test_non_finite_values(self):
+        tree = dendropy.Tree.get(data="((a:1,b:2):3,c:4);", schema="newick")
+        a, b, c = [nd.edge for nd in tree.leaf_node_iter()]
+        a.length = float("inf")
+        b.length = float("nan")
+        c.length = float("-inf")
+        tree.weight = float("nan")
+        tree.annotations.add_new("rate", float("nan"))
+        a.head_node.annotations.add_new("height_95%_HPD", [0.5, float("inf")])
+        c.head_node.annotations.add_new("height", 1.5)
+        # strict JSON, without "Infinity" or "NaN"
+        def _reject_constant(name):
+            raise ValueError(name)
+        for kwargs in ({}, {"real_value_format_specifier": ".2f"}):
+            d3_tree_str = tree.as_string("d3",
+                    store_tree_weights=True,
+                    suppress_annotations=False,
+                    **kwargs)
+            d3_tree = json.loads(d3_tree_str, parse_constant=_reject_constant)
+            self.assertIs(d3_tree["weight"], None)
+            self.assertEqual(d3_tree["annotations"], {"rate": None})
+            ab, c_node = d3_tree["root"]["children"]
+            self.assertEqual(ab["length"], 3.0)
+            self.assertEqual([nd["length"] for nd in ab["children"]], [None, None])
+            self.assertEqual(ab["children"][0]["annotations"], {"height_95%_HPD": [0.5, None]})
+            self.assertIs(c_node["length"], None)
+            self.assertEqual(c_node["annotations"], {"height": 1.5})
+
+    def test_real_value_format_specifier(self):
+        tree = dendropy.Tree.get(data="((a:0.25,b:1234.5):3,c:4);", schema="newick")
+        for specifier in ("", ".2f", ".4E", "8.4f", ".3g"):
+            d3_tree = json.loads(tree.as_string("d3", real_value_format_specifier=specifier))
+            ab, c_node = d3_tree["root"]["children"]
+            self.assertAlmostEqual(ab["children"][0]["length"], 0.25)
+            self.assertEqual(c_node["length"], 4)
+        # specifiers that do not give JSON numbers
+        for specifier in (".3%", ",.2f", "+.2f", "08.3f", "#.0f", "s"):
+            with self.assertRaises(ValueError):
+                tree.as_string("d3", real_value_format_specifier=specifier)
+
+    def test_deep_tree(self):
+        tree = dendropy.Tree()
+        node = tree.seed_node
+        for idx in range(5000):
+            node.new_child(label="x{}".format(idx))
+            node = node.new_child(edge_length=1)
+        # deeper than the JSON decoder can handle
+        d3_tree_str = tree.as_string("d3")
+        self.assertEqual(d3_tree_str.count('"children":['), 5000)
+        self.assertTrue(d3_tree_str.endswith('{"length":1}' + "]}" * 5000 + "}\n"))
 
 class D3WriterTreeListTest(unittest.TestCase):
 
@@ -46,6 +151,19 @@ class D3WriterTreeListTest(unittest.TestCase):
         d3_trees_str = trees.write(
                 file=s,
                 schema="d3")
+        d3_trees = [json.loads(line) for line in s.getvalue().split("\n") if line]
+        self.assertEqual([_d3_tree_to_newick(t) for t in d3_trees],
+                [t.as_string("newick").strip() for t in trees])
+
+    def test_write_trees(self):
+        trees = dendropy.Tree.yield_from_files(
+                files=[pathmap.tree_source_path("pythonidae.reference-trees.newick")],
+                schema="newick")
+        s = StringIO()
+        d3writer.D3Writer().write_trees(trees, s)
+        expected = dendropy.TreeList.get_from_path(
+                pathmap.tree_source_path("pythonidae.reference-trees.newick"), "newick")
+        self.assertEqual(s.getvalue(), expected.as_string("d3"))
 
 
 if __name__ == "__main__":
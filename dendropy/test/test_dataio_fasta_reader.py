@@ -47,6 +47,19 @@ class FastaDnaReaderTestCase(
                 check_column_annotations=False,
                 check_cell_annotations=False)
 
+    def test_mapped_fasta(self):
+        src_path = pathmap.char_source_path("standard-test-chars-dna.fasta")
+        self.verify_get_from(
+                matrix_type=dendropy.DnaCharacterMatrix,
+                src_filepath=src_path,
+                schema="fasta",
+                factory_kwargs={"use_mmap": True},
+                check_taxon_annotations=False,
+                check_matrix_annotations=False,
+                check_sequence_annotations=False,
+                check_column_annotations=False,
+                check_cell_annotations=False)
+
 class FastaRnaReaderTestCase(
         standard_file_test_chars.RnaTestChecker,
         dendropytest.ExtendedTestCase):
@@ -89,5 +102,66 @@ class FastaProteinReaderTestCase(
                 check_column_annotations=False,
                 check_cell_annotations=False)
 
+class FastaPackedReaderTestCase(dendropytest.ExtendedTestCase):
+
+    def check_against_full_matrix(self, matrix_type, src_filename, **kwargs):
+        src_path = pathmap.char_source_path(src_filename)
+        full_matrix = matrix_type.get(path=src_path, schema="fasta", **kwargs)
+        packed_matrix = matrix_type.get(path=src_path,
+                schema="fasta",
+                taxon_namespace=full_matrix.taxon_namespace,
+                packed=True,
+                **kwargs)
+        self.assertIsInstance(packed_matrix, dendropy.PackedCharacterMatrix)
+        self.assertEqual(packed_matrix.data_type, full_matrix.data_type)
+        self.assertEqual(list(packed_matrix), list(full_matrix))
+        for taxon in full_matrix:
+            self.assertIsInstance(packed_matrix[taxon], bytearray)
+            self.assertEqual(packed_matrix.sequence_states(taxon), full_matrix[taxon].values())
+            self.assertEqual(packed_matrix.symbols_as_string(taxon), full_matrix[taxon].symbols_as_string())
+        char_matrix = packed_matrix.to_char_matrix()
+        self.assertIs(type(char_matrix), matrix_type)
+        self.assertIs(char_matrix.taxon_namespace, full_matrix.taxon_namespace)
+        self.assertEqual(list(char_matrix), list(full_matrix))
+        for taxon in full_matrix:
+            self.assertEqual(char_matrix[taxon].values(), full_matrix[taxon].values())
+
+    def test_dna(self):
+        self.check_against_full_matrix(dendropy.DnaCharacterMatrix, "standard-test-chars-dna.fasta")
+
+    def test_mapped_dna(self):
+        self.check_against_full_matrix(dendropy.DnaCharacterMatrix, "standard-test-chars-dna.fasta", use_mmap=True)
+
+    def test_rna(self):
+        self.check_against_full_matrix(dendropy.RnaCharacterMatrix, "standard-test-chars-rna.fasta")
+
+    def test_protein(self):
+        self.check_against_full_matrix(dendropy.ProteinCharacterMatrix, "standard-test-chars-protein.fasta")
+
+    def test_standard(self):
+        s = ">t1\n01 2?\n1\n\n>t2\n-1\t100\r\n"
+        char_matrix = dendropy.StandardCharacterMatrix.get(data=s, schema="fasta", packed=True)
+        self.assertEqual([char_matrix.symbols_as_string(t) for t in char_matrix], ["012?1", "-1100"])
+        self.assertEqual(char_matrix.to_char_matrix()[1].symbols_as_string(), "-1100")
+
+    def test_errors(self):
+        data_strs = [
+            ">t1\nACGT\nACZT\n>t2\nACGT\n",
+            ">t1\nACGT\n>t2\n\xe9CGT\n",
+            ">t1\nACGT\n>t1\nACGT\n",
+            "ACGT\n>t1\nACGT\n",
+        ]
+        for data_str in data_strs:
+            with self.assertRaises(dendropy.DataParseError) as expected:
+                dendropy.DnaCharacterMatrix.get(data=data_str, schema="fasta")
+            with self.assertRaises(dendropy.DataParseError) as observed:
+                dendropy.DnaCharacterMatrix.get(data=data_str, schema="fasta", packed=True)
+            self.assertEqual(observed.exception.line_num, expected.exception.line_num)
+            self.assertEqual(observed.exception.col_num, expected.exception.col_num)
+
+    def test_unsupported_data_type(self):
+        with self.assertRaises(ValueError):
+            dendropy.ContinuousCharacterMatrix.get(data=">t1\n1 2\n", schema="fasta", packed=True)
+
 if __name__ == "__main__":
     unittest.main()
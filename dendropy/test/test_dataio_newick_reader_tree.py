@@ -29,6 +29,10 @@ import random
 import dendropy
 from dendropy.utility import error
 from dendropy.dataio import newickreader
+from dendropy.dataio import nexusprocessing
+from dendropy.dataio import parsecache
+from dendropy.dataio import tokenizer
+from dendropy.utility.textprocessing import StringIO
 from dendropy.test.support import dendropytest
 from dendropy.test.support import compare_and_validate
 from dendropy.test.support import standard_file_test_trees
@@ -599,6 +603,160 @@ class CommentMetaDataTests(dendropytest.ExtendedTestCase):
         for idx, nd in enumerate(tree.postorder_node_iter()):
             self.assertEqual(nd.annotations.values_as_dict(), expected[idx])
 
+class NewickTreeStatementParserEngineTest(dendropytest.ExtendedTestCase):
+
+    def parse_trees(self, tree_string, **kwargs):
+        tree_list = dendropy.TreeList.get(
+                data=tree_string,
+                schema="newick",
+                **kwargs)
+        return self.summarize_trees(tree_list)
+
+    def summarize_trees(self, tree_list):
+        results = []
+        for tree in tree_list:
+            nodes = []
+            for nd in tree.preorder_node_iter():
+                nodes.append((
+                    nd.label,
+                    nd.taxon.label if nd.taxon is not None else None,
+                    nd.edge.length,
+                    len(nd._child_nodes),
+                    sorted((a.name, a.value) for a in nd.annotations),
+                    nd.comments,
+                    ))
+            results.append((tree.is_rooted, tree.comments, nodes))
+        return results
+
+    def test_equivalence_with_standard_parser(self):
+        tree_strings = [
+            "(a,b);",
+            "(a,b):0.5;",
+            "T0:10;",
+            ";;(a,b);;(c,d)e:1;;",
+            "[&R] ((a:1,b:2)[&x=1]:3,'c d':4)[&y=2];",
+            "(,);",
+            "(a,);",
+            "(a,,b);",
+            "(a,,);",
+            "((a,b),(,c),);",
+            "(a[x]b,c_d,'e_f','g''h');",
+            "[x1](a[x2],[x3]([x4]b,[x5]([x6]c,[x7]d,[x8]e,[x9]f)g[x10])h[x11])i[x12];",
+            "([a1][a2]a[a3]:[a4]1[a5],[h1][h2][h3]([b1]b[b2]:[b3][b4]2[b5],[g1][g2]([c1]c[c2]:[c3]3[c4][c5],[f1]([d1]d[d2][d3]:[d4]4[d5],[e1]e[e2]:5[e3][e4][e5])[f2]f[f3]:[f4]6[f5])[g3][g4]g:7[g5])[h4]h[h5]:8)[i1][i2]i[i3]:[i4]9[i5];",
+        ]
+        for tree_string in tree_strings:
+            for kwargs in (
+                    {},
+                    {"suppress_internal_node_taxa": False, "suppress_leaf_node_taxa": True},
+                    {"preserve_underscores": True},
+                    ):
+                expected = self.parse_trees(tree_string, **kwargs)
+                observed = self.parse_trees(tree_string, parser_engine="statement", **kwargs)
+                self.assertEqual(observed, expected)
+
+    def test_equivalence_with_standard_parser_on_data_file(self):
+        tree_filepath = pathmap.tree_source_path("dendropy-test-trees-multifurcating-rooted-annotated.newick")
+        with open(tree_filepath, "r") as src:
+            tree_string = src.read()
+        expected = self.parse_trees(tree_string)
+        for block_size in (1, 7, 65536):
+            reader = newickreader.NewickReader(parser_engine="statement")
+            reader.statement_block_size = block_size
+            tree_list = dendropy.TreeList()
+            taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(
+                    taxon_namespace=tree_list.taxon_namespace,
+                    enable_lookup_by_taxon_number=False)
+            for tree in reader.tree_iter(
+                    stream=StringIO(tree_string),
+                    taxon_symbol_mapper=taxon_symbol_mapper,
+                    tree_factory=tree_list.new_tree):
+                pass
+            self.assertEqual(self.summarize_trees(tree_list), expected)
+
+    def test_invalid_trees(self):
+        invalid_tree_statements = (
+            "(a,(b,c))a",
+            "(a,(b,c)) (b,(a,c))",
+            "(a,(b,c)),",
+            "(a,(b,c)))",
+            "(a,(b,c)):",
+            "(a,(b,c))(",
+            "(e,(c,(d,e)a)b;(b,(a,e)c)d;",
+            "(a:x,b);",
+            "((a,b)c,(b,c)a)d;",
+            "(a,'b);",
+            )
+        for s in invalid_tree_statements:
+            with self.assertRaises(error.DataParseError):
+                t = dendropy.Tree.get(data=s, schema="newick", parser_engine="statement")
+
+    def read_trees_with_statement_parser(self, tree_string, block_size, **kwargs):
+        reader = newickreader.NewickReader(parser_engine="statement", **kwargs)
+        reader.statement_block_size = block_size
+        tree_list = dendropy.TreeList()
+        taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(
+                taxon_namespace=tree_list.taxon_namespace)
+        for tree in reader.tree_iter(
+                stream=StringIO(tree_string),
+                taxon_symbol_mapper=taxon_symbol_mapper,
+                tree_factory=tree_list.new_tree):
+            pass
+        return tree_list
+
+    def test_error_line_and_column_numbers(self):
+        invalid_tree_strings = (
+            "(a,b);\n(a,b));",
+            "(a,b);\n\n  (a,(b,c);",
+            "(a,b)\n:x;",
+            "(a,b);\r\n(a,[c]b)c);",
+            "(a,b);\n(a,'b",
+            "(a,b);\n(a:x,b);",
+            "(a,b);\n(a,b)",
+            "(a,b); (a,b); (a,b));",
+            "(a,b); [c] (a,b);\n(a,b); (a,(b:x,c));",
+            )
+        for tree_string in invalid_tree_strings:
+            with self.assertRaises(error.DataParseError) as cm:
+                dendropy.TreeList.get(data=tree_string, schema="newick")
+            expected = (type(cm.exception), cm.exception.line_num, cm.exception.col_num)
+            for block_size in (1, 7, 65536):
+                with self.assertRaises(error.DataParseError) as cm:
+                    self.read_trees_with_statement_parser(tree_string, block_size)
+                observed = (type(cm.exception), cm.exception.line_num, cm.exception.col_num)
+                self.assertEqual(observed, expected)
+
+    def test_unterminated_comment(self):
+        for tree_string, line_num in (
+                ("[& unclosed (a,b);", 1),
+                ("(a,b);\n[& unclosed (a,b);", 2),
+                ("(a,b);\n(a,[x [y] b);", 2),
+                ):
+            for kwargs in (
+                    {},
+                    {"tree_offset": 1},
+                    {"parse_cache": parsecache.TreeParseCache()},
+                    ):
+                with self.assertRaises(tokenizer.Tokenizer.UnexpectedEndOfStreamError) as cm:
+                    dendropy.TreeList.get(data=tree_string, schema="newick",
+                            parser_engine="statement", **kwargs)
+                self.assertEqual(cm.exception.line_num, line_num)
+
+    def test_deeply_nested_tree(self):
+        num_tips = 5000
+        tree_string = ("(" * (num_tips - 1)
+                + "t0"
+                + "".join(",t{})".format(i) for i in range(1, num_tips))
+                + ";")
+        tree = dendropy.Tree.get(data=tree_string,
+                schema="newick",
+                parser_engine="statement")
+        self.assertEqual(len(tree.leaf_nodes()), num_tips)
+        self.assertEqual(len(tree.internal_nodes()), num_tips - 1)
+
+    def test_unrecognized_parser_engine(self):
+        with self.assertRaises(ValueError):
+            dendropy.Tree.get(data="(a,b);", schema="newick", parser_engine="foo")
+
 # class NewickTreeTaxonNamespaceTest(dendropytest.ExtendedTestCase):
 
 #     def test_namespace_passing(self):
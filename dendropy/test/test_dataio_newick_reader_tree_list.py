@@ -23,6 +23,7 @@ Tests for general NEWICK tree list reading.
 import sys
 import unittest
 import dendropy
+from dendropy.dataio import parsecache
 from dendropy.test.support import dendropytest
 from dendropy.test.support import standard_file_test_trees
 from dendropy.test.support import curated_test_tree
@@ -177,6 +178,208 @@ class NewickTreeListReaderMultipleRedundantSemiColons(
                 suppress_leaf_node_taxa=False,
                 suppress_edge_lengths=False)
 
+class NewickTreeListReaderBufferedTokenizerTestCase(
+        standard_file_test_trees.NewickTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NewickTestTreesChecker.create_class_fixtures(cls)
+
+    def test_get(self):
+        for tree_file_title in [
+            "dendropy-test-trees-multifurcating-rooted",
+            "dendropy-test-trees-n14-unrooted-treeshapes",
+            "dendropy-test-trees-n33-unrooted-x10a",
+                ]:
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            tree_list = dendropy.TreeList.get(
+                    path=tree_filepath,
+                    schema=self.__class__.schema,
+                    tokenizer_engine="buffered")
+            self.verify_standard_trees(tree_list=tree_list,
+                    tree_file_title=tree_file_title)
+
+    def test_unrecognized_tokenizer_engine(self):
+        tree_filepath = self.schema_tree_filepaths["dendropy-test-trees-n12-x2"]
+        with self.assertRaises(ValueError):
+            dendropy.TreeList.get(
+                    path=tree_filepath,
+                    schema=self.__class__.schema,
+                    tokenizer_engine="foo")
+
+class NewickTreeListReaderStatementParserTestCase(
+        standard_file_test_trees.NewickTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NewickTestTreesChecker.create_class_fixtures(cls)
+
+    def test_get(self):
+        for tree_file_title in [
+            "dendropy-test-trees-multifurcating-rooted",
+            "dendropy-test-trees-multifurcating-rooted-annotated",
+            "dendropy-test-trees-n14-unrooted-treeshapes",
+            "dendropy-test-trees-n33-unrooted-x10a",
+                ]:
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            tree_list = dendropy.TreeList.get(
+                    path=tree_filepath,
+                    schema=self.__class__.schema,
+                    parser_engine="statement")
+            self.verify_standard_trees(tree_list=tree_list,
+                    tree_file_title=tree_file_title)
+
+    def test_yield(self):
+        tree_file_title = "dendropy-test-trees-n33-unrooted-x10a"
+        tree_filepath = self.schema_tree_filepaths[tree_file_title]
+        tree_list = dendropy.TreeList()
+        for tree in dendropy.Tree.yield_from_files(
+                files=[tree_filepath],
+                schema=self.__class__.schema,
+                taxon_namespace=tree_list.taxon_namespace,
+                parser_engine="statement"):
+            tree_list.append(tree)
+        self.verify_standard_trees(tree_list=tree_list,
+                tree_file_title=tree_file_title)
+
+class NewickTreeListReaderParseCacheTestCase(
+        standard_file_test_trees.NewickTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NewickTestTreesChecker.create_class_fixtures(cls)
+
+    def test_get(self):
+        for tree_file_title in [
+            "dendropy-test-trees-multifurcating-rooted-annotated",
+            "dendropy-test-trees-n14-unrooted-treeshapes",
+            "dendropy-test-trees-n33-unrooted-x10a",
+                ]:
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            parse_cache = parsecache.TreeParseCache()
+            taxon_namespace = dendropy.TaxonNamespace()
+            for idx in range(2):
+                tree_list = dendropy.TreeList.get(
+                        path=tree_filepath,
+                        schema=self.__class__.schema,
+                        taxon_namespace=taxon_namespace,
+                        parse_cache=parse_cache)
+                self.verify_standard_trees(tree_list=tree_list,
+                        tree_file_title=tree_file_title)
+            self.assertEqual(parse_cache.hits, len(tree_list))
+            self.assertEqual(parse_cache.misses, len(tree_list))
+            self.assertEqual(parse_cache.hit_rate(), 0.5)
+
+    def test_repeated_statements(self):
+        data = "[&R][&W 0.5][tree note] ((a:1,b:2)x[&y=1]:3,c[note]);\n[&W 0.5][tree note] ((a:1,b:2)x[&y=1]:3,c[note]);\n\n  [&R][&W 0.5][tree note] ((a:1,b:2)x[&y=1]:3,c[note]);  "
+        parse_cache = parsecache.TreeParseCache()
+        trees = dendropy.TreeList.get(
+                data=data,
+                schema="newick",
+                store_tree_weights=True,
+                parse_cache=parse_cache)
+        expected = dendropy.TreeList.get(
+                data=data,
+                schema="newick",
+                store_tree_weights=True)
+        self.assertEqual(parse_cache.hits, 1)
+        self.assertEqual(parse_cache.misses, 2)
+        self.assertEqual(len(parse_cache), 2)
+        self.assertEqual(parse_cache.num_nodes, 10)
+        self.assertEqual(len(trees), 3)
+        for tree, expected_tree in zip(trees, expected):
+            self.assertEqual(tree.as_string("newick"), expected_tree.as_string("newick"))
+            self.assertEqual(tree.is_rooted, expected_tree.is_rooted)
+            self.assertEqual(bool(tree.is_rooted), tree is not trees[1])
+            self.assertEqual(tree.weight, 0.5)
+            self.assertEqual(tree.comments, ["tree note"])
+            node_x = tree.find_node_with_label("x")
+            self.assertEqual(node_x.edge.length, 3)
+            self.assertEqual([(a.name, a.value) for a in node_x.annotations], [("y", "1")])
+            self.assertEqual(tree.find_node_with_taxon_label("c").comments, ["note"])
+        self.assertIs(trees[2].find_node_with_taxon_label("a").taxon, trees[0].find_node_with_taxon_label("a").taxon)
+        # the trees built from the cache do not share any objects
+        trees[0].find_node_with_label("x").annotations.add_new("z", 2)
+        trees[0].find_node_with_taxon_label("c").comments.append("other")
+        trees[0].comments.append("other")
+        tree = dendropy.Tree.get(
+                data=data.split("\n")[0],
+                schema="newick",
+                taxon_namespace=trees.taxon_namespace,
+                store_tree_weights=True,
+                parse_cache=parse_cache)
+        self.assertEqual(parse_cache.hits, 2)
+        self.assertEqual(tree.as_string("newick"), expected[0].as_string("newick"))
+        self.assertEqual(len(tree.find_node_with_label("x").annotations), 1)
+        self.assertEqual(tree.find_node_with_taxon_label("c").comments, ["note"])
+        self.assertEqual(tree.comments, ["tree note"])
+
+    def test_different_taxon_namespace_or_settings(self):
+        data = "((a,b),(c,d));"
+        parse_cache = parsecache.TreeParseCache()
+        t1 = dendropy.Tree.get(data=data, schema="newick", parse_cache=parse_cache)
+        t2 = dendropy.Tree.get(data=data, schema="newick", parse_cache=parse_cache)
+        self.assertIsNot(t2.taxon_namespace, t1.taxon_namespace)
+        self.assertEqual([t.label for t in t2.taxon_namespace], ["a", "b", "c", "d"])
+        t3 = dendropy.Tree.get(data=data, schema="newick",
+                taxon_namespace=t2.taxon_namespace,
+                rooting="force-rooted",
+                parse_cache=parse_cache)
+        self.assertTrue(t3.is_rooted)
+        self.assertEqual(parse_cache.hits, 0)
+        self.assertEqual(parse_cache.misses, 3)
+        self.assertEqual(len(parse_cache), 2)
+
+    def test_structure_only(self):
+        data = "((a:1,b:2):3,(c:4,d:5):6);\n((a:1,b:2):3,(c:4,d:5):6);\n"
+        parse_cache = parsecache.TreeParseCache()
+        trees = dendropy.TreeList.get(data=data, schema="newick",
+                structure_only=True,
+                parse_cache=parse_cache)
+        self.assertEqual(parse_cache.hits, 1)
+        self.assertIsInstance(trees[1], dendropy.CompactTree)
+        trees[0].edge_lengths[1] = 10.0
+        self.assertEqual(trees[1].edge_lengths[1], 3.0)
+        self.assertEqual(trees[1].to_tree().as_string("newick"), "((a:1.0,b:2.0):3.0,(c:4.0,d:5.0):6.0);\n")
+        self.assertEqual(list(trees[1].parent_indexes), list(trees[0].parent_indexes))
+        self.assertEqual(trees[1].node_taxa, trees[0].node_taxa)
+
+    def test_eviction(self):
+        statements = ["((a,b),(c,d));", "((a,c),(b,d));", "((a,d),(b,c));", "(a,b,c,d);"]
+        parse_cache = parsecache.TreeParseCache(max_size=2)
+        dendropy.TreeList.get(data="\n".join(statements * 2), schema="newick",
+                parse_cache=parse_cache)
+        self.assertEqual(parse_cache.hits, 0)
+        self.assertEqual(parse_cache.evictions, 6)
+        self.assertEqual(len(parse_cache), 2)
+        parse_cache = parsecache.TreeParseCache(max_nodes=12)
+        trees = dendropy.TreeList.get(data="\n".join(statements + statements[::-1]), schema="newick",
+                parse_cache=parse_cache)
+        # trees of 7, 7, 7 and 5 nodes: only the last two fit together
+        self.assertEqual(parse_cache.hits, 2)
+        self.assertEqual(parse_cache.evictions, 5)
+        self.assertEqual(parse_cache.num_nodes, 7)
+        self.assertEqual([t.as_string("newick") for t in trees],
+                [s + "\n" for s in statements + statements[::-1]])
+        parse_cache.clear()
+        self.assertEqual(len(parse_cache), 0)
+        self.assertEqual(parse_cache.num_nodes, 0)
+        parse_cache.reset_counters()
+        self.assertIs(parse_cache.hit_rate(), None)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            parsecache.TreeParseCache(max_size=0)
+        with self.assertRaises(ValueError):
+            parsecache.TreeParseCache(max_nodes=0)
+        with self.assertRaises(ValueError):
+            dendropy.Tree.get(data="(a,b);", schema="newick",
+                    finish_node_fn=lambda node: None,
+                    parse_cache=parsecache.TreeParseCache())
+
 class NewickTreeListReaderTaxonNamespaceTest(dendropytest.ExtendedTestCase):
 
     def test_shared_taxon_namespace(self):
@@ -24,6 +24,7 @@ import collections
 import unittest
 import dendropy
 import re
+from dendropy.utility.textprocessing import StringIO
 from dendropy.test.support import pathmap
 from dendropy.test.support import standard_file_test_trees
 from dendropy.test.support import compare_and_validate
@@ -440,5 +441,75 @@ class NewickTreeWriterGeneralOptionsTests(
         for nd in tree2:
             self.assertEqual(nd.edge.length, 1000)
 
+class NewickTreeWriterStreamingEngineTests(dendropytest.ExtendedTestCase):
+
+    def check_same_output(self, tree_list, **kwargs):
+        expected = tree_list.as_string("newick", **kwargs)
+        observed = tree_list.as_string("newick", writer_engine="streaming", **kwargs)
+        self.assertEqual(observed, expected)
+
+    def test_node_labeling(self):
+        for has_leaf_node_labels in (True, False):
+            for has_internal_node_taxa in (True, False):
+                tree = newick_tree_writer_test_tree(
+                        has_leaf_node_labels=has_leaf_node_labels,
+                        has_internal_node_taxa=has_internal_node_taxa,
+                        label_pool=["a b", "c_d", "e'f", "g(h)", "i"] + [chr(i) for i in range(ord('j'), ord('z')+1)])
+                tree_list = dendropy.TreeList([tree], taxon_namespace=tree.taxon_namespace)
+                for suppress_leaf_taxon_labels in (True, False):
+                    for suppress_leaf_node_labels in (True, False):
+                        for suppress_internal_taxon_labels in (True, False):
+                            for unquoted_underscores in (True, False):
+                                for preserve_spaces in (True, False):
+                                    self.check_same_output(tree_list,
+                                            suppress_leaf_taxon_labels=suppress_leaf_taxon_labels,
+                                            suppress_leaf_node_labels=suppress_leaf_node_labels,
+                                            suppress_internal_taxon_labels=suppress_internal_taxon_labels,
+                                            unquoted_underscores=unquoted_underscores,
+                                            preserve_spaces=preserve_spaces,
+                                            node_label_element_separator="$$$")
+
+    def test_annotations_and_comments(self):
+        tree_list = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-annotated-x10a.newick"),
+                schema="newick",
+                extract_comment_metadata=True)
+        for kwargs in (
+                {},
+                {"suppress_annotations": False},
+                {"suppress_annotations": False, "annotations_as_nhx": True},
+                {"suppress_item_comments": False, "suppress_rooting": True},
+                {"suppress_edge_lengths": True, "store_tree_weights": True},
+                {"real_value_format_specifier": ".4f"},
+                {"edge_label_compose_fn": lambda e: "{:.2E}".format(e.length)},
+                {"node_label_compose_fn": lambda nd: nd.taxon.label if nd.taxon else "in ternal"},
+                ):
+            self.check_same_output(tree_list, **kwargs)
+
+    def test_write_trees_from_iterator(self):
+        path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x100a.newick")
+        expected = dendropy.TreeList.get(path=path, schema="newick").as_string("newick")
+        for writer_engine in ("standard", "streaming"):
+            writer = dendropy.dataio.get_writer("newick", writer_engine=writer_engine)
+            dest = StringIO()
+            writer.write_trees(dendropy.Tree.yield_from_files(files=[path], schema="newick"), dest)
+            self.assertEqual(dest.getvalue(), expected)
+
+    def test_deeply_nested_tree(self):
+        tree = dendropy.Tree()
+        node = tree.seed_node
+        for idx in range(5000):
+            node.new_child(label="x{}".format(idx))
+            node = node.new_child()
+        s = tree.as_string("newick",
+                writer_engine="streaming",
+                suppress_leaf_node_labels=False)
+        self.assertTrue(s.startswith("(x0,(x1,(x2,"))
+        self.assertEqual(s.count("("), 5000)
+
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            dendropy.dataio.get_writer("newick", writer_engine="fast")
+
 if __name__ == "__main__":
     unittest.main()
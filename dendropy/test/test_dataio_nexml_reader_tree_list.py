@@ -23,6 +23,8 @@ Tests for general NEXML tree list reading.
 import sys
 import unittest
 import dendropy
+from dendropy.dataio import nexmlreader
+from dendropy.utility.textprocessing import StringIO
 from dendropy.test.support import dendropytest
 from dendropy.test.support import standard_file_test_trees
 from dendropy.test import base_standard_trees_parsing_test_cases
@@ -66,5 +68,48 @@ class NexmlStandardTreeParsingTestCase(
                     tree_file_title=tree_file_title,
                     tree_offset=0)
 
+class NexmlIncrementalParsingTestCase(dendropytest.ExtendedTestCase):
+
+    def test_processed_elements_freed(self):
+        tree_filepath = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.nexml")
+        reader = nexmlreader.NexmlReader()
+        reader._taxon_namespace_factory = dendropy.TaxonNamespace
+        processed_tree_elements = []
+        with open(tree_filepath, "r") as src:
+            for trees_idx, nxtrees, nxtree in reader._iter_tree_elements(src):
+                if nxtree is None:
+                    continue
+                # trees already processed have been removed from their block
+                tree_elements = [t._element for t in nxtrees.findall_tree()]
+                self.assertIn(nxtree._element, tree_elements)
+                for tree_element in processed_tree_elements:
+                    self.assertNotIn(tree_element, tree_elements)
+                processed_tree_elements.append(nxtree._element)
+        self.assertEqual(len(processed_tree_elements), 10)
+
+    def test_trees_and_chars(self):
+        ds1 = dendropy.DataSet.get(
+                path=pathmap.char_source_path("standard-test-chars-dna.as_cells.nexml"),
+                schema="nexml")
+        tns = ds1.taxon_namespaces[0]
+        ds1.new_tree_list(taxon_namespace=tns).read(
+                data="((a,b),(c,e));((a,c),(b,e));",
+                schema="newick")
+        ds1.new_tree_list(taxon_namespace=tns).read(
+                data="((a,e),(c,b));",
+                schema="newick")
+        data = ds1.as_string("nexml")
+        ds2 = dendropy.DataSet.get(data=data, schema="nexml")
+        self.assertEqual(len(ds2.taxon_namespaces), 1)
+        self.assertEqual(len(ds2.char_matrices), 1)
+        self.assertEqual(
+                [str(ds2.char_matrices[0][t]) for t in ds2.taxon_namespaces[0]],
+                [str(ds1.char_matrices[0][t]) for t in tns])
+        self.assertEqual([len(t) for t in ds2.tree_lists], [2, 1])
+        trees = dendropy.Tree.yield_from_files(files=[StringIO(data)], schema="nexml")
+        self.assertEqual(
+                [t.as_string("newick") for t in trees],
+                [t.as_string("newick") for tree_list in ds2.tree_lists for t in tree_list])
+
 if __name__ == "__main__":
     unittest.main()
@@ -96,5 +96,36 @@ class NexmlStandardTreeListWriterTestCase(
                 tree_file_title=tree_file_title,
                 tree_offset=0)
 
+class NexmlTreeWriterMetadataTestCase(dendropytest.ExtendedTestCase):
+
+    def test_namespaces_and_ids(self):
+        trees = dendropy.TreeList.get(data="((a,b),(c,d));((a,c),(b,d));", schema="newick")
+        node = trees[1].find_node_with_taxon_label("c")
+        node.annotations.add_new(name="color", value="red",
+                name_prefix="foo", namespace="http://example.org/foo/")
+        node.edge.annotations.add_new(name="rate", value=0.5,
+                name_prefix="bar", namespace="http://example.org/bar/")
+        hidden = node.parent_node.annotations.add_new(name="x", value=1,
+                name_prefix="hidden", namespace="http://example.org/hidden/")
+        hidden.is_hidden = True
+        s = trees.as_string("nexml")
+        # namespaces of nested and edge annotations are declared in the
+        # opening tag, which is written before the trees
+        header = s[:s.index("<otus")]
+        self.assertIn('xmlns:foo="http://example.org/foo/"', header)
+        self.assertIn('xmlns:bar="http://example.org/bar/"', header)
+        self.assertNotIn("hidden", s)
+        ids = re.findall(r' id="(d\d+)"', s)
+        self.assertEqual(len(ids), len(set(ids)))
+        trees2 = dendropy.TreeList.get(data=s, schema="nexml")
+        self.assertEqual(
+                [t.as_string("newick", suppress_edge_lengths=True, suppress_rooting=True) for t in trees2],
+                [t.as_string("newick") for t in trees])
+        node2 = trees2[1].find_node_with_taxon_label("c")
+        self.assertEqual([(a.prefixed_name, a.value) for a in node2.annotations],
+                [("foo:color", "red")])
+        self.assertEqual([(a.prefixed_name, a.value) for a in node2.edge.annotations],
+                [("bar:rate", "0.5")])
+
 if __name__ == "__main__":
     unittest.main()
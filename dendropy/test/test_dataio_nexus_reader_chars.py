@@ -28,6 +28,7 @@ from dendropy.test.support import pathmap
 from dendropy.test.support import standard_file_test_chars
 from dendropy.test.support import compare_and_validate
 from dendropy.dataio import nexusreader
+from dendropy.dataio import tokenizer
 from dendropy.utility import messaging
 _LOG = messaging.get_logger(__name__)
 
@@ -203,6 +204,111 @@ class NexusTooManyTaxaTest(
                 data_str,
                 'nexus')
 
+class NexusCharactersRowParsingTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        # small chunks so that matrices are split among the worker processes
+        self.matrix_chunk_size = nexusreader.NexusReader.matrix_chunk_size
+        nexusreader.NexusReader.matrix_chunk_size = 200
+
+    def tearDown(self):
+        nexusreader.NexusReader.matrix_chunk_size = self.matrix_chunk_size
+
+    def check_against_token_parsing(self, matrix_type, src, **kwargs):
+        expected = matrix_type.get(schema="nexus", **src)
+        for row_kwargs in ({"num_processes": 2}, {"packed": True}, {"packed": True, "num_processes": 2}):
+            row_kwargs.update(kwargs)
+            char_matrix = matrix_type.get(schema="nexus",
+                    taxon_namespace=expected.taxon_namespace,
+                    **dict(src, **row_kwargs))
+            if row_kwargs.get("packed", False):
+                self.assertIsInstance(char_matrix, dendropy.PackedCharacterMatrix)
+                char_matrix = char_matrix.to_char_matrix()
+            self.assertEqual(list(char_matrix), list(expected))
+            for taxon in expected:
+                self.assertEqual(char_matrix[taxon].symbols_as_string(), expected[taxon].symbols_as_string())
+                if char_matrix.default_state_alphabet is expected.default_state_alphabet:
+                    self.assertEqual(char_matrix[taxon].values(), expected[taxon].values())
+
+    def test_files(self):
+        for matrix_type, src_filename in (
+                (dendropy.DnaCharacterMatrix, "standard-test-chars-dna.basic.nexus"),
+                (dendropy.DnaCharacterMatrix, "standard-test-chars-dna.interleaved.nexus"),
+                (dendropy.DnaCharacterMatrix, "standard-test-chars-dna.matchchar.nexus"),
+                (dendropy.DnaCharacterMatrix, "standard-test-chars-dna.multi.nexus"),
+                (dendropy.DnaCharacterMatrix, "pythonidae.chars.interleaved.nexus"),
+                (dendropy.ProteinCharacterMatrix, "standard-test-chars-protein.multi.nexus"),
+                (dendropy.StandardCharacterMatrix, "standard-test-chars-generic.dotted.nexus"),
+                (dendropy.StandardCharacterMatrix, "apternodus.chars.interleaved.nexus"),
+                ):
+            for tokenizer_engine in ("standard", "buffered"):
+                self.check_against_token_parsing(matrix_type,
+                        {"path": pathmap.char_source_path(src_filename)},
+                        tokenizer_engine=tokenizer_engine)
+
+    def test_comments_and_labels(self):
+        data_str = """\
+        #NEXUS
+        BEGIN CHARACTERS;
+            DIMENSIONS NTAX=4 NCHAR=8;
+            FORMAT DATATYPE=DNA GAP=- MISSING=? MATCHCHAR=.;
+            MATRIX
+                AAA ACGT[a [nested]
+                comment]ACGT
+                'B[B]''s' AC{AG}{CT}..-?
+                C_C ..
+                    ..AC GT
+                'D D' .[x]...{CT}...
+            ;
+        END;
+        """
+        # multistates of the shared DNA alphabet, which is not modified
+        self.check_against_token_parsing(dendropy.DnaCharacterMatrix, {"data": data_str})
+        char_matrix = dendropy.DnaCharacterMatrix.get(data=data_str, schema="nexus", packed=True)
+        self.assertEqual([t.label for t in char_matrix], ["AAA", "B[B]'s", "C C", "D D"])
+        self.assertEqual([char_matrix.symbols_as_string(t) for t in char_matrix],
+                ["ACGTACGT", "ACRYAC-?", "ACGTACGT", "ACGTYCGT"])
+
+    def test_errors(self):
+        data_str_template = """\
+        #NEXUS
+        BEGIN CHARACTERS;
+            DIMENSIONS NTAX=3 NCHAR=4;
+            FORMAT DATATYPE=DNA GAP=- MISSING=? MATCHCHAR=.;
+            MATRIX
+                {}
+            ;
+        END;
+        """
+        for rows, error_type in (
+                ("AAA ACGT\n BBB ACZT", nexusreader.NexusReader.InvalidCharacterStateSymbolError),
+                ("AAA ACGT\n BBB ACGTA", nexusreader.NexusReader.TooManyCharactersError),
+                ("AAA ACGT\n BBB ACGT\n CCC ACGT\n DDD ACGT", nexusreader.NexusReader.TooManyTaxaError),
+                ("AAA AC.T\n BBB ACGT", nexusreader.NexusReader.NexusReaderError),
+                ("AAA AC\n BBB ACGT", nexusreader.NexusReader.TooManyCharactersError),
+                ):
+            data_str = data_str_template.format(rows)
+            with self.assertRaises(error_type) as expected:
+                dendropy.DnaCharacterMatrix.get(data=data_str, schema="nexus")
+            for kwargs in ({"packed": True}, {"num_processes": 2}):
+                with self.assertRaises(error_type) as observed:
+                    dendropy.DnaCharacterMatrix.get(data=data_str, schema="nexus", **kwargs)
+                self.assertEqual(observed.exception.line_num, expected.exception.line_num)
+
+    def test_unterminated_multistate(self):
+        # preceded by enough rows to be split among the worker processes
+        rows = ["T{} ACGT".format(idx) for idx in range(40)]
+        for bad_row in ("BAD A{CG", "BAD AC(GT", "BAD A{AG}(G"):
+            data_str = "#NEXUS\nBEGIN CHARACTERS;\n    DIMENSIONS NTAX=42 NCHAR=4;\n    FORMAT DATATYPE=DNA;\n    MATRIX\n{}\n{}\nLAST ACGT\n;\nEND;\n".format(
+                    "\n".join(rows), bad_row)
+            with self.assertRaises(tokenizer.Tokenizer.UnexpectedEndOfStreamError):
+                dendropy.DnaCharacterMatrix.get(data=data_str, schema="nexus")
+            for kwargs in ({"packed": True}, {"num_processes": 2}, {"packed": True, "num_processes": 2}):
+                with self.assertRaises(tokenizer.Tokenizer.UnexpectedEndOfStreamError) as observed:
+                    dendropy.DnaCharacterMatrix.get(data=data_str, schema="nexus", **kwargs)
+                # the line of the row
+                self.assertEqual(observed.exception.line_num, 46)
+
 class NexusCharsSubsetsTest(
         compare_and_validate.Comparator,
         dendropytest.ExtendedTestCase):
@@ -66,6 +66,29 @@ class NexusStandardTreeParsingTestCase(
                     tree_file_title=tree_file_title,
                     tree_offset=0)
 
+class NexusBufferedTokenizerTreeParsingTestCase(
+        standard_file_test_trees.NexusTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NexusTestTreesChecker.create_class_fixtures(cls)
+
+    def test_get(self):
+        for tree_file_title in (
+                "dendropy-test-trees-multifurcating-rooted-annotated",
+                "dendropy-test-trees-n33-unrooted-annotated-x10a",
+                ):
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            tree_list = dendropy.TreeList.get(
+                    path=tree_filepath,
+                    schema="nexus",
+                    tokenizer_engine="buffered")
+            self.verify_standard_trees(
+                    tree_list=tree_list,
+                    tree_file_title=tree_file_title,
+                    tree_offset=0)
+
 class NexusMultiTreeListTestCase(dendropytest.ExtendedTestCase):
 
     def test_multiple_trees1(self):
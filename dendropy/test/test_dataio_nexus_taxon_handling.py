@@ -194,6 +194,88 @@ class TaxonSymbolMappingTest(unittest.TestCase):
                 self.assertIs(t1, translate[token])
         self.assertEqual(len(tns), len(labels))
 
+    def successive_lookup(self, tsm, symbol):
+        # resolution order: translate token, label, taxon number
+        for taxon_map in (tsm.token_taxon_map, tsm.label_taxon_map, tsm.number_taxon_map):
+            if taxon_map is tsm.number_taxon_map and not tsm.enable_lookup_by_taxon_number:
+                continue
+            try:
+                return taxon_map[symbol]
+            except KeyError:
+                pass
+        return None
+
+    def check_symbol_taxon_map(self, tsm, symbols):
+        for symbol in symbols:
+            self.assertIs(tsm.lookup_taxon_symbol(symbol, create_taxon_if_not_found=False),
+                    self.successive_lookup(tsm, symbol))
+
+    def test_symbol_resolution_order(self):
+        tns = dendropy.TaxonNamespace(["2", "x", "y"])
+        tsm = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns)
+        symbols = ["1", "2", "3", "4", "5", "6", "x", "X", "y", "Y", "z"]
+        self.check_symbol_taxon_map(tsm, symbols)
+        # label before number
+        self.assertIs(tsm.require_taxon_for_symbol("2"), tns[0])
+        self.assertIs(tsm.require_taxon_for_symbol("3"), tns[2])
+        self.assertIs(tsm.require_taxon_for_symbol("X"), tns[1])
+        # translate token before label and number
+        tsm.add_translate_token("y", tns[0])
+        tsm.add_translate_token(1, tns[2])
+        self.check_symbol_taxon_map(tsm, symbols)
+        self.assertIs(tsm.require_taxon_for_symbol("Y"), tns[0])
+        self.assertIs(tsm.require_taxon_for_symbol(1), tns[2])
+        # new taxa do not override higher-precedence symbols
+        t4 = tsm.new_taxon("Y")
+        self.assertIs(tsm.require_taxon_for_symbol("y"), tns[0])
+        self.assertIs(tsm.require_taxon_for_symbol("4"), t4)
+        t5 = tsm.new_taxon("4")
+        self.assertIs(tsm.require_taxon_for_symbol("4"), t5)
+        self.assertIs(tsm.require_taxon_for_symbol("5"), t5)
+        t6 = dendropy.Taxon("1")
+        tsm.add_taxon(t6)
+        self.assertIs(tsm.require_taxon_for_symbol("1"), tns[2])
+        self.assertIs(tsm.require_taxon_for_symbol("6"), t6)
+        self.check_symbol_taxon_map(tsm, symbols)
+        tsm.reset_supplemental_mappings()
+        self.check_symbol_taxon_map(tsm, symbols)
+        self.assertEqual(len(tns), 6)
+
+    def test_case_sensitive_lookup(self):
+        tns = dendropy.TaxonNamespace(["a", "A"], is_case_sensitive=True)
+        tsm = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns,
+                case_sensitive=True)
+        self.assertIs(tsm.require_taxon_for_symbol("a"), tns[0])
+        self.assertIs(tsm.require_taxon_for_symbol("A"), tns[1])
+        tsm.add_translate_token("B", tns[0])
+        self.assertIs(tsm.require_taxon_for_symbol("B"), tns[0])
+        t = tsm.require_taxon_for_symbol("b")
+        self.assertEqual(t.label, "b")
+        self.assertEqual(len(tns), 3)
+
+    def test_case_sensitive_lookup_with_case_insensitive_namespace(self):
+        tns = dendropy.TaxonNamespace(["b", "Q", "c"])
+        tsm = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns,
+                case_sensitive=True)
+        symbols = ["1", "2", "b", "B", "q", "Q", "c", "C", "t", "T"]
+        self.check_symbol_taxon_map(tsm, symbols)
+        # labels are matched with the case rule of the taxon namespace
+        self.assertIs(tsm.require_taxon_for_symbol("B"), tns[0])
+        self.assertIs(tsm.require_taxon_for_symbol("q"), tns[1])
+        # translate tokens are matched case-sensitively
+        tsm.add_translate_token("t", tns[2])
+        tsm.add_translate_token("C", tns[0])
+        self.check_symbol_taxon_map(tsm, symbols)
+        self.assertIs(tsm.require_taxon_for_symbol("t"), tns[2])
+        self.assertIs(tsm.require_taxon_for_symbol("C"), tns[0])
+        self.assertIs(tsm.require_taxon_for_symbol("c"), tns[2])
+        self.assertEqual(len(tns), 3)
+        t = tsm.require_taxon_for_symbol("T")
+        self.assertEqual(t.label, "T")
+        self.assertIs(tsm.require_taxon_for_symbol("t"), tns[2])
+        self.check_symbol_taxon_map(tsm, symbols)
+        self.assertEqual(len(tns), 4)
+
     def test_taxon_namespace_locking(self):
         tns = dendropy.TaxonNamespace()
         tsm = nexusprocessing.NexusTaxonSymbolMapper(taxon_namespace=tns)
@@ -259,6 +341,48 @@ class NexusTaxaCaseInsensitivityTest(unittest.TestCase):
             self.assertTrue(x in expected)
         self.assertEqual(len(d.taxon_namespace), 5)
 
+    def testCaseSensitiveTreesWithMixedCaseSymbols(self):
+        data_str = """\
+            #NEXUS
+            BEGIN TAXA;
+                DIMENSIONS NTAX=4;
+                TAXLABELS b Q c d;
+            END;
+            BEGIN TREES;
+                TRANSLATE
+                    t1 b,
+                    T1 Q;
+                TREE u = ((t1,T1),C,D);
+                TREE v = ((B,q),c,d);
+            END;
+            """
+        trees = dendropy.TreeList.get(data=data_str, schema="nexus",
+                case_sensitive_taxon_labels=True)
+        self.assertEqual([t.label for t in trees.taxon_namespace], ["b", "Q", "c", "d"])
+        for tree in trees:
+            self.assertEqual([nd.taxon.label for nd in tree.leaf_node_iter()],
+                    ["b", "Q", "c", "d"])
+
+class NexusLargeTaxonSetTest(unittest.TestCase):
+
+    def test_translate(self):
+        labels = ["Taxon{}".format(idx+1) for idx in range(2000)]
+        tree_str = "({});".format(",".join(str(idx+1) for idx in range(len(labels))))
+        taxa_block = "BEGIN TAXA;\nDIMENSIONS NTAX={};\nTAXLABELS {};\nEND;\n".format(
+                len(labels), " ".join(labels))
+        translate = ",\n".join("{} {}".format(idx+1, label.upper()) for idx, label in enumerate(labels))
+        for has_taxa_block in (True, False):
+            data_str = "#NEXUS\n{}BEGIN TREES;\nTRANSLATE\n{};\nTREE t = {}\nEND;\n".format(
+                    taxa_block if has_taxa_block else "",
+                    translate,
+                    tree_str)
+            tree = dendropy.Tree.get(data=data_str, schema="nexus")
+            self.assertEqual(len(tree.taxon_namespace), len(labels))
+            self.assertEqual([t.label.lower() for t in tree.taxon_namespace],
+                    [label.lower() for label in labels])
+            self.assertEqual([nd.taxon for nd in tree.leaf_node_iter()],
+                    list(tree.taxon_namespace))
+
 class NexusTooManyTaxaTest(
         dendropytest.ExtendedTestCase):
 
@@ -0,0 +1,164 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for parallel (multi-process) tree iteration reading.
+"""
+
+import sys
+import unittest
+import dendropy
+from dendropy.utility import error
+from dendropy.utility.textprocessing import StringIO
+from dendropy.dataio import parallelyielder
+from dendropy.test.support import dendropytest
+from dendropy.test.support import standard_file_test_trees
+from dendropy.test.support import pathmap
+
+if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
+    from dendropy.utility.filesys import pre_py34_open as open
+
+class ParallelNexusTreeYielderTestCase(
+        standard_file_test_trees.NexusTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NexusTestTreesChecker.create_class_fixtures(cls)
+
+    def test_basic(self):
+        tree_file_titles = [
+            "dendropy-test-trees-n12-x2",
+            "dendropy-test-trees-n33-unrooted-x10a",
+            "dendropy-test-trees-n33-unrooted-x10b",
+            "dendropy-test-trees-n33-unrooted-annotated-x10a",
+        ]
+        expected_file_names = []
+        expected_tree_references = []
+        tree_files = []
+        for tree_file_title in tree_file_titles:
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            tree_files.append(tree_filepath)
+            num_trees = self.tree_references[tree_file_title]["num_trees"]
+            for tree_idx in range(num_trees):
+                expected_file_names.append(tree_filepath)
+                expected_tree_references.append(self.tree_references[tree_file_title][str(tree_idx)])
+        collected_trees = []
+        tns = dendropy.TaxonNamespace()
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=tree_files,
+                schema="nexus",
+                taxon_namespace=tns,
+                num_processes=2)
+        for tree_idx, tree in enumerate(tree_sources):
+            self.assertEqual(tree_sources.current_file_name, expected_file_names[tree_idx])
+            collected_trees.append(tree)
+        self.assertEqual(len(collected_trees), len(expected_tree_references))
+        for tree, ref_tree in zip(collected_trees, expected_tree_references):
+            self.assertIs(tree.taxon_namespace, tns)
+            for nd in tree.leaf_node_iter():
+                self.assertIn(nd.taxon, tns)
+            self.compare_to_reference_tree(tree, ref_tree)
+
+class ParallelNewickTreeYielderTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.tree_files = [pathmap.tree_source_path(f) for f in (
+            "dendropy-test-trees-n33-unrooted-x100a.newick",
+            "pythonidae.reference-trees.newick",
+            "dendropy-test-trees-n33-unrooted-x10a.newick",
+            )]
+        self.original_chunk_size = parallelyielder.ParallelTreeDataYielder.chunk_size
+        # small enough for files to be split into multiple chunks
+        parallelyielder.ParallelTreeDataYielder.chunk_size = 5000
+
+    def tearDown(self):
+        parallelyielder.ParallelTreeDataYielder.chunk_size = self.original_chunk_size
+
+    def read_trees(self, files, **kwargs):
+        tns = dendropy.TaxonNamespace()
+        trees = []
+        file_indexes = []
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=files,
+                schema="newick",
+                taxon_namespace=tns,
+                **kwargs)
+        for tree in tree_sources:
+            self.assertIs(tree.taxon_namespace, tns)
+            for nd in tree:
+                if nd.taxon is not None:
+                    self.assertIn(nd.taxon, tns)
+            trees.append(tree.as_string("newick"))
+            file_indexes.append(tree_sources.current_file_index)
+        return [t.label for t in tns], trees, file_indexes
+
+    def test_equivalence_with_sequential_reading(self):
+        expected = self.read_trees(self.tree_files)
+        for num_processes in (2, 3):
+            observed = self.read_trees(self.tree_files, num_processes=num_processes)
+            self.assertEqual(observed, expected)
+
+    def test_file_objects(self):
+        expected = self.read_trees(self.tree_files)
+        tree_files = [open(f, "r") for f in self.tree_files]
+        observed = self.read_trees(tree_files, num_processes=2)
+        for f in tree_files:
+            f.close()
+        self.assertEqual(observed, expected)
+
+    def test_tree_offset_and_stride(self):
+        for tree_offset, tree_stride in ((0, 1), (30, 1), (3, 4)):
+            expected = self.read_trees(self.tree_files,
+                    tree_offset=tree_offset,
+                    tree_stride=tree_stride)
+            observed = self.read_trees(self.tree_files,
+                    tree_offset=tree_offset,
+                    tree_stride=tree_stride,
+                    num_processes=2)
+            self.assertEqual(observed[1:], expected[1:])
+
+    def test_tree_list_read(self):
+        expected = dendropy.TreeList.get(
+                path=self.tree_files[0],
+                schema="newick")
+        observed = dendropy.TreeList()
+        n = observed.read(
+                path=self.tree_files[0],
+                schema="newick",
+                num_processes=2)
+        self.assertEqual(n, len(expected))
+        self.assertEqual([t.label for t in observed.taxon_namespace],
+                [t.label for t in expected.taxon_namespace])
+        for t1, t2 in zip(observed, expected):
+            self.assertIs(t1.taxon_namespace, observed.taxon_namespace)
+            self.assertEqual(t1.as_string("newick"), t2.as_string("newick"))
+
+    def test_parse_error(self):
+        tree_string = "(a,b);\n" * 2000 + "(a,(b,c);\n" + "(a,b);\n" * 10
+        with self.assertRaises(error.DataParseError) as cm:
+            for tree in dendropy.Tree.yield_from_files(
+                    files=[StringIO(tree_string)],
+                    schema="newick",
+                    num_processes=2):
+                pass
+        # the line of the unbalanced statement
+        self.assertEqual(cm.exception.line_num, 2001)
+
+if __name__ == "__main__":
+    unittest.main()
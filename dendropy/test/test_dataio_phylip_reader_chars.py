@@ -58,6 +58,19 @@ class PhylipCharactersReaderDnaTestCase(
                     check_column_annotations=False,
                     check_cell_annotations=False)
 
+    def test_mapped_phylip(self):
+        src_path = pathmap.char_source_path("standard-test-chars-dna.relaxed.phylip")
+        self.verify_get_from(
+                matrix_type=dendropy.DnaCharacterMatrix,
+                src_filepath=src_path,
+                schema="phylip",
+                factory_kwargs={"use_mmap": True},
+                check_taxon_annotations=False,
+                check_matrix_annotations=False,
+                check_sequence_annotations=False,
+                check_column_annotations=False,
+                check_cell_annotations=False)
+
 class PhylipCharactersReaderRnaTestCase(
         standard_file_test_chars.RnaTestChecker,
         dendropytest.ExtendedTestCase):
@@ -251,6 +264,64 @@ AAACCATTGC CGGTACGCTT AA
             self.assertEqual(taxon.label, expected_taxon)
             self.assertEqual(char_matrix[taxon].symbols_as_string(), self.expected_seqs[expected_taxon])
 
+class PhylipPackedCharactersTestCase(dendropytest.ExtendedTestCase):
+
+    def check_against_full_matrix(self, matrix_type, src_filename, **kwargs):
+        src_path = pathmap.char_source_path(src_filename)
+        full_matrix = matrix_type.get(path=src_path, schema="phylip", **kwargs)
+        packed_matrix = matrix_type.get(path=src_path,
+                schema="phylip",
+                taxon_namespace=full_matrix.taxon_namespace,
+                packed=True,
+                **kwargs)
+        self.assertIsInstance(packed_matrix, dendropy.PackedCharacterMatrix)
+        self.assertEqual(list(packed_matrix), list(full_matrix))
+        for taxon in full_matrix:
+            self.assertEqual(packed_matrix.symbols_as_string(taxon), full_matrix[taxon].symbols_as_string())
+        char_matrix = packed_matrix.to_char_matrix()
+        self.assertIs(type(char_matrix), matrix_type)
+        for taxon in full_matrix:
+            self.assertEqual(char_matrix[taxon].symbols_as_string(), full_matrix[taxon].symbols_as_string())
+
+    def test_dna(self):
+        self.check_against_full_matrix(dendropy.DnaCharacterMatrix, "standard-test-chars-dna.relaxed.phylip")
+
+    def test_mapped_dna(self):
+        self.check_against_full_matrix(dendropy.DnaCharacterMatrix, "standard-test-chars-dna.relaxed.phylip", use_mmap=True)
+
+    def test_rna(self):
+        self.check_against_full_matrix(dendropy.RnaCharacterMatrix, "standard-test-chars-rna.relaxed.phylip")
+
+    def test_protein(self):
+        self.check_against_full_matrix(dendropy.ProteinCharacterMatrix, "standard-test-chars-protein.relaxed.phylip")
+
+    def test_standard(self):
+        self.check_against_full_matrix(dendropy.StandardCharacterMatrix, "standard-test-chars-generic.relaxed.phylip")
+
+    def test_interleaved_with_bad_chars(self):
+        s = """\
+2    12
+Turkey    AAGCTN ATT3828T
+Salmo gairAAGCCT AGTGC3A
+
+GAG
+GAG
+        """
+        char_matrix = dendropy.DnaCharacterMatrix.get(
+                data=s,
+                schema="phylip",
+                interleaved=True,
+                strict=True,
+                ignore_invalid_chars=True,
+                packed=True)
+        self.assertEqual([char_matrix.symbols_as_string(t) for t in char_matrix],
+                ["AAGCTNATTTGAG", "AAGCCTAGTGCAGAG"])
+        with self.assertRaises(phylipreader.PhylipReader.PhylipStrictInterleavedError) as expected:
+            dendropy.DnaCharacterMatrix.get(data=s, schema="phylip", interleaved=True, strict=True)
+        with self.assertRaises(phylipreader.PhylipReader.PhylipStrictInterleavedError) as observed:
+            dendropy.DnaCharacterMatrix.get(data=s, schema="phylip", interleaved=True, strict=True, packed=True)
+        self.assertEqual(observed.exception.line_num, expected.exception.line_num)
+
 class PhylipContinuousVariantsTestCases(dendropytest.ExtendedTestCase):
 
     @classmethod
@@ -0,0 +1,229 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading the structure of trees only, into |CompactTree| objects.
+"""
+
+import math
+import unittest
+import dendropy
+from dendropy.dataio import newickreader
+from dendropy.utility.textprocessing import StringIO
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+class StructureOnlyTreeReadingTestCase(dendropytest.ExtendedTestCase):
+
+    def structure_string(self, tree):
+        return tree.as_string("newick",
+                suppress_internal_node_labels=True,
+                suppress_annotations=True,
+                suppress_rooting=False)
+
+    def check_against_full_trees(self, filename, schema, **kwargs):
+        path = pathmap.tree_source_path(filename)
+        full_trees = dendropy.TreeList.get(path=path, schema=schema, **kwargs)
+        compact_trees = dendropy.TreeList.get(path=path,
+                schema=schema,
+                structure_only=True,
+                taxon_namespace=full_trees.taxon_namespace,
+                **kwargs)
+        self.assertIs(compact_trees.tree_type, dendropy.CompactTree)
+        self.assertEqual(len(compact_trees), len(full_trees))
+        for full_tree, compact_tree in zip(full_trees, compact_trees):
+            self.assertIsInstance(compact_tree, dendropy.CompactTree)
+            self.assertIs(compact_tree.taxon_namespace, full_trees.taxon_namespace)
+            self.assertEqual(compact_tree.num_nodes(), len(full_tree.nodes()))
+            tree = compact_tree.to_tree()
+            self.assertIsInstance(tree, dendropy.Tree)
+            self.assertEqual(tree.label, full_tree.label)
+            self.assertEqual(tree.is_rooted, full_tree.is_rooted)
+            self.assertEqual(self.structure_string(tree), self.structure_string(full_tree))
+
+    def test_newick(self):
+        for parser_engine in ("standard", "statement"):
+            self.check_against_full_trees("dendropy-test-trees-n33-unrooted-annotated-x10a.newick",
+                    "newick",
+                    parser_engine=parser_engine)
+
+    def test_nexus_with_translate_block(self):
+        self.check_against_full_trees("cetaceans.mb.no-clock.mcmc.trees", "nexus")
+
+    def test_nexus_multiple_tree_blocks(self):
+        self.check_against_full_trees("multitreeblocks.nex", "nexus")
+
+    def test_nexus_annotated(self):
+        self.check_against_full_trees("pythonidae.beast.summary.tre", "nexus")
+
+    def test_structure(self):
+        for parser_engine in ("standard", "statement"):
+            tree = dendropy.Tree.get(
+                    data="[&R] ((a:1,b:2)x:3,(c,[comment]d)[&k=1]);",
+                    schema="newick",
+                    parser_engine=parser_engine,
+                    structure_only=True)
+            self.assertIsInstance(tree, dendropy.CompactTree)
+            self.assertTrue(tree.is_rooted)
+            self.assertEqual(list(tree.parent_indexes), [-1, 0, 1, 1, 0, 4, 4])
+            self.assertEqual([t.label if t is not None else None for t in tree.node_taxa],
+                    [None, None, "a", "b", None, "c", "d"])
+            self.assertEqual([tree.edge_length(i) for i in range(tree.num_nodes())],
+                    [None, 3.0, 1.0, 2.0, None, None, None])
+            self.assertTrue(math.isnan(tree.edge_lengths[0]))
+            self.assertEqual(tree.leaf_node_indexes(), [2, 3, 5, 6])
+            self.assertEqual(len(tree.taxon_namespace), 4)
+
+    def test_errors(self):
+        tree_strs = [
+            "((a,b);",
+            "(a,b));",
+            "(a b);",
+            "(a,a);",
+            "(a:x,b);",
+            "(a,b)",
+            "a,b;",
+        ]
+        for tree_str in tree_strs:
+            for parser_engine in ("standard", "statement"):
+                with self.assertRaises(dendropy.DataParseError) as expected:
+                    dendropy.Tree.get(data=tree_str,
+                            schema="newick",
+                            parser_engine=parser_engine)
+                with self.assertRaises(dendropy.DataParseError) as observed:
+                    dendropy.Tree.get(data=tree_str,
+                            schema="newick",
+                            parser_engine=parser_engine,
+                            structure_only=True)
+                self.assertIs(type(observed.exception), type(expected.exception))
+                self.assertEqual(observed.exception.line_num, expected.exception.line_num)
+                self.assertEqual(observed.exception.col_num, expected.exception.col_num)
+
+    def test_read_into_tree_list(self):
+        tree_list = dendropy.TreeList(tree_type=dendropy.CompactTree)
+        tree_list.read(data="((a,b),(c,d));((a,c),(b,d));", schema="newick")
+        self.assertEqual(len(tree_list), 2)
+        for tree in tree_list:
+            self.assertIsInstance(tree, dendropy.CompactTree)
+            self.assertIs(tree.taxon_namespace, tree_list.taxon_namespace)
+        tree_list = dendropy.TreeList()
+        with self.assertRaises(TypeError):
+            tree_list.read(data="((a,b),(c,d));", schema="newick", structure_only=True)
+
+    def test_unsupported_arguments(self):
+        with self.assertRaises(ValueError):
+            newickreader.NewickReader(structure_only=True, suppress_leaf_node_taxa=True)
+
+class StructureOnlySplitCountingTestCase(dendropytest.ExtendedTestCase):
+
+    tree_strs = [
+        "((a:1,b:2):3,(c:4,d:5):6);",
+        "[&R] ((a:1,b:2):3,(c:4,d:5):6);",
+        "((a:1,b:2):3,c:4);",
+        "(a:1,(b:2,(c:3,d:4):5):6);",
+        "(((a:1,b:2):3):4,(c,d):6);",
+        "[&R] ((((a:1,b:2):3)):4,((c,d)):6):7;",
+        "[&W 0.25] ((a:1,b:2):3,c:4,(d,e):1);",
+        "[&W 1/4] (a,(b,(c,(d,e))));",
+        "((a:1):2);",
+    ]
+
+    def test_encode_split_bitmasks(self):
+        for tree_str in self.tree_strs:
+            for parser_engine in ("standard", "statement"):
+                tns = dendropy.TaxonNamespace()
+                tree = dendropy.Tree.get(data=tree_str,
+                        schema="newick",
+                        taxon_namespace=tns,
+                        store_tree_weights=True)
+                compact_tree = dendropy.Tree.get(data=tree_str,
+                        schema="newick",
+                        taxon_namespace=tns,
+                        store_tree_weights=True,
+                        parser_engine=parser_engine,
+                        structure_only=True)
+                self.assertEqual(compact_tree.weight, tree.weight)
+                tree.encode_bipartitions()
+                expected = sorted((b.split_bitmask, tree.bipartition_edge_map[b].length)
+                        for b in tree.bipartition_encoding)
+                split_bitmasks, edge_lengths, tree_leafset_bitmask = compact_tree.encode_split_bitmasks()
+                self.assertEqual(sorted(zip(split_bitmasks, edge_lengths)), expected)
+                self.assertEqual(tree_leafset_bitmask, tree.seed_node.edge.bipartition.leafset_bitmask)
+
+    def test_split_distribution(self):
+        for tree_str in self.tree_strs:
+            tns = dendropy.TaxonNamespace()
+            tree = dendropy.Tree.get(data=tree_str,
+                    schema="newick",
+                    taxon_namespace=tns,
+                    store_tree_weights=True)
+            compact_tree = dendropy.Tree.get(data=tree_str,
+                    schema="newick",
+                    taxon_namespace=tns,
+                    store_tree_weights=True,
+                    structure_only=True)
+            expected = dendropy.SplitDistribution(taxon_namespace=tns, use_tree_weights=True)
+            expected.count_splits_on_tree(tree)
+            observed = dendropy.SplitDistribution(taxon_namespace=tns, use_tree_weights=True)
+            observed.count_splits_on_tree(compact_tree)
+            self.assertEqual(observed.split_counts, expected.split_counts)
+            self.assertEqual(observed.split_edge_lengths, expected.split_edge_lengths)
+            self.assertEqual(observed.sum_of_tree_weights, expected.sum_of_tree_weights)
+            self.assertEqual(observed.tree_rooting_types_counted, expected.tree_rooting_types_counted)
+
+    def check_tree_array(self, filename, schema, **kwargs):
+        path = pathmap.tree_source_path(filename)
+        tns = dendropy.TaxonNamespace()
+        expected = dendropy.TreeArray(taxon_namespace=tns, **kwargs)
+        expected.read_from_files(files=[path], schema=schema)
+        observed = dendropy.TreeArray(taxon_namespace=tns, **kwargs)
+        observed.read_from_files(files=[path], schema=schema, structure_only=True)
+        self.assertEqual(len(observed), len(expected))
+        for idx in range(len(expected)):
+            self.assertEqual(
+                    sorted(zip(*observed.get_split_bitmask_and_edge_tuple(idx))),
+                    sorted(zip(*expected.get_split_bitmask_and_edge_tuple(idx))))
+        self.assertEqual(observed._tree_leafset_bitmasks, expected._tree_leafset_bitmasks)
+        self.assertEqual(observed._tree_weights, expected._tree_weights)
+        self.assertEqual(observed.split_distribution.split_counts,
+                expected.split_distribution.split_counts)
+
+    def test_tree_array_newick(self):
+        self.check_tree_array("dendropy-test-trees-n33-unrooted-x100a.newick", "newick")
+
+    def test_tree_array_nexus(self):
+        self.check_tree_array("cetaceans.mb.no-clock.mcmc.trees", "nexus")
+
+    def test_tree_array_rooted(self):
+        self.check_tree_array("pythonidae.beast.summary.tre", "nexus", is_rooted_trees=True)
+
+    def test_tree_array_with_node_ages(self):
+        tns = dendropy.TaxonNamespace()
+        tree_array = dendropy.TreeArray(taxon_namespace=tns,
+                is_rooted_trees=True,
+                ignore_node_ages=False)
+        tree_array.read_from_files(
+                files=[StringIO("[&R] ((a:1,b:1):1,(c:1,d:1):1);")],
+                schema="newick",
+                structure_only=True)
+        self.assertEqual(len(tree_array), 1)
+        split_bitmask = tns.taxa_bitmask(labels=["a", "b"])
+        self.assertEqual(tree_array.split_distribution.split_node_ages[split_bitmask], [1.0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,19 +22,41 @@ Tests for tokenizers classes.
 
 import unittest
 from dendropy.dataio import nexusprocessing
+from dendropy.utility import filesys
 from dendropy.utility.textprocessing import StringIO
+from dendropy.test.support import pathmap
+
+def tokenization_record(tk):
+    record = []
+    while True:
+        token = tk.next_token()
+        record.append((
+            token,
+            tk.is_token_quoted,
+            tk.pull_captured_comments(),
+            tk.token_line_num,
+            tk.token_column_num,
+            tk.current_line_num,
+            tk.current_column_num,
+            tk.is_eof()))
+        if token is None:
+            break
+    return record
 
 class NexusTokenizerTestCase(unittest.TestCase):
     """
     Unit tests for NexusTokenizer.
     """
 
+    def new_tokenizer(self, src):
+        return nexusprocessing.NexusTokenizer(src=src)
+
     def check_tokenization(self,
             input_str,
             expected_tokens):
         src = StringIO(input_str)
         observed = []
-        for token in nexusprocessing.NexusTokenizer(src=src):
+        for token in self.new_tokenizer(src=src):
             observed.append(token)
         self.assertEqual(observed, expected_tokens)
 
@@ -145,7 +167,7 @@ class NexusTokenizerTestCase(unittest.TestCase):
                 ]
         src = StringIO(input_str)
         observed_tokens = []
-        tk = nexusprocessing.NexusTokenizer(src=src)
+        tk = self.new_tokenizer(src=src)
         for token in tk:
             if token in expected_comments:
                 expected_comment = expected_comments[token]
@@ -156,5 +178,141 @@ class NexusTokenizerTestCase(unittest.TestCase):
         self.assertEqual(expected_comments, {})
         self.assertEqual(observed_tokens, expected_tokens)
 
+    def test_skip_past_char(self):
+        tk = self.new_tokenizer(StringIO("(a,'b;c') [x;[y;]z] (d''e,f);\n(g,h);i"))
+        self.assertEqual(tk.next_token(), "(")
+        self.assertTrue(tk.skip_past_char(";"))
+        self.assertEqual(tk.current_token, ";")
+        self.assertEqual(tk.pull_captured_comments(), None)
+        self.assertEqual(tk.next_token(), "(")
+        self.assertEqual(tk.current_line_num, 2)
+        self.assertTrue(tk.skip_past_char(";"))
+        self.assertEqual(tk.next_token(), "i")
+        self.assertFalse(tk.skip_past_char(";"))
+        self.assertTrue(tk.is_eof())
+
+    def test_skip_past_char_unterminated_quote(self):
+        tk = self.new_tokenizer(StringIO("(a,'b;c"))
+        with self.assertRaises(nexusprocessing.Tokenizer.UnterminatedQuoteError):
+            tk.skip_past_char(";")
+
+class BufferedNexusTokenizerTestCase(NexusTokenizerTestCase):
+    """
+    Unit tests for BufferedNexusTokenizer, using a block size small enough
+    for tokens, quoted strings and comments to span multiple blocks.
+    """
+
+    def new_tokenizer(self, src, block_size=3):
+        tk = nexusprocessing.BufferedNexusTokenizer(src=src)
+        tk.block_size = block_size
+        return tk
+
+    def check_against_standard_tokenizer(self, input_str):
+        expected = tokenization_record(
+                nexusprocessing.NexusTokenizer(src=StringIO(input_str)))
+        for block_size in (1, 2, 7, 65536):
+            observed = tokenization_record(
+                    self.new_tokenizer(StringIO(input_str), block_size=block_size))
+            self.assertEqual(observed, expected)
+
+    def test_equivalence_with_standard_tokenizer(self):
+        input_strs = [
+            "",
+            "   ",
+            "abc  ",
+            "[c]'quoted label'",
+            "'a''b' 'c'' d'",
+            "a[x[y]z]b c",
+            "x_y 'x_y'",
+            "a\n\n b [\n]\n(c)",
+            "a'b c",
+            "]x",
+            "[unterminated comment",
+            "#NEXUS\nbegin trees;\n   tree t1 = [&R] ((a:1,b:2)[&x=1]:3,'c d':4);\nend;\n",
+        ]
+        for input_str in input_strs:
+            self.check_against_standard_tokenizer(input_str)
+
+    def test_equivalence_with_standard_tokenizer_on_data_file(self):
+        with open(pathmap.tree_source_path("pythonidae.beast.summary.tre"), "r") as src:
+            input_str = src.read()
+        self.check_against_standard_tokenizer(input_str)
+
+    def test_skip_past_char_equivalence_with_standard_tokenizer(self):
+        input_strs = [
+            "a b;c",
+            "a'b;c';d",
+            "a [x]'b;c';d",
+            "a 'b''c;d' e;f",
+            "a [x;[y;]z];b",
+            "a\n'b\nc;'\n;\nd",
+            "abc",
+        ]
+        for input_str in input_strs:
+            expected_tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str))
+            expected_tk.next_token()
+            expected = [expected_tk.skip_past_char(";")] + tokenization_record(expected_tk)
+            for block_size in (1, 2, 7, 65536):
+                tk = self.new_tokenizer(StringIO(input_str), block_size=block_size)
+                tk.next_token()
+                observed = [tk.skip_past_char(";")] + tokenization_record(tk)
+                self.assertEqual(observed, expected)
+
+    def test_capture_eol(self):
+        input_str = "t1 ACGT\nt2 AC\r\nGT\n"
+        tk = self.new_tokenizer(StringIO(input_str))
+        tk.set_capture_eol(True)
+        observed = list(tk)
+        self.assertEqual(observed, ["t1", "ACGT", "\n", "t2", "AC", "\r", "\n", "GT", "\n"])
+
+    def test_unterminated_quote(self):
+        tk = self.new_tokenizer(StringIO("abc\n 'def"))
+        self.assertEqual(tk.next_token(), "abc")
+        with self.assertRaises(nexusprocessing.Tokenizer.UnterminatedQuoteError) as cm:
+            tk.next_token()
+        self.assertEqual(cm.exception.line_num, 2)
+
+class MappedTextFileTokenizerTestCase(unittest.TestCase):
+    """
+    Unit tests for tokenizing memory-mapped sources.
+    """
+
+    def check_against_standard_tokenizer(self, input_bytes):
+        expected = tokenization_record(
+                nexusprocessing.NexusTokenizer(src=StringIO(input_bytes.decode("ascii"))))
+        with pathmap.SandboxedFile(mode="wb") as f:
+            f.write(input_bytes)
+            f.flush()
+            for tokenizer_engine in ("standard", "buffered"):
+                with filesys.MappedTextFile(f.name, encoding="ascii") as src:
+                    tk = nexusprocessing.create_nexus_tokenizer(src=src,
+                            tokenizer_engine=tokenizer_engine)
+                    observed = tokenization_record(tk)
+                self.assertEqual(observed, expected)
+
+    def test_equivalence_with_standard_tokenizer(self):
+        input_strs = [
+            b"",
+            b"abc  ",
+            b"'a''b' [c[d]] 'c'' d'",
+            b"a\n\n b [\n]\n(c)",
+            b"#NEXUS\nbegin trees;\n   tree t1 = [&R] ((a:1,b:2)[&x=1]:3,'c d':4);\nend;\n",
+        ]
+        for input_str in input_strs:
+            self.check_against_standard_tokenizer(input_str)
+
+    def test_lines(self):
+        with pathmap.SandboxedFile(mode="wb") as f:
+            f.write(b"a\r\nbc\rd\n\ne")
+            f.flush()
+            with filesys.MappedTextFile(f.name, encoding="ascii") as src:
+                self.assertEqual(list(src), ["a\n", "bc\n", "d\n", "\n", "e"])
+                src.seek(0)
+                self.assertEqual(list(src.iter_lines()), ["a", "bc", "d", "", "e"])
+                src.seek(0)
+                self.assertEqual(src.read(2), "a\n")
+                self.assertEqual(src.read(), "bc\nd\n\ne")
+                self.assertEqual(src.line_num_at(src.buffer.find(b"d")), 3)
+
 if __name__ == "__main__":
     unittest.main()
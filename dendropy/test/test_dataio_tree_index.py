@@ -0,0 +1,182 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for random access to trees in files using a tree source index.
+"""
+
+import os
+import sys
+import unittest
+import dendropy
+from dendropy.dataio import treeindex
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
+    from dendropy.utility.filesys import pre_py34_open as open
+
+class TreeSourceIndexTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.original_scan_block_size = treeindex.TreeSourceIndex.scan_block_size
+        self.sandboxed_files = []
+
+    def tearDown(self):
+        treeindex.TreeSourceIndex.scan_block_size = self.original_scan_block_size
+        for sandboxed_file in self.sandboxed_files:
+            sandboxed_file.__exit__(None, None, None)
+            try:
+                os.remove(treeindex.TreeSourceIndex.get_index_path(sandboxed_file.filepath))
+            except OSError:
+                pass
+
+    def copy_to_sandbox(self, data):
+        sandboxed_file = pathmap.SandboxedFile()
+        self.sandboxed_files.append(sandboxed_file)
+        f = sandboxed_file.__enter__()
+        f.write(data)
+        f.flush()
+        return sandboxed_file.filepath
+
+    def copy_source_to_sandbox(self, filename):
+        with open(pathmap.tree_source_path(filename), "r") as src:
+            return self.copy_to_sandbox(src.read())
+
+    def check_tree_list_offsets(self, path, schema, collection_offset, tree_offsets):
+        for tree_offset in tree_offsets:
+            expected = dendropy.TreeList.get(
+                    path=path,
+                    schema=schema,
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset)
+            observed = dendropy.TreeList.get(
+                    path=path,
+                    schema=schema,
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset,
+                    use_tree_index=True)
+            self.assertEqual(observed.label, expected.label)
+            self.assertEqual([t.label for t in observed], [t.label for t in expected])
+            self.assertEqual(
+                    [t.as_string("newick") for t in observed],
+                    [t.as_string("newick") for t in expected])
+            expected = dendropy.Tree.get(
+                    path=path,
+                    schema=schema,
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset)
+            observed = dendropy.Tree.get(
+                    path=path,
+                    schema=schema,
+                    collection_offset=collection_offset,
+                    tree_offset=tree_offset,
+                    use_tree_index=True)
+            self.assertEqual(observed.as_string("newick"), expected.as_string("newick"))
+
+    def test_newick(self):
+        path = self.copy_source_to_sandbox("dendropy-test-trees-n33-unrooted-x100a.newick")
+        for scan_block_size in (7, 65536):
+            treeindex.TreeSourceIndex.scan_block_size = scan_block_size
+            tree_index = treeindex.TreeSourceIndex.build(path, "newick")
+            self.assertEqual(tree_index.num_collections(), 1)
+            self.assertEqual(tree_index.num_trees(), 100)
+        self.check_tree_list_offsets(path, "newick", 0, [0, 1, 50, 99, -1, -10])
+
+    def test_nexus_with_translate_block(self):
+        path = self.copy_source_to_sandbox("cetaceans.mb.no-clock.mcmc.trees")
+        tree_index = treeindex.TreeSourceIndex.build(path, "nexus")
+        expected = dendropy.TreeList.get(path=path, schema="nexus")
+        self.assertEqual(tree_index.num_trees(), len(expected))
+        self.check_tree_list_offsets(path, "nexus", 0, [0, 100, len(expected)-1, -3])
+
+    def test_nexus_multiple_tree_blocks(self):
+        path = self.copy_source_to_sandbox("multitreeblocks.nex")
+        tree_index = treeindex.TreeSourceIndex.build(path, "nexus")
+        self.assertEqual(tree_index.num_collections(), 3)
+        for collection_offset in range(3):
+            self.assertEqual(tree_index.num_trees(collection_offset), 3)
+            self.check_tree_list_offsets(path, "nexus", collection_offset, [0, 2, -2])
+
+    def test_statement_boundaries(self):
+        data = (
+            "[&R] ('a;b',(c,'d''s;'));\n"
+            "[a ;comment [with ;nested] comment] ((a,b),(c,d));;\n"
+            "(a,(b[&x=';'],(c,d)));\n"
+            "(a'b,c,d);\n"
+        )
+        path = self.copy_to_sandbox(data)
+        for scan_block_size in (1, 2, 3, 5, 65536):
+            treeindex.TreeSourceIndex.scan_block_size = scan_block_size
+            tree_index = treeindex.TreeSourceIndex.build(path, "newick")
+            self.assertEqual(tree_index.num_trees(), 4)
+            self.assertEqual(
+                    [dendropy.Tree.get(data=tree_index.extract(start=i, stop=i+1), schema="newick").as_string("newick")
+                        for i in range(4)],
+                    [t.as_string("newick") for t in dendropy.TreeList.get(path=path, schema="newick")])
+
+    def test_extract_slice(self):
+        path = self.copy_source_to_sandbox("dendropy-test-trees-n33-unrooted-x100a.newick")
+        tree_index = treeindex.TreeSourceIndex.build(path, "newick")
+        expected = dendropy.TreeList.get(path=path, schema="newick")
+        observed = dendropy.TreeList.get(
+                data=tree_index.extract(start=20, stop=30),
+                schema="newick",
+                taxon_namespace=expected.taxon_namespace)
+        self.assertEqual(
+                [t.as_string("newick") for t in observed],
+                [t.as_string("newick") for t in expected[20:30]])
+
+    def test_index_file_reuse(self):
+        path = self.copy_source_to_sandbox("dendropy-test-trees-n33-unrooted-x10a.newick")
+        index_path = treeindex.TreeSourceIndex.get_index_path(path)
+        self.assertFalse(os.path.exists(index_path))
+        tree = dendropy.Tree.get(path=path, schema="newick", tree_offset=3, use_tree_index=True)
+        self.assertTrue(os.path.exists(index_path))
+        tree_index = treeindex.TreeSourceIndex.load(index_path)
+        self.assertTrue(tree_index.is_current())
+        self.assertEqual(tree_index.num_trees(), 10)
+        self.assertEqual(
+                treeindex.TreeSourceIndex.get_for_path(path, "newick").collections,
+                tree_index.collections)
+
+    def test_stale_index_file(self):
+        path = self.copy_to_sandbox("(a,b);\n(c,d);\n")
+        tree_index = treeindex.TreeSourceIndex.get_for_path(path, "newick")
+        self.assertEqual(tree_index.num_trees(), 2)
+        with open(path, "a") as dest:
+            dest.write("(e,f);\n")
+        tree = dendropy.Tree.get(path=path, schema="newick", tree_offset=2, use_tree_index=True)
+        self.assertEqual([nd.taxon.label for nd in tree.leaf_node_iter()], ["e", "f"])
+        self.assertEqual(treeindex.TreeSourceIndex.get_for_path(path, "newick").num_trees(), 3)
+
+    def test_tree_offset_out_of_range(self):
+        path = self.copy_to_sandbox("(a,b);\n(c,d);\n")
+        with self.assertRaises(IndexError):
+            dendropy.TreeList.get(path=path, schema="newick", tree_offset=2, use_tree_index=True)
+        with self.assertRaises(IndexError):
+            dendropy.Tree.get(path=path, schema="newick", tree_offset=-3, use_tree_index=True)
+        with self.assertRaises(IndexError):
+            dendropy.Tree.get(path=path, schema="newick", collection_offset=1, use_tree_index=True)
+
+    def test_requires_path(self):
+        with self.assertRaises(TypeError):
+            dendropy.Tree.get(data="(a,b);", schema="newick", tree_offset=0, use_tree_index=True)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for skipping (burning-in and thinning) trees when iterating over trees
+in files.
+"""
+
+import unittest
+import dendropy
+from dendropy.utility.textprocessing import StringIO
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+class TreeYielderSkipTestCase(dendropytest.ExtendedTestCase):
+
+    offset_strides = [
+            (0, 1),
+            (1, 1),
+            (5, 3),
+            (0, 7),
+            (25, 2),
+            (1000, 1),
+            ]
+
+    def read_trees(self, files, schema, **kwargs):
+        tns = dendropy.TaxonNamespace()
+        trees = []
+        tree_offsets = []
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=files,
+                schema=schema,
+                taxon_namespace=tns,
+                **kwargs)
+        for tree in tree_sources:
+            trees.append((tree.label, tree.as_string("newick")))
+            tree_offsets.append(tree_sources.current_tree_offset)
+        return trees, tree_offsets
+
+    def check_skipping(self, filename, schema, **kwargs):
+        path = pathmap.tree_source_path(filename)
+        all_trees, all_tree_offsets = self.read_trees([path], schema, **kwargs)
+        self.assertEqual(all_tree_offsets, list(range(len(all_trees))))
+        for tree_offset, tree_stride in self.offset_strides:
+            observed = self.read_trees([path, path], schema,
+                    tree_offset=tree_offset,
+                    tree_stride=tree_stride,
+                    **kwargs)
+            expected_tree_offsets = list(range(len(all_trees)))[tree_offset::tree_stride]
+            expected_trees = all_trees[tree_offset::tree_stride]
+            self.assertEqual(observed, (expected_trees * 2, expected_tree_offsets * 2))
+
+    def test_newick(self):
+        for parser_engine in ("standard", "statement"):
+            for tokenizer_engine in ("standard", "buffered"):
+                self.check_skipping("dendropy-test-trees-n33-unrooted-annotated-x10a.newick",
+                        "newick",
+                        parser_engine=parser_engine,
+                        tokenizer_engine=tokenizer_engine)
+
+    def test_nexus_with_translate_block(self):
+        for tokenizer_engine in ("standard", "buffered"):
+            self.check_skipping("cetaceans.mb.no-clock.mcmc.trees",
+                    "nexus",
+                    tokenizer_engine=tokenizer_engine)
+
+    def test_nexus_multiple_tree_blocks(self):
+        self.check_skipping("multitreeblocks.nex", "nexus")
+
+    def test_nexus_newick(self):
+        self.check_skipping("dendropy-test-trees-n33-unrooted-x10a.newick", "nexus/newick")
+
+    def test_nexml(self):
+        self.check_skipping("dendropy-test-trees-n33-unrooted-x10a.nexml", "nexml")
+
+    def test_skipped_statement_boundaries(self):
+        tree_str = (
+            "[&R] ('a;b',(c,'d''s;'));\n"
+            "[a ;comment [with ;nested] comment] ((a,b),(c,d));;\n"
+            "(a,(b[&x=';'],(c,d)));\n"
+            "(a'b,c,d);\n"
+            "(e,f);\n"
+        )
+        for parser_engine in ("standard", "statement"):
+            all_trees = dendropy.TreeList.get(data=tree_str, schema="newick", parser_engine=parser_engine)
+            self.assertEqual(len(all_trees), 5)
+            for tree_offset in range(6):
+                trees, tree_offsets = self.read_trees([StringIO(tree_str)], "newick",
+                        tree_offset=tree_offset,
+                        parser_engine=parser_engine)
+                self.assertEqual(tree_offsets, list(range(tree_offset, 5)))
+                self.assertEqual(
+                        [t[1] for t in trees],
+                        [t.as_string("newick") for t in all_trees[tree_offset:]])
+
+    def test_tree_array_read(self):
+        path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x100a.newick")
+        expected = dendropy.TreeList.get(path=path, schema="newick")
+        tree_array = dendropy.TreeArray(taxon_namespace=expected.taxon_namespace)
+        tree_array.read_from_files(
+                files=[path],
+                schema="newick",
+                tree_offset=25,
+                tree_stride=5)
+        self.assertEqual(len(tree_array), 15)
+        for idx, tree in enumerate(expected[25::5]):
+            tree.encode_bipartitions()
+            self.assertEqual(
+                    set(tree_array.get_split_bitmask_and_edge_tuple(idx)[0]),
+                    set(b.split_bitmask for b in tree.bipartition_encoding))
+
+    def test_invalid_values(self):
+        path = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.newick")
+        with self.assertRaises(ValueError):
+            dendropy.Tree.yield_from_files(files=[path], schema="newick", tree_offset=-1)
+        with self.assertRaises(ValueError):
+            dendropy.Tree.yield_from_files(files=[path], schema="newick", tree_stride=0)
+
+if __name__ == "__main__":
+    unittest.main()
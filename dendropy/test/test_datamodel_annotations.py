@@ -23,6 +23,7 @@ Annotation tests.
 import collections
 import unittest
 import copy
+import dendropy
 from dendropy.datamodel import basemodel
 from dendropy.test.support import compare_and_validate
 
@@ -54,5 +55,61 @@ class AnnotableDeepCopyTester(compare_and_validate.Comparator, unittest.TestCase
         x2 = copy.deepcopy(x1)
         self.compare_distinct_annotables(x1, x2)
 
+class DeferredAnnotationsTester(unittest.TestCase):
+
+    tree_str = "[&R] [&gene=abc] ((a[&height=1.5,rate={0.1,0.2}]:1,b:2)[&&NHX:S=x:E=y]:3[&support=0.9],(c[&note],d)[a comment]);"
+
+    def get_tree(self):
+        return dendropy.Tree.get(data=self.tree_str, schema="newick")
+
+    def get_annotations(self, item):
+        return [(a.name, a.value) for a in item.annotations]
+
+    def test_parsed_on_access(self):
+        tree = self.get_tree()
+        node = tree.find_node_with_taxon_label("a")
+        self.assertFalse(isinstance(node._annotations, basemodel.AnnotationSet))
+        self.assertTrue(node.has_annotations)
+        self.assertIsInstance(node._annotations, basemodel.AnnotationSet)
+        self.assertEqual(self.get_annotations(node),
+                [("height", "1.5"), ("rate", ["0.1", "0.2"])])
+        self.assertIs(node.annotations.target, node)
+        self.assertEqual(self.get_annotations(tree), [("gene", "abc")])
+        self.assertEqual(self.get_annotations(node.parent_node),
+                [("S", "x"), ("E", "y"), ("support", "0.9")])
+        # comments without metadata fields are not deferred
+        node = tree.find_node_with_taxon_label("c")
+        self.assertEqual(node.comments, ["&note"])
+        self.assertFalse(hasattr(node, "_annotations"))
+        self.assertEqual(node.parent_node.comments, ["a comment"])
+        tree = dendropy.Tree.get(data=self.tree_str, schema="newick", extract_comment_metadata=False)
+        self.assertFalse(tree.seed_node.has_annotations)
+        self.assertEqual(tree.comments, ["&gene=abc"])
+
+    def test_added_annotations(self):
+        tree = self.get_tree()
+        tree.add_deferred_annotations("&x=1", lambda source, annotations: annotations.add_new(source[1], "?"))
+        tree.annotations.add_new(name="y", value=2)
+        tree.add_deferred_annotations("&z=3", lambda source, annotations: annotations.add_new(source[1], "?"))
+        self.assertEqual(self.get_annotations(tree),
+                [("gene", "abc"), ("x", "?"), ("y", 2), ("z", "?")])
+
+    def test_copies(self):
+        tree = self.get_tree()
+        for tree2 in (copy.deepcopy(tree), dendropy.Tree(tree)):
+            self.assertEqual(self.get_annotations(tree2), [("gene", "abc")])
+            self.assertEqual(
+                    [self.get_annotations(nd) for nd in tree2.preorder_node_iter()],
+                    [self.get_annotations(nd) for nd in tree.preorder_node_iter()])
+        self.assertEqual(
+                [self.get_annotations(nd) for nd in tree.preorder_node_iter() if nd.has_annotations],
+                [[("S", "x"), ("E", "y"), ("support", "0.9")], [("height", "1.5"), ("rate", ["0.1", "0.2"])]])
+
+    def test_writing(self):
+        tree = self.get_tree()
+        self.assertEqual(tree.as_string("newick", suppress_annotations=False),
+                dendropy.Tree.get(data=self.tree_str, schema="newick").as_string("newick", suppress_annotations=False))
+        self.assertIn("[&height=1.5,rate={0.1,0.2}]", tree.as_string("newick", suppress_annotations=False))
+
 if __name__ == "__main__":
     unittest.main()
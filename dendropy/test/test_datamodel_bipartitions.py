@@ -22,6 +22,7 @@ Testing of calculation of and operations with bipartitions.
 
 import warnings
 import unittest
+import random
 import re
 import sys
 import json
@@ -96,6 +97,123 @@ class BipartitionEncodingTestCase(ExtendedTestCase):
                                 expected_split_bitmask = int(tree_bipartitions_ref[label]["split_bitmask"])
                                 self.assertEqual(bipartition.split_bitmask, expected_split_bitmask)
 
+class IncrementalBipartitionEncodingTestCase(ExtendedTestCase):
+
+    def setUp(self):
+        self.trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.newick"),
+                schema="newick")
+        self.rng = random.Random(1)
+
+    def bipartition_values(self, bipartitions):
+        return sorted((b.split_bitmask, b.leafset_bitmask, b.tree_leafset_bitmask, bool(b.is_rooted), b.is_mutable)
+                for b in bipartitions)
+
+    def assert_bipartitions_current(self, tree):
+        self.assertEqual(set(id(edge.bipartition) for edge in tree.postorder_edge_iter()),
+                set(id(b) for b in tree.bipartition_encoding))
+        observed = self.bipartition_values(tree.bipartition_encoding)
+        tree.encode_bipartitions(suppress_unifurcations=False, collapse_unrooted_basal_bifurcation=False)
+        self.assertEqual(observed, self.bipartition_values(tree.bipartition_encoding))
+
+    def subtree_prune_and_regraft(self, tree):
+        nodes = [nd for nd in tree.preorder_node_iter() if nd.parent_node is not None]
+        node = self.rng.choice(nodes)
+        subtree_nodes = set(node.preorder_iter())
+        target = self.rng.choice([nd for nd in nodes if nd not in subtree_nodes and nd is not node.parent_node])
+        old_parent = node.parent_node
+        old_parent.remove_child(node)
+        new_parent = dendropy.Node()
+        target_parent = target.parent_node
+        target_parent.insert_child(target_parent.child_nodes().index(target), new_parent)
+        target_parent.remove_child(target)
+        new_parent.add_child(target)
+        new_parent.add_child(node)
+        return [old_parent, new_parent]
+
+    def nearest_neighbor_interchange(self, tree):
+        node = self.rng.choice([nd for nd in tree.preorder_internal_node_iter(exclude_seed_node=True)
+                if len(nd.parent_node.child_nodes()) > 1])
+        parent = node.parent_node
+        sibling = self.rng.choice([nd for nd in parent.child_nodes() if nd is not node])
+        child = self.rng.choice(node.child_nodes())
+        node.remove_child(child)
+        parent.remove_child(sibling)
+        node.add_child(sibling)
+        parent.add_child(child)
+        return [node, parent]
+
+    def test_moves(self):
+        for tree in self.trees[:4]:
+            for is_rooted in (False, True):
+                tree = tree.clone(1)
+                tree.is_rooted = is_rooted
+                tree.encode_bipartitions()
+                for move_idx in range(30):
+                    move = self.rng.choice(["spr", "nni", "prune", "collapse", "reroot", "reseed"])
+                    nodes = [nd for nd in tree.preorder_node_iter() if nd.parent_node is not None]
+                    if move == "spr":
+                        tree.update_bipartitions_at(self.subtree_prune_and_regraft(tree))
+                    elif move == "nni":
+                        tree.update_bipartitions_at(self.nearest_neighbor_interchange(tree))
+                    elif move == "prune":
+                        if len(tree.leaf_nodes()) < 8:
+                            continue
+                        tree.prune_subtree(self.rng.choice([nd for nd in nodes if nd.is_leaf()]),
+                                update_bipartitions="incremental")
+                    elif move == "collapse":
+                        internal_nodes = [nd for nd in nodes if nd.child_nodes()]
+                        if len(internal_nodes) < 8:
+                            continue
+                        edge = self.rng.choice(internal_nodes).edge
+                        tail_node = edge.tail_node
+                        edge.collapse()
+                        tree.update_bipartitions_at([tail_node])
+                    elif move == "reroot":
+                        tree.reroot_at_edge(self.rng.choice(nodes).edge,
+                                update_bipartitions="incremental",
+                                suppress_unifurcations=self.rng.random() < 0.5)
+                    elif move == "reseed":
+                        tree.reseed_at(self.rng.choice([nd for nd in nodes if nd.child_nodes()]),
+                                update_bipartitions="incremental",
+                                collapse_unrooted_basal_bifurcation=self.rng.random() < 0.5,
+                                suppress_unifurcations=self.rng.random() < 0.5)
+                    self.assert_bipartitions_current(tree)
+
+    def test_unedited_bipartitions_kept(self):
+        tree = self.trees[0]
+        tree.encode_bipartitions()
+        bipartitions = dict((nd, nd.edge.bipartition) for nd in tree)
+        edited_nodes = self.nearest_neighbor_interchange(tree)
+        path_nodes = set(edited_nodes[0].ancestor_iter(inclusive=True))
+        encoding = tree.update_bipartitions_at(edited_nodes)
+        self.assertIs(encoding, tree.bipartition_encoding)
+        for nd in tree:
+            if nd in path_nodes:
+                self.assertIsNot(nd.edge.bipartition, bipartitions[nd])
+            else:
+                self.assertIs(nd.edge.bipartition, bipartitions[nd])
+            self.assertIs(tree.bipartition_edge_map[nd.edge.bipartition], nd.edge)
+        self.assert_bipartitions_current(tree)
+
+    def test_mutable_and_unencoded(self):
+        tree = self.trees[1]
+        encoding = tree.update_bipartitions_at([tree.seed_node], is_bipartitions_mutable=True)
+        self.assertEqual(len(encoding), len(tree.nodes()))
+        self.assertTrue(all(b.is_mutable for b in encoding))
+        tree.encode_bipartitions(suppress_unifurcations=False, collapse_unrooted_basal_bifurcation=False)
+        edited_nodes = self.subtree_prune_and_regraft(tree)
+        # a new subtree, which is only encoded as the child of an edited node
+        subtree = dendropy.Node()
+        for label in ("x", "y"):
+            subtree.new_child(taxon=tree.taxon_namespace.new_taxon(label))
+        tree.seed_node.add_child(subtree)
+        tree.update_bipartitions_at(edited_nodes + [tree.seed_node])
+        self.assertEqual(self.bipartition_values(tree.bipartition_encoding),
+                self.bipartition_values(tree.clone(1).encode_bipartitions(
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=False)))
+
 if __name__ == "__main__":
     unittest.main()
 
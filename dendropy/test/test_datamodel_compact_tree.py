@@ -0,0 +1,161 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests of the traversals and calculations of |CompactTree| objects, against
+those of the corresponding |Tree| objects.
+"""
+
+import unittest
+import dendropy
+from dendropy.calculate import treecompare
+from dendropy.calculate import treemeasure
+from dendropy.utility import error
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+class CompactTreeTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.taxon_namespace = dendropy.TaxonNamespace()
+        self.trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.newick"),
+                schema="newick",
+                taxon_namespace=self.taxon_namespace)
+        self.ultrametric_trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.random.bd0301.tre"),
+                schema="nexus")
+
+    def node_indexes(self, tree):
+        return dict((id(nd), idx) for idx, nd in enumerate(tree.preorder_node_iter()))
+
+    def test_from_tree(self):
+        tree = dendropy.Tree.get(
+                data="[&R] [&W 0.5] ((a:1,b:2)x:3,(c,d):4)y;",
+                schema="newick",
+                store_tree_weights=True)
+        compact_tree = dendropy.CompactTree.from_tree(tree)
+        self.assertIs(compact_tree.taxon_namespace, tree.taxon_namespace)
+        self.assertEqual(compact_tree.label, tree.label)
+        self.assertIs(compact_tree.is_rooted, True)
+        self.assertEqual(compact_tree.weight, tree.weight)
+        self.assertEqual(list(compact_tree.parent_indexes), [-1, 0, 1, 1, 0, 4, 4])
+        self.assertEqual([compact_tree.edge_length(idx) for idx in range(7)],
+                [None, 3.0, 1.0, 2.0, 4.0, None, None])
+        self.assertEqual([t.label if t else None for t in compact_tree.node_taxa],
+                [None, None, "a", "b", None, "c", "d"])
+        self.assertEqual(list(compact_tree.taxon_indexes()), [-1, -1, 0, 1, -1, 2, 3])
+        self.assertEqual(compact_tree.to_tree().as_string("newick", suppress_internal_node_labels=True),
+                tree.as_string("newick", suppress_internal_node_labels=True))
+        for tree in self.trees:
+            compact_tree = dendropy.CompactTree.from_tree(tree)
+            self.assertEqual(compact_tree.to_tree().as_string("newick", suppress_internal_node_labels=True),
+                    tree.as_string("newick", suppress_internal_node_labels=True))
+
+    def test_traversals(self):
+        for tree in self.trees:
+            compact_tree = dendropy.CompactTree.from_tree(tree)
+            node_indexes = self.node_indexes(tree)
+            nodes = list(tree.preorder_node_iter())
+            self.assertEqual(compact_tree.preorder_node_indexes(), list(range(len(nodes))))
+            self.assertEqual(compact_tree.postorder_node_indexes(),
+                    [node_indexes[id(nd)] for nd in tree.postorder_node_iter()])
+            self.assertEqual(compact_tree.levelorder_node_indexes(),
+                    [node_indexes[id(nd)] for nd in tree.levelorder_node_iter()])
+            self.assertEqual(compact_tree.leaf_node_indexes(),
+                    [node_indexes[id(nd)] for nd in tree.leaf_node_iter()])
+            self.assertEqual(compact_tree.internal_node_indexes(),
+                    [node_indexes[id(nd)] for nd in tree.preorder_internal_node_iter()])
+            self.assertEqual(compact_tree.internal_node_indexes(exclude_seed_node=True),
+                    [node_indexes[id(nd)] for nd in tree.preorder_internal_node_iter(exclude_seed_node=True)])
+            child_offsets, child_indexes = compact_tree.child_index_arrays()
+            self.assertEqual(len(child_offsets), len(nodes) + 1)
+            for idx, nd in enumerate(nodes):
+                expected = [node_indexes[id(ch)] for ch in nd.child_node_iter()]
+                self.assertEqual(list(child_indexes[child_offsets[idx]:child_offsets[idx+1]]), expected)
+                self.assertEqual(compact_tree.child_node_indexes(idx), expected)
+                self.assertEqual(compact_tree.ancestor_node_indexes(idx),
+                        [node_indexes[id(anc)] for anc in nd.ancestor_iter()])
+                self.assertEqual(compact_tree.ancestor_node_indexes(idx, inclusive=True),
+                        [node_indexes[id(anc)] for anc in nd.ancestor_iter(inclusive=True)])
+
+    def test_lengths_and_distances(self):
+        for tree in self.trees:
+            compact_tree = dendropy.CompactTree.from_tree(tree)
+            self.assertAlmostEqual(compact_tree.length(), tree.length())
+            distances = compact_tree.calc_node_root_distances()
+            tree.calc_node_root_distances()
+            for idx, nd in enumerate(tree.preorder_node_iter()):
+                self.assertAlmostEqual(distances[idx], nd.root_distance)
+            self.assertAlmostEqual(compact_tree.max_distance_from_root(), tree.max_distance_from_root())
+
+    def test_node_ages(self):
+        for tree in self.ultrametric_trees:
+            compact_tree = dendropy.CompactTree.from_tree(tree)
+            for kwargs in ({}, {"is_force_max_age": True}, {"is_force_min_age": True}):
+                ages = compact_tree.calc_node_ages(**kwargs)
+                tree.calc_node_ages(**kwargs)
+                for idx, nd in enumerate(tree.preorder_node_iter()):
+                    self.assertAlmostEqual(ages[idx], nd.age)
+        compact_tree = dendropy.CompactTree.from_tree(self.trees[0])
+        with self.assertRaises(error.UltrametricityError):
+            compact_tree.calc_node_ages()
+        ages = compact_tree.calc_node_ages(is_force_max_age=True)
+        self.assertAlmostEqual(ages[0], compact_tree.max_distance_from_root())
+        self.assertEqual(len(compact_tree.calc_node_ages(ultrametricity_precision=False)), compact_tree.num_nodes())
+        with self.assertRaises(ValueError):
+            compact_tree.calc_node_ages(is_force_max_age=True, is_force_min_age=True)
+
+    def test_tree_measures(self):
+        for tree in list(self.trees) + list(self.ultrametric_trees):
+            compact_tree = dendropy.CompactTree.from_tree(tree)
+            self.assertAlmostEqual(treemeasure.B1(compact_tree), treemeasure.B1(tree))
+            self.assertAlmostEqual(treemeasure.N_bar(compact_tree), treemeasure.N_bar(tree))
+            for normalize in (True, False, "yule", "pda"):
+                self.assertAlmostEqual(treemeasure.sackin_index(compact_tree, normalize=normalize),
+                        treemeasure.sackin_index(tree, normalize=normalize))
+            self.assertAlmostEqual(treemeasure.treeness(compact_tree), treemeasure.treeness(tree))
+        for tree in self.ultrametric_trees:
+            compact_tree = dendropy.CompactTree.from_tree(tree)
+            for normalize in ("max", None, "yule", "pda"):
+                self.assertAlmostEqual(treemeasure.colless_tree_imbalance(compact_tree, normalize=normalize),
+                        treemeasure.colless_tree_imbalance(tree, normalize=normalize))
+        with self.assertRaises(TypeError):
+            treemeasure.colless_tree_imbalance(dendropy.CompactTree.from_tree(self.trees[0]))
+
+    def test_tree_comparisons(self):
+        compact_trees = [dendropy.CompactTree.from_tree(tree) for tree in self.trees]
+        for idx1, tree1 in enumerate(self.trees):
+            for idx2, tree2 in enumerate(self.trees):
+                expected = (
+                        treecompare.false_positives_and_negatives(tree1, tree2),
+                        treecompare.symmetric_difference(tree1, tree2),
+                        treecompare.weighted_robinson_foulds_distance(tree1, tree2),
+                        treecompare.euclidean_distance(tree1, tree2))
+                for t1, t2 in ((compact_trees[idx1], compact_trees[idx2]),
+                        (compact_trees[idx1], tree2),
+                        (tree1, compact_trees[idx2])):
+                    self.assertEqual(treecompare.false_positives_and_negatives(t1, t2), expected[0])
+                    self.assertEqual(treecompare.symmetric_difference(t1, t2), expected[1])
+                    self.assertAlmostEqual(treecompare.weighted_robinson_foulds_distance(t1, t2), expected[2])
+                    self.assertAlmostEqual(treecompare.euclidean_distance(t1, t2), expected[3])
+        with self.assertRaises(ValueError):
+            treecompare.weighted_robinson_foulds_distance(compact_trees[0], compact_trees[1], edge_weight_attr="weight")
+
+if __name__ == "__main__":
+    unittest.main()
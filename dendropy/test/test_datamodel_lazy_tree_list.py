@@ -0,0 +1,166 @@
+#! /usr/bin/env python
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for lazily-parsed tree collections.
+"""
+
+import os
+import time
+import unittest
+import dendropy
+from dendropy.dataio import treeindex
+from dendropy.test.support import dendropytest
+from dendropy.test.support import pathmap
+
+class LazyTreeListTestCase(dendropytest.ExtendedTestCase):
+
+    def get_lazy_tree_list(self, filename, schema, **kwargs):
+        return dendropy.LazyTreeList(
+                path=pathmap.tree_source_path(filename),
+                schema=schema,
+                save_tree_index=False,
+                **kwargs)
+
+    def tree_strings(self, trees):
+        return [t.as_string("newick") for t in trees]
+
+    def test_access(self):
+        for filename, schema, collection_offset in (
+                ("dendropy-test-trees-n33-unrooted-x100a.newick", "newick", 0),
+                ("cetaceans.mb.no-clock.mcmc.trees", "nexus", 0),
+                ("multitreeblocks.nex", "nexus", 1),
+                ):
+            expected = dendropy.TreeList.get(
+                    path=pathmap.tree_source_path(filename),
+                    schema=schema,
+                    collection_offset=collection_offset)
+            trees = self.get_lazy_tree_list(filename, schema,
+                    collection_offset=collection_offset,
+                    cache_size=5)
+            self.assertEqual(len(trees), len(expected))
+            self.assertEqual(self.tree_strings(trees), self.tree_strings(expected))
+            for idx in (0, 2, -1, -len(expected)):
+                self.assertEqual(trees[idx].as_string("newick"), expected[idx].as_string("newick"))
+                self.assertIs(trees[idx].taxon_namespace, trees.taxon_namespace)
+            for s in (slice(None), slice(1, None, 2), slice(None, None, -1), slice(5, 2)):
+                tree_list = trees[s]
+                self.assertIsInstance(tree_list, dendropy.TreeList)
+                self.assertIs(tree_list.taxon_namespace, trees.taxon_namespace)
+                self.assertEqual(self.tree_strings(tree_list), self.tree_strings(expected[s]))
+            self.assertEqual([t.label for t in trees.taxon_namespace],
+                    [t.label for t in expected.taxon_namespace])
+            with self.assertRaises(IndexError):
+                trees[len(expected)]
+            with self.assertRaises(IndexError):
+                trees[-len(expected)-1]
+
+    def test_cache(self):
+        trees = self.get_lazy_tree_list("dendropy-test-trees-n33-unrooted-x100a.newick", "newick",
+                cache_size=3)
+        t0 = trees[0]
+        t1 = trees[1]
+        self.assertIs(trees[0], t0)
+        trees[2]
+        trees[3]
+        # tree 1 was the least recently used
+        self.assertEqual(trees.num_cached_trees(), 3)
+        self.assertIs(trees[0], t0)
+        self.assertIsNot(trees[1], t1)
+        self.assertEqual(trees[1].as_string("newick"), t1.as_string("newick"))
+        for tree in trees:
+            self.assertTrue(trees.num_cached_trees() <= 3)
+        trees.clear_cache()
+        self.assertEqual(trees.num_cached_trees(), 0)
+
+    def test_tree_offset_and_structure_only(self):
+        expected = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("cetaceans.mb.no-clock.mcmc.trees"),
+                schema="nexus",
+                tree_offset=50)
+        trees = self.get_lazy_tree_list("cetaceans.mb.no-clock.mcmc.trees", "nexus",
+                tree_offset=50,
+                structure_only=True)
+        self.assertEqual(len(trees), len(expected))
+        self.assertIsInstance(trees[0], dendropy.CompactTree)
+        self.assertIs(trees[:2].tree_type, dendropy.CompactTree)
+        self.assertEqual(
+                [t.to_tree().as_string("newick", suppress_edge_lengths=True) for t in trees],
+                [t.as_string("newick", suppress_edge_lengths=True) for t in expected])
+
+    def test_tree_offset_taxa(self):
+        # the taxa of the skipped trees are added first, as with eager reading
+        sandboxed_file = pathmap.SandboxedFile()
+        with sandboxed_file as f:
+            f.write("((e,f),(g,h));\n((a,b),(c,d));\n((d,c),(b,a));\n((h,a),(b,e));\n")
+            f.flush()
+            for tree_offset in (1, 3):
+                expected = dendropy.TreeList.get(
+                        path=sandboxed_file.filepath,
+                        schema="newick",
+                        tree_offset=tree_offset)
+                trees = dendropy.LazyTreeList(
+                        path=sandboxed_file.filepath,
+                        schema="newick",
+                        tree_offset=tree_offset,
+                        save_tree_index=False)
+                trees.iteration_batch_size = 2
+                self.assertEqual(len(trees), len(expected))
+                self.assertEqual([t.label for t in trees.taxon_namespace], [])
+                self.assertEqual([sorted(b.split_bitmask for b in t.encode_bipartitions()) for t in trees],
+                        [sorted(b.split_bitmask for b in t.encode_bipartitions()) for t in expected])
+                self.assertEqual([t.label for t in trees.taxon_namespace],
+                        [t.label for t in expected.taxon_namespace])
+
+    def test_modified_source(self):
+        sandboxed_file = pathmap.SandboxedFile()
+        with sandboxed_file as f:
+            f.write("((a,b),(c,d));\n((a,c),(b,d));\n")
+            f.flush()
+            try:
+                trees = dendropy.LazyTreeList(path=sandboxed_file.filepath, schema="newick")
+                self.assertTrue(os.path.exists(treeindex.TreeSourceIndex.get_index_path(sandboxed_file.filepath)))
+                self.assertEqual(self.tree_strings(trees), ["((a,b),(c,d));\n", "((a,c),(b,d));\n"])
+                trees.clear_cache()
+                # make sure that the modification time changes
+                time.sleep(0.01)
+                f.write("((a,d),(b,c));\n")
+                f.flush()
+                with self.assertRaises(IOError):
+                    trees[0]
+                trees = dendropy.LazyTreeList(path=sandboxed_file.filepath, schema="newick")
+                self.assertEqual(len(trees), 3)
+            finally:
+                os.remove(treeindex.TreeSourceIndex.get_index_path(sandboxed_file.filepath))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(dendropy.UnspecifiedSourceError):
+            dendropy.LazyTreeList(schema="newick")
+        with self.assertRaises(dendropy.UnspecifiedSchemaError):
+            dendropy.LazyTreeList(path=pathmap.tree_source_path("pythonidae.mb.run1.t"))
+        with self.assertRaises(TypeError):
+            self.get_lazy_tree_list("pythonidae.mb.run1.t", "nexus", foo=1)
+        with self.assertRaises(IndexError):
+            self.get_lazy_tree_list("multitreeblocks.nex", "nexus", tree_offset=3)
+        with self.assertRaises(IndexError):
+            self.get_lazy_tree_list("multitreeblocks.nex", "nexus", collection_offset=3)
+        with self.assertRaises(ValueError):
+            self.get_lazy_tree_list("multitreeblocks.nex", "nexus", cache_size=0)
+
+if __name__ == "__main__":
+    unittest.main()
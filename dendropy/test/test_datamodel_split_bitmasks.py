@@ -22,6 +22,7 @@ Testing of calculation of and operations with split bitmask hashes.
 
 import warnings
 import unittest
+import random
 import re
 import sys
 from dendropy.test.support import pathmap
@@ -299,6 +300,72 @@ class IsTrivialTest(unittest.TestCase):
         for i, r in enumerate([y, y, y, n, y, n, n, y, y, y, y, n, y, n, n, y, y, n, n, y, n, y, y, y, y, n, n, y, n, y, y, y, ]):
             self.assertEqual(r, dendropy.Bipartition.is_trivial_bitmask(i, 0x17))
 
+class IntBitmaskBackendTest(unittest.TestCase):
+
+    def get_backend(self):
+        return bitprocessing.IntBitmaskBackend()
+
+    def setUp(self):
+        self.backend = self.get_backend()
+        rng = random.Random(1)
+        self.bitmasks = [0, 1, 2, 0xFF, 0x100, (1 << 64) - 1, 1 << 64]
+        for num_bits in (7, 63, 64, 65, 1000, 20000):
+            self.bitmasks.append(rng.getrandbits(num_bits))
+
+    def test_set_bit_indexes(self):
+        for bitmask in self.bitmasks:
+            expected = [idx for idx in range(bitmask.bit_length()) if bitmask & (1 << idx)]
+            self.assertEqual(self.backend.set_bit_indexes(bitmask), expected)
+            self.assertEqual(self.backend.num_set_bits(bitmask), len(expected))
+            self.assertEqual(self.backend.bitmask_from_indexes(expected), bitmask)
+            self.assertEqual(self.backend.bitmask_from_indexes(reversed(expected)), bitmask)
+
+    def test_union(self):
+        expected = 0
+        for bitmask in self.bitmasks:
+            expected |= bitmask
+        self.assertEqual(self.backend.union(self.bitmasks), expected)
+        self.assertEqual(self.backend.union(iter(self.bitmasks)), expected)
+        self.assertEqual(self.backend.union([]), 0)
+        self.assertEqual(self.backend.union([5]), 5)
+
+    def test_taxon_namespace(self):
+        tns = dendropy.TaxonNamespace(["T{}".format(idx) for idx in range(200)])
+        taxa = [tns[idx] for idx in (0, 3, 64, 65, 199)]
+        previous_backend = bitprocessing.set_bitmask_backend(self.backend)
+        try:
+            bitmask = tns.taxa_bitmask(taxa=taxa)
+            self.assertEqual(bitmask, (1 << 0) | (1 << 3) | (1 << 64) | (1 << 65) | (1 << 199))
+            self.assertEqual(tns.taxa_bitmask(labels=[t.label for t in taxa]), bitmask)
+            self.assertEqual(tns.bitmask_taxa_list(bitmask), taxa)
+            self.assertEqual(bitprocessing.indexes_of_set_bits(bitmask, one_based=True), [1, 4, 65, 66, 200])
+        finally:
+            bitprocessing.set_bitmask_backend(previous_backend)
+
+@unittest.skipIf(bitprocessing.numpy is None, "NumPy is not installed")
+class NumpyBitmaskBackendTest(IntBitmaskBackendTest):
+
+    def get_backend(self):
+        return bitprocessing.NumpyBitmaskBackend()
+
+    def test_words(self):
+        for bitmask in self.bitmasks:
+            words = self.backend.as_words(bitmask, 400)
+            self.assertEqual(len(words), 400)
+            self.assertEqual(self.backend.from_words(words), bitmask)
+
+class BitmaskBackendSelectionTest(unittest.TestCase):
+
+    def test_selection(self):
+        previous_backend = bitprocessing.set_bitmask_backend("int")
+        try:
+            self.assertEqual(bitprocessing.get_bitmask_backend().name, "int")
+            self.assertRaises(ValueError, bitprocessing.set_bitmask_backend, "bitarray")
+            if bitprocessing.numpy is None:
+                self.assertRaises(ImportError, bitprocessing.set_bitmask_backend, "numpy")
+        finally:
+            bitprocessing.set_bitmask_backend(previous_backend)
+
 class IncompleteLeafSetSplitTest(unittest.TestCase):
 
     def check(self, title, src_prefix):
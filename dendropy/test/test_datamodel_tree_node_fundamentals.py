@@ -20,6 +20,8 @@
 Tests basic Node child management.
 """
 
+import gc
+import pickle
 import unittest
 import dendropy
 import copy
@@ -135,6 +137,63 @@ class NodeCloning(compare_and_validate.Comparator, unittest.TestCase):
                     taxon_namespace_scoped=False,
                     compare_tree_annotations=True)
 
+class NodeSlots(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        tree = dendropy.Tree.get(data="((a:1,b:2)[&x=1]:3,(c:1,d:1):4);", schema="newick")
+        tree.calc_node_ages(ultrametricity_precision=False)
+        tree.calc_node_root_distances()
+        tree.encode_bipartitions()
+        for nd in tree:
+            for obj in (nd, nd.edge, nd.edge.bipartition):
+                self.assertFalse(any(type(r) is dict for r in gc.get_referents(obj)))
+
+    def test_extension_attributes(self):
+        nd = dendropy.Node(label="x")
+        nd.desc_paths = {"a": 1}
+        nd.edge.rate = 2.0
+        self.assertEqual(nd.desc_paths, {"a": 1})
+        self.assertEqual(nd.__dict__, {"desc_paths": {"a": 1}})
+        self.assertEqual(nd.edge.__dict__, {"rate": 2.0})
+        nd.new_child(label="y").desc_paths = {"b": 2}
+        clone = copy.deepcopy(nd)
+        self.assertEqual(clone.label, "x")
+        self.assertEqual(clone.desc_paths, {"a": 1})
+        self.assertIsNot(clone.desc_paths, nd.desc_paths)
+        self.assertEqual(clone.edge.rate, 2.0)
+        self.assertEqual(clone._child_nodes[0].desc_paths, {"b": 2})
+        self.assertIs(clone._child_nodes[0].parent_node, clone)
+        with self.assertRaises(AttributeError):
+            clone.root_distance
+
+    def test_deferred_annotations(self):
+        nd = dendropy.Node()
+        self.assertFalse(nd.has_annotations)
+        nd.add_deferred_annotations("a", lambda source, annotations: annotations.add_new(source, 1))
+        nd.add_deferred_annotations("b", lambda source, annotations: annotations.add_new(source, 2))
+        self.assertEqual([(a.name, a.value) for a in nd.annotations], [("a", 1), ("b", 2)])
+        self.assertIs(nd.annotations.target, nd)
+
+    def test_pickle(self):
+        tree = dendropy.Tree.get(data="((a:1,b:2)[&x=1]:3,(c:1,d:1):4);", schema="newick")
+        tree.encode_bipartitions()
+        tree.seed_node.desc_paths = {"a": 1}
+        tree.seed_node.edge.rate = 2.0
+        expected = tree.as_string("newick")
+        expected_bipartitions = [b.split_bitmask for b in tree.bipartition_encoding]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            t2 = pickle.loads(pickle.dumps(tree, protocol=protocol))
+            self.assertEqual(t2.as_string("newick"), expected)
+            self.assertEqual(t2.seed_node.desc_paths, {"a": 1})
+            self.assertEqual(t2.seed_node.edge.rate, 2.0)
+            self.assertEqual([b.split_bitmask for b in t2.bipartition_encoding], expected_bipartitions)
+            for nd in t2:
+                self.assertIs(nd.edge.head_node, nd)
+                for ch in nd.child_node_iter():
+                    self.assertIs(ch.parent_node, nd)
+                self.assertFalse(nd.edge.bipartition.is_mutable)
+            self.assertEqual(t2.seed_node.child_nodes()[0].annotations.get_value("x"), "1")
+
 class TestNodeSetChildNodes(unittest.TestCase):
 
     def test_set_child_nodes(self):
@@ -547,6 +547,67 @@ class TestTreeIterators(curated_test_tree.CuratedTestTree, unittest.TestCase):
             ancestors = [ch.label for ch in nd.ancestor_iter(inclusive=True, filter_fn=filter_fn)]
             self.assertEqual(ancestors, expected_ancestors)
 
+class TestTreeTraversalCache(curated_test_tree.CuratedTestTree, unittest.TestCase):
+
+    def assert_traversals_current(self, tree):
+        seed_node = tree.seed_node
+        for tree_iter, node_iter in (
+                (tree.preorder_node_iter, seed_node.preorder_iter),
+                (tree.postorder_node_iter, seed_node.postorder_iter),
+                (tree.levelorder_node_iter, seed_node.levelorder_iter),
+                (tree.leaf_node_iter, seed_node.leaf_iter),
+                (tree.preorder_internal_node_iter, seed_node.preorder_internal_node_iter),
+                (tree.postorder_internal_node_iter, seed_node.postorder_internal_node_iter),
+                ):
+            # twice, with the second traversal being from the cache
+            for idx in range(2):
+                self.assertEqual(list(tree_iter()), list(node_iter()))
+        self.assertEqual(list(tree.preorder_edge_iter()), [nd.edge for nd in seed_node.preorder_iter()])
+        self.assertEqual(list(tree.postorder_edge_iter()), [nd.edge for nd in seed_node.postorder_iter()])
+        self.assertEqual(list(tree.levelorder_edge_iter()), [nd.edge for nd in seed_node.levelorder_iter()])
+        self.assertEqual(list(tree.leaf_edge_iter()), [nd.edge for nd in seed_node.leaf_iter()])
+
+    def test_traversals_after_edits(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        self.assert_traversals_current(tree)
+        node_map = dict((nd.label, nd) for nd in anodes)
+        edits = (
+            lambda: node_map["e"].add_child(dendropy.Node(label="x")),
+            lambda: node_map["c"].insert_child(0, node_map["h"]),
+            lambda: node_map["g"].remove_child(node_map["l"]),
+            lambda: node_map["b"].clear_child_nodes(),
+            lambda: node_map["f"].set_child_nodes([node_map["n"], node_map["m"]]),
+            lambda: tree.reseed_at(node_map["f"]),
+            lambda: tree.ladderize(),
+            lambda: node_map["g"].edge.collapse(),
+            lambda: tree.suppress_unifurcations(),
+            lambda: tree.prune_subtree(node_map["h"]),
+            lambda: setattr(tree, "seed_node", node_map["c"]),
+            )
+        for edit in edits:
+            edit()
+            self.assert_traversals_current(tree)
+
+    def test_cached_traversal_snapshots(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        expected = [nd.label for nd in tree.postorder_node_iter()]
+        visited = []
+        for nd in tree.postorder_node_iter():
+            visited.append(nd.label)
+            if nd.parent_node is not None and nd.is_leaf():
+                nd.parent_node.remove_child(nd)
+        self.assertEqual(visited, expected)
+        self.assertEqual([nd.label for nd in tree.postorder_node_iter()], ["a"])
+
+    def test_copied_trees(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        expected = [nd.label for nd in tree.preorder_node_iter()]
+        for tree2 in (dendropy.Tree(tree), tree.clone(0), tree.clone(1), tree.clone(2)):
+            nodes = list(tree2.preorder_node_iter())
+            self.assertEqual([nd.label for nd in nodes], expected)
+            for nd in nodes:
+                self.assertNotIn(nd, anodes)
+
 class TreeRootingState(dendropytest.ExtendedTestCase):
 
     def test_is_rooted(self):
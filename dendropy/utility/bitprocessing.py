@@ -18,9 +18,22 @@
 
 """
 Various bitwise utilities.
-"""
+
+Bitmasks are Python integers, with the least-significant bit corresponding
+to the first element (e.g., the first taxon of a taxon namespace). Operations
+that scale with the number of bits of a bitmask, such as counting or
+enumerating its set bits, building a bitmask from bit indexes, or combining
+many bitmasks, are delegated to a pluggable bitmask backend (see
+:func:`set_bitmask_backend()`)."""
 
 import sys
+import binascii
+import functools
+import operator
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 if sys.hexversion >= 0x03010000:
     def bit_length(n):
@@ -60,14 +73,13 @@ def int_as_bitstring(n, length=None, symbol0=None, symbol1=None, reverse=False):
         return s
 
 def num_set_bits(n):
-    return bin(n).count("1")
+    return _bitmask_backend.num_set_bits(n)
 
 def least_significant_set_bit(n):
     """
     Returns least-significant bit in integer 'n' that is set.
     """
-    m = n & (n - 1)
-    return m ^ n
+    return n & -n
 
 def indexes_of_set_bits(s, fill_bitmask=-1, one_based=False, ordination_in_mask=False):
     return [i for i in set_bit_index_iter(s, fill_bitmask, one_based, ordination_in_mask)]
@@ -83,13 +95,222 @@ def set_bit_index_iter(s, fill_bitmask=-1, one_based=False, ordination_in_mask=F
             index will be the index in a taxon block that is the subset of the
             full set of taxa).
     """
+    maskedSplitRep = s & fill_bitmask
+    if not ordination_in_mask:
+        if maskedSplitRep <= 0:
+            return
+        offset = one_based and 1 or 0
+        for idx in _bitmask_backend.set_bit_indexes(maskedSplitRep):
+            yield idx + offset
+        return
     currBitIndex = one_based and 1 or 0
     test_bit = 1
-    maskedSplitRep = s & fill_bitmask
-    standard_ordination = not ordination_in_mask
     while test_bit <= maskedSplitRep:
         if maskedSplitRep & test_bit:
             yield currBitIndex
-        if standard_ordination or (fill_bitmask & test_bit):
+        if fill_bitmask & test_bit:
             currBitIndex += 1
         test_bit <<= 1
+
+###############################################################################
+## Bitmask Backends
+
+if hasattr(int, "from_bytes"):
+    def int_from_bytes(b):
+        """
+        Returns the integer represented by the little-endian bytes ``b``.
+        """
+        return int.from_bytes(b, "little")
+    def int_as_bytes(n, num_bytes=None):
+        """
+        Returns the little-endian bytes representing the non-negative integer
+        ``n``, padded to ``num_bytes`` if given.
+        """
+        if num_bytes is None:
+            num_bytes = (n.bit_length() + 7) // 8
+        return n.to_bytes(num_bytes, "little")
+else:
+    def int_from_bytes(b):
+        """
+        Returns the integer represented by the little-endian bytes ``b``.
+        """
+        b = bytearray(b)
+        if not b:
+            return 0
+        b.reverse()
+        return int(binascii.hexlify(bytes(b)), 16)
+    def int_as_bytes(n, num_bytes=None):
+        """
+        Returns the little-endian bytes representing the non-negative integer
+        ``n``, padded to ``num_bytes`` if given.
+        """
+        if num_bytes is None:
+            num_bytes = (bit_length(n) + 7) // 8
+        if num_bytes == 0:
+            return b""
+        b = bytearray(binascii.unhexlify("{:0{}x}".format(n, num_bytes * 2)))
+        b.reverse()
+        return bytes(b)
+
+# indexes of the set bits of each byte value
+_BYTE_SET_BIT_INDEXES = tuple(
+        tuple(idx for idx in range(8) if value & (1 << idx))
+        for value in range(256))
+
+class IntBitmaskBackend(object):
+    """
+    Bitmask operations on Python integers.
+
+    This is the default backend. Bitmasks that scale with the number of bits
+    are processed a byte at a time rather than a bit at a time, so that,
+    e.g., enumerating the set bits of a bitmask takes time proportional to
+    its number of bits rather than to the square of that number.
+    """
+
+    name = "int"
+
+    def bitmask_from_indexes(self, indexes):
+        """
+        Returns the bitmask with the bits at ``indexes`` set.
+        """
+        indexes = list(indexes)
+        if not indexes:
+            return 0
+        b = bytearray((max(indexes) >> 3) + 1)
+        for idx in indexes:
+            b[idx >> 3] |= 1 << (idx & 7)
+        return int_from_bytes(bytes(b))
+
+    def union(self, bitmasks):
+        """
+        Returns the bitwise OR of ``bitmasks``.
+        """
+        return functools.reduce(operator.or_, bitmasks, 0)
+
+    if hasattr(int, "bit_count"):
+        def num_set_bits(self, bitmask):
+            """
+            Returns the number of bits set in ``bitmask``.
+            """
+            return bitmask.bit_count()
+    else:
+        def num_set_bits(self, bitmask):
+            """
+            Returns the number of bits set in ``bitmask``.
+            """
+            return bin(bitmask).count("1")
+
+    def set_bit_indexes(self, bitmask):
+        """
+        Returns the list of indexes of the bits set in the non-negative
+        integer ``bitmask``, in increasing order.
+        """
+        indexes = []
+        byte_set_bit_indexes = _BYTE_SET_BIT_INDEXES
+        for byte_idx, value in enumerate(bytearray(int_as_bytes(bitmask))):
+            if value:
+                offset = byte_idx << 3
+                for idx in byte_set_bit_indexes[value]:
+                    indexes.append(offset + idx)
+        return indexes
+
+class NumpyBitmaskBackend(IntBitmaskBackend):
+    """
+    Bitmask operations on fixed-width arrays of unsigned 64-bit words, using
+    NumPy.
+
+    Bitmasks are still passed to and returned from this backend as Python
+    integers, so that they can be used as (hashable) keys of dictionaries and
+    sets, but are converted to word arrays (see :meth:`as_words()`) for the
+    operations that scale with their number of bits. Building a bitmask from
+    bit indexes, counting set bits and enumerating set bits are vectorized.
+    This pays off with large taxon namespaces (e.g., of tens of thousands of
+    taxa), while with small ones the conversions cost more than the integer
+    operations. OR-reduction is left to the integer operations, which already
+    process whole words and would cost no more than the conversions.
+    """
+
+    name = "numpy"
+
+    def __init__(self):
+        if numpy is None:
+            raise ImportError("NumPy is required for the 'numpy' bitmask backend")
+
+    def as_words(self, bitmask, num_words=None):
+        """
+        Returns ``bitmask`` as an array of unsigned 64-bit words, padded to
+        ``num_words`` words if given.
+        """
+        if num_words is None:
+            num_words = (bit_length(bitmask) + 63) >> 6
+        return numpy.frombuffer(int_as_bytes(bitmask, num_words << 3), dtype="<u8")
+
+    def from_words(self, words):
+        """
+        Returns the bitmask represented by the array of unsigned 64-bit words
+        ``words``.
+        """
+        return int_from_bytes(numpy.asarray(words, dtype="<u8").tobytes())
+
+    def bitmask_from_indexes(self, indexes):
+        indexes = numpy.fromiter(indexes, dtype=numpy.int64)
+        if not len(indexes):
+            return 0
+        bits = numpy.zeros(int(indexes.max()) + 1, dtype=numpy.uint8)
+        bits[indexes] = 1
+        return int_from_bytes(numpy.packbits(bits, bitorder="little").tobytes())
+
+    def num_set_bits(self, bitmask):
+        if bitmask < 0:
+            return IntBitmaskBackend.num_set_bits(self, bitmask)
+        words = self.as_words(bitmask)
+        if hasattr(numpy, "bitwise_count"):
+            return int(numpy.bitwise_count(words).sum())
+        return int(numpy.unpackbits(words.view(numpy.uint8)).sum())
+
+    def set_bit_indexes(self, bitmask):
+        b = numpy.frombuffer(int_as_bytes(bitmask), dtype=numpy.uint8)
+        return numpy.flatnonzero(numpy.unpackbits(b, bitorder="little")).tolist()
+
+_BITMASK_BACKENDS = {
+    "int": IntBitmaskBackend,
+    "numpy": NumpyBitmaskBackend,
+}
+
+_bitmask_backend = IntBitmaskBackend()
+
+def get_bitmask_backend():
+    """
+    Returns the bitmask backend in use.
+    """
+    return _bitmask_backend
+
+def set_bitmask_backend(backend):
+    """
+    Sets the bitmask backend used by, e.g., :func:`num_set_bits()`,
+    :func:`set_bit_index_iter()` and
+    :meth:`TaxonNamespace.taxa_bitmask()`.
+
+    Parameters
+    ----------
+    backend : string, {['int'], 'numpy'}, or backend object
+        The name of the backend: 'int' processes bitmasks as Python integers
+        (``IntBitmaskBackend``), while 'numpy' processes them as arrays of
+        64-bit words (``NumpyBitmaskBackend``), which requires NumPy.
+        Alternatively, an object with the methods of ``IntBitmaskBackend``.
+
+    Returns
+    -------
+    b : backend object
+        The previous bitmask backend, e.g., to be restored later.
+    """
+    global _bitmask_backend
+    if isinstance(backend, str):
+        try:
+            backend_type = _BITMASK_BACKENDS[backend]
+        except KeyError:
+            raise ValueError("Unrecognized bitmask backend: '{}'".format(backend))
+        backend = backend_type()
+    previous_backend = _bitmask_backend
+    _bitmask_backend = backend
+    return previous_backend
@@ -25,6 +25,12 @@ import time
 import os
 import sys
 import re
+import mmap
+import codecs
+import locale
+import io
+import zlib
+import multiprocessing
 from threading import Event, Thread, Lock
 
 from dendropy.utility import messaging
@@ -335,4 +341,437 @@ def get_lines(stream):
     s = stream.read()
     return re.split(r'\r\n|\n|\r', s)
 
+###############################################################################
+## Memory-mapped input
+
+class MappedTextFile(object):
+    """
+    Read-only text file-like object that reads a file through a memory map
+    instead of through the buffers of a file object.
+
+    The file is not loaded into memory: text is decoded directly from the
+    mapped pages as it is requested, so files much larger than the available
+    memory can be read. As with files opened in universal newlines mode,
+    '\\r\\n' and '\\r' line breaks are translated into '\\n'. Readers
+    that want to avoid decoding data that they do not need can scan the
+    mapped bytes in ``buffer`` directly (e.g., using a bytes regular
+    expression) and decode just the ranges of interest using :meth:`decode()`.
+    Positions (as returned by :meth:`tell()` or passed to :meth:`seek()`) are
+    byte offsets in the file. The encoding must be ASCII-compatible (e.g.,
+    UTF-8 or Latin-1).
+    """
+
+    _line_end_pattern = re.compile(b"\r\n?|\n")
+
+    def __init__(self, path, encoding=None):
+        """
+        Parameters
+        ----------
+        path : string
+            Path to the file.
+        encoding : string
+            The encoding of the file. If |None|, then the preferred encoding
+            of the locale is used, as with the built-in ``open()``.
+        """
+        if encoding is None:
+            encoding = locale.getpreferredencoding(False)
+        self.name = path
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        try:
+            self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            self.buffer = b""
+        self.size = len(self.buffer)
+        self.closed = False
+        self._pos = 0
+        self._decoder = codecs.getincrementaldecoder(self.encoding)()
+        self._is_after_cr = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        if isinstance(self.buffer, mmap.mmap):
+            try:
+                self.buffer.close()
+            except BufferError:
+                # still referenced by a match object (e.g., in the traceback
+                # of an exception): the map will be released when this is
+                # garbage-collected
+                pass
+        self._file.close()
+        self.closed = True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += self.size
+        self._pos = max(0, min(offset, self.size))
+        self._decoder.reset()
+        self._is_after_cr = False
+        return self._pos
+
+    def decode(self, start, end):
+        """
+        Returns the text decoded from the mapped bytes from ``start`` up to
+        (but not including) ``end``. Line breaks are not translated.
+        """
+        return codecs.decode(self.buffer[start:end], self.encoding)
+
+    def line_num_at(self, offset):
+        """
+        Returns the (1-based) number of the line containing the byte at
+        ``offset``.
+        """
+        line_num = 1
+        for m in self._line_end_pattern.finditer(self.buffer, 0, offset):
+            line_num += 1
+        return line_num
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size
+        text = ""
+        while not text and self._pos < self.size:
+            end = min(self._pos + max(size, 1), self.size)
+            text = self._decoder.decode(self.buffer[self._pos:end], end >= self.size)
+            self._pos = end
+            if not text:
+                # partial multi-byte character
+                continue
+            if self._is_after_cr and text[0] == "\n":
+                text = text[1:]
+            self._is_after_cr = text.endswith("\r")
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def readline(self):
+        if self._is_after_cr:
+            self._is_after_cr = False
+            if self.buffer[self._pos:self._pos+1] == b"\n":
+                self._pos += 1
+        self._decoder.reset()
+        start = self._pos
+        if start >= self.size:
+            return ""
+        m = self._line_end_pattern.search(self.buffer, start)
+        if m is None:
+            self._pos = self.size
+            return self.decode(start, self.size)
+        self._pos = m.end()
+        return self.decode(start, m.start()) + "\n"
+
+    def iter_lines(self):
+        """
+        Iterates over the lines from the current position onwards, without
+        line breaks and with the same conventions as :func:`get_lines()`
+        (i.e., if the data ends with a line break, then the last line
+        yielded is an empty string). Unlike :func:`get_lines()`, the lines
+        are decoded one at a time, as needed.
+        """
+        while True:
+            start = self._pos
+            m = self._line_end_pattern.search(self.buffer, start)
+            if m is None:
+                self._pos = self.size
+                yield self.decode(start, self.size)
+                return
+            self._pos = m.end()
+            yield self.decode(start, m.start())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+    next = __next__ # Python 2 legacy support
+
+###############################################################################
+## Compressed files
+
+try:
+    import gzip
+except ImportError:
+    gzip = None
+try:
+    import bz2
+except ImportError:
+    bz2 = None
+try:
+    import lzma
+except ImportError:
+    try:
+        from backports import lzma
+    except ImportError:
+        lzma = None
+
+# Leading bytes ("magic numbers") identifying the supported compression
+# formats.
+COMPRESSION_MAGIC_BYTES = (
+    ("gzip", b"\x1f\x8b"),
+    ("bz2", b"BZh"),
+    ("xz", b"\xfd7zXZ\x00"),
+    )
+
+# Filename extensions of files that are compressed when written.
+COMPRESSION_FILENAME_EXTENSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    }
+
+def detect_compression(path):
+    """
+    Returns the compression format ("gzip", "bz2" or "xz") of the file at
+    ``path``, as identified by its leading bytes, or |None| if the file is
+    not compressed (or is not a regular file).
+    """
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as src:
+        head = src.read(6)
+    for compression, magic in COMPRESSION_MAGIC_BYTES:
+        if head.startswith(magic):
+            return compression
+    return None
+
+def compression_for_filename(path):
+    """
+    Returns the compression format ("gzip", "bz2" or "xz") implied by the
+    extension of ``path``, or |None| if the extension is not that of a
+    compressed file.
+    """
+    return COMPRESSION_FILENAME_EXTENSIONS.get(os.path.splitext(path)[1].lower(), None)
+
+def _get_compression_module(compression):
+    module = {"gzip": gzip, "bz2": bz2, "xz": lzma}[compression]
+    if module is None:
+        raise NotImplementedError("Reading or writing '{}'-compressed files is not supported by this Python installation".format(compression))
+    return module
+
+def _is_bgzf_file(path):
+    with open(path, "rb") as src:
+        header = src.read(BgzfBlockReader._header_size)
+    return BgzfBlockReader._parse_block_size(header) is not None
+
+def _open_compressed_binary_file(path, mode, compression):
+    module = _get_compression_module(compression)
+    if mode == "r" and compression == "gzip" and _is_bgzf_file(path):
+        return io.BufferedReader(BgzfBlockReader(path), buffer_size=BgzfBlockReader.max_block_size)
+    elif compression == "gzip":
+        return gzip.GzipFile(path, mode + "b")
+    elif compression == "bz2":
+        return bz2.BZ2File(path, mode + "b")
+    else:
+        return module.LZMAFile(path, mode + "b")
+
+def open_compressed_file(path, mode="r", compression=None):
+    """
+    Opens the file at ``path``, which is (or, if ``mode`` is "w", will be)
+    compressed using ``compression`` ("gzip", "bz2" or "xz"), for reading or
+    writing text. The data is decompressed or compressed as it is read or
+    written, without the uncompressed data being stored on disk or in memory
+    as a whole. Blocked gzip (BGZF) files, as produced by ``bgzip``, are
+    decompressed with their blocks being decompressed in parallel (see
+    :class:`BgzfBlockReader`). If ``compression`` is not given, it is
+    detected from the leading bytes of the file when reading, or from its
+    extension when writing.
+
+    As with files opened in universal newlines mode, '\\r\\n' and '\\r' line
+    breaks are translated into '\\n' when reading (under Python 3 only: under
+    Python 2, the stream returned gives the decompressed bytes).
+    """
+    if mode not in ("r", "w", "a"):
+        raise ValueError("Invalid mode: '{}'".format(mode))
+    if compression is None:
+        if mode == "r":
+            compression = detect_compression(path)
+        else:
+            compression = compression_for_filename(path)
+        if compression is None:
+            raise ValueError("Cannot determine compression format of '{}'".format(path))
+    stream = _open_compressed_binary_file(path, mode, compression)
+    if sys.version_info.major < 3:
+        return stream
+    if mode == "r":
+        return io.TextIOWrapper(stream, newline=None)
+    return io.TextIOWrapper(stream)
+
+def open_text_file(path, mode="r", use_mmap=False):
+    """
+    Opens the file at ``path`` for reading or writing text, transparently
+    decompressing it if it is compressed (when reading) or compressing it if
+    its name has the extension of a compressed file (".gz", ".bz2" or
+    ".xz") (when writing). If ``use_mmap`` is |True|, then an uncompressed
+    file opened for reading is read through a memory map (see
+    :class:`MappedTextFile`); this is ignored for compressed files, which
+    cannot be mapped.
+    """
+    if mode == "r":
+        compression = detect_compression(path)
+    else:
+        compression = compression_for_filename(path)
+    if compression is not None:
+        return open_compressed_file(path, mode=mode, compression=compression)
+    if mode == "r" and use_mmap:
+        return MappedTextFile(path)
+    if mode == "r" and sys.version_info < (3, 4):
+        return pre_py34_open(path, mode)
+    return open(path, mode)
+
+def open_binary_file(path, mode="r"):
+    """
+    Opens the file at ``path`` for reading or writing bytes, transparently
+    decompressing or compressing it as with :func:`open_text_file()`.
+    """
+    if mode == "r":
+        compression = detect_compression(path)
+    else:
+        compression = compression_for_filename(path)
+    if compression is not None:
+        return _open_compressed_binary_file(path, mode, compression)
+    return open(path, mode + "b")
+
+class BgzfBlockReader(io.RawIOBase):
+    """
+    Raw binary stream of the decompressed data of a blocked gzip (BGZF) file,
+    i.e. a file made up of a series of independent gzip members, each of at
+    most 64 KiB, whose sizes are recorded in their headers (as written by
+    ``bgzip`` or by Biopython and Pysam, for example).
+
+    As the sizes of the blocks are known without decompressing them, batches
+    of blocks are read and then decompressed in parallel by a pool of
+    threads (the ``zlib`` module releases the global interpreter lock while
+    decompressing), with the decompressed data of each batch being returned
+    in order. This is not possible with ordinary gzip files, which consist of
+    a single compressed stream that can only be decompressed sequentially.
+    """
+
+    # size of the fixed part of a BGZF block header
+    _header_size = 18
+
+    # maximum size of a (compressed or decompressed) BGZF block
+    max_block_size = 65536
+
+    def _parse_block_size(header):
+        """
+        Returns the total size of the block whose header begins ``header``,
+        or |None| if ``header`` is not that of a BGZF block.
+        """
+        if (len(header) < BgzfBlockReader._header_size
+                or header[:4] != b"\x1f\x8b\x08\x04"):
+            return None
+        header = bytearray(header)
+        extra_size = header[10] | (header[11] << 8)
+        # the "BC" subfield giving the block size should be the first
+        # (and is usually the only) extra subfield
+        if header[12:14] != b"BC" or extra_size < 6:
+            return None
+        return (header[16] | (header[17] << 8)) + 1
+    _parse_block_size = staticmethod(_parse_block_size)
+
+    def _decompress_block(block):
+        header = bytearray(block[:12])
+        extra_size = header[10] | (header[11] << 8)
+        data = zlib.decompress(block[12+extra_size:-8], -15)
+        trailer = bytearray(block[-8:])
+        crc = trailer[0] | (trailer[1] << 8) | (trailer[2] << 16) | (trailer[3] << 24)
+        size = trailer[4] | (trailer[5] << 8) | (trailer[6] << 16) | (trailer[7] << 24)
+        if len(data) != size or (zlib.crc32(data) & 0xffffffff) != crc:
+            raise IOError("Corrupt BGZF block")
+        return data
+    _decompress_block = staticmethod(_decompress_block)
+
+    def __init__(self, path, num_threads=None, blocks_per_batch=None):
+        """
+        Parameters
+        ----------
+        path : string
+            Path to the file.
+        num_threads : integer
+            Number of threads decompressing blocks. If |None|, then one
+            thread per CPU (up to a maximum of 8) will be used.
+        blocks_per_batch : integer
+            Number of blocks to read and decompress at a time. If |None|,
+            then 16 blocks per thread are used.
+        """
+        io.RawIOBase.__init__(self)
+        if num_threads is None:
+            try:
+                num_threads = min(multiprocessing.cpu_count(), 8)
+            except NotImplementedError:
+                num_threads = 1
+        if blocks_per_batch is None:
+            blocks_per_batch = 16 * num_threads
+        self.name = path
+        self.num_threads = num_threads
+        self.blocks_per_batch = blocks_per_batch
+        self._file = open(path, "rb")
+        self._pool = None
+        self._buffer = b""
+        self._buffer_pos = 0
+
+    def readable(self):
+        return True
+
+    def close(self):
+        if not self.closed:
+            self._file.close()
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+        io.RawIOBase.close(self)
+
+    def _read_blocks(self):
+        blocks = []
+        for i in range(self.blocks_per_batch):
+            header = self._file.read(BgzfBlockReader._header_size)
+            if not header:
+                break
+            block_size = BgzfBlockReader._parse_block_size(header)
+            if block_size is None:
+                raise IOError("Invalid BGZF block header in '{}'".format(self.name))
+            block = header + self._file.read(block_size - len(header))
+            if len(block) != block_size:
+                raise IOError("Truncated BGZF block in '{}'".format(self.name))
+            blocks.append(block)
+        return blocks
+
+    def _fill_buffer(self):
+        while self._buffer_pos >= len(self._buffer):
+            blocks = self._read_blocks()
+            if not blocks:
+                return False
+            if self.num_threads > 1 and len(blocks) > 1:
+                if self._pool is None:
+                    from multiprocessing.pool import ThreadPool
+                    self._pool = ThreadPool(self.num_threads)
+                data = self._pool.map(BgzfBlockReader._decompress_block, blocks)
+            else:
+                data = [BgzfBlockReader._decompress_block(block) for block in blocks]
+            self._buffer = b"".join(data)
+            self._buffer_pos = 0
+        return True
 
+    def readinto(self, b):
+        if not self._fill_buffer():
+            return 0
+        size = min(len(b), len(self._buffer) - self._buffer_pos)
+        b[:size] = self._buffer[self._buffer_pos:self._buffer_pos+size]
+        self._buffer_pos += size
+        return size